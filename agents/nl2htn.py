@@ -19,7 +19,7 @@ class NL2HTNAgent:
     and then runs a planner to generate a plan.
     """
     
-    def __init__(self, prompt_template: str, llm: LLM, builder: ModelBuilder, planner: Planner) -> None:
+    def __init__(self, prompt_template: str, llm: LLM, builder: ModelBuilder, planner: Planner, split: bool = False) -> None:
         """
         Initializes the NL2HTNAgent with a language model, a builder for the domain and problem,
         and a planner to generate plans.
@@ -27,11 +27,13 @@ class NL2HTNAgent:
         :param llm: The language model to use for extracting the domain and problem.
         :param builder: The builder to use for constructing the domain and problem.
         :param planner: The planner to use for generating plans.
+        :param split: Request the model section-wise with concurrent queries instead of in one completion.
         """
         self.llm = llm
         self.builder = builder
         self.prompt_template = prompt_template
         self.planner = planner
+        self.split = split
 
     def run(self, task_desc: str, domain_path: str, problem_path: str, plan_path: str, response_path: str | None = None) -> Tuple[str, int]:
         """
@@ -48,6 +50,7 @@ class NL2HTNAgent:
                 model=self.llm,
                 task_desc=task_desc,
                 prompt_template=self.prompt_template,
+                split=self.split,
             )
         except Exception as e:
             return f"Error extracting domain and problem: {e}\n" + traceback.format_exc(), 1
@@ -2,5 +2,8 @@ from .domain_builder import *
 from .task_builder import *
 from .feedback_builder import *
 from .prompt_builder import *
+from .pipeline_builder import *
+from .repair_builder import *
+from .refinement_builder import *
 from .utils import *
 from .llm import *
\ No newline at end of file
@@ -10,7 +10,6 @@ for how to structurally prompt LLMs so they are compatible with class function p
 """
 
 import re
-import time
 
 from collections import OrderedDict
 from typing import Any
@@ -29,6 +28,8 @@ class DomainBuilder:
         predicates: list[Predicate] = None,
         functions: list[Function] = None,
         pddl_actions: list[Action] = None,
+        retry_policy: RetryPolicy = None,
+        render_cache: RenderCache = None,
     ) -> None:
         """
         Initializes an L2P domain builder object.
@@ -38,18 +39,97 @@ class DomainBuilder:
             types (dict[str,str]): flat types dictionary w/ {name: description} key-value pair (PDDL :types)
             type_hierarchy (list[dict[str,str]]): type hierarchy dictionary list (PDDL :types)
             constants (dict[str,str]): flat constant dictionary w/ {name: type} key-value pair (PDDL :constants)
-            predicates (list[Predicate]): list of Predicate objects (PDDL :predicates)
-            functions (list[Function]): list of Function objects (PDDL :functions)
-            pddl_actions (list[Action]): list of Action objects (PDDL :action)
+            predicates (list[Predicate]): list of Predicate objects (PDDL :predicates), stored as a `NamedCollection` (one predicate per name, later duplicates replace earlier ones)
+            functions (list[Function]): list of Function objects (PDDL :functions), stored as a `NamedCollection` (one function per name)
+            pddl_actions (list[Action]): list of Action objects (PDDL :action), stored as a `NamedCollection` (one action per name)
+            retry_policy (RetryPolicy): retry policy of `formalize_*` calls, share one instance across a pipeline to cap its retry budget
+            render_cache (RenderCache): cache of rendered prompt fragments and PDDL sections, defaults to a new cache
         """
 
         self.requirements = requirements or []
+        self._versions = {"types": 0, "type_hierarchy": 0, "constants": 0}  # see `_render`
         self.types = types or {}
         self.type_hierarchy = type_hierarchy or []
         self.constants = constants or {}
-        self.predicates = predicates or []
-        self.functions = functions or []
-        self.pddl_actions = pddl_actions or []
+        self.predicates = predicates
+        self.functions = functions
+        self.pddl_actions = pddl_actions
+        self.fix_log = []  # changes applied by `auto_fix` rule-based fixes
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.render_cache = render_cache or RenderCache()
+        self._type_index = None  # cached TypeIndex of current types, see `get_type_index()`
+        self._type_index_source = None
+        self._usage_index = None  # incrementally maintained UsageIndex, see `get_usage_index()`
+        self._usage_index_source = None
+
+    """Storage"""
+
+    # types/constants are versioned on assignment, so their prompt fragments are rendered once;
+    # edit them through `set_*`/`delete_*` (or reassign them) rather than in place
+
+    @property
+    def types(self) -> dict[str, str]:
+        return self._types
+
+    @types.setter
+    def types(self, types: dict[str, str]):
+        self._types = types
+        self._versions["types"] += 1
+
+    @property
+    def type_hierarchy(self) -> list[dict[str, str]]:
+        return self._type_hierarchy
+
+    @type_hierarchy.setter
+    def type_hierarchy(self, type_hierarchy: list[dict[str, str]]):
+        self._type_hierarchy = type_hierarchy
+        self._versions["type_hierarchy"] += 1
+
+    @property
+    def constants(self) -> dict[str, str]:
+        return self._constants
+
+    @constants.setter
+    def constants(self, constants: dict[str, str]):
+        self._constants = constants
+        self._versions["constants"] += 1
+
+    # name-keyed collections; lists assigned directly are wrapped, so lookups stay O(1)
+
+    @property
+    def predicates(self) -> NamedCollection:
+        return self._predicates
+
+    @predicates.setter
+    def predicates(self, predicates: list[Predicate] | None):
+        self._predicates = NamedCollection.of(predicates)
+
+    @property
+    def functions(self) -> NamedCollection:
+        return self._functions
+
+    @functions.setter
+    def functions(self, functions: list[Function] | None):
+        self._functions = NamedCollection.of(functions)
+
+    @property
+    def pddl_actions(self) -> NamedCollection:
+        return self._pddl_actions
+
+    @pddl_actions.setter
+    def pddl_actions(self, pddl_actions: list[Action] | None):
+        self._pddl_actions = NamedCollection.of(pddl_actions)
+
+    def _render(self, name: str, source: Any) -> str:
+        """
+        Renders fragment `name` of `source` through `self.render_cache`. If `source` is this
+        builder's own types, type hierarchy or constants, it is cached by their version
+        (collections are always cached by theirs); other plain sources are rendered directly.
+        """
+        for attr, version in self._versions.items():
+            if source is getattr(self, attr):
+                return self.render_cache.render(name, source, version=version)
+        return self.render_cache.render(name, source)
 
     """Formalize/generate functions"""
 
@@ -83,51 +163,36 @@ class DomainBuilder:
             validation_info (tuple[bool,str]): validation info containing pass flag and error message
         """
 
-        types_str = pretty_print_dict(types) if types else "No types provided."
+        types_str = self._render("types", types)
 
-        prompt = prompt_template.replace("{domain_desc}", domain_desc).replace(
-            "{types}", types_str
+        prompt = PromptTemplate.of(prompt_template).render(
+            domain_desc=domain_desc,
+            types=types_str,
+            strict=False,
         )
 
-        # iterate through attempts in case of extraction failure
-        for attempt in range(max_retries):
-            try:
-                model.reset_tokens()
-                llm_output = model.query(prompt=prompt)
-
-                # parse LLM output into types
-                types = parse_types(llm_output=llm_output)
-
-                # flag that removes keyword 'object' if detected
-                if check_invalid_obj_usage:
-                    if types and "object" in types:
-                        del types["object"]
-
-                # run syntax validation if applicable
-                validation_info = (True, "All validations passed.")
-                if syntax_validator:
-                    for error_type in syntax_validator.error_types:
-                        validator = getattr(syntax_validator, f"{error_type}", None)
-                        if not callable(validator):
-                            continue
-
-                        # dispatch based on expected arguments
-                        if error_type == "validate_format_types":
-                            validation_info = validator(types)
-
-                        if not validation_info[0]:
-                            return types, llm_output, validation_info
-
-                return types, llm_output, validation_info
-
-            except Exception as e:
-                print(
-                    f"Error encountered during attempt {attempt + 1}/{max_retries}: {e}. "
-                    f"\nLLM Output: \n\n{llm_output if 'llm_output' in locals() else 'None'}\n\n Retrying..."
+        # parse and validate LLM output, retried via `self.retry_policy` on failure
+        def handle(llm_output: str):
+            # parse LLM output into types
+            types = parse_types(llm_output=llm_output)
+
+            # flag that removes keyword 'object' if detected
+            if check_invalid_obj_usage:
+                if types and "object" in types:
+                    del types["object"]
+
+            # run syntax validation if applicable, collecting violations of every check
+            validation_info = (True, "All validations passed.")
+            if syntax_validator:
+                validation_info = ValidationPipeline.of(syntax_validator).validate(
+                    new_types=types,
                 )
-                time.sleep(2)  # add a delay before retrying
 
-        raise RuntimeError("Max retries exceeded. Failed to extract types.")
+            return types, llm_output, validation_info
+
+        return self.retry_policy.run(
+            model, prompt, handle, max_retries, "Max retries exceeded. Failed to extract types."
+        )
 
     @require_llm
     def formalize_type_hierarchy(
@@ -158,61 +223,44 @@ class DomainBuilder:
             validation_info (tuple[bool,str]): validation info containing pass flag and error message
         """
 
-        types_str = pretty_print_dict(types) if types else "No types provided."
+        types_str = self._render("types", types)
 
-        prompt = prompt_template.replace("{domain_desc}", domain_desc).replace(
-            "{types}", types_str
+        prompt = PromptTemplate.of(prompt_template).render(
+            domain_desc=domain_desc,
+            types=types_str,
+            strict=False,
         )
 
-        # iterate through attempts in case of extraction failure
-        for attempt in range(max_retries):
-            try:
-                model.reset_tokens()
-                llm_output = model.query(prompt=prompt)
-
-                # extract respective types from response
-                type_hierarchy = parse_type_hierarchy(llm_output=llm_output)
-
-                # flag that removes keyword 'object' if detected
-                if type_hierarchy is not None:
-                    if check_invalid_obj_usage:
-                        # promote children if top-level "object" type exists
-                        new_hierarchy = []
-                        for entry in type_hierarchy:
-                            if "object" in entry:
-                                children = entry.get("children", [])
-                                new_hierarchy.extend(children)
-                            else:
-                                new_hierarchy.append(entry)
-                        type_hierarchy = new_hierarchy
-
-                # run syntax validation if applicable
-                validation_info = (True, "All validations passed.")
-                if syntax_validator:
-                    for error_type in syntax_validator.error_types:
-                        validator = getattr(syntax_validator, f"{error_type}", None)
-                        if not callable(validator):
-                            continue
-
-                        # dispatch based on expected arguments
-                        if error_type == "validate_format_types":
-                            validation_info = validator(type_hierarchy)
-                        elif error_type == "validate_cyclic_types":
-                            validation_info = validator(type_hierarchy)
-
-                        if not validation_info[0]:
-                            return type_hierarchy, llm_output, validation_info
-
-                return type_hierarchy, llm_output, validation_info
+        # parse and validate LLM output, retried via `self.retry_policy` on failure
+        def handle(llm_output: str):
+            # extract respective types from response
+            type_hierarchy = parse_type_hierarchy(llm_output=llm_output)
 
-            except Exception as e:
-                print(
-                    f"Error encountered during attempt {attempt + 1}/{max_retries}: {e}. "
-                    f"\nLLM Output: \n\n{llm_output if 'llm_output' in locals() else 'None'}\n\n Retrying..."
+            # flag that removes keyword 'object' if detected
+            if type_hierarchy is not None:
+                if check_invalid_obj_usage:
+                    # promote children if top-level "object" type exists
+                    new_hierarchy = []
+                    for entry in type_hierarchy:
+                        if "object" in entry:
+                            children = entry.get("children", [])
+                            new_hierarchy.extend(children)
+                        else:
+                            new_hierarchy.append(entry)
+                    type_hierarchy = new_hierarchy
+
+            # run syntax validation if applicable, collecting violations of every check
+            validation_info = (True, "All validations passed.")
+            if syntax_validator:
+                validation_info = ValidationPipeline.of(syntax_validator).validate(
+                    new_types=type_hierarchy,
                 )
-                time.sleep(2)  # add a delay before retrying
 
-        raise RuntimeError("Max retries exceeded. Failed to extract types.")
+            return type_hierarchy, llm_output, validation_info
+
+        return self.retry_policy.run(
+            model, prompt, handle, max_retries, "Max retries exceeded. Failed to extract types."
+        )
 
     @require_llm
     def formalize_constants(
@@ -243,51 +291,34 @@ class DomainBuilder:
             validation_info (tuple[bool,str]): validation info containing pass flag and error message
         """
 
-        types_str = pretty_print_dict(types) if types else "No types provided."
-        const_str = (
-            format_constants(constants) if constants else "No constants provided."
-        )
+        types_str = self._render("types", types)
+        const_str = self._render("constants", constants)
 
-        prompt = (
-            prompt_template.replace("{domain_desc}", domain_desc)
-            .replace("{types}", types_str)
-            .replace("{constants}", const_str)
+        prompt = PromptTemplate.of(prompt_template).render(
+            domain_desc=domain_desc,
+            types=types_str,
+            constants=const_str,
+            strict=False,
         )
 
-        # iterate through attempts in case of extraction failure
-        for attempt in range(max_retries):
-            try:
-                model.reset_tokens()
-                llm_output = model.query(prompt=prompt)
-
-                # parse LLM output into constants
-                constants = parse_constants(llm_output=llm_output)
-
-                # run syntax validation if applicable
-                validation_info = (True, "All validations passed.")
-                if syntax_validator:
-                    for error_type in syntax_validator.error_types:
-                        validator = getattr(syntax_validator, f"{error_type}", None)
-                        if not callable(validator):
-                            continue
-
-                        # dispatch based on expected arguments
-                        if error_type == "validate_constant_types":
-                            validation_info = validator(constants, types)
-
-                        if not validation_info[0]:
-                            return constants, llm_output, validation_info
-
-                return constants, llm_output, validation_info
-
-            except Exception as e:
-                print(
-                    f"Error encountered during attempt {attempt + 1}/{max_retries}: {e}. "
-                    f"\nLLM Output: \n\n{llm_output if 'llm_output' in locals() else 'None'}\n\n Retrying..."
+        # parse and validate LLM output, retried via `self.retry_policy` on failure
+        def handle(llm_output: str):
+            # parse LLM output into constants
+            constants = parse_constants(llm_output=llm_output)
+
+            # run syntax validation if applicable, collecting violations of every check
+            validation_info = (True, "All validations passed.")
+            if syntax_validator:
+                validation_info = ValidationPipeline.of(syntax_validator).validate(
+                    constants=constants,
+                    types=types,
                 )
-                time.sleep(2)  # add a delay before retrying
 
-        raise RuntimeError("Max retries exceeded. Failed to extract constants.")
+            return constants, llm_output, validation_info
+
+        return self.retry_policy.run(
+            model, prompt, handle, max_retries, "Max retries exceeded. Failed to extract constants."
+        )
 
     @require_llm
     def formalize_predicates(
@@ -322,73 +353,40 @@ class DomainBuilder:
             validation_info (tuple[bool, str]): validation info containing pass flag and error message
         """
 
-        types_str = pretty_print_dict(types) if types else "No types provided."
-        const_str = (
-            format_constants(constants) if constants else "No constants provided."
-        )
-        preds_str = (
-            "\n".join([f"{pred['raw']}" for pred in predicates])
-            if predicates
-            else "No predicates provided."
+        types_str = self._render("types", types)
+        const_str = self._render("constants", constants)
+        preds_str = self._render("predicates", predicates)
+        funcs_str = self._render("functions", functions)
+
+        prompt = PromptTemplate.of(prompt_template).render(
+            domain_desc=domain_desc,
+            types=types_str,
+            constants=const_str,
+            predicates=preds_str,
+            functions=funcs_str,
+            strict=False,
         )
-        funcs_str = (
-            "\n".join([f"{func['raw']}" for func in functions])
-            if functions
-            else "No functions provided."
-        )
-
-        prompt = (
-            prompt_template.replace("{domain_desc}", domain_desc)
-            .replace("{types}", types_str)
-            .replace("{constants}", const_str)
-            .replace("{predicates}", preds_str)
-            .replace("{functions}", funcs_str)
-        )
-
-        # iterate through attempts in case of extraction failure
-        for attempt in range(max_retries):
-            try:
-                model.reset_tokens()
-                llm_output = model.query(prompt=prompt)  # prompt model
-
-                # extract new predicates from response
-                new_predicates = parse_new_predicates(llm_output=llm_output)
-
-                # run syntax validation if applicable
-                validation_info = (True, "All validations passed.")
-                if syntax_validator:
-                    for error_type in syntax_validator.error_types:
-                        validator = getattr(syntax_validator, f"{error_type}", None)
-                        if not callable(validator):
-                            continue
-
-                        # dispatch based on expected arguments
-                        if error_type == "validate_header":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_duplicate_headers":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_unsupported_keywords":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_types_predicates":
-                            validation_info = validator(new_predicates, types)
-                        elif error_type == "validate_format_predicates":
-                            validation_info = validator(new_predicates, types)
-                        elif error_type == "validate_duplicate_predicates":
-                            validation_info = validator(predicates, new_predicates)
-
-                        if not validation_info[0]:
-                            return new_predicates, llm_output, validation_info
-
-                return new_predicates, llm_output, validation_info
 
-            except Exception as e:
-                print(
-                    f"Error encountered during attempt {attempt + 1}/{max_retries}: {e}. "
-                    f"\nLLM Output: \n\n{llm_output if 'llm_output' in locals() else 'None'}\n\n Retrying..."
+        # parse and validate LLM output, retried via `self.retry_policy` on failure
+        def handle(llm_output: str):
+            # extract new predicates from response
+            new_predicates = parse_new_predicates(llm_output=llm_output)
+
+            # run syntax validation if applicable, collecting violations of every check
+            validation_info = (True, "All validations passed.")
+            if syntax_validator:
+                validation_info = ValidationPipeline.of(syntax_validator).validate(
+                    llm_output=llm_output,
+                    new_predicates=new_predicates,
+                    types=types,
+                    predicates=predicates,
                 )
-                time.sleep(2)  # add a delay before retrying
 
-        raise RuntimeError("Max retries exceeded. Failed to extract predicates.")
+            return new_predicates, llm_output, validation_info
+
+        return self.retry_policy.run(
+            model, prompt, handle, max_retries, "Max retries exceeded. Failed to extract predicates."
+        )
 
     @require_llm
     def formalize_functions(
@@ -423,69 +421,39 @@ class DomainBuilder:
             validation_info (tuple[bool,str]): validation info containing pass flag and error message
         """
 
-        types_str = pretty_print_dict(types) if types else "No types provided."
-        const_str = (
-            format_constants(constants) if constants else "No constants provided."
-        )
-        preds_str = (
-            "\n".join([f"{pred['raw']}" for pred in predicates])
-            if predicates
-            else "No predicates provided."
-        )
-        funcs_str = (
-            "\n".join([f"{func['raw']}" for func in functions])
-            if functions
-            else "No functions provided."
+        types_str = self._render("types", types)
+        const_str = self._render("constants", constants)
+        preds_str = self._render("predicates", predicates)
+        funcs_str = self._render("functions", functions)
+
+        prompt = PromptTemplate.of(prompt_template).render(
+            domain_desc=domain_desc,
+            types=types_str,
+            constants=const_str,
+            predicates=preds_str,
+            functions=funcs_str,
+            strict=False,
         )
 
-        prompt = (
-            prompt_template.replace("{domain_desc}", domain_desc)
-            .replace("{types}", types_str)
-            .replace("{constants}", const_str)
-            .replace("{predicates}", preds_str)
-            .replace("{functions}", funcs_str)
-        )
-
-        # iterate through attempts in case of extraction failure
-        for attempt in range(max_retries):
-            try:
-                model.reset_tokens()
-                llm_output = model.query(prompt=prompt)
-
-                # extract functions from response
-                functions = parse_functions(llm_output=llm_output)
-
-                # run syntax validation if applicable
-                validation_info = (True, "All validations passed.")
-                if syntax_validator:
-                    for error_type in syntax_validator.error_types:
-                        validator = getattr(syntax_validator, f"{error_type}", None)
-                        if not callable(validator):
-                            continue
-
-                        # dispatch based on expected arguments
-                        if error_type == "validate_header":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_duplicate_headers":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_unsupported_keywords":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_format_functions":
-                            validation_info = validator(functions, types)
-
-                        if not validation_info[0]:
-                            return functions, llm_output, validation_info
-
-                return functions, llm_output, validation_info
-
-            except Exception as e:
-                print(
-                    f"Error encountered during attempt {attempt + 1}/{max_retries}: {e}. "
-                    f"\nLLM Output: \n\n{llm_output if 'llm_output' in locals() else 'None'}\n\n Retrying..."
+        # parse and validate LLM output, retried via `self.retry_policy` on failure
+        def handle(llm_output: str):
+            # extract functions from response
+            functions = parse_functions(llm_output=llm_output)
+
+            # run syntax validation if applicable, collecting violations of every check
+            validation_info = (True, "All validations passed.")
+            if syntax_validator:
+                validation_info = ValidationPipeline.of(syntax_validator).validate(
+                    llm_output=llm_output,
+                    new_functions=functions,
+                    types=types,
                 )
-                time.sleep(2)  # add a delay before retrying
 
-        raise RuntimeError("Max retries exceeded. Failed to extract functions.")
+            return functions, llm_output, validation_info
+
+        return self.retry_policy.run(
+            model, prompt, handle, max_retries, "Max retries exceeded. Failed to extract functions."
+        )
 
     @require_llm
     def extract_nl_actions(
@@ -516,39 +484,32 @@ class DomainBuilder:
             llm_output (str): the raw string BaseLLM response
         """
 
-        types_str = pretty_print_dict(types) if types else "No types provided."
+        types_str = self._render("types", types)
         nl_act_str = (
             "\n".join(f" - {name}: {desc}" for name, desc in nl_actions.items())
             if nl_actions
             else "No actions provided."
         )
 
-        prompt = (
-            prompt_template.replace("{domain_desc}", domain_desc)
-            .replace("{types}", types_str)
-            .replace("{nl_actions}", nl_act_str)
+        prompt = PromptTemplate.of(prompt_template).render(
+            domain_desc=domain_desc,
+            types=types_str,
+            nl_actions=nl_act_str,
+            strict=False,
         )
 
-        # iterate through attempts in case of extraction failure
-        for attempt in range(max_retries):
-            try:
-                model.reset_tokens()
-                llm_output = model.query(prompt=prompt)
-
-                # extract respective nl actions from response
-                nl_actions = parse_types(llm_output=llm_output, heading="ACTIONS")
+        # parse and validate LLM output, retried via `self.retry_policy` on failure
+        def handle(llm_output: str):
+            # extract respective nl actions from response
+            nl_actions = parse_types(llm_output=llm_output, heading="ACTIONS")
 
-                if nl_actions is not None:
-                    return nl_actions, llm_output
+            if nl_actions is None:
+                raise ValueError("No actions found in LLM output.")
+            return nl_actions, llm_output
 
-            except Exception as e:
-                print(
-                    f"Error encountered during attempt {attempt + 1}/{max_retries}: {e}. "
-                    f"\nLLM Output: \n\n{llm_output if 'llm_output' in locals() else 'None'}\n\n Retrying..."
-                )
-                time.sleep(2)  # add a delay before retrying
-
-        raise RuntimeError("Max retries exceeded. Failed to extract NL actions.")
+        return self.retry_policy.run(
+            model, prompt, handle, max_retries, "Max retries exceeded. Failed to extract NL actions."
+        )
 
     @require_llm
     def formalize_pddl_action(
@@ -565,6 +526,7 @@ class DomainBuilder:
         functions: list[Function] | None = None,
         extract_new_preds=False,
         syntax_validator: SyntaxValidator = None,
+        auto_fix: bool = False,
         max_retries: int = 3,
     ) -> tuple[Action, list[Predicate], str, tuple[bool, str]]:
         """
@@ -584,6 +546,7 @@ class DomainBuilder:
             functions (list[Function]): list of current functions in specification, defaults to None
             extract_new_preds (bool): flag for parsing new predicates generated from action, defaults to False
             syntax_validator (SyntaxValidator): syntax checker for generated actions
+            auto_fix (bool): apply rule-based fixes (`l2p/utils/pddl_fixer.py`) before validation, defaults to False
             max_retries (int): max # of retries if failure occurs
 
         Returns:
@@ -598,91 +561,54 @@ class DomainBuilder:
             if action_list
             else "No other actions provided."
         )
-        types_str = pretty_print_dict(types) if types else "No types provided."
-        const_str = (
-            format_constants(constants) if constants else "No constants provided."
-        )
-        preds_str = (
-            "\n".join([f"{pred['raw']}" for pred in predicates])
-            if predicates
-            else "No predicates provided."
-        )
-        funcs_str = (
-            "\n".join([f"{func['raw']}" for func in functions])
-            if functions
-            else "No functions provided."
+        types_str = self._render("types", types)
+        const_str = self._render("constants", constants)
+        preds_str = self._render("predicates", predicates)
+        funcs_str = self._render("functions", functions)
+
+        prompt = PromptTemplate.of(prompt_template).render(
+            domain_desc=domain_desc,
+            action_list=act_list_str,
+            action_name=action_name,
+            action_desc=action_desc or "No description available.",
+            types=types_str,
+            constants=const_str,
+            predicates=preds_str,
+            functions=funcs_str,
+            strict=False,
         )
 
-        prompt = (
-            prompt_template.replace("{domain_desc}", domain_desc)
-            .replace("{action_list}", act_list_str)
-            .replace("{action_name}", action_name)
-            .replace("{action_desc}", action_desc or "No description available.")
-            .replace("{types}", types_str)
-            .replace("{constants}", const_str)
-            .replace("{predicates}", preds_str)
-            .replace("{functions}", funcs_str)
-        )
+        # parse and validate LLM output, retried via `self.retry_policy` on failure
+        def handle(llm_output: str):
+            if auto_fix:
+                llm_output, changes = fix_action_output(llm_output)
+                self.fix_log.extend(changes)
 
-        # iterate through attempts in case of extraction failure
-        for attempt in range(max_retries):
-            try:
-                model.reset_tokens()
-                llm_output = model.query(prompt=prompt)
+            # parse LLM output into action and predicates
+            action = parse_action(llm_output=llm_output, action_name=action_name)
 
-                # parse LLM output into action and predicates
-                action = parse_action(llm_output=llm_output, action_name=action_name)
-
-                if extract_new_preds:
-                    new_predicates = parse_new_predicates(llm_output=llm_output)
-                else:
-                    new_predicates = []
-
-                # run syntax validation if applicable
-                validation_info = (True, "All validations passed.")
-                if syntax_validator:
-                    for error_type in syntax_validator.error_types:
-                        validator = getattr(syntax_validator, f"{error_type}", None)
-                        if not callable(validator):
-                            continue
-
-                        # dispatch based on expected arguments
-                        if error_type == "validate_header":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_duplicate_headers":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_unsupported_keywords":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_params":
-                            validation_info = validator(action["params"], types)
-                        elif error_type == "validate_duplicate_predicates":
-                            validation_info == validator(predicates, new_predicates)
-                        elif error_type == "validate_types_predicates":
-                            validation_info = validator(new_predicates, types)
-                        elif error_type == "validate_format_predicates":
-                            validation_info = validator(new_predicates, types)
-                        elif error_type == "validate_usage_action":
-                            validation_info = validator(
-                                llm_output,
-                                predicates,
-                                types,
-                                functions,
-                                extract_new_preds,
-                            )
-
-                        if not validation_info[0]:
-                            return action, new_predicates, llm_output, validation_info
-
-                return action, new_predicates, llm_output, validation_info
-
-            except Exception as e:
-                print(
-                    f"Error on attempt {attempt + 1}/{max_retries}: {e}\n"
-                    f"LLM Output:\n{llm_output if 'llm_output' in locals() else 'None'}\nRetrying...\n"
+            if extract_new_preds:
+                new_predicates = parse_new_predicates(llm_output=llm_output)
+            else:
+                new_predicates = []
+
+            # run syntax validation if applicable, collecting violations of every check
+            validation_info = (True, "All validations passed.")
+            if syntax_validator:
+                validation_info = ValidationPipeline.of(syntax_validator).validate(
+                    llm_output=llm_output,
+                    action=action,
+                    new_predicates=new_predicates,
+                    types=types,
+                    predicates=predicates,
+                    functions=functions,
                 )
-                time.sleep(2)
 
-        raise RuntimeError("Max retries exceeded. Failed to extract PDDL action.")
+            return action, new_predicates, llm_output, validation_info
+
+        return self.retry_policy.run(
+            model, prompt, handle, max_retries, "Max retries exceeded. Failed to extract PDDL action."
+        )
 
     # NOTE: This function is experimental and may be subject to change in future versions.
     @require_llm
@@ -725,85 +651,66 @@ class DomainBuilder:
             if action_list
             else "No other actions provided."
         )
-        types_str = pretty_print_dict(types) if types else "No types provided."
-        const_str = (
-            format_constants(constants) if constants else "No constants provided."
-        )
-        preds_str = (
-            "\n".join([f"{pred['raw']}" for pred in predicates])
-            if predicates
-            else "No predicates provided."
-        )
-        funcs_str = (
-            "\n".join([f"{func['raw']}" for func in functions])
-            if functions
-            else "No functions provided."
+        types_str = self._render("types", types)
+        const_str = self._render("constants", constants)
+        preds_str = self._render("predicates", predicates)
+        funcs_str = self._render("functions", functions)
+
+        prompt = PromptTemplate.of(prompt_template).render(
+            domain_desc=domain_desc,
+            action_list=act_list_str,
+            types=types_str,
+            constants=const_str,
+            predicates=preds_str,
+            functions=funcs_str,
+            strict=False,
         )
 
-        prompt = (
-            prompt_template.replace("{domain_desc}", domain_desc)
-            .replace("{action_list}", act_list_str)
-            .replace("{types}", types_str)
-            .replace("{constants}", const_str)
-            .replace("{predicates}", preds_str)
-            .replace("{functions}", funcs_str)
-        )
+        # parse and validate LLM output, retried via `self.retry_policy` on failure
+        def handle(llm_output: str):
+            # extract respective types from response
+            raw_actions = llm_output.split("## NEXT ACTION")
+
+            actions = []
+            for i in raw_actions:
+                # define the regex patterns
+                action_pattern = re.compile(r"\[([^\]]+)\]")
+                rest_of_string_pattern = re.compile(r"\[([^\]]+)\](.*)", re.DOTALL)
+
+                # search for the action name
+                action_match = action_pattern.search(i)
+                action_name = action_match.group(1) if action_match else None
 
-        # iterate through attempts in case of extraction failure
-        for attempt in range(max_retries):
+                # extract the rest of the string
+                rest_match = rest_of_string_pattern.search(i)
+                rest_of_string = rest_match.group(2).strip() if rest_match else None
+
+                actions.append(
+                    parse_action(llm_output=rest_of_string, action_name=action_name)
+                )
+
+            # if user queries predicate creation via LLM
             try:
-                model.reset_tokens()
-
-                llm_output = model.query(prompt=prompt)
-
-                # extract respective types from response
-                raw_actions = llm_output.split("## NEXT ACTION")
-
-                actions = []
-                for i in raw_actions:
-                    # define the regex patterns
-                    action_pattern = re.compile(r"\[([^\]]+)\]")
-                    rest_of_string_pattern = re.compile(r"\[([^\]]+)\](.*)", re.DOTALL)
-
-                    # search for the action name
-                    action_match = action_pattern.search(i)
-                    action_name = action_match.group(1) if action_match else None
-
-                    # extract the rest of the string
-                    rest_match = rest_of_string_pattern.search(i)
-                    rest_of_string = rest_match.group(2).strip() if rest_match else None
-
-                    actions.append(
-                        parse_action(llm_output=rest_of_string, action_name=action_name)
-                    )
-
-                # if user queries predicate creation via LLM
-                try:
-                    if extract_new_preds:
-                        new_predicates = parse_new_predicates(llm_output)
-                    else:
-                        new_predicates = []
-
-                    if predicates:
-                        new_predicates = [
-                            pred
-                            for pred in new_predicates
-                            if pred["name"] not in [p["name"] for p in predicates]
-                        ]  # remove re-defined predicates
-                except Exception as e:
-                    print(f"No new predicates: {e}")
-                    new_predicates = None
-
-                return actions, new_predicates, llm_output
+                if extract_new_preds:
+                    new_predicates = parse_new_predicates(llm_output)
+                else:
+                    new_predicates = []
 
+                if predicates:
+                    new_predicates = [
+                        pred
+                        for pred in new_predicates
+                        if pred["name"] not in [p["name"] for p in predicates]
+                    ]  # remove re-defined predicates
             except Exception as e:
-                print(
-                    f"Error on attempt {attempt + 1}/{max_retries}: {e}\n"
-                    f"LLM Output:\n{llm_output if 'llm_output' in locals() else 'None'}\nRetrying...\n"
-                )
-                time.sleep(2)
+                print(f"No new predicates: {e}")
+                new_predicates = None
 
-        raise RuntimeError("Max retries exceeded. Failed to extract PDDL action.")
+            return actions, new_predicates, llm_output
+
+        return self.retry_policy.run(
+            model, prompt, handle, max_retries, "Max retries exceeded. Failed to extract PDDL action."
+        )
 
     @require_llm
     def formalize_parameters(
@@ -837,55 +744,36 @@ class DomainBuilder:
             validation_info (tuple[bool,str]): validation info containing pass flag and error message
         """
 
-        types_str = pretty_print_dict(types) if types else "No types provided."
+        types_str = self._render("types", types)
 
-        prompt = (
-            prompt_template.replace("{domain_desc}", domain_desc)
-            .replace("{action_name}", action_name)
-            .replace("{action_desc}", action_desc or "No description available.")
-            .replace("{types}", types_str)
+        prompt = PromptTemplate.of(prompt_template).render(
+            domain_desc=domain_desc,
+            action_name=action_name,
+            action_desc=action_desc or "No description available.",
+            types=types_str,
+            strict=False,
         )
 
-        # iterate through attempts in case of extraction failure
-        for attempt in range(max_retries):
-            try:
-                model.reset_tokens()
-                llm_output = model.query(prompt=prompt)  # get BaseLLM response
-
-                # extract respective types from response
-                param, param_raw = parse_params(llm_output=llm_output)
-
-                # run syntax validation if applicable
-                validation_info = (True, "All validations passed.")
-                if syntax_validator:
-                    for error_type in syntax_validator.error_types:
-                        validator = getattr(syntax_validator, f"{error_type}", None)
-                        if not callable(validator):
-                            continue
-
-                        # dispatch based on expected arguments
-                        if error_type == "validate_header":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_duplicate_headers":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_unsupported_keywords":
-                            validation_info = validator(param_raw)
-                        elif error_type == "validate_params":
-                            validation_info = validator(param, types)
-
-                        if not validation_info[0]:
-                            return param, param_raw, llm_output, validation_info
-
-                return param, param_raw, llm_output, validation_info
-
-            except Exception as e:
-                print(
-                    f"Error encountered during attempt {attempt + 1}/{max_retries}: {e}. "
-                    f"\nLLM Output: \n\n{llm_output if 'llm_output' in locals() else 'None'}\n\n Retrying..."
+        # parse and validate LLM output, retried via `self.retry_policy` on failure
+        def handle(llm_output: str):
+            # extract respective types from response
+            param, param_raw = parse_params(llm_output=llm_output)
+
+            # run syntax validation if applicable, collecting violations of every check
+            validation_info = (True, "All validations passed.")
+            if syntax_validator:
+                validation_info = ValidationPipeline.of(syntax_validator).validate(
+                    llm_output=llm_output,
+                    keyword_text=param_raw,
+                    params=param,
+                    types=types,
                 )
-                time.sleep(2)  # add a delay before retrying
 
-        raise RuntimeError("Max retries exceeded. Failed to extract parameters.")
+            return param, param_raw, llm_output, validation_info
+
+        return self.retry_policy.run(
+            model, prompt, handle, max_retries, "Max retries exceeded. Failed to extract parameters."
+        )
 
     @require_llm
     def formalize_preconditions(
@@ -930,92 +818,52 @@ class DomainBuilder:
         """
 
         params_str = format_params(params) if params else "No parameters provided."
-        types_str = pretty_print_dict(types) if types else "No types provided."
-        const_str = (
-            format_constants(constants) if constants else "No constants provided."
+        types_str = self._render("types", types)
+        const_str = self._render("constants", constants)
+        preds_str = self._render("predicates", predicates)
+        funcs_str = self._render("functions", functions)
+
+        prompt = PromptTemplate.of(prompt_template).render(
+            domain_desc=domain_desc,
+            action_name=action_name,
+            action_desc=action_desc or "No description available.",
+            parameters=params_str,
+            types=types_str,
+            constants=const_str,
+            predicates=preds_str,
+            functions=funcs_str,
+            strict=False,
         )
-        preds_str = (
-            "\n".join([f"{pred['raw']}" for pred in predicates])
-            if predicates
-            else "No predicates provided."
-        )
-        funcs_str = (
-            "\n".join([f"{func['raw']}" for func in functions])
-            if functions
-            else "No functions provided."
-        )
-
-        prompt = (
-            prompt_template.replace("{domain_desc}", domain_desc)
-            .replace("{action_name}", action_name)
-            .replace("{action_desc}", action_desc or "No description available.")
-            .replace("{parameters}", params_str)
-            .replace("{types}", types_str)
-            .replace("{constants}", const_str)
-            .replace("{predicates}", preds_str)
-            .replace("{functions}", funcs_str)
-        )
-
-        # iterate through attempts in case of extraction failure
-        for attempt in range(max_retries):
-            try:
-                model.reset_tokens()
-                llm_output = model.query(prompt=prompt)  # get BaseLLM response
 
-                # extract respective preconditions from response
-                preconditions = parse_preconditions(llm_output=llm_output)
+        # parse and validate LLM output, retried via `self.retry_policy` on failure
+        def handle(llm_output: str):
+            # extract respective preconditions from response
+            preconditions = parse_preconditions(llm_output=llm_output)
 
-                if extract_new_preds:
-                    new_predicates = parse_new_predicates(llm_output=llm_output)
-                else:
-                    new_predicates = None
-
-                # run syntax validation if applicable
-                validation_info = (True, "All validations passed.")
-                if syntax_validator:
-                    for error_type in syntax_validator.error_types:
-                        validator = getattr(syntax_validator, f"{error_type}", None)
-                        if not callable(validator):
-                            continue
-
-                        # dispatch based on expected arguments
-                        if error_type == "validate_header":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_duplicate_headers":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_unsupported_keywords":
-                            validation_info = validator(preconditions)
-                        elif error_type == "validate_duplicate_predicates":
-                            validation_info == validator(predicates, new_predicates)
-                        elif error_type == "validate_pddl_action":
-                            all_predicates = predicates
-                            all_predicates.extend(new_predicates)
-                            validation_info = validator(
-                                preconditions,
-                                all_predicates,
-                                params,
-                                types,
-                                "preconditions",
-                            )
-
-                        if not validation_info[0]:
-                            return (
-                                preconditions,
-                                new_predicates,
-                                llm_output,
-                                validation_info,
-                            )
-
-                return preconditions, new_predicates, llm_output, validation_info
-
-            except Exception as e:
-                print(
-                    f"Error encountered during attempt {attempt + 1}/{max_retries}: {e}. "
-                    f"\nLLM Output: \n\n{llm_output if 'llm_output' in locals() else 'None'}\n\n Retrying..."
+            if extract_new_preds:
+                new_predicates = parse_new_predicates(llm_output=llm_output)
+            else:
+                new_predicates = None
+
+            # run syntax validation if applicable, collecting violations of every check
+            validation_info = (True, "All validations passed.")
+            if syntax_validator:
+                validation_info = ValidationPipeline.of(syntax_validator).validate(
+                    llm_output=llm_output,
+                    keyword_text=preconditions,
+                    preconditions=preconditions,
+                    action_params=params,
+                    new_predicates=new_predicates,
+                    types=types,
+                    predicates=predicates,
+                    functions=functions,
                 )
-                time.sleep(2)  # add a delay before retrying
 
-        raise RuntimeError("Max retries exceeded. Failed to extract preconditions.")
+            return preconditions, new_predicates, llm_output, validation_info
+
+        return self.retry_policy.run(
+            model, prompt, handle, max_retries, "Max retries exceeded. Failed to extract preconditions."
+        )
 
     @require_llm
     def formalize_effects(
@@ -1062,84 +910,53 @@ class DomainBuilder:
         """
 
         params_str = format_params(params) if params else "No parameters provided."
-        types_str = pretty_print_dict(types) if types else "No types provided."
-        const_str = (
-            format_constants(constants) if constants else "No constants provided."
-        )
-        preds_str = (
-            "\n".join([f"{pred['raw']}" for pred in predicates])
-            if predicates
-            else "No predicates provided."
-        )
-        funcs_str = (
-            "\n".join([f"{func['raw']}" for func in functions])
-            if functions
-            else "No functions provided."
-        )
-
-        prompt = (
-            prompt_template.replace("{domain_desc}", domain_desc)
-            .replace("{action_name}", action_name)
-            .replace("{action_desc}", action_desc or "No description available.")
-            .replace("{parameters}", params_str)
-            .replace("{preconditions}", preconditions or "No precondition provided.")
-            .replace("{types}", types_str)
-            .replace("{constants}", const_str)
-            .replace("{predicates}", preds_str)
-            .replace("{functions}", funcs_str)
+        types_str = self._render("types", types)
+        const_str = self._render("constants", constants)
+        preds_str = self._render("predicates", predicates)
+        funcs_str = self._render("functions", functions)
+
+        prompt = PromptTemplate.of(prompt_template).render(
+            domain_desc=domain_desc,
+            action_name=action_name,
+            action_desc=action_desc or "No description available.",
+            parameters=params_str,
+            preconditions=preconditions or "No precondition provided.",
+            types=types_str,
+            constants=const_str,
+            predicates=preds_str,
+            functions=funcs_str,
+            strict=False,
         )
 
-        # iterate through attempts in case of extraction failure
-        for attempt in range(max_retries):
-            try:
-                model.reset_tokens()
-                llm_output = model.query(prompt=prompt)  # get BaseLLM response
+        # parse and validate LLM output, retried via `self.retry_policy` on failure
+        def handle(llm_output: str):
+            # extract respective effects from response
+            effects = parse_effects(llm_output=llm_output)
 
-                # extract respective effects from response
-                effects = parse_effects(llm_output=llm_output)
-
-                if extract_new_preds:
-                    new_predicates = parse_new_predicates(llm_output=llm_output)
-                else:
-                    new_predicates = None
-
-                # run syntax validation if applicable
-                validation_info = (True, "All validations passed.")
-                if syntax_validator:
-                    for error_type in syntax_validator.error_types:
-                        validator = getattr(syntax_validator, f"{error_type}", None)
-                        if not callable(validator):
-                            continue
-
-                        # dispatch based on expected arguments
-                        if error_type == "validate_header":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_duplicate_headers":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_unsupported_keywords":
-                            validation_info = validator(effects)
-                        elif error_type == "validate_duplicate_predicates":
-                            validation_info == validator(predicates, new_predicates)
-                        elif error_type == "validate_pddl_action":
-                            all_predicates = predicates
-                            all_predicates.extend(new_predicates)
-                            validation_info = validator(
-                                effects, all_predicates, params, types, "effects"
-                            )
-
-                        if not validation_info[0]:
-                            return effects, new_predicates, llm_output, validation_info
-
-                return effects, new_predicates, llm_output, validation_info
-
-            except Exception as e:
-                print(
-                    f"Error encountered during attempt {attempt + 1}/{max_retries}: {e}. "
-                    f"\nLLM Output: \n\n{llm_output if 'llm_output' in locals() else 'None'}\n\n Retrying..."
+            if extract_new_preds:
+                new_predicates = parse_new_predicates(llm_output=llm_output)
+            else:
+                new_predicates = None
+
+            # run syntax validation if applicable, collecting violations of every check
+            validation_info = (True, "All validations passed.")
+            if syntax_validator:
+                validation_info = ValidationPipeline.of(syntax_validator).validate(
+                    llm_output=llm_output,
+                    keyword_text=effects,
+                    effects=effects,
+                    action_params=params,
+                    new_predicates=new_predicates,
+                    types=types,
+                    predicates=predicates,
+                    functions=functions,
                 )
-                time.sleep(2)  # add a delay before retrying
 
-        raise RuntimeError("Max retries exceeded. Failed to extract effects.")
+            return effects, new_predicates, llm_output, validation_info
+
+        return self.retry_policy.run(
+            model, prompt, handle, max_retries, "Max retries exceeded. Failed to extract effects."
+        )
 
     # NOTE: This function is experimental and may be subject to change in future versions.
     @require_llm
@@ -1176,64 +993,39 @@ class DomainBuilder:
 
         spec_results = {}  # results dictionary of top-level PDDL domain specifications
 
-        prompt = prompt_template.replace("{domain_desc}", domain_desc)
+        prompt = PromptTemplate.of(prompt_template).render(domain_desc=domain_desc, strict=False)
 
-        # iterate through attempts in case of extraction failure
-        for attempt in range(max_retries):
-            try:
-                model.reset_tokens()
-                llm_output = model.query(prompt=prompt)
-
-                if formalize_types:
-                    types = parse_type_hierarchy(llm_output=llm_output)
-                if formalize_constants:
-                    constants = parse_constants(llm_output=llm_output)
-                if formalize_predicates:
-                    predicates = parse_new_predicates(llm_output=llm_output)
-                if formalize_functions:
-                    functions = parse_functions(llm_output=llm_output)
-
-                spec_results["types"] = types
-                spec_results["constants"] = constants
-                spec_results["predicates"] = predicates
-                spec_results["functions"] = functions
-
-                # run syntax validation if applicable
-                validation_info = (True, "All validations passed.")
-                if syntax_validator:
-                    for error_type in syntax_validator.error_types:
-                        validator = getattr(syntax_validator, f"{error_type}", None)
-                        if not callable(validator):
-                            continue
-
-                        # dispatch based on expected arguments
-                        if error_type == "validate_format_types":
-                            validation_info = validator(types)
-                        elif error_type == "validate_cyclic_types":
-                            validation_info = validator(types)
-                        elif error_type == "validate_constant_types":
-                            validation_info = validator(constants, types)
-                        elif error_type == "validate_types_predicates":
-                            validation_info = validator(predicates, types)
-                        elif error_type == "validate_format_predicates":
-                            validation_info = validator(predicates, types)
-                        elif error_type == "validate_format_functions":
-                            validation_info = validator(functions, types)
-
-                        if not validation_info[0]:
-                            return spec_results, llm_output, validation_info
-
-                return spec_results, llm_output, validation_info
+        # parse and validate LLM output, retried via `self.retry_policy` on failure
+        def handle(llm_output: str):
+            if formalize_types:
+                types = parse_type_hierarchy(llm_output=llm_output)
+            if formalize_constants:
+                constants = parse_constants(llm_output=llm_output)
+            if formalize_predicates:
+                predicates = parse_new_predicates(llm_output=llm_output)
+            if formalize_functions:
+                functions = parse_functions(llm_output=llm_output)
 
-            except Exception as e:
-                print(
-                    f"Error encountered during attempt {attempt + 1}/{max_retries}: {e}. "
-                    f"\nLLM Output: \n\n{llm_output if 'llm_output' in locals() else 'None'}\n\n Retrying..."
+            spec_results["types"] = types
+            spec_results["constants"] = constants
+            spec_results["predicates"] = predicates
+            spec_results["functions"] = functions
+
+            # run syntax validation if applicable, collecting violations of every check
+            validation_info = (True, "All validations passed.")
+            if syntax_validator:
+                validation_info = ValidationPipeline.of(syntax_validator).validate(
+                    new_types=types,
+                    constants=constants,
+                    new_predicates=predicates,
+                    new_functions=functions,
+                    types=types,
                 )
-                time.sleep(2)  # add a delay before retrying
 
-        raise RuntimeError(
-            "Max retries exceeded. Failed to extract domain specification."
+            return spec_results, llm_output, validation_info
+
+        return self.retry_policy.run(
+            model, prompt, handle, max_retries, "Max retries exceeded. Failed to extract domain specification."
         )
 
     """Delete functions"""
@@ -1272,6 +1064,8 @@ class DomainBuilder:
         if self.type_hierarchy is not None:
             self.type_hierarchy = remove_and_promote(self.type_hierarchy)
 
+        self._type_index = None
+
     def delete_constants(self, name: str):
         """Deletes specific constant from current specification"""
         if self.constants is not None:
@@ -1281,50 +1075,52 @@ class DomainBuilder:
 
     def delete_predicate(self, name: str):
         """Deletes specific predicate from current specification"""
-        if self.predicates is not None:
-            self.predicates = [
-                predicate for predicate in self.predicates if predicate["name"] != name
-            ]
+        self.predicates.pop(name, None)
 
     def delete_function(self, name: str):
         """Deletes specific function from current specification"""
-        if self.functions is not None:
-            self.functions = [
-                function for function in self.functions if function["name"] != name
-            ]
+        self.functions.pop(name, None)
 
     def delete_pddl_action(self, name: str):
         """Deletes specific PDDL action from current specification"""
-        if self.pddl_actions is not None:
-            self.pddl_actions = [
-                action for action in self.pddl_actions if action["name"] != name
-            ]
+        self.pddl_actions.pop(name, None)
 
     """Set functions"""
 
     def set_types(self, types: dict[str, str]):
         """Sets types for current specification"""
         self.types = types
+        self._type_index = None
 
     def set_type_hierarchy(self, type_hierarchy: list[dict[str, str]]):
         """Sets type hierarchy for current specification"""
         self.type_hierarchy = type_hierarchy
+        self._type_index = None
 
     def set_constants(self, constants: dict[str, str]):
         """Sets constants for current specification"""
         self.constants = constants
 
     def set_predicate(self, predicate: Predicate):
-        """Appends a predicate for current specification"""
-        self.predicates.append(predicate)
+        """
+        Appends a predicate for current specification. A predicate whose name is already defined
+        replaces the existing one in place instead of being appended as a duplicate.
+        """
+        self.predicates.add(predicate)
 
     def set_function(self, function: Function):
-        """Appends a function for current specification"""
-        self.functions.append(function)
+        """
+        Appends a function for current specification. A function whose name is already defined
+        replaces the existing one in place instead of being appended as a duplicate.
+        """
+        self.functions.add(function)
 
     def set_pddl_action(self, pddl_action: Action):
-        """Appends a PDDL action for current specification"""
-        self.pddl_actions.append(pddl_action)
+        """
+        Appends a PDDL action for current specification. An action whose name is already defined
+        replaces the existing one in place instead of being appended as a duplicate.
+        """
+        self.pddl_actions.add(pddl_action)
 
     """Get functions"""
 
@@ -1336,21 +1132,77 @@ class DomainBuilder:
         """Returns type hierarchy from current specification"""
         return self.type_hierarchy
 
+    def get_type_index(self) -> TypeIndex:
+        """
+        Returns the `TypeIndex` of the current type hierarchy (or flat types), built once and
+        reused until types change. Pass it as `types` to validators to avoid re-flattening.
+        """
+        types = self.type_hierarchy or self.types
+        if self._type_index is None or self._type_index_source is not types:
+            self._type_index = TypeIndex(types)
+            self._type_index_source = types  # rebuilt if types are reassigned directly
+        return self._type_index
+
+    def get_usage_index(self) -> UsageIndex:
+        """
+        Returns the `UsageIndex` of current actions and predicates. Only actions/predicates
+        changed since the last call are re-indexed (see `NamedCollection.changed_keys`); it is
+        rebuilt if the collections were reassigned.
+        """
+        actions, predicates = self.pddl_actions, self.predicates
+        source = self._usage_index_source
+        index = self._usage_index
+
+        changed = None
+        if index is not None and source[0] is actions and source[2] is predicates:
+            changed = (actions.changed_keys(source[1]), predicates.changed_keys(source[3]))
+
+        if changed is None or None in changed:
+            index = UsageIndex(actions=actions, predicates=predicates)
+        else:
+            for name in changed[0]:
+                if name in actions.keys():
+                    index.add_action(actions.get(name))
+                else:
+                    index.remove_action(name)
+            for name in changed[1]:
+                if name in predicates.keys():
+                    index.add_predicate(predicates.get(name))
+                else:
+                    index.remove_predicate(name)
+
+        self._usage_index = index
+        self._usage_index_source = (actions, actions.version, predicates, predicates.version)
+        return index
+
+    def get_prompt_fragments(self) -> dict[str, str]:
+        """
+        Returns the {types}, {constants}, {predicates} and {functions} prompt fragments of the
+        current specification, rendered through `self.render_cache` (i.e. for `PromptBuilder.set_fragments`).
+        """
+        sources = {
+            "types": self.type_hierarchy or self.types,
+            "constants": self.constants,
+            "predicates": self.predicates,
+            "functions": self.functions,
+        }
+        return {name: self._render(name, source) for name, source in sources.items()}
+
     def get_constants(self) -> dict[str, str]:
         """Returns constants from current specification"""
         return self.constants
 
     def get_predicates(self) -> list[Predicate]:
-        """Returns predicates from current specification"""
-        return self.predicates
+        """Returns predicates from current specification (as a new list, edit them with `set_predicate`/`delete_predicate`)"""
+        return list(self.predicates)
 
     def get_functions(self) -> list[Function]:
-        """Returns functions from current specification"""
-        return self.functions
+        """Returns functions from current specification (as a new list, edit them with `set_function`/`delete_function`)"""
+        return list(self.functions)
 
     def get_pddl_actions(self) -> list[Action]:
-        """Returns PDDL actions from current specification"""
-        return self.pddl_actions
+        """Returns PDDL actions from current specification (as a new list, edit them with `set_pddl_action`/`delete_pddl_action`)"""
+        return list(self.pddl_actions)
 
     def generate_requirements(
         self,
@@ -1459,11 +1311,11 @@ class DomainBuilder:
         desc += f"(define (domain {domain_name})\n"
         desc += indent(string=f"(:requirements\n   {' '.join(requirements)})", level=1)
         if types:
-            types_str = format_types_to_string(types)
+            types_str = self._render("pddl_types", types)
             desc += f"\n\n   (:types \n{indent(string=types_str, level=2)}\n   )"
 
         if constants:
-            const_str = format_constants(constants)
+            const_str = self._render("pddl_constants", constants)
             desc += f"\n\n   (:constants \n{indent(string=const_str, level=2)}\n   )"
 
         if not predicates:
@@ -1471,11 +1323,11 @@ class DomainBuilder:
                 "[WARNING]: Domain has no predicates. This may cause planners to reject the domain or behave unexpectedly."
             )
         else:
-            pred_str = format_expression(predicates)
+            pred_str = self._render("pddl_predicates", predicates)
             desc += f"\n\n   (:predicates \n{indent(string=pred_str, level=2)}\n   )"
 
         if functions:
-            func_str = format_expression(functions)
+            func_str = self._render("pddl_functions", functions)
             desc += f"\n\n   (:functions \n{indent(string=func_str, level=2)}\n   )"
 
         if not actions:
@@ -1483,7 +1335,7 @@ class DomainBuilder:
                 "[WARNING]: Domain has no actions. The planner will not be able to generate any plan unless the goal is already satisfied."
             )
         else:
-            desc += format_actions(actions)
+            desc += self._render("pddl_actions", actions)
         desc += "\n)"
         desc = desc.replace("AND", "and").replace("OR", "or")
         return desc
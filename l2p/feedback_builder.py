@@ -6,8 +6,14 @@ It supports multiple feedback strategies including human-written or LLM-generate
 
 NOTE: is worth noting that the usefulness of LLM feedback is experimental. It is inspired by the NL2PLAN framework
     (Gestrin et al., 2024) and is designed to provide feedback to LLM output w/o human intervention.
+
+With `precheck=True`, LLM feedback calls are preceded by static checks (`SyntaxValidator` checks and
+structural heuristics such as unused types/predicates, empty effects or unused objects). Issues found
+are returned as feedback without querying the LLM; outputs that pass are, by default, accepted
+without an LLM call as well (`skip_clean`). See `get_stats()` for skip rates.
 """
 
+from typing import Callable
 from collections import OrderedDict
 from .utils import *
 from .llm import BaseLLM, require_llm
@@ -19,6 +25,27 @@ class FeedbackBuilder:
         must provide their own implementation of using this feedback to revise outputs.
     """
 
+    def __init__(
+        self,
+        precheck: bool = False,
+        skip_clean: bool = True,
+        syntax_validator: SyntaxValidator | None = None,
+    ) -> None:
+        """
+        Initializes an L2P feedback builder object.
+
+        Args:
+            precheck (bool): run static checks before LLM feedback calls, defaults to False
+            skip_clean (bool): with `precheck`, accept outputs that pass all static checks without
+                querying the LLM, defaults to True
+            syntax_validator (SyntaxValidator): validator used by static checks, defaults to a new `SyntaxValidator`
+        """
+
+        self.precheck = precheck
+        self.skip_clean = skip_clean
+        self.syntax_validator = syntax_validator or SyntaxValidator()
+        self.stats = {"queries": 0, "skipped": 0, "shortcut": 0}
+
     @require_llm
     def get_feedback(
         self,
@@ -37,6 +64,7 @@ class FeedbackBuilder:
         elif feedback_type.lower() == "llm":
             model.reset_tokens()
             feedback_msg = model.query(prompt=feedback_template)
+            self.stats["queries"] += 1
         else:
             raise ValueError("Invalid feedback_type. Expected 'human' or 'llm'")
 
@@ -89,6 +117,225 @@ class FeedbackBuilder:
 
         return feedback
 
+    """Static pre-check functions"""
+
+    def run_precheck(
+        self, feedback_type: str, issues: Callable[[], list[str]]
+    ) -> tuple[bool, str] | None:
+        """
+        Runs static checks in place of an LLM feedback call (if `precheck` is enabled). If a check
+        raises (i.e. input the validator cannot process), the LLM feedback call is made instead.
+
+        Args:
+            feedback_type (str): type of feedback assistant - 'llm', 'human'
+            issues (Callable): returns list of issues found by static checks
+
+        Returns:
+            feedback (tuple[bool,str] | None): (no_fb, fb_msg) if the LLM call can be skipped, else None
+        """
+
+        if not self.precheck or feedback_type.lower() != "llm":
+            return None
+
+        try:
+            found = issues()
+        except Exception as e:
+            print(f"[WARNING] Static pre-check failed, falling back to LLM feedback: {e}")
+            return None
+
+        if found:
+            self.stats["shortcut"] += 1
+            return False, "### JUDGMENT\n```\n" + "\n\n".join(found) + "\n```"
+
+        if self.skip_clean:
+            self.stats["skipped"] += 1
+            return True, "### JUDGMENT\n```\nno feedback\n```"
+
+        return None
+
+    def _failed_checks(self, checks: list[Callable[[], tuple[bool, str]]]) -> list[str]:
+        """Returns messages of failed validator checks (exceptions of checks are propagated)"""
+        issues = []
+        for check in checks:
+            passed, msg = check()
+            if not passed:
+                issues.append(msg)
+        return issues
+
+    def precheck_types(
+        self,
+        types: dict[str, str] | list[dict[str, str]] = None,
+        predicates: list[Predicate] = None,
+        actions: list[Action] = None,
+    ) -> list[str]:
+        """
+        Static checks on :types - format, cycles and (if predicates and actions are given) unused types.
+
+        Args:
+            types (dict[str,str] | list[dict[str,str]]): PDDL types of current specification
+            predicates (list[Predicate]): PDDL predicates of current specification, defaults to None
+            actions (list[Action]): PDDL actions of current specification, defaults to None
+
+        Returns:
+            issues (list[str]): issues found
+        """
+
+        validator = self.syntax_validator
+        type_index = TypeIndex.of(types)
+        issues = self._failed_checks(
+            [
+                lambda: validator.validate_format_types(type_index),
+                lambda: validator.validate_cyclic_types(type_index),
+            ]
+        )
+
+        if type_index and predicates is not None and actions is not None:
+            used = prune_types(type_index, predicates, actions)
+            unused = [t for t in type_index.flat if t.split(" ")[0] not in used]
+            if unused:
+                issues.append(
+                    f"[WARNING]: Type(s) {unused} are not used by any predicate or action. Remove them or make use of them."
+                )
+
+        return issues
+
+    def precheck_predicates(
+        self,
+        predicates: list[Predicate] = None,
+        types: dict[str, str] | list[dict[str, str]] = None,
+        actions: list[Action] = None,
+    ) -> list[str]:
+        """
+        Static checks on predicates - format, types, duplicates and (if actions are given) unused predicates.
+
+        Args:
+            predicates (list[Predicate]): PDDL predicates of current specification
+            types (dict[str,str] | list[dict[str,str]]): PDDL types of current specification
+            actions (list[Action]): PDDL actions of current specification, defaults to None
+
+        Returns:
+            issues (list[str]): issues found
+        """
+
+        predicates = predicates or []
+        validator = self.syntax_validator
+        issues = self._failed_checks(
+            [
+                lambda: validator.validate_format_predicates(predicates, types),
+                lambda: validator.validate_types_predicates(predicates, types),
+            ]
+        )
+
+        names = [pred["name"] for pred in predicates]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            issues.append(f"[ERROR]: Predicate(s) {duplicates} are defined more than once.")
+
+        if actions is not None:
+            used = {pred["name"] for pred in prune_predicates(predicates, actions)}
+            unused = [name for name in names if name not in used]
+            if unused:
+                issues.append(
+                    f"[WARNING]: Predicate(s) {unused} are not used by any action. Remove them or make use of them."
+                )
+
+        return issues
+
+    def precheck_action(
+        self,
+        action: Action = None,
+        types: dict[str, str] | list[dict[str, str]] = None,
+        predicates: list[Predicate] = None,
+        functions: list[Function] = None,
+    ) -> list[str]:
+        """
+        Static checks on a PDDL action - parameters, precondition/effect usage and empty effects.
+
+        Args:
+            action (Action): current action specifications
+            types (dict[str,str] | list[dict[str,str]]): PDDL types of current specification
+            predicates (list[Predicate]): PDDL predicates of current specification
+            functions (list[Function]): PDDL functions of current specification
+
+        Returns:
+            issues (list[str]): issues found
+        """
+
+        if not action:
+            return ["[ERROR]: No action provided."]
+
+        validator = self.syntax_validator
+        predicates = predicates or []
+        issues = self._failed_checks(
+            [
+                lambda: validator.validate_params(action["params"], types),
+                lambda: validator.validate_pddl_action(
+                    action["preconditions"], predicates, action["params"], functions, types, part="preconditions"
+                ),
+                lambda: validator.validate_pddl_action(
+                    action["effects"], predicates, action["params"], functions, types, part="effects"
+                ),
+            ]
+        )
+
+        effects = "".join(action["effects"].split())
+        if effects in ("", "()", "(and)"):
+            issues.append(f"[ERROR]: Action `{action['name']}` has no effects.")
+
+        return issues
+
+    def precheck_task(
+        self,
+        objects: dict[str, str] = None,
+        initial: list[dict[str, str]] = None,
+        goal: list[dict[str, str]] = None,
+        types: dict[str, str] | list[dict[str, str]] = None,
+        predicates: list[Predicate] = None,
+        functions: list[Function] = None,
+    ) -> list[str]:
+        """
+        Static checks on task components - object types, initial/goal states and (if both initial and
+        goal states are given) objects never used in either.
+
+        Args:
+            objects (dict[str,str]): objects of current task specification
+            initial (list[dict[str,str]]): initial states of current task specification, defaults to None
+            goal (list[dict[str,str]]): goal states of current task specification, defaults to None
+            types (dict[str,str] | list[dict[str,str]]): PDDL types of current specification
+            predicates (list[Predicate]): PDDL predicates of current specification
+            functions (list[Function]): PDDL functions of current specification
+
+        Returns:
+            issues (list[str]): issues found
+        """
+
+        objects = objects or {}
+        validator = self.syntax_validator
+        checks = [lambda: validator.validate_task_objects(objects, types)]
+        state_index = StateIndex(objects, predicates=predicates, functions=functions)
+        for states, state_type in ((initial, "initial"), (goal, "goal")):
+            if states is not None:
+                checks.append(
+                    lambda states=states, state_type=state_type: validator.validate_task_states(
+                        states=states,
+                        objects=objects,
+                        state_type=state_type,
+                        collect_all=True,
+                        state_index=state_index,
+                    )
+                )
+        issues = self._failed_checks(checks)
+
+        if initial is not None and goal is not None:
+            used = {param for state in initial + goal for param in state["params"]}
+            unused = [obj for obj in objects if obj not in used]
+            if unused:
+                issues.append(
+                    f"[WARNING]: Object(s) {unused} are not used in the initial or goal state."
+                )
+
+        return issues
+
     @require_llm
     def type_feedback(
         self,
@@ -98,6 +345,8 @@ class FeedbackBuilder:
         feedback_type: str = "llm",
         llm_output: str = "",
         types: dict[str, str] | list[dict[str, str]] = None,
+        predicates: list[Predicate] = None,
+        actions: list[Action] = None,
     ) -> tuple[bool, str]:
         """
         Provides feedback to initial LLM output for :types.
@@ -109,18 +358,27 @@ class FeedbackBuilder:
             feedback_type (str): type of feedback assistant - 'llm', 'human'
             llm_output (str): original LLM output
             types (dict[str,str] | list[dict[str,str]]): PDDL types of current specification
+            predicates (list[Predicate]): used by static pre-check for unused types, defaults to None
+            actions (list[Action]): used by static pre-check for unused types, defaults to None
 
         Returns:
             no_fb (bool): flag that deems if feedback is not needed
             fb_msg (str): feedback message from assistant
         """
 
+        feedback = self.run_precheck(
+            feedback_type, lambda: self.precheck_types(types, predicates, actions)
+        )
+        if feedback:
+            return feedback
+
         types_str = pretty_print_dict(types) if types else "No types provided."
 
-        prompt = (
-            feedback_template.replace("{types}", types_str)
-            .replace("{domain_desc}", domain_desc)
-            .replace("{llm_output}", llm_output)
+        prompt = PromptTemplate.of(feedback_template).render(
+            types=types_str,
+            domain_desc=domain_desc,
+            llm_output=llm_output,
+            strict=False,
         )
 
         # retrieve feedback for types
@@ -162,11 +420,12 @@ class FeedbackBuilder:
             pretty_print_dict(nl_actions) if nl_actions else "No actions provided."
         )
 
-        prompt = (
-            feedback_template.replace("{domain_desc}", domain_desc)
-            .replace("{types}", types_str)
-            .replace("{nl_actions}", nl_act_str)
-            .replace("{llm_output}", llm_output)
+        prompt = PromptTemplate.of(feedback_template).render(
+            domain_desc=domain_desc,
+            types=types_str,
+            nl_actions=nl_act_str,
+            llm_output=llm_output,
+            strict=False,
         )
 
         no_fb, fb_msg = self.get_feedback(model, prompt, feedback_type, llm_output)
@@ -207,6 +466,13 @@ class FeedbackBuilder:
             fb_msg (str): feedback message from assistant
         """
 
+        feedback = self.run_precheck(
+            feedback_type,
+            lambda: self.precheck_action(action, types, predicates, functions),
+        )
+        if feedback:
+            return feedback
+
         # format string info replacements
         act_name_str = action["name"] if action else "No action name provided."
         params_str = (
@@ -232,17 +498,18 @@ class FeedbackBuilder:
             else "No functions provided."
         )
 
-        prompt = (
-            feedback_template.replace("{domain_desc}", domain_desc)
-            .replace("{action_name}", act_name_str)
-            .replace("{action_params}", params_str)
-            .replace("{action_preconditions}", prec_str)
-            .replace("{action_effects}", eff_str)
-            .replace("{types}", types_str)
-            .replace("{constants}", const_str)
-            .replace("{predicates}", preds_str)
-            .replace("{functions}", funcs_str)
-            .replace("{llm_output}", llm_output)
+        prompt = PromptTemplate.of(feedback_template).render(
+            domain_desc=domain_desc,
+            action_name=act_name_str,
+            action_params=params_str,
+            action_preconditions=prec_str,
+            action_effects=eff_str,
+            types=types_str,
+            constants=const_str,
+            predicates=preds_str,
+            functions=funcs_str,
+            llm_output=llm_output,
+            strict=False,
         )
 
         no_fb, fb_msg = self.get_feedback(model, prompt, feedback_type, llm_output)
@@ -283,6 +550,15 @@ class FeedbackBuilder:
             fb_msg (str): feedback message from assistant
         """
 
+        feedback = self.run_precheck(
+            feedback_type,
+            lambda: self._failed_checks(
+                [lambda: self.syntax_validator.validate_params(parameter or OrderedDict(), types)]
+            ),
+        )
+        if feedback:
+            return feedback
+
         # format string info replacements
         act_name_str = action_name if action_name else "No action name provided"
         act_desc_str = action_desc if action_desc else "No action description provided"
@@ -297,14 +573,15 @@ class FeedbackBuilder:
             format_constants(constants) if constants else "No constants provided."
         )
 
-        prompt = (
-            feedback_template.replace("{domain_desc}", domain_desc)
-            .replace("{action_name}", act_name_str)
-            .replace("{action_desc}", act_desc_str)
-            .replace("{action_params}", params_str)
-            .replace("{types}", types_str)
-            .replace("{constants}", const_str)
-            .replace("{llm_output}", llm_output)
+        prompt = PromptTemplate.of(feedback_template).render(
+            domain_desc=domain_desc,
+            action_name=act_name_str,
+            action_desc=act_desc_str,
+            action_params=params_str,
+            types=types_str,
+            constants=const_str,
+            llm_output=llm_output,
+            strict=False,
         )
 
         no_fb, fb_msg = self.get_feedback(model, prompt, feedback_type, llm_output)
@@ -376,17 +653,18 @@ class FeedbackBuilder:
             else "No functions provided."
         )
 
-        prompt = (
-            feedback_template.replace("{domain_desc}", domain_desc)
-            .replace("{action_name}", act_name_str)
-            .replace("{action_desc}", act_desc_str)
-            .replace("{action_params}", params_str)
-            .replace("{action_preconditions}", prec_str)
-            .replace("{types}", types_str)
-            .replace("{constants}", const_str)
-            .replace("{predicates}", preds_str)
-            .replace("{functions}", funcs_str)
-            .replace("{llm_output}", llm_output)
+        prompt = PromptTemplate.of(feedback_template).render(
+            domain_desc=domain_desc,
+            action_name=act_name_str,
+            action_desc=act_desc_str,
+            action_params=params_str,
+            action_preconditions=prec_str,
+            types=types_str,
+            constants=const_str,
+            predicates=preds_str,
+            functions=funcs_str,
+            llm_output=llm_output,
+            strict=False,
         )
 
         no_fb, fb_msg = self.get_feedback(model, prompt, feedback_type, llm_output)
@@ -435,6 +713,23 @@ class FeedbackBuilder:
             fb_msg (str): feedback message from assistant
         """
 
+        feedback = self.run_precheck(
+            feedback_type,
+            lambda: self.precheck_action(
+                {
+                    "name": action_name,
+                    "params": parameter or OrderedDict(),
+                    "preconditions": preconditions or "(and)",
+                    "effects": effects or "",
+                },
+                types,
+                predicates,
+                functions,
+            ),
+        )
+        if feedback:
+            return feedback
+
         # format string info replacements
         act_name_str = action_name if action_name else "No action name provided"
         act_desc_str = action_desc if action_desc else "No action description provided"
@@ -461,18 +756,19 @@ class FeedbackBuilder:
             else "No functions provided."
         )
 
-        prompt = (
-            feedback_template.replace("{domain_desc}", domain_desc)
-            .replace("{action_name}", act_name_str)
-            .replace("{action_desc}", act_desc_str)
-            .replace("{action_params}", params_str)
-            .replace("{action_preconditions}", prec_str)
-            .replace("{action_effects}", eff_str)
-            .replace("{types}", types_str)
-            .replace("{constants}", const_str)
-            .replace("{predicates}", preds_str)
-            .replace("{functions}", funcs_str)
-            .replace("{llm_output}", llm_output)
+        prompt = PromptTemplate.of(feedback_template).render(
+            domain_desc=domain_desc,
+            action_name=act_name_str,
+            action_desc=act_desc_str,
+            action_params=params_str,
+            action_preconditions=prec_str,
+            action_effects=eff_str,
+            types=types_str,
+            constants=const_str,
+            predicates=preds_str,
+            functions=funcs_str,
+            llm_output=llm_output,
+            strict=False,
         )
 
         no_fb, fb_msg = self.get_feedback(model, prompt, feedback_type, llm_output)
@@ -490,6 +786,7 @@ class FeedbackBuilder:
         types: dict[str, str] | list[dict[str, str]] = None,
         constants: dict[str, str] = None,
         predicates: list[Predicate] = None,
+        actions: list[Action] = None,
     ) -> tuple[bool, str]:
         """
         Provides feedback to initial LLM output of PDDL predicates.
@@ -503,12 +800,19 @@ class FeedbackBuilder:
             types (dict[str,str] | list[dict[str,str]]): dictionary of types currently in specification
             constants (dict[str,str]): current constants in specification, defaults to None
             predicates (list[Predicate]): list of predicates currently in specification
+            actions (list[Action]): used by static pre-check for unused predicates, defaults to None
 
         Returns:
             no_fb (bool): flag that deems if feedback is not needed
             fb_msg (str): feedback message from assistant
         """
 
+        feedback = self.run_precheck(
+            feedback_type, lambda: self.precheck_predicates(predicates, types, actions)
+        )
+        if feedback:
+            return feedback
+
         # format string info replacements
         types_str = pretty_print_dict(types) if types else "No types provided."
         const_str = (
@@ -520,12 +824,13 @@ class FeedbackBuilder:
             else "No predicates provided."
         )
 
-        prompt = (
-            feedback_template.replace("{domain_desc}", domain_desc)
-            .replace("{types}", types_str)
-            .replace("{constants}", const_str)
-            .replace("{predicates}", preds_str)
-            .replace("{llm_output}", llm_output)
+        prompt = PromptTemplate.of(feedback_template).render(
+            domain_desc=domain_desc,
+            types=types_str,
+            constants=const_str,
+            predicates=preds_str,
+            llm_output=llm_output,
+            strict=False,
         )
 
         no_fb, fb_msg = self.get_feedback(model, prompt, feedback_type, llm_output)
@@ -570,6 +875,15 @@ class FeedbackBuilder:
             fb_msg (str): feedback message from assistant
         """
 
+        feedback = self.run_precheck(
+            feedback_type,
+            lambda: self.precheck_task(
+                objects, initial or [], goal or [], types, predicates, functions
+            ),
+        )
+        if feedback:
+            return feedback
+
         # format string info replacements
         obj_str = (
             "\n".join([f"{obj} - {type}" for obj, type in objects.items()])
@@ -594,16 +908,17 @@ class FeedbackBuilder:
             else "No functions provided."
         )
 
-        prompt = (
-            feedback_template.replace("{problem_desc}", problem_desc)
-            .replace("{objects}", obj_str)
-            .replace("{initial_states}", init_str)
-            .replace("{goal_states}", goal_str)
-            .replace("{types}", types_str)
-            .replace("{constants}", const_str)
-            .replace("{predicates}", preds_str)
-            .replace("{functions}", funcs_str)
-            .replace("{llm_output}", llm_output)
+        prompt = PromptTemplate.of(feedback_template).render(
+            problem_desc=problem_desc,
+            objects=obj_str,
+            initial_states=init_str,
+            goal_states=goal_str,
+            types=types_str,
+            constants=const_str,
+            predicates=preds_str,
+            functions=funcs_str,
+            llm_output=llm_output,
+            strict=False,
         )
 
         no_fb, fb_msg = self.get_feedback(model, prompt, feedback_type, llm_output)
@@ -644,6 +959,12 @@ class FeedbackBuilder:
             fb_msg (str): feedback message from assistant
         """
 
+        feedback = self.run_precheck(
+            feedback_type, lambda: self.precheck_task(objects, types=types)
+        )
+        if feedback:
+            return feedback
+
         # format string info replacements
         obj_str = (
             "\n".join([f"{obj} - {type}" for obj, type in objects.items()])
@@ -666,14 +987,15 @@ class FeedbackBuilder:
             else "No functions provided."
         )
 
-        prompt = (
-            feedback_template.replace("{problem_desc}", problem_desc)
-            .replace("{objects}", obj_str)
-            .replace("{types}", types_str)
-            .replace("{constants}", const_str)
-            .replace("{predicates}", preds_str)
-            .replace("{functions}", funcs_str)
-            .replace("{llm_output}", llm_output)
+        prompt = PromptTemplate.of(feedback_template).render(
+            problem_desc=problem_desc,
+            objects=obj_str,
+            types=types_str,
+            constants=const_str,
+            predicates=preds_str,
+            functions=funcs_str,
+            llm_output=llm_output,
+            strict=False,
         )
 
         no_fb, fb_msg = self.get_feedback(model, prompt, feedback_type, llm_output)
@@ -716,6 +1038,15 @@ class FeedbackBuilder:
             fb_msg (str): feedback message from assistant
         """
 
+        feedback = self.run_precheck(
+            feedback_type,
+            lambda: self.precheck_task(
+                objects, initial or [], None, types, predicates, functions
+            ),
+        )
+        if feedback:
+            return feedback
+
         # format string info replacements
         obj_str = (
             "\n".join([f"{obj} - {type}" for obj, type in objects.items()])
@@ -739,15 +1070,16 @@ class FeedbackBuilder:
             else "No functions provided."
         )
 
-        prompt = (
-            feedback_template.replace("{problem_desc}", problem_desc)
-            .replace("{objects}", obj_str)
-            .replace("{initial_states}", init_str)
-            .replace("{types}", types_str)
-            .replace("{constants}", const_str)
-            .replace("{predicates}", preds_str)
-            .replace("{functions}", funcs_str)
-            .replace("{llm_output}", llm_output)
+        prompt = PromptTemplate.of(feedback_template).render(
+            problem_desc=problem_desc,
+            objects=obj_str,
+            initial_states=init_str,
+            types=types_str,
+            constants=const_str,
+            predicates=preds_str,
+            functions=funcs_str,
+            llm_output=llm_output,
+            strict=False,
         )
 
         no_fb, fb_msg = self.get_feedback(model, prompt, feedback_type, llm_output)
@@ -792,6 +1124,15 @@ class FeedbackBuilder:
             fb_msg (str): feedback message from assistant
         """
 
+        feedback = self.run_precheck(
+            feedback_type,
+            lambda: self.precheck_task(
+                objects, initial or [], goal or [], types, predicates, functions
+            ),
+        )
+        if feedback:
+            return feedback
+
         # format string info replacements
         obj_str = (
             "\n".join([f"{obj} - {type}" for obj, type in objects.items()])
@@ -816,18 +1157,26 @@ class FeedbackBuilder:
             else "No functions provided."
         )
 
-        prompt = (
-            feedback_template.replace("{problem_desc}", problem_desc)
-            .replace("{objects}", obj_str)
-            .replace("{initial_states}", init_str)
-            .replace("{goal_states}", goal_str)
-            .replace("{types}", types_str)
-            .replace("{constants}", const_str)
-            .replace("{predicates}", preds_str)
-            .replace("{functions}", funcs_str)
-            .replace("{llm_output}", llm_output)
+        prompt = PromptTemplate.of(feedback_template).render(
+            problem_desc=problem_desc,
+            objects=obj_str,
+            initial_states=init_str,
+            goal_states=goal_str,
+            types=types_str,
+            constants=const_str,
+            predicates=preds_str,
+            functions=funcs_str,
+            llm_output=llm_output,
+            strict=False,
         )
 
         no_fb, fb_msg = self.get_feedback(model, prompt, feedback_type, llm_output)
 
         return no_fb, fb_msg
+
+    def get_stats(self) -> dict[str, int | float]:
+        """Returns # of LLM feedback queries, pre-check skips/shortcuts and the resulting skip rate"""
+        stats = dict(self.stats)
+        total = stats["queries"] + stats["skipped"] + stats["shortcut"]
+        stats["skip_rate"] = (stats["skipped"] + stats["shortcut"]) / total if total else 0.0
+        return stats
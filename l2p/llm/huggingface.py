@@ -190,8 +190,9 @@ class HUGGING_FACE(BaseLLM):
         end_when_error: bool = False,
         max_retry: int = 3,
         est_margin: int = 200,
+        temperature: float | None = None,
     ) -> str:
-        """Generate a response from HuggingFace model based on the prompt."""
+        """Generate a response from HuggingFace model based on the prompt (at `temperature` if given, else the model's)."""
 
         if not isinstance(prompt, str) or not prompt.strip():
             raise ValueError("Prompt must be a non-empty string.")
@@ -231,7 +232,9 @@ class HUGGING_FACE(BaseLLM):
                     outputs = self.llm.generate(
                         **input,
                         max_new_tokens=max_new_tokens,
-                        temperature=self.temperature,
+                        temperature=(
+                            self.temperature if temperature is None else temperature
+                        ),
                         top_p=self.top_p,
                         pad_token_id=self.pad_token_id,
                         eos_token_id=self.eos_token_id,
@@ -105,8 +105,9 @@ class OPENAI(BaseLLM):
         end_when_error=False,
         max_retry=3,
         est_margin=200,
+        temperature=None,
     ) -> str:
-        """Generate a response from OpenAI based on the prompt."""
+        """Generate a response from OpenAI based on the prompt (at `temperature` if given, else the model's)."""
 
         if not isinstance(prompt, str) or not prompt.strip():
             raise ValueError("Prompt must be a non-empty string.")
@@ -134,7 +135,9 @@ class OPENAI(BaseLLM):
                 )
 
                 kwargs = {
-                    "temperature": self.temperature,
+                    "temperature": (
+                        self.temperature if temperature is None else temperature
+                    ),
                     "max_completion_tokens": requested_tokens,
                     "top_p": self.top_p,
                     "frequency_penalty": self.frequency_penalty,
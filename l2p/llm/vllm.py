@@ -161,8 +161,9 @@ class VLLM(BaseLLM):
         end_when_error: bool=False,
         max_retry: int=3,
         est_margin: int=200,
+        temperature: float | None=None,
         ) -> str:
-        """Generate a response from model based on the prompt."""
+        """Generate a response from model based on the prompt (at `temperature` if given, else the model's)."""
         
         if not isinstance(prompt, str) or not prompt.strip():
             raise ValueError("Prompt must be a non-empty string.")
@@ -193,7 +194,17 @@ class VLLM(BaseLLM):
                         f"({self.context_length}). It will be truncated."
                     )
                 
-                llm_output = self.llm.generate([full_prompt], self.sampling_params)
+                sampling_params = self.sampling_params
+                if temperature is not None:
+                    from vllm import SamplingParams
+
+                    sampling_params = SamplingParams(
+                        temperature = temperature,
+                        top_p = self.top_p,
+                        stop = self.stop,
+                        max_tokens = self.max_new_tokens,
+                    )
+                llm_output = self.llm.generate([full_prompt], sampling_params)
                 llm_output = llm_output[0].outputs[0].text
                     
                 conn_success = True
@@ -2,21 +2,23 @@
 This file contains collection of functions for HDDL domain and problem generation purposes
 """
 
-import re, time
-import traceback
+import re
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from .utils import *
 from .llm_builder import LLM, require_llm
 from .domain_builder import DomainBuilder
 from .task_builder import TaskBuilder
 
+MODEL_SECTIONS = ["TYPES", "PREDICATES", "TASKS", "ACTIONS", "OBJECTS", "INITIAL", "GOAL"]
+
 class ModelBuilder(DomainBuilder, TaskBuilder):
     """
     Class to build a planning model, including the domain and problem specifications and the HTN capabilities.
     """
     isHTN: bool
     
-    def __init__(self, domain_name, problem_name, requirements: list[str] = [], isHTN: bool = False):
+    def __init__(self, domain_name, problem_name, requirements: list[str] = [], isHTN: bool = False, retry_policy: RetryPolicy = None):
         """
         Initializes the MainBuilder class.
 
@@ -25,8 +27,9 @@ class ModelBuilder(DomainBuilder, TaskBuilder):
             problem_name (str): Name of the problem.
             requirements (list[str]): List of requirements for the domain.
             isHTN (bool): Flag to indicate if the model is HTN or not.
+            retry_policy (RetryPolicy): Retry policy shared by all extraction calls.
         """
-        super().__init__()
+        super().__init__(retry_policy=retry_policy)
         self.isHTN = isHTN
         self.domain_name = domain_name
         self.problem_name = problem_name
@@ -38,6 +41,8 @@ class ModelBuilder(DomainBuilder, TaskBuilder):
         model: LLM,
         task_desc: str,
         prompt_template: str,
+        split: bool = False,
+        max_workers: int = 4,
         max_retries: int = 1,
     ) -> str:
         """
@@ -49,76 +54,197 @@ class ModelBuilder(DomainBuilder, TaskBuilder):
         
         This function is designed to be used with an LLM that can process the task description and return structured information about the domain and problem.
 
+        With `split=True` the model is requested section-wise instead of in one completion: the
+        skeleton (types and predicates) first, then actions, HTN tasks/methods and the problem
+        (objects, initial, goal) as concurrent queries that reuse the skeleton. Each query is
+        retried on its own, so a malformed section does not force a retry of the others.
+
         Args:
             model (LLM): LLM
             task_desc (str): problem description
             prompt_template (str): prompt template class
+            split (bool): request skeleton and remaining sections in separate (parallel) queries
+            max_workers (int): max # of concurrent queries in split mode
             max_retries (int): max # of retries if failure occurs
         Returns:
             llm_response (str): the raw string LLM response
         """
 
+        if split:
+            return self._extract_split(model, task_desc, prompt_template, max_workers, max_retries)
+
         model.reset_tokens()
 
-        prompt = prompt_template.replace("{task_desc}", task_desc)
-
-        # iterate through attempts in case of extraction failure
-        for attempt in range(max_retries):
-            try:
-                model.reset_tokens()
-                self.llm_response = model.query(prompt)
-                               
-                # extract respective types from response
-                raw_types_hierarchy = extract_section_by_name(self.llm_response, "TYPES")
-                raw_types_hierarchy = extract_section_by_name(raw_types_hierarchy, "OUTPUT", level=2)
-                self.types_hierarchy = convert_to_dict(llm_response=raw_types_hierarchy)
-
-                # extract respective types predicates and tasks from response
-                raw_predicates = extract_section_by_name(self.llm_response, "PREDICATES")
-                raw_predicates = extract_section_by_name(raw_predicates, "OUTPUT", level=2)
-                self.predicates = parse_list_of_predicates(raw_predicates)
-  
-                if self.isHTN:
-                    # extract respective tasks and methods from responseç
-                    raw_tasks = extract_section_by_name(self.llm_response, "TASKS")
-                    raw_tasks = extract_section_by_name(raw_tasks, "OUTPUT", level=2)
-                    self.tasks = parse_tasks(raw_tasks)
-                    for task in self.tasks.items():
-                        task_name = task[0]
-                        raw_task_info = extract_section_by_name(self.llm_response, task_name)
-                        methods = parse_methods(raw_task_info)
-                        self.tasks[task_name]["methods"] = methods
-                                             
-                # extract respective actions from response
-                raw_actions = extract_section_by_name(self.llm_response, "ACTIONS")
-                raw_actions_list = split_sections(raw_actions, level=2)
-                self.actions = parse_actions_list(raw_actions_list)
-       
-       
-                # --- Extract respective Problem types from response ---
-                
-                raw_objects = extract_section_by_name(self.llm_response, "OBJECTS")
-                raw_objects = extract_section_by_name(raw_objects, "OUTPUT", level=2)
-                self.objects = parse_objects(raw_objects, md_mode=True)
-                
-                raw_initial = extract_section_by_name(self.llm_response, "INITIAL")
-                raw_initial = extract_section_by_name(raw_initial, "OUTPUT", level=2)
-                self.initial = parse_initial(raw_initial, md_mode=True)
-                
-                raw_goal = extract_section_by_name(self.llm_response, "GOAL")
-                raw_goal = extract_section_by_name(raw_goal, "OUTPUT", level=2)
-                self.goal = parse_goal(raw_goal, md_mode=True)
-                
-                return self.llm_response
+        prompt = PromptTemplate.of(prompt_template).render(task_desc=task_desc, strict=False)
 
-            except Exception as e:
-                print(
-                    f"Error encountered: {e}. Retrying {attempt + 1}/{max_retries}..."
+        # parse every section of LLM output, retried via `self.retry_policy` on failure
+        def handle(llm_response: str):
+            # extract every section from response
+            parsed = {}
+            for group in self._section_groups():
+                parsed.update(self._parse_sections(llm_response, group))
+            self._set_sections(parsed)
+            self.llm_response = llm_response
+
+            return llm_response
+
+        return self.retry_policy.run(
+            model, prompt, handle, max_retries, "Max retries exceeded. Failed to extract task."
+        )
+
+    def _section_groups(self) -> list[list[str]]:
+        """Sections queried together in split mode; the first group is the skeleton"""
+        groups = [["TYPES", "PREDICATES"], ["ACTIONS"], ["OBJECTS", "INITIAL", "GOAL"]]
+        if self.isHTN:
+            groups.insert(1, ["TASKS"])
+        return groups
+
+    def _extract_split(
+        self,
+        model: LLM,
+        task_desc: str,
+        prompt_template: str,
+        max_workers: int,
+        max_retries: int,
+    ) -> str:
+        """Split mode of `extract_domain_and_problem`"""
+
+        skeleton, *groups = self._section_groups()
+
+        # A. skeleton, which every other section depends on
+        skeleton_response, parsed = self._query_sections(
+            model, self._section_prompt(prompt_template, task_desc, skeleton), skeleton, max_retries
+        )
+        context = "\n\n".join(
+            f"# {name}\n{extract_section_by_name(skeleton_response, name)}" for name in skeleton
+        )
+
+        # B. remaining sections as concurrent queries, each retried on its own
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._query_sections,
+                    model,
+                    self._section_prompt(prompt_template, task_desc, group, context),
+                    group,
+                    max_retries,
                 )
-                print(traceback.format_exc())
-                time.sleep(2)  # add a delay before retrying
+                for group in groups
+            ]
+            responses = [skeleton_response]
+            for future in futures:
+                llm_response, group_parsed = future.result()
+                responses.append(llm_response)
+                parsed.update(group_parsed)
+
+        self._set_sections(parsed)
+        self.llm_response = "\n\n".join(responses)
+        return self.llm_response
+
+    def _query_sections(
+        self, model: LLM, prompt: str, sections: list[str], max_retries: int
+    ) -> tuple[str, dict]:
+        """Queries and parses a group of sections, retrying only this group on failure"""
+
+        return self.retry_policy.run(
+            model,
+            prompt,
+            lambda llm_response: (llm_response, self._parse_sections(llm_response, sections)),
+            max_retries,
+            f"Max retries exceeded. Failed to extract sections {sections}.",
+        )
+
+    def _section_prompt(
+        self, prompt_template: str, task_desc: str, sections: list[str], context: str = ""
+    ) -> str:
+        """
+        Builds a prompt that requests only `sections`, reusing the [ROLE], [TEMPLATE] and [TASK]
+        blocks of the one-shot prompt template.
+
+        Args:
+            prompt_template (str): one-shot prompt template
+            task_desc (str): problem description
+            sections (list[str]): names of the (level 1) template sections to request
+            context (str): previously generated sections the LLM has to build upon
+
+        Returns:
+            prompt (str): prompt for the given sections
+        """
+
+        role = extract_bracket_block(prompt_template, "ROLE")
+        template = extract_bracket_block(prompt_template, "TEMPLATE")
+        task = extract_bracket_block(prompt_template, "TASK")
+
+        # section bodies run until the next known section, as HTN task sections also use "# "
+        known = re.compile(rf"^# ({'|'.join(MODEL_SECTIONS)})[ \t]*$", re.MULTILINE)
+        starts = {m.group(1): m.start() for m in known.finditer(template)}
+        bounds = sorted(starts.values()) + [len(template)]
+        formats = [
+            template[starts[name] : next(b for b in bounds if b > starts[name])].strip()
+            for name in sections
+            if name in starts
+        ]
+
+        prompt = f"[ROLE]\n{role}\n\n"
+        prompt += f"Only define the following sections: {', '.join(sections)}.\n\n"
+        prompt += "[TEMPLATE]\n\n" + "\n\n".join(formats) + "\n\n"
+        if context:
+            prompt += f"[CONTEXT]\nThe following sections are already defined. Use them as they are and do not repeat them:\n\n{context}\n\n"
+        prompt += f"[TASK]\n{task}"
+        return PromptTemplate(prompt).render(task_desc=task_desc, strict=False)
+
+    def _parse_sections(self, llm_response: str, sections: list[str]) -> dict:
+        """
+        Parses the given sections of an LLM response.
+
+        Args:
+            llm_response (str): raw LLM response
+            sections (list[str]): names of the sections to parse
+
+        Returns:
+            parsed (dict): builder attribute name -> parsed value
+        """
+
+        def output(name: str) -> str:
+            section = extract_section_by_name(llm_response, name)
+            if not section:
+                raise ValueError(f"Could not find the '# {name}' section in the LLM output.")
+            return extract_section_by_name(section, "OUTPUT", level=2)
+
+        parsed = {}
+        for name in sections:
+            if name == "TYPES":
+                parsed["types_hierarchy"] = parse_md_types(output(name))
+
+            elif name == "PREDICATES":
+                parsed["predicates"] = parse_list_of_predicates(output(name))
+
+            elif name == "TASKS":
+                tasks = parse_tasks(output(name))
+                for task_name in tasks:
+                    raw_task_info = extract_section_by_name(llm_response, task_name)
+                    tasks[task_name]["methods"] = parse_methods(raw_task_info)
+                parsed["tasks"] = tasks
+
+            elif name == "ACTIONS":
+                raw_actions = extract_section_by_name(llm_response, "ACTIONS")
+                parsed["actions"] = parse_actions_list(split_sections(raw_actions, level=2))
+
+            elif name == "OBJECTS":
+                parsed["objects"] = parse_objects(md_block("OBJECTS", output(name)))
+
+            elif name == "INITIAL":
+                parsed["initial"] = parse_initial(md_block("INITIAL", output(name)))
+
+            elif name == "GOAL":
+                parsed["goal"] = parse_goal(md_block("GOAL", output(name)))
+
+        return parsed
 
-        raise RuntimeError("Max retries exceeded. Failed to extract task.")
+    def _set_sections(self, parsed: dict):
+        """Stores parsed sections (see `_parse_sections`) in the builder"""
+        for attr, value in parsed.items():
+            setattr(self, attr, value)
 
     
     def HPDLmethod_desc(self, method: HPDLMethod) -> str:
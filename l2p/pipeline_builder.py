@@ -0,0 +1,437 @@
+"""
+Pipeline Construction/Execution Functions
+
+This module defines the `PipelineBuilder` class, which chains L2P builder calls into a
+dependency graph (DAG). Each node is a single builder call (i.e. `formalize_types`) that
+declares the values it consumes (inputs) and the values it produces (outputs). Nodes whose
+inputs are all available run concurrently, bounded by a global LLM concurrency budget.
+
+For instance, an NL2Plan-style flow can be declared as:
+
+    pipeline = PipelineBuilder(max_workers=4, llm_concurrency=2)
+
+    pipeline.add_node(
+        name="types",
+        func=lambda domain_desc: domain_builder.formalize_types(
+            model=model, domain_desc=domain_desc, prompt_template=types_prompt
+        )[0],
+        inputs=["domain_desc"],
+        outputs=["types"],
+    )
+    pipeline.add_node(
+        name="objects",
+        func=lambda problem_desc, types: task_builder.formalize_objects(
+            model=model, problem_desc=problem_desc, prompt_template=objects_prompt, types=types
+        )[0],
+        inputs=["problem_desc", "types"],
+        outputs=["objects"],
+    )
+
+    values = pipeline.run({"domain_desc": domain_desc, "problem_desc": problem_desc})
+
+Independent nodes (i.e. objects extraction vs. action construction, or initial vs. goal
+states) are dispatched as soon as their inputs are ready.
+
+The `Speculator` class removes feedback latency from sequential flows: while the LLM reviews a
+stage's output (i.e. `FeedbackBuilder.type_feedback`), the next stage already runs on the
+unreviewed output. If the feedback requests changes, the speculative run is cancelled (or its
+result discarded); otherwise its result is used as is.
+
+    speculator.prepare(lambda types: run_hierarchy_construction(types))
+    no_feedback, fb_msg = speculator.check(types, lambda: feedback_builder.type_feedback(...))
+    ...
+    speculated, type_hierarchy = speculator.result(final_types)
+    if not speculated:
+        type_hierarchy = run_hierarchy_construction(final_types)
+"""
+
+import hashlib
+import json
+import threading
+import time
+
+from copy import deepcopy
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+
+@dataclass
+class PipelineNode:
+    name: str
+    func: Callable[..., Any]
+    inputs: list[str]
+    outputs: list[str]
+    params: dict[str, Any] = field(default_factory=dict)  # static keyword arguments
+    uses_llm: bool = True  # if node consumes a slot of the LLM concurrency budget
+    cache: bool = True  # if node results are cached by input hash
+
+
+@dataclass
+class NodeResult:
+    name: str
+    outputs: dict[str, Any]
+    elapsed: float  # wall-clock seconds spent executing node (0.0 if cached)
+    cached: bool
+    input_hash: str
+
+
+class PipelineBuilder:
+    def __init__(
+        self,
+        max_workers: int = 4,
+        llm_concurrency: int | threading.Semaphore = 2,
+        cache: dict[str, dict[str, Any]] | None = None,
+    ) -> None:
+        """
+        Initializes an L2P pipeline builder object.
+
+        Args:
+            max_workers (int): max # of nodes executed concurrently, defaults to 4
+            llm_concurrency (int | threading.Semaphore): global LLM concurrency budget; pass the same
+                semaphore to several pipelines to share one budget between them, defaults to 2
+            cache (dict[str, dict[str, Any]]): results cache keyed by input hash, defaults to empty
+        """
+
+        if isinstance(llm_concurrency, int):
+            if llm_concurrency < 1:
+                raise ValueError("`llm_concurrency` must be at least 1.")
+            llm_concurrency = threading.BoundedSemaphore(llm_concurrency)
+
+        self.max_workers = max_workers
+        self.llm_budget = llm_concurrency
+        self.cache = cache if cache is not None else {}
+        self.nodes: dict[str, PipelineNode] = {}
+        self.results: dict[str, NodeResult] = {}
+        self._cache_lock = threading.Lock()
+
+    """Graph construction functions"""
+
+    def add_node(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        inputs: list[str] | None = None,
+        outputs: list[str] | None = None,
+        params: dict[str, Any] | None = None,
+        uses_llm: bool = True,
+        cache: bool = True,
+    ) -> PipelineNode:
+        """
+        Adds a node to the pipeline. The node function is called with its inputs (and static
+        `params`) as keyword arguments. If a node declares a single output, the return value is
+        assigned to it; otherwise the function must return a tuple of matching length.
+
+        Args:
+            name (str): unique node name
+            func (Callable): builder call to execute
+            inputs (list[str]): names of values consumed by this node, defaults to None
+            outputs (list[str]): names of values produced by this node, defaults to [name]
+            params (dict[str,Any]): static keyword arguments passed to `func`, defaults to None
+            uses_llm (bool): flag if node counts against the LLM concurrency budget, defaults to True
+            cache (bool): flag if node results are cached by input hash, defaults to True
+
+        Returns:
+            node (PipelineNode): the registered node
+        """
+
+        if name in self.nodes:
+            raise ValueError(f"Node `{name}` is already declared in the pipeline.")
+
+        outputs = outputs or [name]
+        for node in self.nodes.values():
+            overlap = set(outputs) & set(node.outputs)
+            if overlap:
+                raise ValueError(
+                    f"Output(s) {sorted(overlap)} of node `{name}` are already produced by node `{node.name}`."
+                )
+
+        node = PipelineNode(
+            name=name,
+            func=func,
+            inputs=list(inputs or []),
+            outputs=list(outputs),
+            params=dict(params or {}),
+            uses_llm=uses_llm,
+            cache=cache,
+        )
+        self.nodes[name] = node
+        return node
+
+    def delete_node(self, name: str):
+        """Deletes specific node from the pipeline"""
+        self.nodes.pop(name, None)
+
+    def get_nodes(self) -> dict[str, PipelineNode]:
+        """Returns nodes of the pipeline"""
+        return self.nodes
+
+    def topological_order(self, available: set[str] | None = None) -> list[str]:
+        """
+        Returns node names in a valid execution order. Raises ValueError if an input is never
+        produced or if the graph contains a cycle.
+
+        Args:
+            available (set[str]): names of values given before the pipeline runs, defaults to None
+        """
+
+        available = set(available or [])
+        producers = {out: node.name for node in self.nodes.values() for out in node.outputs}
+
+        # check that every input is either given or produced by a node
+        for node in self.nodes.values():
+            missing = [i for i in node.inputs if i not in available and i not in producers]
+            if missing:
+                raise ValueError(
+                    f"Node `{node.name}` requires input(s) {missing} that are neither given nor produced by any node."
+                )
+
+        # Kahn's algorithm over node -> node dependencies
+        deps = {
+            node.name: {producers[i] for i in node.inputs if i in producers and i not in available}
+            for node in self.nodes.values()
+        }
+        order = []
+        ready = [name for name, d in deps.items() if not d]
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for other, d in deps.items():
+                if name in d:
+                    d.remove(name)
+                    if not d and other not in order and other not in ready:
+                        ready.append(other)
+
+        if len(order) != len(self.nodes):
+            cyclic = sorted(set(self.nodes) - set(order))
+            raise ValueError(f"Pipeline contains a dependency cycle between nodes: {cyclic}")
+
+        return order
+
+    """Execution functions"""
+
+    def run(self, values: dict[str, Any] | None = None) -> dict[str, Any]:
+        """
+        Executes the pipeline. Each node starts as soon as all of its inputs are ready.
+
+        Args:
+            values (dict[str,Any]): initial values (i.e. domain/problem descriptions), defaults to None
+
+        Returns:
+            values (dict[str,Any]): initial values together with every node output
+        """
+
+        values = dict(values or {})
+        self.topological_order(set(values))  # validate graph before dispatching anything
+        self.results = {}
+
+        pending = {name for name in self.nodes if not set(self.nodes[name].outputs) <= set(values)}
+        running: dict[Future, str] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                # dispatch every node whose inputs are ready
+                for name in sorted(pending):
+                    node = self.nodes[name]
+                    if all(i in values for i in node.inputs):
+                        kwargs = {i: values[i] for i in node.inputs}
+                        running[executor.submit(self._execute, node, kwargs)] = name
+                        pending.discard(name)
+
+                if not running:
+                    raise RuntimeError(f"Pipeline stalled with pending nodes: {sorted(pending)}")
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        for other in running:
+                            other.cancel()
+                        raise RuntimeError(f"Pipeline node `{name}` failed: {e}") from e
+
+                    self.results[name] = result
+                    values.update(result.outputs)
+
+        return values
+
+    def _execute(self, node: PipelineNode, kwargs: dict[str, Any]) -> NodeResult:
+        """Runs a single node, consulting the cache and the LLM concurrency budget."""
+
+        input_hash = self.hash_inputs(node, kwargs)
+
+        if node.cache:
+            with self._cache_lock:
+                cached = self.cache.get(input_hash)
+            if cached is not None:
+                return NodeResult(node.name, dict(cached), 0.0, True, input_hash)
+
+        start = time.perf_counter()
+        if node.uses_llm:
+            with self.llm_budget:
+                output = node.func(**kwargs, **node.params)
+        else:
+            output = node.func(**kwargs, **node.params)
+        elapsed = time.perf_counter() - start
+
+        if len(node.outputs) == 1:
+            outputs = {node.outputs[0]: output}
+        else:
+            if not isinstance(output, tuple) or len(output) != len(node.outputs):
+                raise ValueError(
+                    f"Node `{node.name}` declares outputs {node.outputs} but returned {type(output).__name__}."
+                )
+            outputs = dict(zip(node.outputs, output))
+
+        if node.cache:
+            with self._cache_lock:
+                self.cache[input_hash] = outputs
+
+        return NodeResult(node.name, outputs, elapsed, False, input_hash)
+
+    def hash_inputs(self, node: PipelineNode, kwargs: dict[str, Any]) -> str:
+        """Returns a stable hash of a node's name, inputs and static parameters."""
+        payload = json.dumps(
+            {"node": node.name, "inputs": kwargs, "params": node.params},
+            sort_keys=True,
+            default=repr,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    """Get functions"""
+
+    def get_timings(self) -> dict[str, float]:
+        """Returns wall-clock seconds spent on each node of the last run"""
+        return {name: result.elapsed for name, result in self.results.items()}
+
+    def get_results(self) -> dict[str, NodeResult]:
+        """Returns per-node results of the last run"""
+        return self.results
+
+    def clear_cache(self):
+        """Removes all cached node results"""
+        with self._cache_lock:
+            self.cache.clear()
+
+
+class Speculator:
+    def __init__(self, max_workers: int = 1) -> None:
+        """
+        Initializes an L2P speculator object.
+
+        Args:
+            max_workers (int): max # of speculative stages running at once, defaults to 1
+        """
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.next_stage = None  # callable taking the (unreviewed) output of current stage
+        self._speculation = None  # (candidate, future) that passed feedback
+        self._lock = threading.Lock()
+        self.stats = {"started": 0, "committed": 0, "discarded": 0, "cancelled": 0}
+
+    def prepare(self, next_stage: Callable[[Any], Any] | None):
+        """
+        Sets the stage to run speculatively on outputs passed to `check`. Any previous, unused
+        speculation is discarded.
+
+        Args:
+            next_stage (Callable): function receiving the current stage's output, None to disable
+        """
+
+        with self._lock:
+            speculation, self._speculation = self._speculation, None
+            self.next_stage = next_stage
+        if speculation:
+            self._discard(speculation[1])
+
+    def check(
+        self, candidate: Any, feedback: Callable[[], tuple[bool, str]]
+    ) -> tuple[bool, str]:
+        """
+        Runs `feedback` on a stage output while the prepared next stage runs on it concurrently.
+
+        Args:
+            candidate (Any): current stage output under review (passed to next stage as a copy)
+            feedback (Callable): feedback call returning (no_feedback, feedback message)
+
+        Returns:
+            no_feedback (bool): True if feedback approved the candidate
+            fb_msg (str): feedback message
+        """
+
+        future = None
+        if self.next_stage is not None:
+            future = self.executor.submit(self.next_stage, deepcopy(candidate))
+            self.stats["started"] += 1
+
+        try:
+            no_feedback, fb_msg = feedback()
+        except Exception:
+            if future is not None:
+                self._discard(future)
+            raise
+
+        if future is not None:
+            if no_feedback:
+                with self._lock:
+                    speculation = self._speculation
+                    self._speculation = (deepcopy(candidate), future)
+                if speculation:
+                    self._discard(speculation[1])  # superseded by newer candidate
+            else:
+                self._discard(future)
+
+        return no_feedback, fb_msg
+
+    def result(self, candidate: Any) -> tuple[bool, Any]:
+        """
+        Retrieves the speculative next-stage result for the final output of the current stage
+        and clears the prepared stage.
+
+        Args:
+            candidate (Any): final output of current stage
+
+        Returns:
+            speculated (bool): True if a speculative run on `candidate` passed feedback and succeeded
+            result (Any): next stage result (None if not speculated; caller runs the stage itself)
+        """
+
+        with self._lock:
+            speculation, self._speculation = self._speculation, None
+            self.next_stage = None
+
+        if speculation is None:
+            return False, None
+
+        spec_candidate, future = speculation
+        if spec_candidate != candidate:
+            self._discard(future)
+            return False, None
+
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"[WARNING] Speculative stage failed, re-running: {e}")
+            self.stats["discarded"] += 1
+            return False, None
+
+        self.stats["committed"] += 1
+        return True, result
+
+    def _discard(self, future: Future):
+        """Cancels a speculative run if it has not started yet, else drops its result"""
+        if future.cancel():
+            self.stats["cancelled"] += 1
+        else:
+            self.stats["discarded"] += 1
+
+    def get_stats(self) -> dict[str, int]:
+        """Returns # of speculative runs started, committed, discarded and cancelled"""
+        return dict(self.stats)
+
+    def shutdown(self):
+        """Stops accepting speculative runs; running ones finish in the background"""
+        self.prepare(None)
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from unified_planning.shortcuts import OneshotPlanner
 from unified_planning.io import PDDLReader
 from .utils.pddl_planner import FastDownward as FD
+from .utils.planner_pool import UP_PREFIX, PlannerPool
 
 class Planner(ABC):
     
@@ -70,4 +71,74 @@ class FastDownward(Planner, FD):
             return None
 
     def get_plan(self):
-        return self.plan
\ No newline at end of file
+        return self.plan
+
+
+class PortfolioPlanner(Planner):
+    def __init__(
+        self,
+        planner_path,
+        search_algs=("lama-first", "seq-sat-fd-autotune-1", "seq-opt-lmcut"),
+        up_engines=(),
+        timeout=None,
+        memory_limit=None,
+        pool=None,
+    ):
+        """
+        Races several FastDownward configurations (and optionally UP_Planner engines) on the same task.
+        The first plan found wins and the other runs are killed (see `PlannerPool.race`).
+        :param planner_path: The path to the FastDownward planner executable.
+        :param search_algs: FastDownward aliases, or lists of search options, to run in parallel.
+        :param up_engines: Names of unified-planning engines (i.e. 'aries') to run in parallel.
+        :param timeout: Wall-clock limit in seconds per run (default is no limit).
+        :param memory_limit: Memory limit in bytes per run (default is no limit).
+        :param pool: PlannerPool to run on, shared between planners (default is a pool sized to the portfolio, shut down by `close`).
+        """
+        super().__init__()
+        self.planner_name = 'Portfolio'
+        self.search_algs = list(search_algs) + [UP_PREFIX + engine for engine in up_engines]
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self._owns_pool = pool is None
+        self.pool = pool or PlannerPool(planner_path, max_workers=len(self.search_algs))
+        self.result = None
+        self.plan = None
+
+    def solve(self, domain_path: str, problem_path: str):
+        """
+        Runs the portfolio on the given domain and problem files.
+        :param domain_path: Path to the PDDL domain file.
+        :param problem_path: Path to the PDDL problem file.
+        :return: The plan of the first configuration that found one, otherwise None.
+        """
+        self.result = self.pool.race(
+            domain_path, problem_path, self.search_algs, self.timeout, self.memory_limit
+        )
+        if self.result.success:
+            print(f"Plan ({self.result.search_alg}):", self.result.plan)
+            self.plan = self.result.plan
+            return self.plan
+        else:
+            print("ERROR: Not plan found:", self.result.plan)
+            return None
+
+    def get_plan(self):
+        return self.plan
+
+    def get_result(self):
+        """Returns the PlannerResult of the last portfolio run (winner, exit code and every run)"""
+        return self.result
+
+    def close(self):
+        """
+        Shuts down the planner's own pool, killing any run still going. A pool passed to the
+        constructor is shared, so it is left for its owner to shut down.
+        """
+        if self._owns_pool:
+            self.pool.shutdown(cancel=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -3,8 +3,12 @@ This file uses inputted NL descriptions to generate prompts for LLM. The user do
 have to use this class, but it is generally advisable for ease of use.
 
     - format (str) should be fixed prompt from: /templates
+    - fragments (dict[str,str]) are precomputed placeholder values (i.e. `DomainBuilder.get_prompt_fragments()`)
+      substituted into the task as `{name}`
 """
 
+from .utils.prompt_template import PromptTemplate
+
 
 class PromptBuilder:
     def __init__(
@@ -13,6 +17,7 @@ class PromptBuilder:
         format: str = None,
         examples: list = None,
         task: str = None,
+        fragments: dict[str, str] = None,
     ):
         self.role = role  # role for LLM to follow (i.e. PDDL predicate constructor)
         self.format = format  # prompting format
@@ -20,6 +25,7 @@ class PromptBuilder:
             examples if examples is not None else []
         )  # n-shot examples for LLM to follow
         self.task = task  # dynamic placeholder given information to LLM
+        self.fragments = dict(fragments or {})  # precomputed placeholder values, i.e. {types}
 
     def set_role(self, role):
         """Sets the role for the LLM to perform task"""
@@ -52,6 +58,10 @@ class PromptBuilder:
         """
         self.task = task
 
+    def set_fragments(self, fragments: dict[str, str]):
+        """Sets precomputed fragments (name -> text) substituted for `{name}` placeholders in the task"""
+        self.fragments.update(fragments)
+
     def get_role(self):
         """Returns role of the prompt given"""
         return self.role
@@ -68,6 +78,10 @@ class PromptBuilder:
         """Returns dynamic placeholder task prompt"""
         return self.task
 
+    def get_fragments(self):
+        """Returns precomputed placeholder fragments"""
+        return self.fragments
+
     def remove_role(self):
         """Removes role prompt"""
         self.role = None
@@ -104,6 +118,7 @@ class PromptBuilder:
             prompt += "------------------------------------------------\n"
 
         if self.task:
-            prompt += f"[TASK]:\nHere is the task to solve:\n{self.task}\n\n"
+            task = PromptTemplate.of(self.task).render(self.fragments, strict=False)
+            prompt += f"[TASK]:\nHere is the task to solve:\n{task}\n\n"
 
         return prompt.strip()
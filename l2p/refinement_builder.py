@@ -0,0 +1,194 @@
+"""
+Incremental Action Refinement Functions
+
+This module defines the `RefinementBuilder` class, which runs action-by-action (ABA) refinement
+loops (i.e. LLM+DM) incrementally. Instead of regenerating every action on every outer iteration
+until no new predicates appear, it records for each action:
+    - the predicates relevant to it when it was generated (by parameter types)
+    - the predicates its preconditions/effects use
+
+An action is only re-queried when a new relevant predicate appeared since it was generated, or
+when a predicate it uses disappeared (i.e. pruned). The loop stops once no action is stale,
+which is a fixed point of the ABA algorithm.
+
+For instance:
+    def generate(action_name, predicates):
+        action, new_predicates, llm_output, validation_info = domain_builder.formalize_pddl_action(
+            model=model, ..., action_name=action_name, predicates=predicates
+        )
+        return action, new_predicates
+
+    actions, predicates = refinement_builder.refine(action_names, generate, max_iter=3)
+"""
+
+from typing import Callable
+from .utils import *
+
+
+class RefinementBuilder:
+    def __init__(
+        self, types: dict[str, str] | list[dict[str, str]] | None = None
+    ) -> None:
+        """
+        Initializes an L2P refinement builder object.
+
+        Args:
+            types (dict[str,str] | list[dict[str,str]]): domain types, used to decide which predicates
+                are relevant to an action (predicate over one of its parameter types or their supertypes)
+        """
+
+        self.type_closure = TypeIndex(types).closure
+        self.usage_index = UsageIndex()  # symbols used by each generated action
+        self.records = {}  # action name -> {"context": frozenset[str], "used": frozenset[str]}
+        self.stats = {"queries": 0, "skipped": 0, "iterations": 0, "failed": 0}
+
+    def relevant_predicates(
+        self, action: Action, predicates: list[Predicate]
+    ) -> frozenset[str]:
+        """
+        Returns predicates an action could use: nullary predicates and predicates with at least one
+        parameter of the action's parameter types (or their supertypes).
+
+        Args:
+            action (Action): generated action
+            predicates (list[Predicate]): current predicates
+
+        Returns:
+            relevant (frozenset[str]): `clean` strings of relevant predicates
+        """
+
+        action_types = set()
+        for param_type in action["params"].values():
+            action_types |= self.type_closure.get(param_type, {param_type})
+
+        return frozenset(
+            pred["clean"]
+            for pred in predicates
+            if not pred["params"] or action_types & set(pred["params"].values())
+        )
+
+    def used_predicates(
+        self, action: Action, predicates: list[Predicate]
+    ) -> frozenset[str]:
+        """Returns names of `predicates` used in the action's preconditions or effects"""
+
+        names, _ = action_symbols(action)
+        return frozenset(pred["name"] for pred in predicates if pred["name"] in names)
+
+    def record(
+        self,
+        action_name: str,
+        action: Action,
+        predicates: list[Predicate],
+        new_predicates: list[Predicate] | None = None,
+    ):
+        """
+        Records the context an action was generated with.
+
+        Args:
+            action_name (str): name of action
+            action (Action): generated action
+            predicates (list[Predicate]): predicates given to the action's prompt
+            new_predicates (list[Predicate]): predicates created along with the action, defaults to None
+        """
+
+        known = list(predicates) + list(new_predicates or [])
+        self.records[action_name] = {
+            "context": self.relevant_predicates(action, known),
+            "used": self.used_predicates(action, known),
+        }
+
+    def is_stale(
+        self,
+        action_name: str,
+        actions: dict[str, Action],
+        predicates: list[Predicate],
+    ) -> bool:
+        """
+        Checks if an action has to be (re)generated: it was never generated, a predicate relevant to
+        it appeared since, or a predicate it uses no longer exists.
+
+        Args:
+            action_name (str): name of action
+            actions (dict[str,Action]): generated actions by name
+            predicates (list[Predicate]): current predicates
+
+        Returns:
+            stale (bool): True if action has to be re-queried
+        """
+
+        record = self.records.get(action_name)
+        if record is None or action_name not in actions:
+            return True
+
+        if record["used"] - {pred["name"] for pred in predicates}:
+            return True
+
+        return bool(
+            self.relevant_predicates(actions[action_name], predicates) - record["context"]
+        )
+
+    def refine(
+        self,
+        action_names: list[str],
+        generate: Callable[[str, list[Predicate]], tuple[Action, list[Predicate]]],
+        predicates: list[Predicate] | None = None,
+        actions: dict[str, Action] | None = None,
+        max_iter: int = 2,
+        prune: bool = True,
+    ) -> tuple[dict[str, Action], list[Predicate]]:
+        """
+        Runs the action-by-action algorithm, re-querying only stale actions on every iteration.
+
+        Args:
+            action_names (list[str]): names of actions to generate, in generation order
+            generate (Callable): `generate(action_name, predicates) -> (action, new_predicates)`; an
+                `action` of None marks a failed generation: it is not stored (a previous version is
+                kept) and the action stays stale, so it is retried on the next iteration
+            predicates (list[Predicate]): initial predicates, defaults to None
+            actions (dict[str,Action]): previously generated actions (i.e. from a checkpoint), defaults to None
+            max_iter (int): max # of outer iterations, defaults to 2
+            prune (bool): remove predicates no action uses after each iteration, defaults to True
+
+        Returns:
+            actions (dict[str,Action]): generated actions by name
+            predicates (list[Predicate]): final predicates
+        """
+
+        actions = dict(actions or {})
+        predicates = list(predicates or [])
+        for action_name, action in actions.items():
+            self.usage_index.add_action(action, name=action_name)
+
+        for _ in range(max_iter):
+            stale = [
+                name for name in action_names if self.is_stale(name, actions, predicates)
+            ]
+            self.stats["skipped"] += len(action_names) - len(stale)
+            if not stale:
+                break  # fixed point: no action's relevant context changed
+
+            self.stats["iterations"] += 1
+            for action_name in stale:
+                context = list(predicates)
+                action, new_predicates = generate(action_name, context)
+                self.stats["queries"] += 1
+                if action is None:
+                    self.stats["failed"] += 1
+                    self.records.pop(action_name, None)
+                    continue
+
+                known = {pred["name"] for pred in predicates}
+                predicates.extend(p for p in new_predicates if p["name"] not in known)
+                actions[action_name] = action
+                self.usage_index.add_action(action, name=action_name)
+                self.record(action_name, action, context, new_predicates)
+
+            if prune:
+                predicates = self.usage_index.prune_predicates(predicates)
+
+        return actions, predicates
+
+    def get_stats(self) -> dict[str, int]:
+        """Returns # of LLM queries made, action generations skipped and failed, and iterations run"""
+        return dict(self.stats)
@@ -0,0 +1,395 @@
+"""
+PDDL Section-Level Repair Functions
+
+This module defines the `RepairBuilder` class, which fixes validation failures in LLM output
+without re-generating the whole response. The failing section (i.e. `### Action Preconditions`
+or `### GOAL`) is located by re-running section-level checks, and only that section, the
+validator message and the minimal context needed to fix it (parameters, predicates, types or
+objects) are sent to the LLM. The patched section is spliced back into the original response,
+which is then re-parsed and re-validated.
+
+Header-level errors (missing/duplicate headers, unsupported keywords) cannot be localized to a
+single section; in that case the repair functions return the failing validation info so callers
+can fall back to full re-generation.
+
+Refer to /templates/repair_templates for the structure of repair prompts.
+"""
+
+from .llm import BaseLLM, require_llm
+from .utils import *
+
+ACTION_SECTIONS = [
+    "Action Parameters",
+    "Action Preconditions",
+    "Action Effects",
+    "New Predicates",
+]
+TASK_SECTIONS = ["OBJECTS", "INITIAL", "GOAL"]
+
+
+class RepairBuilder:
+    def __init__(self, max_rounds: int = 2) -> None:
+        """
+        Initializes an L2P repair builder object.
+
+        Args:
+            max_rounds (int): max # of section repairs attempted per call, defaults to 2
+        """
+
+        self.max_rounds = max_rounds
+        self.stats = {"repairs": 0, "resolved": 0, "prompt_chars": 0}
+
+    """Validate functions"""
+
+    def validate_action_sections(
+        self,
+        llm_output: str,
+        action: Action,
+        new_predicates: list[Predicate],
+        syntax_validator: SyntaxValidator,
+        types: dict[str, str] | list[dict[str, str]] | None = None,
+        predicates: list[Predicate] | None = None,
+        functions: list[Function] | None = None,
+    ) -> list[tuple[str | None, str]]:
+        """
+        Runs the validator's enabled checks over an action response, grouping violations by section.
+
+        Args:
+            llm_output (str): raw LLM output
+            action (Action): action parsed from `llm_output`
+            new_predicates (list[Predicate]): new predicates parsed from `llm_output`
+            syntax_validator (SyntaxValidator): syntax checker holding enabled `error_types`
+            types (dict[str,str] | list[dict[str,str]]): current types in domain, defaults to None
+            predicates (list[Predicate]): current predicates in domain, defaults to None
+            functions (list[Function]): current functions in domain, defaults to None
+
+        Returns:
+            errors (list[tuple[str | None, str]]): (section, error message) pairs, in section order.
+                Section is None for header-level errors that cannot be repaired in isolation.
+        """
+
+        violations = ValidationPipeline.of(syntax_validator).run(
+            llm_output=llm_output,
+            action=action,
+            new_predicates=new_predicates,
+            types=types,
+            predicates=predicates,
+            functions=functions,
+        )
+        return self._section_errors(violations, ACTION_SECTIONS)
+
+    def validate_task_sections(
+        self,
+        llm_output: str,
+        objects: dict[str, str],
+        initial: list[dict[str, str]],
+        goal: list[dict[str, str]],
+        syntax_validator: SyntaxValidator,
+        types: dict[str, str] | list[dict[str, str]] | None = None,
+        predicates: list[Predicate] | None = None,
+        functions: list[Function] | None = None,
+    ) -> list[tuple[str | None, str]]:
+        """
+        Runs the validator's enabled checks over a task response, grouping violations by section.
+
+        Args:
+            llm_output (str): raw LLM output
+            objects (dict[str,str]): objects parsed from `llm_output`
+            initial (list[dict[str,str]]): initial states parsed from `llm_output`
+            goal (list[dict[str,str]]): goal states parsed from `llm_output`
+            syntax_validator (SyntaxValidator): syntax checker holding enabled `error_types`
+            types (dict[str,str] | list[dict[str,str]]): current types in domain, defaults to None
+            predicates (list[Predicate]): current predicates in domain, defaults to None
+            functions (list[Function]): current functions in domain, defaults to None
+
+        Returns:
+            errors (list[tuple[str | None, str]]): (section, error message) pairs, in section order.
+                Section is None for header-level errors that cannot be repaired in isolation.
+        """
+
+        violations = ValidationPipeline.of(syntax_validator).run(
+            llm_output=llm_output,
+            objects=objects,
+            initial=initial,
+            goal=goal,
+            types=types,
+            predicates=predicates,
+            functions=functions,
+        )
+        return self._section_errors(violations, TASK_SECTIONS)
+
+    """Repair functions"""
+
+    @require_llm
+    def repair_action(
+        self,
+        model: BaseLLM,
+        prompt_template: str,
+        llm_output: str,
+        action_name: str,
+        syntax_validator: SyntaxValidator,
+        types: dict[str, str] | list[dict[str, str]] | None = None,
+        predicates: list[Predicate] | None = None,
+        functions: list[Function] | None = None,
+        extract_new_preds: bool = False,
+    ) -> tuple[Action, list[Predicate], str, tuple[bool, str]]:
+        """
+        Repairs an action response that failed validation by regenerating only its failing
+        section(s). Returns the failing validation info untouched if the error cannot be
+        localized to a section (i.e. a missing header).
+
+        Args:
+            model (BaseLLM): LLM to query
+            prompt_template (str): structured repair prompt template
+            llm_output (str): raw LLM output that failed validation
+            action_name (str): action name
+            syntax_validator (SyntaxValidator): syntax checker holding enabled `error_types`
+            types (dict[str,str] | list[dict[str,str]]): current types in domain, defaults to None
+            predicates (list[Predicate]): current predicates in domain, defaults to None
+            functions (list[Function]): current functions in domain, defaults to None
+            extract_new_preds (bool): flag for parsing new predicates from response, defaults to False
+
+        Returns:
+            action (Action): repaired action
+            new_predicates (list[Predicate]): repaired list of new predicates
+            llm_output (str): response with repaired section(s) spliced in
+            validation_info (tuple[bool, str]): validation info containing pass flag and error message
+        """
+
+        def parse(output: str):
+            action = parse_action(llm_output=output, action_name=action_name)
+            new_preds = parse_new_predicates(output) if extract_new_preds else []
+            return action, new_preds
+
+        action, new_predicates = parse(llm_output)
+        errors = self.validate_action_sections(
+            llm_output, action, new_predicates, syntax_validator, types, predicates, functions
+        )
+
+        for _ in range(self.max_rounds):
+            if not errors:
+                break
+            section, error_msg = errors[0]
+            if section is None:
+                return action, new_predicates, llm_output, (False, error_msg)
+
+            context = self._action_context(
+                section, action_name, action, new_predicates, types, predicates, functions
+            )
+            patch = self._query_patch(
+                model, prompt_template, llm_output, section, error_msg, context
+            )
+            if patch is None:
+                break
+
+            patched_output = splice_section(llm_output, section, patch)
+            try:
+                patched_action, patched_preds = parse(patched_output)
+            except Exception as e:
+                errors = [(section, str(e))]
+                continue
+
+            llm_output, action, new_predicates = patched_output, patched_action, patched_preds
+            errors = self.validate_action_sections(
+                llm_output, action, new_predicates, syntax_validator, types, predicates, functions
+            )
+
+        return self._result(action, new_predicates, llm_output, errors=errors)
+
+    @require_llm
+    def repair_task(
+        self,
+        model: BaseLLM,
+        prompt_template: str,
+        llm_output: str,
+        syntax_validator: SyntaxValidator,
+        types: dict[str, str] | list[dict[str, str]] | None = None,
+        predicates: list[Predicate] | None = None,
+        functions: list[Function] | None = None,
+    ) -> tuple[
+        dict[str, str], list[dict[str, str]], list[dict[str, str]], str, tuple[bool, str]
+    ]:
+        """
+        Repairs a task response that failed validation by regenerating only its failing
+        section(s) (OBJECTS, INITIAL or GOAL).
+
+        Args:
+            model (BaseLLM): LLM to query
+            prompt_template (str): structured repair prompt template
+            llm_output (str): raw LLM output that failed validation
+            syntax_validator (SyntaxValidator): syntax checker holding enabled `error_types`
+            types (dict[str,str] | list[dict[str,str]]): current types in domain, defaults to None
+            predicates (list[Predicate]): current predicates in domain, defaults to None
+            functions (list[Function]): current functions in domain, defaults to None
+
+        Returns:
+            objects (dict[str,str]): repaired objects
+            initial (list[dict[str,str]]): repaired initial states
+            goal (list[dict[str,str]]): repaired goal states
+            llm_output (str): response with repaired section(s) spliced in
+            validation_info (tuple[bool,str]): validation info containing pass flag and error message
+        """
+
+        def parse(output: str):
+            return parse_objects(output), parse_initial(output), parse_goal(output)
+
+        objects, initial, goal = parse(llm_output)
+        errors = self.validate_task_sections(
+            llm_output, objects, initial, goal, syntax_validator, types, predicates, functions
+        )
+
+        for _ in range(self.max_rounds):
+            if not errors:
+                break
+            section, error_msg = errors[0]
+            if section is None:
+                return objects, initial, goal, llm_output, (False, error_msg)
+
+            context = self._task_context(section, llm_output, types, predicates, functions)
+            patch = self._query_patch(
+                model, prompt_template, llm_output, section, error_msg, context
+            )
+            if patch is None:
+                break
+
+            patched_output = splice_section(llm_output, section, patch)
+            try:
+                patched = parse(patched_output)
+            except Exception as e:
+                errors = [(section, str(e))]
+                continue
+
+            llm_output, (objects, initial, goal) = patched_output, patched
+            errors = self.validate_task_sections(
+                llm_output, objects, initial, goal, syntax_validator, types, predicates, functions
+            )
+
+        return self._result(objects, initial, goal, llm_output, errors=errors)
+
+    """Helper functions"""
+
+    def _query_patch(
+        self,
+        model: BaseLLM,
+        prompt_template: str,
+        llm_output: str,
+        section: str,
+        error_msg: str,
+        context: str,
+    ) -> str | None:
+        """Queries LLM for a single section and returns the patched section body."""
+
+        prompt = PromptTemplate.of(prompt_template).render(
+            section=section,
+            section_content=get_section(llm_output, section),
+            error_msg=error_msg,
+            context=context,
+            strict=False,
+        )
+
+        self.stats["repairs"] += 1
+        self.stats["prompt_chars"] += len(prompt)
+
+        model.reset_tokens()
+        response = model.query(prompt=prompt)
+
+        # prefer content under the repaired heading, otherwise take the first code block
+        body = get_section(response, section) if has_section(response, section) else response
+        if "```" not in body:
+            return None
+        return combine_blocks(body)
+
+    def _section_errors(
+        self, violations: list[Violation], sections: list[str]
+    ) -> list[tuple[str | None, str]]:
+        """Merges violations per section, in section order; a header-level violation masks the rest."""
+
+        for violation in violations:
+            if violation.section is None:
+                return [(None, violation.message)]
+
+        messages = {}
+        for violation in violations:
+            messages.setdefault(violation.section, []).append(violation.message)
+        return [
+            (section, "\n\n".join(messages[section]))
+            for section in sections
+            if section in messages
+        ]
+
+    def _result(self, *values, errors: list[tuple[str | None, str]]) -> tuple:
+        """Appends validation info of the remaining errors to the repaired values."""
+        if errors:
+            return (*values, (False, errors[0][1]))
+        self.stats["resolved"] += 1
+        return (*values, (True, "All validations passed."))
+
+    def _action_context(
+        self,
+        section: str,
+        action_name: str,
+        action: Action,
+        new_predicates: list[Predicate],
+        types: dict[str, str] | list[dict[str, str]] | None,
+        predicates: list[Predicate] | None,
+        functions: list[Function] | None,
+    ) -> str:
+        """Builds the minimal context needed to repair an action section."""
+
+        types_str = pretty_print_dict(types) if types else "No types provided."
+        context = [f"Action name: {action_name}"]
+
+        if section == "Action Parameters":
+            context.append(f"Available types:\n{types_str}")
+        elif section in ("Action Preconditions", "Action Effects"):
+            params_str = "\n".join(f"{n} - {t}" if t else n for n, t in action["params"].items())
+            all_preds = list(predicates or []) + list(new_predicates)
+            preds_str = (
+                "\n".join(p["clean"] for p in all_preds)
+                if all_preds
+                else "No predicates provided."
+            )
+            context.append(f"Action parameters:\n{params_str or 'No parameters.'}")
+            context.append(f"Available predicates:\n{preds_str}")
+            if functions:
+                funcs_str = "\n".join(f["clean"] for f in functions)
+                context.append(f"Available functions:\n{funcs_str}")
+        elif section == "New Predicates":
+            preds_str = (
+                "\n".join(p["clean"] for p in predicates)
+                if predicates
+                else "No predicates provided."
+            )
+            context.append(f"Available types:\n{types_str}")
+            context.append(f"Existing predicates:\n{preds_str}")
+
+        return "\n\n".join(context)
+
+    def _task_context(
+        self,
+        section: str,
+        llm_output: str,
+        types: dict[str, str] | list[dict[str, str]] | None,
+        predicates: list[Predicate] | None,
+        functions: list[Function] | None,
+    ) -> str:
+        """Builds the minimal context needed to repair a task section."""
+
+        if section == "OBJECTS":
+            types_str = pretty_print_dict(types) if types else "No types provided."
+            return f"Available types:\n{types_str}"
+
+        preds_str = (
+            "\n".join(p["clean"] for p in predicates) if predicates else "No predicates provided."
+        )
+        context = [
+            f"Declared objects:\n{combine_blocks(get_section(llm_output, 'OBJECTS'))}",
+            f"Available predicates:\n{preds_str}",
+        ]
+        if functions:
+            context.append("Available functions:\n" + "\n".join(f["clean"] for f in functions))
+        return "\n\n".join(context)
+
+    def get_stats(self) -> dict[str, int]:
+        """Returns # of section repairs, # of resolved responses, and total repair prompt size"""
+        return self.stats
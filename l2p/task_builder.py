@@ -9,7 +9,10 @@ how to use class functions. Refer to /templates in: https://github.com/AI-Planni
 for how to structurally prompt LLMs so they are compatible with class function parsing.
 """
 
-import time
+import io
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Iterable, Iterator
 from .llm import BaseLLM, require_llm
 from .utils import *
 
@@ -18,21 +21,53 @@ class TaskBuilder:
     def __init__(
         self,
         objects: dict[str, str] = None,
-        initial: list[dict[str, str]] = None,
-        goal: list[dict[str, str]] = None,
+        initial: list[dict[str, str]] | FactTable = None,
+        goal: list[dict[str, str]] | FactTable = None,
+        retry_policy: RetryPolicy = None,
     ) -> None:
         """
         Initializes an L2P task builder object.
 
         Args:
-            objects (dict[str,str]): current dictionary of task objects in specification
-            initial (list[dict[str,str]]): current initial states in specification
-            goal (list[dict[str,str]]): current goal states in specification
+            objects (dict[str,str]): current dictionary of task objects in specification (copied)
+            initial (list[dict[str,str]] | FactTable): current initial states in specification, lists are stored as a `NamedCollection` (duplicate states are kept once)
+            goal (list[dict[str,str]] | FactTable): current goal states in specification, lists are stored as a `NamedCollection` (duplicate states are kept once)
+            retry_policy (RetryPolicy): retry policy of `formalize_*` calls, share one instance across a pipeline to cap its retry budget
         """
 
-        self.objects = objects or {}
-        self.initial = initial or []
-        self.goal = goal or []
+        self.objects = objects
+        self.initial = initial
+        self.goal = goal
+        self.fix_log = []  # changes applied by `auto_fix` rule-based fixes
+        self.retry_policy = retry_policy or RetryPolicy()
+
+    """Storage"""
+
+    # objects are owned (deleted in place); state lists are keyed by content, fact tables kept as is
+
+    @property
+    def objects(self) -> dict[str, str]:
+        return self._objects
+
+    @objects.setter
+    def objects(self, objects: dict[str, str] | None):
+        self._objects = dict(objects or {})
+
+    @property
+    def initial(self) -> NamedCollection | FactTable:
+        return self._initial
+
+    @initial.setter
+    def initial(self, initial: list[dict[str, str]] | FactTable | None):
+        self._initial = _state_collection(initial)
+
+    @property
+    def goal(self) -> NamedCollection | FactTable:
+        return self._goal
+
+    @goal.setter
+    def goal(self, goal: list[dict[str, str]] | FactTable | None):
+        self._goal = _state_collection(goal)
 
     """Formalize/generate functions"""
 
@@ -44,7 +79,9 @@ class TaskBuilder:
         prompt_template: str,
         types: dict[str, str] | list[dict[str, str]] | None = None,
         constants: dict[str, str] | None = None,
+        domain_context: DomainContext | None = None,
         syntax_validator: SyntaxValidator = None,
+        auto_fix: bool = False,
         max_retries: int = 3,
     ) -> tuple[dict[str, str], str, tuple[bool, str]]:
         """
@@ -56,7 +93,9 @@ class TaskBuilder:
             prompt_template (str): structured prompt template for :objects extraction
             types (dict[str,str] | list[dict[str,str]]): current types in specification, defaults to None
             constants (dict[str,str]): current constants in specification, defaults to None
+            domain_context (DomainContext): precompiled domain (`l2p/utils/domain_context.py`), replaces types/constants/predicates/functions if given, defaults to None
             syntax_validator (SyntaxValidator): syntax checker for generated objects, defaults to None
+            auto_fix (bool): apply rule-based fixes (`l2p/utils/pddl_fixer.py`) before validation, defaults to False
             max_retries (int): max # of retries if failure occurs
 
         Returns:
@@ -65,57 +104,38 @@ class TaskBuilder:
             validation_info (tuple[bool,str]): validation info containing pass flag and error message
         """
 
-        types_str = pretty_print_dict(types) if types else "No types provided."
-        const_str = (
-            format_constants(constants) if constants else "No constants provided."
-        )
+        ctx = domain_context or DomainContext.from_domain(types, constants, copy=False)
+        types_str, const_str = ctx.types_str, ctx.constants_str
 
-        prompt = (
-            prompt_template.replace("{problem_desc}", problem_desc)
-            .replace("{types}", types_str)
-            .replace("{constants}", const_str)
+        prompt = PromptTemplate.of(prompt_template).render(
+            problem_desc=problem_desc,
+            types=types_str,
+            constants=const_str,
+            strict=False,
         )
 
-        # iterate through attempts in case of extraction failure
-        for attempt in range(max_retries):
-            try:
-                model.reset_tokens()
-                llm_output = model.query(prompt=prompt)  # get BaseLLM response
-
-                # extract respective types from response
-                objects = parse_objects(llm_output=llm_output)
-
-                # run syntax validation if applicable
-                validation_info = (True, "All validations passed.")
-                if syntax_validator:
-                    for error_type in syntax_validator.error_types:
-                        validator = getattr(syntax_validator, f"{error_type}", None)
-                        if not callable(validator):
-                            continue
-
-                        # dispatch based on expected arguments
-                        if error_type == "validate_header":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_duplicate_headers":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_unsupported_keywords":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_task_objects":
-                            validation_info = validator(objects, types)
-
-                        if not validation_info[0]:
-                            return objects, llm_output, validation_info
-
-                return objects, llm_output, validation_info
-
-            except Exception as e:
-                print(
-                    f"Error on attempt {attempt + 1}/{max_retries}: {e}\n"
-                    f"LLM Output:\n{llm_output if 'llm_output' in locals() else 'None'}\nRetrying...\n"
+        # parse and validate LLM output, retried via `self.retry_policy` on failure
+        def handle(llm_output: str):
+            # extract respective types from response
+            objects = parse_objects(llm_output=llm_output)
+            if auto_fix:
+                objects, changes = fix_objects(objects)
+                self.fix_log.extend(changes)
+
+            # run syntax validation if applicable, collecting violations of every check
+            validation_info = (True, "All validations passed.")
+            if syntax_validator:
+                validation_info = ValidationPipeline.of(syntax_validator).validate(
+                    llm_output=llm_output,
+                    objects=objects,
+                    domain_context=ctx,
                 )
-                time.sleep(2)
 
-        raise RuntimeError("Max retries exceeded. Failed to extract objects.")
+            return objects, llm_output, validation_info
+
+        return self.retry_policy.run(
+            model, prompt, handle, max_retries, "Max retries exceeded. Failed to extract objects."
+        )
 
     @require_llm
     def formalize_initial_state(
@@ -130,7 +150,9 @@ class TaskBuilder:
         objects: dict[str, str] | None = None,
         initial: list[dict[str, str]] | None = None,
         goal: list[dict[str, str]] | None = None,
+        domain_context: DomainContext | None = None,
         syntax_validator: SyntaxValidator = None,
+        auto_fix: bool = False,
         max_retries: int = 3,
     ) -> tuple[list[dict[str, str]], str, tuple[bool, str]]:
         """
@@ -147,7 +169,9 @@ class TaskBuilder:
             objects (dict[str,str]): current dictionary of task :objects in specification, defaults to None
             initial (list[dict[str,str]]): current :init states in specification, defaults to None
             goal (list[dict[str,str]]): current :goal states in specification, defaults to None
+            domain_context (DomainContext): precompiled domain (`l2p/utils/domain_context.py`), replaces types/constants/predicates/functions if given, defaults to None
             syntax_validator (SyntaxValidator): syntax checker for generated initial states, defaults to None
+            auto_fix (bool): apply rule-based fixes (`l2p/utils/pddl_fixer.py`) before validation, defaults to False
             max_retries (int): max # of retries if failure occurs
 
         Returns:
@@ -158,77 +182,51 @@ class TaskBuilder:
             validation_info (tuple[bool,str]): validation info containing pass flag and error message
         """
 
-        types_str = pretty_print_dict(types) if types else "No types provided."
-        const_str = (
-            format_constants(constants) if constants else "No constants provided."
-        )
-        preds_str = (
-            "\n".join([f"{pred['raw']}" for pred in predicates])
-            if predicates
-            else "No predicates provided."
-        )
-        funcs_str = (
-            "\n".join([f"{func['raw']}" for func in functions])
-            if functions
-            else "No functions provided."
+        ctx = domain_context or DomainContext.from_domain(
+            types, constants, predicates, functions, copy=False
         )
+        types_str, const_str = ctx.types_str, ctx.constants_str
+        preds_str, funcs_str = ctx.predicates_str, ctx.functions_str
         obj_str = format_objects(objects) if objects else "No objects provided."
         init_str = format_initial(initial) if initial else "No initial state provided."
         goal_str = format_goal(goal) if goal else "No goal state provided."
 
-        prompt = (
-            prompt_template.replace("{problem_desc}", problem_desc)
-            .replace("{types}", types_str)
-            .replace("{constants}", const_str)
-            .replace("{predicates}", preds_str)
-            .replace("{functions}", funcs_str)
-            .replace("{objects}", obj_str)
-            .replace("{initial_state}", init_str)
-            .replace("{goal_state}", goal_str)
+        prompt = PromptTemplate.of(prompt_template).render(
+            problem_desc=problem_desc,
+            types=types_str,
+            constants=const_str,
+            predicates=preds_str,
+            functions=funcs_str,
+            objects=obj_str,
+            initial_state=init_str,
+            goal_state=goal_str,
+            strict=False,
         )
 
-        # iterate through attempts in case of extraction failure
-        for attempt in range(max_retries):
-            try:
-                model.reset_tokens()
-                llm_output = model.query(prompt=prompt)
-
-                # extract respective types from response
-                initial = parse_initial(llm_output=llm_output)
-
-                # run syntax validation if applicable
-                validation_info = (True, "All validations passed.")
-                if syntax_validator:
-                    for error_type in syntax_validator.error_types:
-                        validator = getattr(syntax_validator, f"{error_type}", None)
-                        if not callable(validator):
-                            continue
-
-                        # dispatch based on expected arguments
-                        if error_type == "validate_header":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_duplicate_headers":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_unsupported_keywords":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_task_states":
-                            validation_info = validator(
-                                initial, objects, predicates, "initial"
-                            )
-
-                        if not validation_info[0]:
-                            return initial, llm_output, validation_info
-
-                return initial, llm_output, validation_info
-
-            except Exception as e:
-                print(
-                    f"Error on attempt {attempt + 1}/{max_retries}: {e}\n"
-                    f"LLM Output:\n{llm_output if 'llm_output' in locals() else 'None'}\nRetrying...\n"
+        # parse and validate LLM output, retried via `self.retry_policy` on failure
+        def handle(llm_output: str):
+            if auto_fix:
+                llm_output, changes = fix_task_output(llm_output)
+                self.fix_log.extend(changes)
+
+            # extract respective types from response
+            initial = parse_initial(llm_output=llm_output)
+
+            # run syntax validation if applicable, collecting violations of every check
+            validation_info = (True, "All validations passed.")
+            if syntax_validator:
+                validation_info = ValidationPipeline.of(syntax_validator).validate(
+                    llm_output=llm_output,
+                    initial=initial,
+                    task_objects=objects,
+                    domain_context=ctx,
                 )
-                time.sleep(2)
 
-        raise RuntimeError("Max retries exceeded. Failed to extract initial states.")
+            return initial, llm_output, validation_info
+
+        return self.retry_policy.run(
+            model, prompt, handle, max_retries, "Max retries exceeded. Failed to extract initial states."
+        )
 
     @require_llm
     def formalize_goal_state(
@@ -243,7 +241,9 @@ class TaskBuilder:
         objects: dict[str, str] | None = None,
         initial: list[dict[str, str]] | None = None,
         goal: list[dict[str, str]] | None = None,
+        domain_context: DomainContext | None = None,
         syntax_validator: SyntaxValidator = None,
+        auto_fix: bool = False,
         max_retries: int = 3,
     ) -> tuple[list[dict[str, str]], str, tuple[bool, str]]:
         """
@@ -260,7 +260,9 @@ class TaskBuilder:
             objects (dict[str,str]): current dictionary of task :objects in specification, defaults to None
             initial (list[dict[str,str]]): current :init states in specification, defaults to None
             goal (list[dict[str,str]]): current :goal states in specification, defaults to None
+            domain_context (DomainContext): precompiled domain (`l2p/utils/domain_context.py`), replaces types/constants/predicates/functions if given, defaults to None
             syntax_validator (SyntaxValidator): syntax checker for generated goal states, defaults to None
+            auto_fix (bool): apply rule-based fixes (`l2p/utils/pddl_fixer.py`) before validation, defaults to False
             max_retries (int): max # of retries if failure occurs
 
         Returns:
@@ -271,77 +273,51 @@ class TaskBuilder:
             validation_info (tuple[bool,str]): validation info containing pass flag and error message
         """
 
-        types_str = pretty_print_dict(types) if types else "No types provided."
-        const_str = (
-            format_constants(constants) if constants else "No constants provided."
-        )
-        preds_str = (
-            "\n".join([f"{pred['raw']}" for pred in predicates])
-            if predicates
-            else "No predicates provided."
-        )
-        funcs_str = (
-            "\n".join([f"{func['raw']}" for func in functions])
-            if functions
-            else "No functions provided."
+        ctx = domain_context or DomainContext.from_domain(
+            types, constants, predicates, functions, copy=False
         )
+        types_str, const_str = ctx.types_str, ctx.constants_str
+        preds_str, funcs_str = ctx.predicates_str, ctx.functions_str
         obj_str = format_objects(objects) if objects else "No objects provided."
         init_str = format_initial(initial) if initial else "No initial state provided."
         goal_str = format_goal(goal) if goal else "No goal state provided."
 
-        prompt = (
-            prompt_template.replace("{problem_desc}", problem_desc)
-            .replace("{types}", types_str)
-            .replace("{constants}", const_str)
-            .replace("{predicates}", preds_str)
-            .replace("{functions}", funcs_str)
-            .replace("{objects}", obj_str)
-            .replace("{initial_state}", init_str)
-            .replace("{goal_state}", goal_str)
+        prompt = PromptTemplate.of(prompt_template).render(
+            problem_desc=problem_desc,
+            types=types_str,
+            constants=const_str,
+            predicates=preds_str,
+            functions=funcs_str,
+            objects=obj_str,
+            initial_state=init_str,
+            goal_state=goal_str,
+            strict=False,
         )
 
-        # iterate through attempts in case of extraction failure
-        for attempt in range(max_retries):
-            try:
-                model.reset_tokens()
-                llm_output = model.query(prompt=prompt)
-
-                # extract respective types from response
-                goal = parse_goal(llm_output=llm_output)
-
-                # run syntax validation if applicable
-                validation_info = (True, "All validations passed.")
-                if syntax_validator:
-                    for error_type in syntax_validator.error_types:
-                        validator = getattr(syntax_validator, f"{error_type}", None)
-                        if not callable(validator):
-                            continue
-
-                        # dispatch based on expected arguments
-                        if error_type == "validate_header":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_duplicate_headers":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_unsupported_keywords":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_task_states":
-                            validation_info = validator(
-                                goal, objects, predicates, "goal"
-                            )
-
-                        if not validation_info[0]:
-                            return goal, llm_output, validation_info
-
-                return goal, llm_output, validation_info
-
-            except Exception as e:
-                print(
-                    f"Error on attempt {attempt + 1}/{max_retries}: {e}\n"
-                    f"LLM Output:\n{llm_output if 'llm_output' in locals() else 'None'}\nRetrying...\n"
+        # parse and validate LLM output, retried via `self.retry_policy` on failure
+        def handle(llm_output: str):
+            if auto_fix:
+                llm_output, changes = fix_task_output(llm_output)
+                self.fix_log.extend(changes)
+
+            # extract respective types from response
+            goal = parse_goal(llm_output=llm_output)
+
+            # run syntax validation if applicable, collecting violations of every check
+            validation_info = (True, "All validations passed.")
+            if syntax_validator:
+                validation_info = ValidationPipeline.of(syntax_validator).validate(
+                    llm_output=llm_output,
+                    goal=goal,
+                    task_objects=objects,
+                    domain_context=ctx,
                 )
-                time.sleep(2)
 
-        raise RuntimeError("Max retries exceeded. Failed to extract goal states.")
+            return goal, llm_output, validation_info
+
+        return self.retry_policy.run(
+            model, prompt, handle, max_retries, "Max retries exceeded. Failed to extract goal states."
+        )
 
     @require_llm
     def formalize_task(
@@ -353,7 +329,9 @@ class TaskBuilder:
         constants: dict[str, str] | None = None,
         predicates: list[Predicate] | None = None,
         functions: list[Function] | None = None,
+        domain_context: DomainContext | None = None,
         syntax_validator: SyntaxValidator = None,
+        auto_fix: bool = False,
         max_retries: int = 3,
     ) -> tuple[
         dict[str, str],
@@ -373,7 +351,9 @@ class TaskBuilder:
             constants (dict[str,str]): current constants in specification, defaults to None
             predicates (list[Predicate]): list of current predicates in domain, defaults to None
             functions (list[Function]): list of current functions in specification, defaults to None
+            domain_context (DomainContext): precompiled domain (`l2p/utils/domain_context.py`), replaces types/constants/predicates/functions if given, defaults to None
             syntax_validator (SyntaxValidator): syntax checker for generated :problem, defaults to None
+            auto_fix (bool): apply rule-based fixes (`l2p/utils/pddl_fixer.py`) before validation, defaults to False
             max_retries (int): max # of retries if failure occurs
 
         Returns:
@@ -384,106 +364,185 @@ class TaskBuilder:
             validation_info (tuple[bool,str]): validation info containing pass flag and error message
         """
 
-        types_str = pretty_print_dict(types) if types else "No types provided."
-        const_str = (
-            format_constants(constants) if constants else "No constants provided."
+        ctx = domain_context or DomainContext.from_domain(
+            types, constants, predicates, functions, copy=False
         )
-        preds_str = (
-            "\n".join([f"{pred['raw']}" for pred in predicates])
-            if predicates
-            else "No predicates provided."
+        types_str, const_str = ctx.types_str, ctx.constants_str
+        preds_str, funcs_str = ctx.predicates_str, ctx.functions_str
+
+        prompt = PromptTemplate.of(prompt_template).render(
+            problem_desc=problem_desc,
+            types=types_str,
+            constants=const_str,
+            predicates=preds_str,
+            functions=funcs_str,
+            strict=False,
         )
-        funcs_str = (
-            "\n".join([f"{func['raw']}" for func in functions])
-            if functions
-            else "No functions provided."
+
+        # parse and validate LLM output, retried via `self.retry_policy` on failure
+        def handle(llm_output: str):
+            if auto_fix:
+                llm_output, changes = fix_task_output(llm_output)
+                self.fix_log.extend(changes)
+
+            # extract respective types from response
+            objects = parse_objects(llm_output=llm_output)
+            initial = parse_initial(llm_output=llm_output)
+            goal = parse_goal(llm_output=llm_output)
+            if auto_fix:
+                objects, changes = fix_objects(objects)
+                self.fix_log.extend(changes)
+
+            # run syntax validation if applicable, collecting violations of every check
+            validation_info = (True, "All validations passed.")
+            if syntax_validator:
+                validation_info = ValidationPipeline.of(syntax_validator).validate(
+                    llm_output=llm_output,
+                    objects=objects,
+                    initial=initial,
+                    goal=goal,
+                    domain_context=ctx,
+                )
+
+            return objects, initial, goal, llm_output, validation_info
+
+        return self.retry_policy.run(
+            model, prompt, handle, max_retries, "Max retries exceeded. Failed to extract task."
         )
 
-        prompt = (
-            prompt_template.replace("{problem_desc}", problem_desc)
-            .replace("{types}", types_str)
-            .replace("{constants}", const_str)
-            .replace("{predicates}", preds_str)
-            .replace("{functions}", funcs_str)
+    @require_llm
+    def formalize_tasks(
+        self,
+        model: BaseLLM,
+        problem_descs: list[str] | dict[str, str],
+        prompt_template: str,
+        types: dict[str, str] | list[dict[str, str]] | None = None,
+        constants: dict[str, str] | None = None,
+        predicates: list[Predicate] | None = None,
+        functions: list[Function] | None = None,
+        domain_context: DomainContext | None = None,
+        syntax_validator: SyntaxValidator = None,
+        auto_fix: bool = False,
+        max_retries: int = 3,
+        max_workers: int = 8,
+    ) -> Iterator[
+        tuple[
+            int | str,
+            dict[str, str],
+            list[dict[str, str]],
+            list[dict[str, str]],
+            str,
+            tuple[bool, str],
+        ]
+    ]:
+        """
+        Formalizes many task specifications of the same domain concurrently via LLM (see
+        `formalize_task`). Results are yielded as soon as each problem completes, so they
+        arrive out of order; use the returned key to match them to their description.
+
+        The domain is compiled once into a `DomainContext` and shared by every problem. At
+        most `max_workers` LLM queries are in flight at a time, thus `model` must support
+        concurrent `query` calls. A problem that fails after `max_retries` does not stop the
+        batch; it is yielded with empty components and a failed validation info.
+
+        Args:
+            model (BaseLLM): LLM to query
+            problem_descs (list[str] | dict[str,str]): problem descriptions, keyed by list index or dict key
+            prompt_template (str): structured prompt template for :problem extraction
+            types (dict[str,str] | list[dict[str,str]]): current :types in domain, defaults to None
+            constants (dict[str,str]): current constants in specification, defaults to None
+            predicates (list[Predicate]): list of current predicates in domain, defaults to None
+            functions (list[Function]): list of current functions in specification, defaults to None
+            domain_context (DomainContext): precompiled domain (`l2p/utils/domain_context.py`), replaces types/constants/predicates/functions if given, defaults to None
+            syntax_validator (SyntaxValidator): syntax checker for generated :problem, defaults to None
+            auto_fix (bool): apply rule-based fixes (`l2p/utils/pddl_fixer.py`) before validation, defaults to False
+            max_retries (int): max # of retries per problem if failure occurs
+            max_workers (int): max # of problems formalized concurrently, defaults to 8
+
+        Yields:
+            key (int | str): index/key of the problem in `problem_descs`
+            objects (dict[str,str]): dictionary of object names and assigned types
+            initial (list[dict[str,str]]): list of dictionary of initial states
+            goal (list[dict[str,str]]): list of dictionary of goal states
+            llm_output (str): the raw string BaseLLM response
+            validation_info (tuple[bool,str]): validation info containing pass flag and error message
+        """
+
+        if max_workers < 1:
+            raise ValueError("`max_workers` must be at least 1.")
+
+        ctx = domain_context or DomainContext.from_domain(
+            types, constants, predicates, functions
         )
+        items = (
+            problem_descs.items()
+            if isinstance(problem_descs, dict)
+            else enumerate(problem_descs)
+        )
+        pending_items = iter(items)
+
+        def run(problem_desc: str):
+            return self.formalize_task(
+                model=model,
+                problem_desc=problem_desc,
+                prompt_template=prompt_template,
+                domain_context=ctx,
+                syntax_validator=syntax_validator,
+                auto_fix=auto_fix,
+                max_retries=max_retries,
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            running = {}  # future -> problem key
+
+            def submit_next() -> bool:
+                item = next(pending_items, None)
+                if item is None:
+                    return False
+                key, problem_desc = item
+                running[executor.submit(run, problem_desc)] = key
+                return True
+
+            # only `max_workers` problems are submitted at a time, so closing the
+            # generator early does not leave a backlog of queued LLM calls
+            while len(running) < max_workers and submit_next():
+                pass
 
-        # iterate through attempts in case of extraction failure
-        for attempt in range(max_retries):
             try:
-                model.reset_tokens()
-                llm_output = model.query(prompt=prompt)
-
-                # extract respective types from response
-                objects = parse_objects(llm_output=llm_output)
-                initial = parse_initial(llm_output=llm_output)
-                goal = parse_goal(llm_output=llm_output)
-
-                # run syntax validation if applicable
-                validation_info = (True, "All validations passed.")
-                if syntax_validator:
-                    for error_type in syntax_validator.error_types:
-                        validator = getattr(syntax_validator, f"{error_type}", None)
-                        if not callable(validator):
-                            continue
-
-                        # dispatch based on expected arguments
-                        if error_type == "validate_header":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_duplicate_headers":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_unsupported_keywords":
-                            validation_info = validator(llm_output)
-                        elif error_type == "validate_task_objects":
-                            validation_info = validator(objects, types)
-                        elif error_type == "validate_task_states":
-                            validation_info = validator(
-                                states=initial,
-                                objects=objects,
-                                predicates=predicates,
-                                functions=functions,
-                                state_type="initial",
-                            )
-                            if validation_info[0]:
-                                validation_info = validator(
-                                    states=goal,
-                                    objects=objects,
-                                    predicates=predicates,
-                                    functions=functions,
-                                    state_type="goal",
-                                )
-
-                        if not validation_info[0]:
-                            return objects, initial, goal, llm_output, validation_info
-
-                return objects, initial, goal, llm_output, validation_info
-
-            except Exception as e:
-                print(
-                    f"Error on attempt {attempt + 1}/{max_retries}: {e}\n"
-                    f"LLM Output:\n{llm_output if 'llm_output' in locals() else 'None'}\nRetrying...\n"
-                )
-                time.sleep(2)
-
-        raise RuntimeError("Max retries exceeded. Failed to extract task.")
+                while running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        key = running.pop(future)
+                        try:
+                            result = (key, *future.result())
+                        except Exception as e:
+                            error = f"[ERROR]: Failed to formalize task: {e}"
+                            result = (key, {}, [], [], "", (False, error))
+                        submit_next()
+                        yield result
+            finally:
+                for future in running:
+                    future.cancel()
 
     """Delete functions"""
 
     def delete_objects(self, object: dict[str, str]):
         """Deletes specific item in :objects from current specification"""
-        if self.objects is not None:
-            self.objects = {
-                var: type_ for var, type_ in self.objects.items() if var != object
-            }
+        self.objects.pop(object, None)
 
     def delete_initial_state(self, state: dict[str, str]):
         """Deletes specific :init state from current specification"""
-        if self.initial is not None:
-            self.initial = [s for s in self.initial if s != state]
+        if isinstance(self.initial, FactTable):
+            self.initial = self.initial.remove(state)
+        else:
+            self.initial.pop(state_key(state), None)
 
     def delete_goal_state(self, state: dict[str, str]):
         """Deletes specific PDDL :goal state from current specification"""
-        if self.goal is not None:
-            self.goal = [s for s in self.goal if s != state]
+        if isinstance(self.goal, FactTable):
+            self.goal = self.goal.remove(state)
+        else:
+            self.goal.pop(state_key(state), None)
 
     """Set functions"""
 
@@ -491,12 +550,12 @@ class TaskBuilder:
         """Sets PDDL :objects for current specification"""
         self.objects = objects
 
-    def set_initial(self, initial: list[dict[str, str]]):
-        """Sets PDDL :init states for current specification"""
+    def set_initial(self, initial: list[dict[str, str]] | FactTable):
+        """Sets PDDL :init states (state dictionaries or a `FactTable`) for current specification; duplicate state dictionaries are kept once"""
         self.initial = initial
 
-    def set_goal(self, goal: list[dict[str, str]]):
-        """Sets PDDL :goal states for current specification"""
+    def set_goal(self, goal: list[dict[str, str]] | FactTable):
+        """Sets PDDL :goal states (state dictionaries or a `FactTable`) for current specification; duplicate state dictionaries are kept once"""
         self.goal = goal
 
     """Get functions"""
@@ -505,21 +564,21 @@ class TaskBuilder:
         """Returns PDDL :objects from current specification"""
         return self.objects
 
-    def get_initial(self) -> list[dict[str, str]]:
-        """Returns PDDL :init states from current specification"""
-        return self.initial
+    def get_initial(self) -> list[dict[str, str]] | FactTable:
+        """Returns PDDL :init states from current specification (as a new list, or the `FactTable` if one was set)"""
+        return _state_list(self.initial)
 
-    def get_goal(self) -> list[dict[str, str]]:
-        """Returns PDDL :goal states from current specification"""
-        return self.goal
+    def get_goal(self) -> list[dict[str, str]] | FactTable:
+        """Returns PDDL :goal states from current specification (as a new list, or the `FactTable` if one was set)"""
+        return _state_list(self.goal)
 
     def generate_task(
         self,
         domain_name: str,
         problem_name: str,
         objects: dict[str, str],
-        initial: list[dict[str, str]],
-        goal: list[dict[str, str]],
+        initial: list[dict[str, str]] | FactTable,
+        goal: list[dict[str, str]] | FactTable,
     ) -> str:
         """
         Generates PDDL problem from given information.
@@ -528,19 +587,63 @@ class TaskBuilder:
             domain_name (str): domain name
             problem_name (str): specific task instance name
             objects (dict[str,str]): PDDL :objects
-            initial (list[dict[str,str]]): PDDL :init states
-            goal (list[dict[str,str]]): PDDL :goal states
+            initial (list[dict[str,str]] | FactTable): PDDL :init states
+            goal (list[dict[str,str]] | FactTable): PDDL :goal states
 
         Returns:
             desc (str): PDDL problem in string format
         """
 
-        desc = "(define\n"
-        desc += f"   (problem {problem_name})\n"
-        desc += f"   (:domain {domain_name})\n\n"
-        desc += f"   (:objects \n{indent(format_objects(objects))}\n   )\n\n"
-        desc += f"   (:init\n{indent(format_initial(initial))}\n   )\n\n"
-        desc += f"   (:goal\n{indent(format_goal(goal))}\n   )\n"
-        desc += ")"
+        buffer = io.StringIO()
+        write_task(
+            buffer, domain_name, problem_name, objects, initial, goal, group_objects=False
+        )
+        desc = buffer.getvalue()
         desc = desc.replace("AND", "and").replace("OR", "or")
         return desc
+
+    def write_tasks(
+        self,
+        tasks: Iterable[tuple[str, str]],
+        output_dir: str,
+    ) -> list[str]:
+        """
+        Writes many PDDL problems into `output_dir`, each as soon as it arrives, so `tasks` can
+        be a generator fed by `formalize_tasks` without holding finished problems in memory.
+
+        Args:
+            tasks (Iterable[tuple[str,str]]): pairs of (file name, PDDL problem string)
+            output_dir (str): directory to write problem files into (created if missing)
+
+        Returns:
+            file_paths (list[str]): paths of written problem files, in input order
+        """
+
+        os.makedirs(output_dir, exist_ok=True)
+
+        file_paths = []
+        for file_name, pddl_problem in tasks:
+            file_path = os.path.join(output_dir, file_name)
+            with open(file_path, "w") as f:
+                f.write(pddl_problem)
+            file_paths.append(file_path)
+
+        return file_paths
+
+
+def _state_collection(
+    states: list[dict[str, str]] | FactTable | None,
+) -> NamedCollection | FactTable:
+    """Keeps fact tables, stores state lists in a `NamedCollection` keyed by state content"""
+    if isinstance(states, FactTable):
+        return states
+    return NamedCollection.of(states, key=state_key)
+
+
+def _state_list(
+    states: NamedCollection | FactTable,
+) -> list[dict[str, str]] | FactTable:
+    """Returns fact tables as is, state collections as a list"""
+    if isinstance(states, FactTable):
+        return states
+    return list(states)
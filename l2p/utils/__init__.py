@@ -1,7 +1,23 @@
+from .sexpr import *
+from .type_index import *
+from .fact_table import *
+from .named_collection import *
+from .usage_index import *
 from .pddl_parser import *
 from .pddl_types import *
 from .pddl_validator import *
+from .validation_pipeline import *
 from .pddl_planner import *
 from .pddl_format import *
+from .pddl_writer import *
 from .htn_parser import *
 from .md_parser import *
+from .checkpoint import *
+from .pddl_fixer import *
+from .domain_context import *
+from .state_index import *
+from .retry_policy import *
+from .render_cache import *
+from .prompt_template import *
+from .pddl_objects import *
+from .planner_pool import *
@@ -0,0 +1,255 @@
+"""
+L2P Checkpoint Utilities
+
+This module persists builder state (types, hierarchy, constants, predicates, functions, actions,
+objects, initial and goal states) together with raw LLM outputs after each stage of a run. Each
+checkpoint is written atomically (temporary file + `os.replace`), so a crash mid-write never
+leaves a corrupted stage behind. Checkpoints are keyed by run ID and stage name:
+
+    <root>/<run_id>/<stage>.json
+    <root>/<run_id>/manifest.json  (ordered list of completed stages)
+
+A restarted run can then skip every completed stage and resume at the first incomplete one.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from collections import OrderedDict
+from typing import Any
+from .fact_table import FactTable
+from .named_collection import NamedCollection
+from .pddl_objects import FrozenObject, Params
+
+DOMAIN_FIELDS = [
+    "requirements",
+    "types",
+    "type_hierarchy",
+    "constants",
+    "predicates",
+    "functions",
+    "pddl_actions",
+]
+TASK_FIELDS = ["objects", "initial", "goal"]
+
+
+class Checkpoint:
+    def __init__(self, root: str, run_id: str) -> None:
+        """
+        Initializes a checkpoint store for a single run.
+
+        Args:
+            root (str): directory holding checkpoints of all runs
+            run_id (str): identifier of this run (i.e. "blocksworld-task1")
+        """
+
+        self.root = root
+        self.run_id = run_id
+        self.run_dir = os.path.join(root, run_id)
+        os.makedirs(self.run_dir, exist_ok=True)
+
+    """Save/load functions"""
+
+    def save(self, stage: str, state: dict[str, Any], llm_output: str | None = None):
+        """
+        Atomically persists the state of a completed stage and marks it as complete.
+
+        Args:
+            stage (str): name of stage (i.e. "type_extraction")
+            state (dict[str,Any]): JSON-serializable outputs of stage
+            llm_output (str): raw LLM output(s) of stage, defaults to None
+        """
+
+        record = {
+            "run_id": self.run_id,
+            "stage": stage,
+            "timestamp": time.time(),
+            "state": state,
+            "llm_output": llm_output,
+        }
+        _atomic_write_json(self._stage_path(stage), record)
+
+        completed = self.completed_stages()
+        if stage not in completed:
+            completed.append(stage)
+        _atomic_write_json(
+            os.path.join(self.run_dir, "manifest.json"),
+            {"run_id": self.run_id, "completed": completed},
+        )
+
+    def load(self, stage: str) -> dict[str, Any] | None:
+        """
+        Loads the state of a completed stage.
+
+        Args:
+            stage (str): name of stage
+
+        Returns:
+            state (dict[str,Any]): stored state, None if stage has not completed
+        """
+
+        record = self._load_record(stage)
+        return restore_params(record["state"]) if record else None
+
+    def load_llm_output(self, stage: str) -> str | None:
+        """Returns raw LLM output stored for a completed stage"""
+        record = self._load_record(stage)
+        return record["llm_output"] if record else None
+
+    def has(self, stage: str) -> bool:
+        """Checks if a stage has completed"""
+        return stage in self.completed_stages()
+
+    def completed_stages(self) -> list[str]:
+        """Returns completed stages in the order they were saved"""
+        manifest = os.path.join(self.run_dir, "manifest.json")
+        if not os.path.exists(manifest):
+            return []
+        with open(manifest, "r") as f:
+            completed = json.load(f)["completed"]
+        # only trust stages whose record is actually on disk
+        return [s for s in completed if os.path.exists(self._stage_path(s))]
+
+    def first_incomplete(self, stages: list[str]) -> str | None:
+        """
+        Returns the first stage of a pipeline that has not completed yet.
+
+        Args:
+            stages (list[str]): ordered stage names of the pipeline
+
+        Returns:
+            stage (str): first incomplete stage, None if every stage has completed
+        """
+
+        completed = set(self.completed_stages())
+        for stage in stages:
+            if stage not in completed:
+                return stage
+        return None
+
+    def clear(self):
+        """Removes every checkpoint of this run"""
+        shutil.rmtree(self.run_dir, ignore_errors=True)
+        os.makedirs(self.run_dir, exist_ok=True)
+
+    """Builder state functions"""
+
+    def save_builders(
+        self,
+        stage: str,
+        domain_builder=None,
+        task_builder=None,
+        llm_output: str | None = None,
+    ):
+        """
+        Persists the state of a `DomainBuilder` and/or `TaskBuilder` for a completed stage.
+
+        Args:
+            stage (str): name of stage
+            domain_builder (DomainBuilder): domain builder to snapshot, defaults to None
+            task_builder (TaskBuilder): task builder to snapshot, defaults to None
+            llm_output (str): raw LLM output(s) of stage, defaults to None
+        """
+
+        state = {}
+        if domain_builder is not None:
+            state["domain"] = {
+                f: _serializable(getattr(domain_builder, f)) for f in DOMAIN_FIELDS
+            }
+        if task_builder is not None:
+            state["task"] = {
+                f: _serializable(getattr(task_builder, f)) for f in TASK_FIELDS
+            }
+        self.save(stage, state, llm_output)
+
+    def restore_builders(
+        self, stage: str, domain_builder=None, task_builder=None
+    ) -> bool:
+        """
+        Restores `DomainBuilder` and/or `TaskBuilder` state stored for a completed stage.
+
+        Args:
+            stage (str): name of stage
+            domain_builder (DomainBuilder): domain builder to restore into, defaults to None
+            task_builder (TaskBuilder): task builder to restore into, defaults to None
+
+        Returns:
+            restored (bool): True if stage was found and restored
+        """
+
+        state = self.load(stage)
+        if state is None:
+            return False
+
+        if domain_builder is not None and "domain" in state:
+            for f in DOMAIN_FIELDS:
+                setattr(domain_builder, f, state["domain"][f])
+        if task_builder is not None and "task" in state:
+            for f in TASK_FIELDS:
+                setattr(task_builder, f, state["task"][f])
+        return True
+
+    def _stage_path(self, stage: str) -> str:
+        return os.path.join(self.run_dir, f"{stage}.json")
+
+    def _load_record(self, stage: str) -> dict[str, Any] | None:
+        path = self._stage_path(stage)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r") as f:
+            return json.load(f)
+
+
+def restore_params(obj: Any) -> Any:
+    """
+    Recursively converts `params` dictionaries of predicates/functions/actions back into
+    OrderedDict (ParameterList), which JSON deserialization turns into plain dicts.
+    """
+
+    if isinstance(obj, list):
+        return [restore_params(o) for o in obj]
+    if isinstance(obj, dict):
+        restored = {}
+        for k, v in obj.items():
+            if k == "params" and isinstance(v, dict):
+                restored[k] = OrderedDict(v)
+            else:
+                restored[k] = restore_params(v)
+        return restored
+    return obj
+
+
+def _serializable(value: Any) -> Any:
+    """Converts fact tables into state dictionaries and named collections into lists for JSON"""
+    if isinstance(value, FactTable):
+        return value.to_states()
+    if isinstance(value, NamedCollection):
+        return list(value)
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    """Converts frozen PDDL objects (`l2p/utils/pddl_objects.py`) into dictionaries for JSON"""
+    if isinstance(value, (FrozenObject, Params)):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _atomic_write_json(path: str, data: Any):
+    """Writes JSON to `path` so readers only ever observe the old or the new file."""
+
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2, default=_json_default)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
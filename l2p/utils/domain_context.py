@@ -0,0 +1,138 @@
+"""
+L2P Domain Context
+
+This module defines `DomainContext`, an immutable, precompiled view of a PDDL domain that is
+built once and shared by every task-level builder and validator call made against that domain
+(i.e. when generating hundreds of problems for one domain).
+
+It holds:
+    - pre-rendered prompt fragments ({types}, {constants}, {predicates}, {functions})
+    - name -> definition indexes for predicates and functions
+    - the flattened type dictionary and a `TypeIndex` (parents, supertypes, subtype checks)
+    - predicates and functions as frozen objects (`l2p/utils/pddl_objects.py`), shared rather than
+      deep-copied between contexts built from the same domain
+
+For instance:
+    domain_context = DomainContext.from_domain(
+        types=types, constants=constants, predicates=predicates, functions=functions
+    )
+
+    for problem_desc in problem_descs:
+        objects, initial, goal, llm_output, validation_info = task_builder.formalize_task(
+            model=model,
+            problem_desc=problem_desc,
+            prompt_template=prompt_template,
+            domain_context=domain_context,
+            syntax_validator=syntax_validator,
+        )
+"""
+
+from copy import deepcopy
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+
+from .pddl_format import format_constants, format_types, pretty_print_dict
+from .pddl_objects import FrozenFunction, FrozenPredicate, freeze_all
+from .pddl_types import Function, Predicate
+from .type_index import TypeIndex
+
+
+@dataclass(frozen=True)
+class DomainContext:
+    types: dict[str, str] | list[dict[str, str]] | None
+    constants: Mapping[str, str]
+    predicates: tuple[Predicate, ...]
+    functions: tuple[Function, ...]
+
+    # pre-rendered prompt fragments
+    types_str: str
+    constants_str: str
+    predicates_str: str
+    functions_str: str
+
+    # lookup tables
+    flat_types: Mapping[str, str]  # format_types(types) output
+    type_index: TypeIndex
+    predicate_index: Mapping[str, Predicate]
+    function_index: Mapping[str, Function]
+
+    @classmethod
+    def from_domain(
+        cls,
+        types: dict[str, str] | list[dict[str, str]] | None = None,
+        constants: dict[str, str] | None = None,
+        predicates: list[Predicate] | None = None,
+        functions: list[Function] | None = None,
+        copy: bool = True,
+    ) -> "DomainContext":
+        """
+        Builds a domain context. Types are deep-copied and predicates/functions frozen, so later
+        changes to the given objects do not leak into the context.
+
+        Args:
+            types (dict[str,str] | list[dict[str,str]]): types in domain, defaults to None
+            constants (dict[str,str]): constants in domain, defaults to None
+            predicates (list[Predicate]): predicates in domain, defaults to None
+            functions (list[Function]): functions in domain, defaults to None
+            copy (bool): copy/freeze components; disable for short-lived contexts, defaults to True
+
+        Returns:
+            domain_context (DomainContext): immutable domain context
+        """
+
+        if copy:
+            types = deepcopy(types)
+            predicates = freeze_all(predicates, FrozenPredicate)
+            functions = freeze_all(functions, FrozenFunction)
+        types = types or None
+        constants = dict(constants or {})
+        predicates = tuple(predicates or [])
+        functions = tuple(functions or [])
+
+        flat_types = format_types(types) or {}
+        type_index = TypeIndex(types)
+
+        return cls(
+            types=types,
+            constants=MappingProxyType(constants),
+            predicates=predicates,
+            functions=functions,
+            types_str=pretty_print_dict(types) if types else "No types provided.",
+            constants_str=(
+                format_constants(constants) if constants else "No constants provided."
+            ),
+            predicates_str=(
+                "\n".join([f"{pred['raw']}" for pred in predicates])
+                if predicates
+                else "No predicates provided."
+            ),
+            functions_str=(
+                "\n".join([f"{func['raw']}" for func in functions])
+                if functions
+                else "No functions provided."
+            ),
+            flat_types=MappingProxyType(flat_types),
+            type_index=type_index,
+            predicate_index=MappingProxyType({p["name"]: p for p in predicates}),
+            function_index=MappingProxyType({f["name"]: f for f in functions}),
+        )
+
+    @classmethod
+    def from_builder(cls, domain_builder) -> "DomainContext":
+        """Builds a domain context from the current state of a `DomainBuilder`"""
+        return cls.from_domain(
+            types=domain_builder.type_hierarchy or domain_builder.types,
+            constants=domain_builder.constants,
+            predicates=domain_builder.predicates,
+            functions=domain_builder.functions,
+        )
+
+    def is_subtype(self, child: str, parent: str) -> bool:
+        """Checks if type `child` is `parent` or one of its (transitive) subtypes"""
+        return self.type_index.is_subtype(child, parent)
+
+    def type_names(self) -> list[str]:
+        """Returns names of all declared types"""
+        return self.type_index.names
+
@@ -0,0 +1,308 @@
+"""
+L2P Fact Table
+
+This module defines `FactTable`, a compact store for task states (PDDL :init / :goal). Instead of
+one dict with a `pred_name` string and a list of parameter strings per fact, names are interned
+into a `SymbolTable` (shareable between tables) and each fact is stored as integer IDs in flat
+arrays:
+    - predicate/function symbol ID
+    - offset of its parameter (object) IDs in one shared parameter array
+    - value ID of function states (`op` + `value`), -1 for predicate states
+    - one bit in a negation bitmask
+
+Facts are compared by their ID tuples (`key`), so dedupe, membership, set operations and diffing
+are hash lookups. Tables iterate as the usual state dictionaries (built lazily), so they can be
+passed wherever `list[dict]` states are expected; `TaskBuilder.set_initial`/`set_goal` and
+`format_initial`/`format_goal` accept them directly.
+
+For instance:
+    symbols = SymbolTable()
+    initial = FactTable(parse_initial(llm_output), symbols=symbols)
+    goal = FactTable(parse_goal(llm_output), symbols=symbols)
+    goal.difference(initial)  # goal facts not yet true in the initial state
+"""
+
+from array import array
+from typing import Iterable, Iterator
+
+FactKey = tuple[int, tuple[int, ...], bool, int]
+
+
+class SymbolTable:
+    """Interns names (predicates, functions, objects, values) to consecutive integer IDs"""
+
+    __slots__ = ("names", "ids")
+
+    def __init__(self) -> None:
+        self.names: list[str] = []
+        self.ids: dict[str, int] = {}
+
+    def intern(self, name: str) -> int:
+        """Returns the ID of `name`, adding it if new"""
+        symbol_id = self.ids.get(name)
+        if symbol_id is None:
+            symbol_id = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return symbol_id
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+class FactTable:
+    def __init__(
+        self,
+        states: Iterable[dict[str, str]] | None = None,
+        symbols: SymbolTable | None = None,
+    ) -> None:
+        """
+        Initializes a fact table.
+
+        Args:
+            states (Iterable[dict[str,str]]): predicate states {pred_name, params, neg} and function states {func_name, params, value, op}, defaults to None
+            symbols (SymbolTable): symbol table to intern names into (share it between tables of one task), defaults to None
+        """
+
+        self.symbols = symbols or SymbolTable()
+        self._names = array("i")  # predicate/function symbol ID per fact
+        self._offsets = array("i", [0])  # fact i's params are _params[_offsets[i]:_offsets[i + 1]]
+        self._params = array("i")
+        self._values = array("i")  # symbol ID of "op value" for function states, else -1
+        self._neg = bytearray()  # negation bitmask
+        self._index = None  # key -> first position, built on first lookup
+
+        if states is not None:
+            self.extend(states)
+
+    @classmethod
+    def of(
+        cls, states: "Iterable[dict[str, str]] | FactTable", symbols: SymbolTable | None = None
+    ) -> "FactTable":
+        """Returns `states` if it is already a table (with the same symbols), else builds one"""
+        if isinstance(states, FactTable) and (symbols is None or states.symbols is symbols):
+            return states
+        return cls(states, symbols=symbols)
+
+    """Adding facts"""
+
+    def add(self, state: dict[str, str]):
+        """Appends a state dictionary"""
+
+        intern = self.symbols.intern
+        if state.get("func_name"):
+            self._append(
+                intern(state["func_name"]),
+                [intern(p) for p in state["params"]],
+                False,
+                intern(f"{state['op']} {state['value']}"),
+            )
+        else:
+            self._append(
+                intern(state["pred_name"]),
+                [intern(p) for p in state["params"]],
+                bool(state.get("neg")),
+                -1,
+            )
+
+    def extend(self, states: "Iterable[dict[str, str]] | FactTable"):
+        """Appends states (a table sharing this table's symbols is copied by ID)"""
+        if isinstance(states, FactTable) and states.symbols is self.symbols:
+            for key in states.keys():
+                self._append(*key)
+        else:
+            for state in states:
+                self.add(state)
+
+    def _append(self, name: int, params: Iterable[int], neg: bool, value: int):
+        position = len(self._names)
+        self._names.append(name)
+        self._params.extend(params)
+        self._offsets.append(len(self._params))
+        self._values.append(value)
+        if position % 8 == 0:
+            self._neg.append(0)
+        if neg:
+            self._neg[position >> 3] |= 1 << (position & 7)
+        if self._index is not None:
+            self._index.setdefault(self.key(position), position)
+
+    """Access"""
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __bool__(self) -> bool:
+        return len(self._names) > 0
+
+    def is_negated(self, position: int) -> bool:
+        return bool(self._neg[position >> 3] & (1 << (position & 7)))
+
+    def key(self, position: int) -> FactKey:
+        """ID tuple identifying the fact at `position`: (name, params, neg, value)"""
+        return (
+            self._names[position],
+            tuple(self._params[self._offsets[position] : self._offsets[position + 1]]),
+            self.is_negated(position),
+            self._values[position],
+        )
+
+    def keys(self) -> Iterator[FactKey]:
+        """Keys of all facts, in order"""
+        offsets, params, values, neg = self._offsets, self._params, self._values, self._neg
+        for i, name in enumerate(self._names):
+            yield (
+                name,
+                tuple(params[offsets[i] : offsets[i + 1]]),
+                bool(neg[i >> 3] >> (i & 7) & 1),
+                values[i],
+            )
+
+    def __getitem__(self, position: int) -> dict[str, str]:
+        if position < 0:
+            position += len(self._names)
+        if not 0 <= position < len(self._names):
+            raise IndexError("fact index out of range")
+        return self._state(self.key(position))
+
+    def __iter__(self) -> Iterator[dict[str, str]]:
+        return (self._state(key) for key in self.keys())
+
+    def _state(self, key: FactKey) -> dict[str, str]:
+        """Converts a key into the state dictionary format of `parse_initial`/`parse_goal`"""
+        name, params, neg, value = key
+        names = self.symbols.names
+        params = [names[p] for p in params]
+        if value >= 0:
+            op, val = names[value].split(" ", 1)
+            return {"func_name": names[name], "params": params, "value": val, "op": op}
+        return {"pred_name": names[name], "params": params, "neg": neg}
+
+    def to_states(self) -> list[dict[str, str]]:
+        """Returns all facts as state dictionaries"""
+        return list(self)
+
+    def pddl_lines(self) -> Iterator[str]:
+        """Yields each fact as a PDDL string, i.e. `(on a b)`, `(not (clear a))`, `(= (weight a) 3)`"""
+        names = self.symbols.names
+        for name, params, neg, value in self.keys():
+            inner = f"({names[name]} {' '.join([names[p] for p in params])})"
+            if value >= 0:
+                op, val = names[value].split(" ", 1)
+                yield f"({op} {inner} {val})"
+            else:
+                yield f"(not {inner})" if neg else inner
+
+    """Set operations"""
+
+    def _key_index(self) -> dict[FactKey, int]:
+        if self._index is None:
+            index = {}
+            for position, key in enumerate(self.keys()):
+                index.setdefault(key, position)
+            self._index = index
+        return self._index
+
+    def _keys_of(self, other: "FactTable | Iterable[dict[str, str]]") -> Iterator[FactKey]:
+        """Keys of `other` in this table's symbol IDs"""
+        return FactTable.of(other, symbols=self.symbols).keys()
+
+    def _find_key(self, state: dict[str, str]) -> FactKey | None:
+        """Key of a state dictionary, None if it uses a name this table's symbols do not know"""
+        ids = self.symbols.ids
+        try:
+            if state.get("func_name"):
+                name, neg = ids[state["func_name"]], False
+                value = ids[f"{state['op']} {state['value']}"]
+            else:
+                name, neg, value = ids[state["pred_name"]], bool(state.get("neg")), -1
+            return name, tuple(ids[p] for p in state["params"]), neg, value
+        except KeyError:
+            return None
+
+    def __contains__(self, state: dict[str, str]) -> bool:
+        key = self._find_key(state)
+        return key is not None and key in self._key_index()
+
+    def _select(self, keys: Iterable[FactKey]) -> "FactTable":
+        table = FactTable(symbols=self.symbols)
+        for key in keys:
+            table._append(*key)
+        return table
+
+    def dedupe(self) -> "FactTable":
+        """Returns a table without duplicate facts (first occurrence kept)"""
+        seen = set()
+        return self._select(
+            k for k in self.keys() if not (k in seen or seen.add(k))
+        )
+
+    def union(self, other: "FactTable | Iterable[dict[str, str]]") -> "FactTable":
+        """Facts of this table followed by facts of `other` not already in it (deduplicated)"""
+        table = self.dedupe()
+        seen = table._key_index()
+        table.extend(self._select(k for k in self._keys_of(other) if k not in seen).dedupe())
+        return table
+
+    def intersection(self, other: "FactTable | Iterable[dict[str, str]]") -> "FactTable":
+        """Facts of this table also in `other` (deduplicated)"""
+        other_keys = set(self._keys_of(other))
+        return self._select(k for k in self.dedupe().keys() if k in other_keys)
+
+    def difference(self, other: "FactTable | Iterable[dict[str, str]]") -> "FactTable":
+        """Facts of this table not in `other` (deduplicated)"""
+        other_keys = set(self._keys_of(other))
+        return self._select(k for k in self.dedupe().keys() if k not in other_keys)
+
+    def issubset(self, other: "FactTable | Iterable[dict[str, str]]") -> bool:
+        """Checks if every fact of this table is in `other` (i.e. goal already holds)"""
+        other_keys = set(self._keys_of(other))
+        return all(k in other_keys for k in self.keys())
+
+    def diff(
+        self, other: "FactTable | Iterable[dict[str, str]]"
+    ) -> tuple["FactTable", "FactTable"]:
+        """
+        Compares this table against a newer version of it.
+
+        Args:
+            other (FactTable | Iterable[dict[str,str]]): newer states
+
+        Returns:
+            added (FactTable): facts in `other` but not in this table
+            removed (FactTable): facts in this table but not in `other`
+        """
+        other = FactTable.of(other, symbols=self.symbols)
+        return other.difference(self), self.difference(other)
+
+    def remove(self, state: dict[str, str]) -> "FactTable":
+        """Returns a table without every occurrence of `state`"""
+        key = self._find_key(state)
+        return self._select(k for k in self.keys() if k != key)
+
+    def __or__(self, other):
+        return self.union(other)
+
+    def __and__(self, other):
+        return self.intersection(other)
+
+    def __sub__(self, other):
+        return self.difference(other)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, FactTable):
+            return list(self._keys_of(other)) == list(self.keys())
+        if isinstance(other, list):
+            return self.to_states() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"FactTable({len(self)} facts, {len(self.symbols)} symbols)"
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the fact arrays (excluding the shared symbol table)"""
+        return sum(
+            a.itemsize * len(a) for a in (self._names, self._offsets, self._params, self._values)
+        ) + len(self._neg)
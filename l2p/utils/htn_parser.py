@@ -1,6 +1,7 @@
 """
 This file contains collection of functions for extracting/parsing HTN information from text.
 """
+import ast, re
 from .pddl_parser import *
 from .pddl_types import *
 from .md_parser import *
@@ -272,3 +273,50 @@ def parse_list_of_predicates(text: str) -> list[Predicate]:
         )
 
     return new_predicates
+
+def parse_md_types(text: str) -> list[dict[str, str]]:
+    """
+    Parses a type hierarchy given as a Python dictionary (or list of dictionaries) under a
+    markdown "## OUTPUT" section.
+
+    Args:
+        text (str): content of the "## OUTPUT" section, optionally enclosed by ```
+
+    Returns:
+        list[dict[str, str]]: type hierarchy (see `format_types`)
+    """
+    types = ast.literal_eval(combine_blocks(text))
+    if isinstance(types, dict):
+        types = [types]
+    if not isinstance(types, list) or not all(isinstance(t, dict) for t in types):
+        raise ValueError(f"Could not parse the type hierarchy from the LLM output:\n{text}")
+    return types
+
+def md_block(heading: str, text: str) -> str:
+    """
+    Rewrites the content of a markdown "## OUTPUT" section into the `### HEADING` + ``` block
+    format expected by `parse_objects`, `parse_initial` and `parse_goal`. Trailing
+    `: description` annotations of each line and an enclosing `(and ...)` are dropped.
+
+    Args:
+        heading (str): heading name (i.e. "OBJECTS", "INITIAL", "GOAL")
+        text (str): content of the "## OUTPUT" section, optionally enclosed by ```
+
+    Returns:
+        str: text in block format
+    """
+    lines = []
+    for line in combine_blocks(text).split("\n"):
+        if line.strip().startswith("("):
+            line = re.sub(r"^(\s*\(.*\))\s*:\s.*$", r"\1", line)
+        else:
+            line = line.split(": ")[0]
+        lines.append(line)
+    text = "\n".join(lines).strip()
+
+    # states may be given as a single conjunction, i.e. `(and (s1) (s2))`
+    conjunction = re.fullmatch(r"\(\s*and\b(.*)\)", text, re.DOTALL)
+    if conjunction:
+        text = conjunction.group(1).strip()
+
+    return f"### {heading}\n```\n{text}\n```"
@@ -1,7 +1,13 @@
 """
 This file contains collection of functions for extracting/parsing markdown datastructures from LLM output
+
+Heading, section and bracket-block lookups query a `SectionIndex`, built in one pass per response
+text and cached, so extracting many sections from the same response does not rescan it.
 """
 import re
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import NamedTuple
 
 def extract_bracket_block(text: str, block_name: str) -> str:
     """
@@ -12,14 +18,7 @@ def extract_bracket_block(text: str, block_name: str) -> str:
     Returns:
         str: The content of the block.
     """
-    # Regex to match [BLOCK_NAME] ... [NEXT_BLOCK] or end of string
-    pattern = re.compile(
-        rf"\[{re.escape(block_name)}\]\s*(.*?)(?=\n\[\w+\]|\Z)", re.DOTALL | re.IGNORECASE
-    )
-    match = pattern.search(text)
-    if match:
-        return match.group(1).strip()
-    return ""
+    return SectionIndex.of(text).bracket_block(block_name)
 
 def extract_section_by_name(markdown_text: str, title: str, level : int = 1) -> str:
     """
@@ -33,12 +32,7 @@ def extract_section_by_name(markdown_text: str, title: str, level : int = 1) ->
     Returns:
         str: The content of the section, or None if the section is not found.
     """
-    pattern = rf"(?:^|\n){level*'#'} {re.escape(title)}\n(.*?)(?=\n{level*'#'} |\Z)"
-    match = re.search(pattern, markdown_text, re.DOTALL)
-    if match:
-        return match.group(1).strip()
-    else:
-        return ""
+    return SectionIndex.of(markdown_text).section(title, level)
 
 def split_sections(markdown_text: str, level = 1) -> list[str]:
     """
@@ -51,9 +45,7 @@ def split_sections(markdown_text: str, level = 1) -> list[str]:
     Returns:
         list: A list of sections, each section is a string.
     """
-    pattern = rf"(?:^|\n){level*'#'} (.+?)(?=\n{level*'#'} |\Z)"
-    sections = re.findall(pattern, markdown_text, re.DOTALL)
-    return [section.strip() for section in sections]
+    return SectionIndex.of(markdown_text).split(level)
 
 def extract_list(markdown_text: str) -> list[str]:
     """
@@ -101,3 +93,187 @@ def substract_logical_expression(text: str) -> str:
     else:
         raise ValueError("Could not find the logical expression in the LLM output. Provide the entire response, including all headings even if some are unchanged.")
 
+def _section_span(text: str, heading: str) -> tuple[int, int] | None:
+    """Returns (start, end) character span of the body under a markdown `### heading`."""
+
+    return SectionIndex.of(text).span(heading)
+
+def has_section(text: str, heading: str) -> bool:
+    """Checks if `text` contains a markdown section `### heading`"""
+    return _section_span(text, heading) is not None
+
+def get_section(text: str, heading: str) -> str:
+    """Returns the body under markdown section `### heading` (empty string if not found)"""
+    span = _section_span(text, heading)
+    return text[span[0] : span[1]].strip() if span else ""
+
+def splice_section(text: str, heading: str, content: str) -> str:
+    """
+    Replaces the body under markdown section `### heading` with `content` enclosed in a
+    ``` code block, leaving every other section untouched.
+
+    Args:
+        text (str): raw LLM output
+        heading (str): section heading (i.e. "Action Preconditions")
+        content (str): new section content (without code fences)
+
+    Returns:
+        text (str): LLM output with spliced section
+    """
+
+    span = _section_span(text, heading)
+    if span is None:
+        raise ValueError(f"Could not find section `### {heading}` to splice into.")
+    start, end = span
+    return f"{text[:start]}\n```\n{content.strip()}\n```\n\n{text[end:].lstrip()}"
+
+
+_WHITESPACE = re.compile(r"\s*")
+
+
+class Heading(NamedTuple):
+    """Markdown heading line (`## Title`) with its offsets"""
+
+    level: int  # number of `#`
+    rest: str  # text after the `#`s, i.e. " Title"
+    start: int  # offset of the line
+    end: int  # offset of the line break ending the line (or end of text)
+
+    @property
+    def title(self) -> str:
+        return self.rest.strip()
+
+
+class SectionIndex:
+    """
+    One-pass index of a markdown LLM response: heading lines of every level (with the end of
+    each heading's section) and `[NAME]` bracket blocks. Build it with
+    `SectionIndex.of(text)`, which caches the index of recently used texts.
+
+    The query methods reproduce the matching rules of the helpers built on them
+    (`extract_section_by_name`, `split_sections`, `extract_bracket_block`, `get_section`,
+    `parse_heading`).
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+        self.headings: list[Heading] = [
+            Heading(len(m.group(1)), m.group(2), m.start(), m.end())
+            for m in re.finditer(r"^(#+)(.*)$", text, re.MULTILINE)
+        ]
+        self.starts = [h.start for h in self.headings]
+
+        # starts of `#`*level headings followed by a space (section boundaries), and first
+        # heading per (level, exact text after `# `)
+        self.level_starts: dict[int, list[int]] = {}
+        self.titles: dict[tuple[int, str], int] = {}
+        for i, heading in enumerate(self.headings):
+            if heading.rest.startswith(" "):
+                self.level_starts.setdefault(heading.level, []).append(heading.start)
+                self.titles.setdefault((heading.level, heading.rest[1:]), i)
+
+        # bracket blocks: first `[NAME]` per (lowercase) name and starts of `\n[NAME]` lines
+        self.brackets: dict[str, re.Match] = {}
+        self.bracket_lines: list[int] = []
+        for m in re.finditer(r"\[(\w+)\]", text):
+            self.brackets.setdefault(m.group(1).lower(), m)
+            if m.start() and text[m.start() - 1] == "\n":
+                self.bracket_lines.append(m.start() - 1)
+
+        self._after: dict[str, str | None] = {}
+
+    @classmethod
+    def of(cls, text: str) -> "SectionIndex":
+        """Returns the (cached) index of `text`"""
+        return _cached_index(text)
+
+    def _next_start(self, level: int, min_start: int) -> int:
+        """Start of the first `#`*level section boundary at or after `min_start` (else end of text)"""
+        starts = self.level_starts.get(level, [])
+        i = bisect_left(starts, min_start)
+        return starts[i] if i < len(starts) else len(self.text) + 1
+
+    def section(self, title: str, level: int = 1) -> str:
+        """Body of the first `#`*level `title` section (see `extract_section_by_name`)"""
+        i = self.titles.get((level, title))
+        if i is None:
+            return ""
+        heading = self.headings[i]
+        if heading.end == len(self.text):
+            return ""  # heading line must be followed by a line break
+        # the body starts after the line break, so the line right below cannot end it
+        end = self._next_start(level, heading.end + 2) - 1
+        return self.text[heading.end + 1 : end].strip()
+
+    def split(self, level: int = 1) -> list[str]:
+        """Title and body of every `#`*level section (see `split_sections`)"""
+        sections = []
+        starts = self.level_starts.get(level, [])
+        start = starts[0] if starts else None
+        while start is not None and start < len(self.text):
+            body = start + level + 1
+            end = self._next_start(level, body + 2) - 1  # body holds at least one character
+            if end > body:
+                sections.append(self.text[body:end].strip())
+            start = end + 1
+        return sections
+
+    def span(self, heading: str) -> tuple[int, int] | None:
+        """
+        Span of the body under the first heading line of any level titled `heading`, up to
+        the next heading line of any level (see `get_section`)
+        """
+        title = re.compile(rf"\s*{re.escape(heading)}[ \t]*$", re.MULTILINE)
+        for h in self.headings:
+            match = title.match(self.text, h.start + h.level)
+            if match:
+                start = match.end()
+                for following in self.headings[bisect_right(self.starts, start) :]:
+                    if following.rest[:1].isspace() or (
+                        not following.rest and following.end < len(self.text)
+                    ):
+                        return start, following.start
+                return start, len(self.text)
+        return None
+
+    def after(self, heading: str) -> str | None:
+        """
+        Text after the first occurrence of `heading` up to its next occurrence, cut at the first
+        `\n### ` within, None if `heading` does not occur. Same as
+        `text.split(heading)[1].split("\n### ")[0].strip()` (see `parse_heading`), so a heading
+        recurring inside another one (`## A` in `### A`) still ends the text
+        """
+        if heading not in self._after:
+            start = self.text.find(heading)
+            if start < 0:
+                self._after[heading] = None
+            else:
+                start += len(heading)
+                end = self.text.find(heading, start)
+                end = len(self.text) if end < 0 else end
+                cut = self.text.find("\n### ", start, end)
+                self._after[heading] = self.text[start : end if cut < 0 else cut].strip()
+        return self._after[heading]
+
+    def bracket_block(self, block_name: str) -> str:
+        """Body of the first `[block_name]` block, up to the next `[NAME]` line (see `extract_bracket_block`)"""
+        match = self.brackets.get(block_name.lower()) if re.fullmatch(r"\w+", block_name) else None
+        if match is None:
+            if re.fullmatch(r"\w+", block_name):
+                return ""
+            # names with non-word characters are not indexed
+            pattern = re.compile(
+                rf"\[{re.escape(block_name)}\]\s*(.*?)(?=\n\[\w+\]|\Z)", re.DOTALL | re.IGNORECASE
+            )
+            found = pattern.search(self.text)
+            return found.group(1).strip() if found else ""
+        start = _WHITESPACE.match(self.text, match.end()).end()
+        i = bisect_left(self.bracket_lines, start)
+        end = self.bracket_lines[i] if i < len(self.bracket_lines) else len(self.text)
+        return self.text[start:end].strip()
+
+
+@lru_cache(maxsize=32)
+def _cached_index(text: str) -> SectionIndex:
+    return SectionIndex(text)
@@ -0,0 +1,192 @@
+"""
+L2P Named Collection
+
+This module defines `NamedCollection`, the ordered, key-indexed storage behind the predicates,
+functions and actions of `DomainBuilder` and the states of `TaskBuilder`. Items are kept in one
+insertion-ordered dictionary keyed by `key(item)` (the item name by default), so that:
+    - lookup, replace and delete by key are O(1), and a replaced item keeps its position
+    - it still reads like the list it replaces (iteration, `len`, indexing, `==` and `+` with lists;
+      slices are lists)
+    - every change bumps `version` and is journaled, so caches built from the collection can be
+      updated from `changed_keys(version)` instead of being rebuilt
+    - `snapshot()` returns an immutable tuple of the items, shared until the next change
+
+For instance:
+    predicates = NamedCollection(predicates)
+    predicates.add(predicate)               # appends, or replaces the predicate of the same name
+    predicates.get("holding")               # O(1)
+    predicates.pop("holding")               # O(1)
+
+    version = predicates.version
+    ...
+    predicates.changed_keys(version)        # {"holding", ...}, or None if the journal is too short
+"""
+
+from collections import deque
+from collections.abc import Sequence
+from operator import itemgetter
+from typing import Any, Callable, Hashable, Iterable, Iterator
+
+_name = itemgetter("name")
+
+
+def state_key(state: dict) -> tuple:
+    """Hashable key of a task state dictionary (equal states share a key)"""
+    return tuple(
+        sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in state.items())
+    )
+
+
+class NamedCollection(Sequence):
+    def __init__(
+        self,
+        items: Iterable[Any] = (),
+        key: Callable[[Any], Hashable] | None = None,
+        journal_size: int = 1024,
+    ) -> None:
+        """
+        Builds the collection. Items sharing a key collapse into one entry, at the position of the
+        first and holding the last.
+
+        Args:
+            items (Iterable[Any]): initial items, defaults to empty
+            key (Callable): `key(item) -> Hashable`, defaults to `item["name"]`
+            journal_size (int): # of most recent changes `changed_keys` can report, defaults to 1024
+        """
+
+        self.key = key or _name
+        self.version = 0
+        self._items: dict[Hashable, Any] = {}
+        self._journal: deque[tuple[int, Hashable]] = deque(maxlen=journal_size)
+        self._snapshot: tuple | None = None
+        self.extend(items)
+
+    @classmethod
+    def of(
+        cls,
+        items: "Iterable[Any] | NamedCollection | None",
+        key: Callable[[Any], Hashable] | None = None,
+    ) -> "NamedCollection":
+        """Returns `items` if it already is a collection with the same key, otherwise builds one"""
+        if isinstance(items, NamedCollection) and items.key is (key or _name):
+            return items
+        return cls(items or (), key=key)
+
+    def _changed(self, key: Hashable):
+        self.version += 1
+        self._journal.append((self.version, key))
+        self._snapshot = None
+
+    """Mutation"""
+
+    def add(self, item: Any) -> Any | None:
+        """
+        Appends an item, or replaces the item with the same key in place.
+
+        Returns:
+            previous (Any | None): the replaced item, None if the key was new
+        """
+        key = self.key(item)
+        previous = self._items.get(key)
+        self._items[key] = item
+        self._changed(key)
+        return previous
+
+    append = add  # list compatibility
+
+    def extend(self, items: Iterable[Any]):
+        for item in items:
+            self.add(item)
+
+    def pop(self, key: Hashable, *default) -> Any:
+        """Removes and returns the item with `key` (or `default` if given and the key is missing)"""
+        if key not in self._items:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        item = self._items.pop(key)
+        self._changed(key)
+        return item
+
+    def remove(self, item: Any):
+        """Removes `item` (list compatibility); raises ValueError if it is not in the collection"""
+        if item not in self:
+            raise ValueError(f"{item!r} is not in collection")
+        self.pop(self.key(item))
+
+    def clear(self):
+        for key in list(self._items):
+            self.pop(key)
+
+    """Lookup"""
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        return self._items.get(key, default)
+
+    def keys(self):
+        """Keys in item order (a live view, `key in collection.keys()` is O(1))"""
+        return self._items.keys()
+
+    def snapshot(self) -> tuple:
+        """Immutable tuple of the current items, reused until the collection changes"""
+        if self._snapshot is None:
+            self._snapshot = tuple(self._items.values())
+        return self._snapshot
+
+    def changed_keys(self, since: int) -> set[Hashable] | None:
+        """
+        Keys added, replaced or removed after version `since`.
+
+        Args:
+            since (int): a previously read `version`
+
+        Returns:
+            keys (set | None): changed keys, None if the journal no longer reaches back to `since`
+        """
+        if since == self.version:
+            return set()
+        if since > self.version or not self._journal or self._journal[0][0] > since + 1:
+            return None
+        keys = set()
+        for version, key in reversed(self._journal):
+            if version <= since:
+                break
+            keys.add(key)
+        return keys
+
+    def copy(self) -> "NamedCollection":
+        return NamedCollection(self._items.values(), key=self.key, journal_size=self._journal.maxlen)
+
+    """Sequence protocol"""
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._items.values())
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return list(self.snapshot()[index])  # list compatibility, i.e. `items[:2] + [item]`
+        return self.snapshot()[index]
+
+    def __contains__(self, item: Any) -> bool:
+        try:
+            key = self.key(item)
+        except (KeyError, TypeError, IndexError):
+            return False
+        return key in self._items and self._items[key] == item
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (NamedCollection, list, tuple)):
+            return self.snapshot() == tuple(other)
+        return NotImplemented
+
+    def __add__(self, other: Iterable[Any]) -> list:
+        return list(self._items.values()) + list(other)
+
+    def __radd__(self, other: Iterable[Any]) -> list:
+        return list(other) + list(self._items.values())
+
+    def __repr__(self) -> str:
+        return f"NamedCollection({list(self._items.values())!r})"
@@ -0,0 +1,244 @@
+"""
+L2P Rule-Based PDDL Fixer
+
+This module contains deterministic rewrites for common, mechanical mistakes found in LLM
+generated PDDL, applied before validation so that an LLM retry is only spent on semantic
+errors. Every fix returns the corrected component together with a list of human-readable
+changes that were applied (empty if nothing changed).
+
+`fix_action_output` / `fix_task_output` rewrite raw LLM responses (used by the builders'
+`auto_fix` option); `fix_objects` cleans already parsed task objects.
+
+Fixes applied:
+    - stray backticks inside PDDL content
+    - uppercase logical connectives/quantifiers (i.e. `AND` -> `and`)
+    - unbalanced parentheses (unmatched `)` removed, missing `)` appended)
+    - action parameters declared without `?` (and their references in the action body)
+    - type annotations inside task states (i.e. `(drive c1 - car)` -> `(drive c1)`)
+"""
+
+import re
+
+from .md_parser import get_section, has_section, splice_section
+
+KEYWORDS = [
+    "and",
+    "or",
+    "not",
+    "imply",
+    "forall",
+    "exists",
+    "when",
+    "increase",
+    "decrease",
+    "assign",
+    "scale-up",
+    "scale-down",
+]
+
+_STRAY_BACKTICK = re.compile(r"(?<!`)`(?!`)")
+_UPPER_KEYWORD = re.compile(
+    r"\(\s*(" + "|".join(re.escape(k) for k in KEYWORDS) + r")(?=[\s()])",
+    re.IGNORECASE,
+)
+# `- name - type` declaration (optionally followed by `: description`) missing its `?`
+_UNPREFIXED_PARAM = re.compile(
+    r"^(\s*-\s*)([A-Za-z_][\w-]*)(?=\s+-\s+[A-Za-z_][\w-]*\s*(?::|$))"
+)
+_STATE_TYPE_ANNOTATION = re.compile(r"(?<=[\w?])\s+-\s+[A-Za-z_][\w-]*(?=[\s)])")
+
+
+def fix_backticks(text: str) -> tuple[str, list[str]]:
+    """Removes single backticks that are not part of a ``` code fence"""
+
+    fixed = _STRAY_BACKTICK.sub("", text)
+    if fixed != text:
+        return fixed, ["Removed stray backticks."]
+    return text, []
+
+
+def fix_keyword_case(text: str) -> tuple[str, list[str]]:
+    """Lowercases PDDL logical connectives, quantifiers and effect operators"""
+
+    changed = set()
+
+    def lower(match: re.Match) -> str:
+        keyword = match.group(1)
+        if keyword != keyword.lower():
+            changed.add(keyword)
+        return match.group(0).replace(keyword, keyword.lower())
+
+    fixed = _UPPER_KEYWORD.sub(lower, text)
+    if changed:
+        return fixed, [f"Lowercased keyword(s): {sorted(changed)}."]
+    return text, []
+
+
+def fix_parentheses(text: str) -> tuple[str, list[str]]:
+    """
+    Balances parentheses of a PDDL expression, ignoring `;` comments. Closing parentheses
+    without a matching opening one are removed, missing closing parentheses are appended.
+    """
+
+    lines = []
+    depth = removed = 0
+    for line in text.split("\n"):
+        code, sep, comment = line.partition(";")
+        kept = []
+        for char in code:
+            if char == "(":
+                depth += 1
+            elif char == ")":
+                if depth == 0:
+                    removed += 1
+                    continue
+                depth -= 1
+            kept.append(char)
+        lines.append("".join(kept) + sep + comment)
+
+    if not removed and not depth:
+        return text, []
+
+    fixed = "\n".join(lines)
+    changes = []
+    if removed:
+        changes.append(f"Removed {removed} unmatched closing parenthes(es).")
+    if depth:
+        fixed += ")" * depth
+        changes.append(f"Appended {depth} missing closing parenthes(es).")
+    return fixed, changes
+
+
+def fix_expression(text: str) -> tuple[str, list[str]]:
+    """
+    Applies every expression-level fix (backticks, keyword case, parentheses).
+
+    Args:
+        text (str): PDDL expression (i.e. action preconditions)
+
+    Returns:
+        text (str): fixed expression
+        changes (list[str]): description of applied fixes
+    """
+
+    changes = []
+    for fix in (fix_backticks, fix_keyword_case, fix_parentheses):
+        text, applied = fix(text)
+        changes.extend(applied)
+    return text, changes
+
+
+def fix_objects(objects: dict[str, str]) -> tuple[dict[str, str], list[str]]:
+    """
+    Strips backticks and leading `?` from task object names.
+
+    Args:
+        objects (dict[str,str]): task objects {name: type}
+
+    Returns:
+        objects (dict[str,str]): fixed task objects
+        changes (list[str]): description of applied fixes
+    """
+
+    fixed = {}
+    changed = []
+    for name, obj_type in objects.items():
+        new_name = name.strip(" `").lstrip("?")
+        new_type = obj_type.strip(" `") if obj_type else obj_type
+        if new_name != name or new_type != obj_type:
+            changed.append(name)
+        fixed[new_name] = new_type
+
+    if changed:
+        return fixed, [f"Cleaned object name(s)/type(s): {changed}."]
+    return objects, []
+
+
+def _rename_params(body: str, names: list[str]) -> str:
+    """Prefixes bare references to `names` with `?` (argument positions only)."""
+    for name in names:
+        body = re.sub(rf"(?<=\s)(?<!\?){re.escape(name)}(?=[\s()])", f"?{name}", body)
+    return body
+
+
+def fix_action_output(llm_output: str) -> tuple[str, list[str]]:
+    """
+    Applies safe rewrites to a raw `formalize_pddl_action` response before parsing, so that
+    both the parsed action and text-based validators see the fixed version. Fixes missing
+    `?` in `### Action Parameters` (renaming references in the action body) and backticks,
+    keyword case and parentheses in `### Action Preconditions` / `### Action Effects`.
+
+    Args:
+        llm_output (str): raw LLM output
+
+    Returns:
+        llm_output (str): fixed LLM output
+        changes (list[str]): description of applied fixes
+    """
+
+    changes = []
+    renamed = []
+
+    if has_section(llm_output, "Action Parameters"):
+        section = get_section(llm_output, "Action Parameters")
+        if section.count("```") >= 2:
+            lines = []
+            for line in section.split("```")[1].strip("\n").split("\n"):
+                match = _UNPREFIXED_PARAM.match(line)
+                if match and match.group(2) not in ("None", "none"):
+                    renamed.append(match.group(2))
+                    line = f"{match.group(1)}?{match.group(2)}{line[match.end(2):]}"
+                lines.append(line)
+            if renamed:
+                llm_output = splice_section(llm_output, "Action Parameters", "\n".join(lines))
+                changes.append(f"Added `?` to parameter(s): {renamed}.")
+
+    for heading in ("Action Preconditions", "Action Effects"):
+        if not has_section(llm_output, heading):
+            continue
+        section = get_section(llm_output, heading)
+        if section.count("```") < 2:
+            continue
+        body = section.split("```")[1].strip("\n")
+        fixed, applied = fix_expression(body)
+        fixed = _rename_params(fixed, renamed)
+        if fixed != body:
+            llm_output = splice_section(llm_output, heading, fixed)
+            changes.extend(f"[{heading}] {c}" for c in applied)
+
+    return llm_output, changes
+
+
+def fix_task_output(llm_output: str) -> tuple[str, list[str]]:
+    """
+    Applies safe rewrites to a raw task response before parsing: backticks, keyword case,
+    parentheses and type annotations (i.e. `(drive c1 - car)`) in `### INITIAL`/`### GOAL`.
+
+    Args:
+        llm_output (str): raw LLM output
+
+    Returns:
+        llm_output (str): fixed LLM output
+        changes (list[str]): description of applied fixes
+    """
+
+    changes = []
+    for heading in ("INITIAL", "GOAL"):
+        if not has_section(llm_output, heading):
+            continue
+        section = get_section(llm_output, heading)
+        if section.count("```") != 2:
+            continue
+        body = section.split("```")[1].strip("\n")
+        fixed, applied = fix_expression(body)
+        untyped = "\n".join(
+            _STATE_TYPE_ANNOTATION.sub("", code) + sep + comment
+            for code, sep, comment in (l.partition(";") for l in fixed.split("\n"))
+        )
+        if untyped != fixed:
+            applied.append("Removed type annotation(s) from states.")
+        if untyped != body:
+            llm_output = splice_section(llm_output, heading, untyped)
+            changes.extend(f"[{heading}] {c}" for c in applied)
+
+    return llm_output, changes
@@ -5,7 +5,10 @@ This module contains collection of functions for formatting Python PDDL componen
 import json
 import re
 from collections import defaultdict, OrderedDict
+from typing import Iterable, Iterator
+from .fact_table import FactTable
 from .pddl_types import Action, Function, Predicate
+from .sexpr import SExpr
 
 
 # ---- PDDL DOMAIN FORMATTER ----
@@ -178,44 +181,83 @@ def format_action_desc(action: Action) -> str:
 
 def format_objects(objects: dict[str, str]) -> str:
     """Formats task objects into a PDDL-style string."""
-    objects = "\n".join(
-        [f"{obj} - {type}" if type else f"{obj}" for obj, type in objects.items()]
-    )
-    return objects
+    return "\n".join(iter_objects(objects))
 
 
-def format_initial(initial_states: list[dict[str, str]]) -> str:
+def format_initial(initial_states: list[dict[str, str]] | FactTable) -> str:
     """Formats task initial states into a PDDL-style string."""
+    return "\n".join(iter_states(initial_states))
 
-    full_str = []
 
-    for state in initial_states:
-        # if function statement
-        if state.get("func_name"):
-            state_op, state_func, state_params, state_value = (
-                state["op"],
-                state["func_name"],
-                " ".join(state["params"]),
-                state["value"],
-            )
-            full_str.append(f"({state_op} ({state_func} {state_params}) {state_value})")
-        # if predicate statement
-        elif state.get("pred_name"):
+def format_goal(goal_states: list[dict[str, str]] | FactTable) -> str:
+    """Formats task goal states into a PDDL-style string."""
+    goal_states_str = "\n".join(iter_states(goal_states))
+    return f"(and \n{indent(goal_states_str, 1)}\n)"
 
-            inner_str = f"({state['pred_name']} {' '.join(state['params'])})"
 
-            full_str.append(f"(not {inner_str})" if state["neg"] else inner_str)
+def iter_objects(
+    objects: dict[str, str] | Iterable[tuple[str, str]],
+    group: bool = False,
+    names_per_line: int = 16,
+) -> Iterator[str]:
+    """
+    Yields task object declarations line by line.
+
+    Args:
+        objects (dict[str,str] | Iterable[tuple[str,str]]): objects and their types, or (name, type) pairs (i.e. a generator)
+        group (bool): declare objects of the same type on one line (`a b c - block`), defaults to False.
+            Dictionaries are grouped by type; other iterables by consecutive runs of one type, so
+            memory stays bounded by `names_per_line`
+        names_per_line (int): max # of objects per grouped line, defaults to 16
 
-    initial_states_str = "\n".join(full_str)  # combine the states into a single string
+    Returns:
+        lines (Iterator[str]): object declarations, i.e. `b1 - block`
+    """
 
-    return initial_states_str
+    pairs = objects.items() if isinstance(objects, dict) else objects
 
+    if not group:
+        for obj, type in pairs:
+            yield f"{obj} - {type}" if type else f"{obj}"
+        return
 
-def format_goal(goal_states: list[dict[str, str]]) -> str:
-    """Formats task goal states into a PDDL-style string."""
-    full_str = []
+    if isinstance(objects, dict):
+        by_type = defaultdict(list)
+        for obj, type in pairs:
+            by_type[type].append(obj)
+        runs = ((type, names) for type, names in by_type.items())
+    else:
+        runs = _consecutive_runs(pairs, names_per_line)
+
+    for type, names in runs:
+        for i in range(0, len(names), names_per_line):
+            names_str = " ".join(names[i : i + names_per_line])
+            yield f"{names_str} - {type}" if type else names_str
+
+
+def _consecutive_runs(
+    pairs: Iterable[tuple[str, str]], max_len: int
+) -> Iterator[tuple[str, list[str]]]:
+    """Groups consecutive (name, type) pairs of one type into runs of at most `max_len` names"""
+    run_type, names = None, []
+    for obj, type in pairs:
+        if names and (type != run_type or len(names) >= max_len):
+            yield run_type, names
+            names = []
+        run_type = type
+        names.append(obj)
+    if names:
+        yield run_type, names
 
-    for state in goal_states:
+
+def iter_states(states: Iterable[dict[str, str]] | FactTable) -> Iterator[str]:
+    """Yields task states (initial or goal) as PDDL strings, one per state"""
+
+    if isinstance(states, FactTable):
+        yield from states.pddl_lines()
+        return
+
+    for state in states:
         # if function statement
         if state.get("func_name"):
             state_op, state_func, state_params, state_value = (
@@ -224,17 +266,11 @@ def format_goal(goal_states: list[dict[str, str]]) -> str:
                 " ".join(state["params"]),
                 state["value"],
             )
-            full_str.append(f"({state_op} ({state_func} {state_params}) {state_value})")
+            yield f"({state_op} ({state_func} {state_params}) {state_value})"
         # if predicate statement
         elif state.get("pred_name"):
             inner_str = f"({state['pred_name']} {' '.join(state['params'])})"
-            full_str.append(f"(not {inner_str})" if state["neg"] else inner_str)
-
-        goal_states_str = "\n".join(full_str)  # combine the states into a single string
-
-    goal_states_str = f"(and \n{indent(goal_states_str, 1)}\n)"
-
-    return goal_states_str
+            yield f"(not {inner_str})" if state["neg"] else inner_str
 
 
 # ---- HELPER FUNCTIONS ----
@@ -267,7 +303,9 @@ def remove_comments(text: str, comment_prefixes=[";", "#", "//"]) -> str:
 
 
 def format_pddl_expr(expr):
-    """Parses nested list format into bracket."""
+    """Parses nested list format (or `SExpr`) into bracket."""
+    if isinstance(expr, SExpr):
+        return str(expr)
     if isinstance(expr, list):
         return "(" + " ".join(format_pddl_expr(e) for e in expr) + ")"
     else:
@@ -0,0 +1,357 @@
+"""
+L2P Frozen PDDL Objects
+
+This module defines compact, immutable counterparts of the `Predicate`, `Function`, `Action`,
+`HDDLTask`, `HDDLMethod`, `HPDLTask` and `HPDLMethod` dictionaries of `pddl_types.py`:
+    - fields live in `__slots__` (no per-object `__dict__`), names and types are interned
+    - `params` is a `Params`, a tuple-backed read-only mapping instead of an `OrderedDict`, shared
+      by every object with the same parameter list
+    - `clean` is only stored when it differs from the signature derived from name and params
+    - objects never change, so snapshots share them: `copy`/`deepcopy` return the object itself
+      and `freeze_all` reuses items that are already frozen
+    - each object *is* a read-only view with today's dictionary interface (`pred["name"]`,
+      `pred.get("desc")`, `pred["params"].items()`, `==` with the equivalent dictionary), so code
+      reading predicates/actions works unchanged. `to_dict()` returns a mutable dictionary
+    - other values (i.e. `ordered_subtasks`, keys outside the schema) are stored as given; lists
+      and dictionaries among them are hashed by value, as tuples
+
+Builders keep storing mutable dictionaries. The frozen objects are used where a snapshot must not
+follow later edits: `DomainContext` freezes its predicates and functions, and `checkpoint.py`
+writes them back out as dictionaries.
+
+For instance:
+    predicate = FrozenPredicate.of(predicate)         # from a `Predicate` dictionary
+    predicate["clean"]                                 # "(on ?b1 - block ?b2 - block)"
+    predicate.replace(desc="b1 is stacked on b2")      # new object, other fields shared
+
+    snapshot = freeze_all(domain_builder.predicates)   # tuple, frozen items are reused as they are
+"""
+
+import sys
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Iterable, Iterator
+from weakref import WeakValueDictionary
+
+_MISSING = object()  # slot value of a field absent from the source dictionary
+_DERIVED = object()  # slot value of a `clean` equal to the derived signature
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+class Params(Mapping):
+    """Immutable, ordered parameter list ({param_name: param_type}) backed by a tuple of pairs"""
+
+    __slots__ = ("_items", "__weakref__")
+
+    def __init__(self, params: Mapping | Iterable[tuple[str, str]] = ()) -> None:
+        pairs = params.items() if isinstance(params, Mapping) else params
+        object.__setattr__(
+            self, "_items", tuple((_intern(name), _intern(type_)) for name, type_ in pairs)
+        )
+
+    @classmethod
+    def of(cls, params: "Mapping | Iterable[tuple[str, str]] | None") -> "Params":
+        """Returns `params` if it already is a `Params`, otherwise the shared `Params` of equal pairs"""
+        if isinstance(params, Params):
+            return params
+        key = tuple(params.items() if isinstance(params, Mapping) else params or ())
+        try:
+            shared = _shared_params.get(key)
+            if shared is None:
+                shared = _shared_params[key] = cls(key)
+        except TypeError:  # unhashable types, not shared
+            shared = cls(key)
+        return shared
+
+    def __getitem__(self, name: str) -> str:
+        for key, type_ in self._items:
+            if key == name:
+                return type_
+        raise KeyError(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return (name for name, _ in self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def pairs(self) -> tuple[tuple[str, str], ...]:
+        """(name, type) pairs in order, without building a view"""
+        return self._items
+
+    def to_dict(self) -> OrderedDict:
+        return OrderedDict(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Params):
+            return self._items == other._items
+        if isinstance(other, OrderedDict):  # order-sensitive, as between two OrderedDicts
+            return OrderedDict(self._items) == other
+        if isinstance(other, Mapping):
+            return dict(self._items) == dict(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(_hashable(self._items))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Params is immutable")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (Params, (self._items,))
+
+    def __repr__(self) -> str:
+        return f"Params({list(self._items)!r})"
+
+
+# identical parameter lists (i.e. `?b - block`) share one `Params` while in use
+_shared_params: "WeakValueDictionary[tuple, Params]" = WeakValueDictionary()
+
+
+def _hashable(value: Any) -> Any:
+    """Hashable equivalent of `value`: lists/tuples as tuples, mappings as frozensets of items"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(v) for v in value)
+    if isinstance(value, (FrozenObject, Params)):
+        return value  # hashed by their own `__hash__`
+    if isinstance(value, Mapping):
+        return frozenset((k, _hashable(v)) for k, v in value.items())
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def signature(name: str, params: Mapping) -> str:
+    """`(name ?p - type ...)` signature, as built by `parse_new_predicates`"""
+    pairs = params.pairs() if isinstance(params, Params) else params.items()
+    parts = [f"{p} - {t}" if t else p for p, t in pairs]
+    return f"({name} {' '.join(parts)})"
+
+
+class FrozenObject(Mapping):
+    """Base of the frozen PDDL objects: slotted fields exposed as a read-only mapping"""
+
+    __slots__ = ("_extra",)
+    _fields: tuple[str, ...] = ()  # dictionary keys, in order
+    _convert: dict = {"params": Params.of}  # field -> conversion of the source value
+    _layout: tuple = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # (field, slot, conversion) per field, resolved once per class
+        cls._layout = tuple(
+            (field, cls._slot(field), cls._convert.get(field, _intern if field == "name" else None))
+            for field in cls._fields
+        )
+
+    def __init__(self, item: Mapping | None = None, /, **fields) -> None:
+        """
+        Builds a frozen object from a dictionary.
+
+        Args:
+            item (Mapping): source dictionary (i.e. a `Predicate`), defaults to None
+            **fields: field values, override `item`
+        """
+
+        values = {**item, **fields} if fields and item else fields or item or {}
+        set_slot = object.__setattr__
+        present = 0
+        for field, slot, convert in self._layout:
+            value = values.get(field, _MISSING)
+            if value is not _MISSING:
+                present += 1
+                if convert is not None:
+                    value = convert(value)
+            set_slot(self, slot, value)
+
+        # keys outside the schema, kept as given
+        extra = ()
+        if len(values) > present:
+            extra = tuple((k, v) for k, v in values.items() if k not in self._fields)
+        set_slot(self, "_extra", extra)
+
+    @classmethod
+    def of(cls, item: Mapping) -> "FrozenObject":
+        """Returns `item` if it already is frozen (of this class), otherwise freezes it"""
+        return item if type(item) is cls else cls(item)
+
+    @staticmethod
+    def _slot(field: str) -> str:
+        return field
+
+    def replace(self, **changes) -> "FrozenObject":
+        """Returns a copy with `changes` applied; unchanged fields are shared, not copied"""
+        return type(self)(self, **changes)
+
+    def to_dict(self) -> dict:
+        """Mutable dictionary with today's layout (`params` as an `OrderedDict`)"""
+        return {key: _thaw(value) for key, value in self.items()}
+
+    """Mapping protocol"""
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            value = getattr(self, key)
+            if value is _MISSING:
+                raise KeyError(key)
+            return value
+        for name, value in self._extra:
+            if name == key:
+                return value
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for field, slot, _ in self._layout:
+            if getattr(self, slot) is not _MISSING:
+                yield field
+        for name, _ in self._extra:
+            yield name
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._fields:
+            return getattr(self, self._slot(key)) is not _MISSING
+        return any(name == key for name, _ in self._extra)
+
+    def _key(self) -> tuple:
+        return tuple(getattr(self, slot) for slot in self.__slots__) + (self._extra,)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is type(self):
+            return self is other or self._key() == other._key()
+        if isinstance(other, Mapping):
+            return self.to_dict() == (other.to_dict() if isinstance(other, FrozenObject) else dict(other))
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(_hashable(self._key()))
+
+    """Immutability"""
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable, use replace()")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable, use replace()")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (type(self), (dict(self.items()),))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+
+class _Signed(FrozenObject):
+    """Frozen object with a `clean` signature, stored only if it differs from the derived one"""
+
+    __slots__ = ()
+
+    def __init__(self, item: Mapping | None = None, /, **fields) -> None:
+        super().__init__(item, **fields)
+        clean = self._clean
+        if (
+            type(clean) is str
+            and self.name is not _MISSING
+            and self.params is not _MISSING
+            and clean == signature(self.name, self.params)
+        ):
+            object.__setattr__(self, "_clean", _DERIVED)
+
+    @staticmethod
+    def _slot(field: str) -> str:
+        return "_clean" if field == "clean" else field
+
+    @property
+    def clean(self) -> Any:
+        clean = self._clean
+        return signature(self.name, self.params) if clean is _DERIVED else clean
+
+
+class FrozenPredicate(_Signed):
+    __slots__ = ("name", "desc", "raw", "params", "_clean")
+    _fields = ("name", "desc", "raw", "params", "clean")
+
+
+class FrozenFunction(_Signed):
+    __slots__ = ("name", "desc", "raw", "params", "_clean")
+    _fields = ("name", "desc", "raw", "params", "clean")
+
+
+class FrozenAction(FrozenObject):
+    __slots__ = ("name", "desc", "raw", "params", "preconditions", "effects")
+    _fields = ("name", "desc", "raw", "params", "preconditions", "effects")
+
+
+class FrozenHDDLTask(_Signed):
+    __slots__ = ("name", "desc", "raw", "params", "_clean")
+    _fields = ("name", "desc", "raw", "params", "clean")
+
+
+class FrozenHDDLMethod(FrozenObject):
+    __slots__ = ("name", "params", "desc", "raw", "task", "ordered_subtasks")
+    _fields = ("name", "params", "desc", "raw", "task", "ordered_subtasks")
+    _convert = {"params": Params.of, "task": FrozenHDDLTask.of}
+
+
+class FrozenHPDLMethod(FrozenObject):
+    __slots__ = ("name", "params", "raw", "ordered_subtasks", "task", "desc")
+    _fields = ("name", "params", "raw", "ordered_subtasks", "task", "desc")
+    _convert = {"params": Params.of, "task": _intern}
+
+
+class FrozenHPDLTask(_Signed):
+    __slots__ = ("name", "desc", "raw", "params", "_clean", "methods")
+    _fields = ("name", "desc", "raw", "params", "clean", "methods")
+    _convert = {
+        "params": Params.of,
+        "methods": lambda methods: tuple(FrozenHPDLMethod.of(m) for m in methods),
+    }
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, (FrozenObject, Params)):
+        return value.to_dict()
+    if isinstance(value, tuple) and value and isinstance(value[0], FrozenObject):
+        return [v.to_dict() for v in value]
+    return value
+
+
+def freeze_all(
+    items: Iterable[Mapping] | None, cls: type[FrozenObject] = FrozenPredicate
+) -> tuple[FrozenObject, ...]:
+    """
+    Snapshots a list of dictionaries (or frozen objects) as a tuple of frozen objects. Items that
+    are already frozen are shared, so re-snapshotting a mostly unchanged list is cheap.
+
+    Args:
+        items (Iterable[Mapping]): i.e. predicates, functions or actions, defaults to None
+        cls (type[FrozenObject]): frozen class of the items, defaults to FrozenPredicate
+
+    Returns:
+        snapshot (tuple[FrozenObject]): immutable snapshot
+    """
+    if isinstance(items, tuple) and all(type(item) is cls for item in items):
+        return items
+    return tuple(cls.of(item) for item in items or ())
+
+
+def thaw_all(items: Iterable[Any] | None) -> list:
+    """Converts frozen objects back into mutable dictionaries (other items are kept as they are)"""
+    return [item.to_dict() if isinstance(item, FrozenObject) else item for item in items or ()]
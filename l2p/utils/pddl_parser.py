@@ -15,8 +15,11 @@ from typing import Optional
 from pddl import parse_domain, parse_problem
 from pddl.formatter import domain_to_string, problem_to_string
 
+from .md_parser import SectionIndex
 from .pddl_format import remove_comments
 from .pddl_types import Action, Function, Predicate
+from .sexpr import SExpr, parse_sexpr
+from .usage_index import UsageIndex
 
 
 # ---- PDDL DOMAIN PARSERS ----
@@ -444,7 +447,7 @@ def parse_action(llm_output: str, action_name: str) -> Action:
         "params": parameters,
         "preconditions": preconditions,
         "effects": effects,
-        "raw": llm_response,
+        "raw": llm_output,
     }
 
 
@@ -539,7 +542,7 @@ def prune_types(
     actions: list[Action],
 ) -> dict[str, str]:
     """
-    Prune types that are not used in any predicate or action.
+    Prune types that are not used in any predicate or action (see `UsageIndex`).
 
     Parameters:
         types (dict or list): Either a flat dict of {type: description} or a nested list of type hierarchies.
@@ -549,57 +552,15 @@ def prune_types(
     Returns:
         dict[str, str]: A dictionary of used types.
     """
-    used_types = {}
-    all_type_names = {}
-
-    def collect_all_types(obj):
-        """Recursively extract all type names and their descriptions from the input."""
-
-        # if setup is normal types dictionary
-        if isinstance(obj, dict):
-            for type_name, desc in obj.items():
-                all_type_names[type_name] = desc
-
-        # if set up is type hierarchy list dictionary
-        elif isinstance(obj, list):
-            for node in obj:
-                type_name = next((k for k in node if k != "children"), None)
-                if type_name:
-                    all_type_names[type_name] = node[type_name]
-                    collect_all_types(node.get("children", []))
-
-    # flatten all types into all_type_names
-    collect_all_types(types)
-
-    # identify used types
-    for type_name in all_type_names:
-        base_name = type_name.split(" ")[0]
-        found = False
-
-        for pred in predicates:
-            if base_name in pred["params"].values():
-                used_types[type_name] = all_type_names[type_name]
-                found = True
-                break
-        if found:
-            continue
-
-        for action in actions:
-            if base_name in action["params"].values():
-                used_types[type_name] = all_type_names[type_name]
-                break
-            if base_name in action["preconditions"] or base_name in action["effects"]:
-                used_types[type_name] = all_type_names[type_name]
-                break
-
-    return used_types
+    return UsageIndex(actions=actions, predicates=predicates).prune_types(types)
 
 
 def prune_predicates(
     predicates: list[Predicate], actions: list[Action]
 ) -> list[Predicate]:
     """
-    Remove predicates that are not used in any action.
+    Remove predicates that are not used in any action (see `UsageIndex`; keep one index alive
+    to prune incrementally as actions are added).
 
     Args:
         predicates (list[Predicate]): a list of predicates
@@ -608,21 +569,7 @@ def prune_predicates(
     Returns:
         list[Predicate]: the pruned list of predicates
     """
-    used_predicates = []
-    seen_predicate_names = set()
-
-    for pred in predicates:
-        for action in actions:
-            # Add a space or a ")" to avoid partial matches
-            names = [f"{pred['name']} ", f"{pred['name']})"]
-            for name in names:
-                if name in action["preconditions"] or name in action["effects"]:
-                    if pred["name"] not in seen_predicate_names:
-                        used_predicates.append(pred)
-                        seen_predicate_names.add(pred["name"])
-                    break
-
-    return used_predicates
+    return UsageIndex(actions=actions).prune_predicates(predicates)
 
 
 # ---- PDDL PROBLEM PARSERS ----
@@ -672,7 +619,7 @@ def parse_initial(llm_output: str) -> list[dict[str, str]]:
 
     initial_raw = combine_blocks(initial_head)
     initial_clean = remove_comments(initial_raw)
-    initial_parsed = parse_pddl(f"({initial_clean})")
+    initial_parsed = parse_sexpr(f"({initial_clean})")
 
     return parse_task_states(initial_parsed)
 
@@ -695,89 +642,91 @@ def parse_goal(llm_output: str) -> list[dict[str, str]]:
 
     goal_raw = combine_blocks(goal_head)
     goal_clean = remove_comments(goal_raw)
-    goal_parsed = parse_pddl(f"({goal_clean})")
+    goal_parsed = parse_sexpr(f"({goal_clean})")
 
     return parse_task_states(goal_parsed)
 
 
-def parse_task_states(parsed_states: list) -> list[dict]:
+def parse_task_states(parsed_states: SExpr) -> list[dict]:
+    """
+    Converts parsed task states (`parse_sexpr` output of the wrapped state block) into state
+    dictionaries. `and` conjunctions are flattened.
+
+    Parameters:
+        parsed_states (SExpr): expression whose items are the states
+
+    Returns:
+        states (list[dict]): predicate states {pred_name, params, neg} and function states {func_name, params, value, op}
+    """
+
     states = []
-    for line in parsed_states:
+    stack = list(reversed(parsed_states.items))
+    while stack:
+        line = stack.pop()
 
         if isinstance(line, str):
-            line = [line]
-
-        # only parse lines
-        if isinstance(line, list):
-            name = line[0].split(" ")[0]
-
-            if name == "and":
-                continue
-            # if comparsion operator
-            if name in ["=", ">", "<", ">=", "<="]:
-                op = name
-                name = line[1][0].split(" ")[0]  # retrieve function name
-                params = line[1][0].split(" ")[1:]
-                value = line[2]
-                states.append(
-                    {"func_name": name, "params": params, "value": value, "op": op}
-                )
-                continue
-            if name == "not":
-                name = line[1][0].split(" ")[0]  # retrieve function name
-                params = line[1][0].split(" ")[1:]
-                neg = True
-            else:
-                neg = False
-                params = line[0].split(" ")[1:]
-            states.append({"pred_name": name, "params": params, "neg": neg})
+            line = SExpr([line])
+
+        name = line.head
+        if name is None:
+            continue
+
+        if name == "and":
+            stack.extend(reversed(line.args))
+            continue
+        # if comparsion operator
+        if name in ["=", ">", "<", ">=", "<="]:
+            func = _as_sexpr(line[1])
+            value = line[2]
+            states.append(
+                {
+                    "func_name": func.head,  # retrieve function name
+                    "params": list(func.args),
+                    "value": value if isinstance(value, str) else str(value),
+                    "op": name,
+                }
+            )
+            continue
+        if name == "not":
+            inner = _as_sexpr(line[1])
+            name = inner.head  # retrieve predicate name
+            params = [p for p in inner.args if isinstance(p, str)]
+            neg = True
+        else:
+            neg = False
+            params = [p for p in line.args if isinstance(p, str)]
+        states.append({"pred_name": name, "params": params, "neg": neg})
 
     return states
 
 
+def _as_sexpr(item: SExpr | str) -> SExpr:
+    """Wraps a bare symbol, i.e. `(not clear)` is read as `(not (clear))`"""
+    return item if isinstance(item, SExpr) else SExpr([item])
+
+
 # ---- SUPPLEMENTARY PARSING FUNCTIONS ----
 
 
 def parse_heading(llm_output: str, heading: str) -> str:
     """Extract the text between the heading and the next second level heading in the LLM output."""
-    if heading not in llm_output:
+    # text between the heading and the next `### ` heading, from the response's cached index
+    heading_str = SectionIndex.of(llm_output).after(heading)
+    if heading_str is None:
         raise ValueError(
             f"Could not find heading {heading} in the LLM output:\n{llm_output}\n. Likely this is caused by a too long response and limited context length. If so, try to shorten the message and exclude objects which aren't needed for the task"
         )
-    heading_str = (
-        llm_output.split(heading)[1].split("\n### ")[0].strip()
-    )  # Get the text between the heading and the next heading
     return heading_str
 
 
 def parse_pddl(pddl_str: str) -> list:
     """
-    Simplified PDDL parser that converts the string into a nested list structure.
+    Simplified PDDL parser that converts the string into a nested list structure. Built on
+    `parse_sexpr`, which validators/parsers use directly.
     """
 
-    # tokenize string
-    tokens = re.sub(r"([()])", r" \1 ", pddl_str).split()
-    stack = []
-    current = []
-
-    # iterate each token, if it is a bracket, we append to new list
-    for token in tokens:
-        if token == "(":
-            stack.append(current)
-            current = []
-        elif token == ")":
-            if stack:
-                parent = stack.pop()
-                parent.append(current)
-                current = parent
-        else:
-            current.append(token)
-
-    if len(current) != 1:
-        raise ValueError("Malformed PDDL expression")
-
-    nested_pddl = concatenate_strings(current[0])
-    return nested_pddl
+    expr = parse_sexpr(pddl_str)
+    return expr.to_list() if isinstance(expr, SExpr) else expr
 
 
 def combine_blocks(heading_str: str):
@@ -798,7 +747,10 @@ def combine_blocks(heading_str: str):
 
 
 def concatenate_strings(nested_list):
-    """Helper function that concatenates strings within a list together."""
+    """
+    Helper function that concatenates strings within a list together. NOTE: superseded by
+    `SExpr.to_list()`; kept for compatibility.
+    """
     if not isinstance(nested_list, list):
         return nested_list
 
@@ -4,9 +4,20 @@ L2P is compatible with FastDownward: https://www.fast-downward.org
 For usage, users must clone or download the submodule /downward separately and direct the
 `planner_path` to the folder. This module is not necessary to use L2P, but for ease of use
 to produce plans from generated domain and problem PDDL specifications via LLMs.
+
+Planner runs can be bounded with a wall-clock `timeout` (the planner's whole process group is
+killed) and a `memory_limit` (address-space rlimit, POSIX only). Output is spooled to a temporary
+file and only the plan steps are read back. To run many planner invocations concurrently, see
+`PlannerPool` (`l2p/utils/planner_pool.py`).
 """
 
-import subprocess, re
+import os, re, signal, subprocess, tempfile, threading, time
+from dataclasses import dataclass, field
+
+try:
+    import resource  # POSIX only: memory limits are ignored without it
+except ImportError:
+    resource = None
 
 # Define the exit codes
 SUCCESS = 0
@@ -33,6 +44,118 @@ DRIVER_CRITICAL_ERROR = 35
 DRIVER_INPUT_ERROR = 36
 DRIVER_UNSUPPORTED = 37
 
+_PLAN_STEP = re.compile(r"\w+.*\(.*\)")
+
+
+@dataclass
+class PlannerResult:
+    success: bool  # a plan was found
+    plan: str  # plan steps, otherwise the error message
+    exitcode: int | None  # portfolio exit code (`generate_portfolio_exitcode`), None if cancelled
+    returncode: int | None  # raw planner return code, None if the planner could not be started
+    elapsed: float  # wall-clock seconds
+    timed_out: bool = False
+    cancelled: bool = False
+    search_alg: str | list[str] = ""
+    domain_file: str = ""
+    problem_file: str = ""
+    runs: list["PlannerResult"] = field(default_factory=list)  # portfolio members (`PlannerPool.race`)
+
+
+class PlannerProcess:
+    def __init__(
+        self,
+        command: list[str],
+        timeout: float | None = None,
+        memory_limit: int | None = None,
+        cwd: str | None = None,
+    ) -> None:
+        """
+        A single planner run in its own process group, so that it can be killed with all of
+        the processes it spawned (i.e. FastDownward's translator and search).
+
+        Args:
+            command (list[str]): planner command line
+            timeout (float): wall-clock limit in seconds, defaults to None (no limit)
+            memory_limit (int): address-space limit in bytes per process (POSIX only), defaults to None (no limit)
+            cwd (str): working directory (FastDownward writes `sas_plan`/`output.sas` there), defaults to None
+        """
+
+        self.command = command
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.cwd = cwd
+        self.timed_out = False
+        self.cancelled = False
+        self._process: subprocess.Popen | None = None
+        self._lock = threading.Lock()
+
+    def _limit_memory(self):
+        # runs in the child between fork and exec (platforms without `prlimit`)
+        resource.setrlimit(resource.RLIMIT_AS, (self.memory_limit, self.memory_limit))
+
+    def run(self) -> tuple[int | None, str]:
+        """
+        Runs the planner to completion, timeout or `kill()`.
+
+        Returns:
+            returncode (int | None): planner return code, None if cancelled before it started
+            plan (str): plan steps found in the planner output
+        """
+
+        limit = self.memory_limit if resource else None
+        prlimit = getattr(resource, "prlimit", None)
+        with tempfile.TemporaryFile("w+") as output:
+            with self._lock:
+                if self.cancelled:
+                    return None, ""
+                self._process = subprocess.Popen(
+                    self.command,
+                    stdout=output,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    cwd=self.cwd,
+                    start_new_session=True,  # own process group
+                    preexec_fn=self._limit_memory if limit and not prlimit else None,
+                )
+                if limit and prlimit:
+                    # set from the parent: `preexec_fn` is not safe in threaded callers
+                    # (i.e. `PlannerPool`); processes spawned later inherit the limit
+                    try:
+                        prlimit(self._process.pid, resource.RLIMIT_AS, (limit, limit))
+                    except ProcessLookupError:
+                        pass  # already exited
+            try:
+                returncode = self._process.wait(timeout=self.timeout)
+            except subprocess.TimeoutExpired:
+                self.timed_out = True
+                self.kill()
+                returncode = self._process.wait()
+
+            output.seek(0)
+            plan = "\n".join(
+                m.group(0) for m in map(_PLAN_STEP.match, output) if m is not None
+            )
+        return returncode, plan
+
+    def kill(self):
+        """Kills the planner and every process it spawned (no-op if it already exited)"""
+        with self._lock:
+            process = self._process
+            if process is None:
+                self.cancelled = True  # never started
+                return
+            if process.poll() is not None:
+                return
+            self.cancelled = not self.timed_out
+            try:
+                if hasattr(os, "killpg"):
+                    os.killpg(process.pid, signal.SIGKILL)
+                else:
+                    process.kill()
+            except ProcessLookupError:
+                pass
+
 
 class FastDownward:
 
@@ -40,7 +163,12 @@ class FastDownward:
         self.planner_path = planner_path  # directory of FastDownward planner
 
     def run_fast_downward(
-        self, domain_file: str, problem_file: str, search_alg: str = "lama-first"
+        self,
+        domain_file: str,
+        problem_file: str,
+        search_alg: str = "lama-first",
+        timeout: float | None = None,
+        memory_limit: int | None = None,
     ):
         """
         Main function to run planner.
@@ -50,41 +178,121 @@ class FastDownward:
             problem_file (str): PDDL problem file path
             search_alg (str): search algorithm/heuristic to use
                 + refer to: https://www.fast-downward.org/PlannerUsage
+            timeout (float): wall-clock limit in seconds, defaults to None (no limit)
+            memory_limit (int): memory limit in bytes (POSIX only), defaults to None (no limit)
 
         Returns:
             success (bool): if a plan was found, otherwise False for incomplete.
             plan_output (str): plan output information.
 
         """
-        try:
-            result = subprocess.run(
-                [self.planner_path, "--alias", search_alg, domain_file, problem_file],
-                capture_output=True,
-                text=True,
-            )
+        result = self.run(
+            domain_file, problem_file, search_alg, timeout, memory_limit, verbose=True
+        )
+        return result.success, result.plan
 
-            exitcodes = [result.returncode]
+    def run(
+        self,
+        domain_file: str,
+        problem_file: str,
+        search_alg: str | list[str] = "lama-first",
+        timeout: float | None = None,
+        memory_limit: int | None = None,
+        cwd: str | None = None,
+        verbose: bool = False,
+        process: PlannerProcess | None = None,
+    ) -> PlannerResult:
+        """
+        Runs the planner and maps its return code through `generate_portfolio_exitcode` and
+        `handle_error`. A run killed at `timeout` counts as SEARCH_OUT_OF_TIME.
 
-            if result.returncode == SUCCESS:
-                # Planning succeeded
-                print("Planning succeeded!")
-                print(
-                    "All run components successfully terminated (translator: completed, search: found a plan, validate: validated a plan)"
-                )
+        Args:
+            domain_file (str): PDDL domain file path
+            problem_file (str): PDDL problem file path
+            search_alg (str | list[str]): alias or search options (see `command`), defaults to "lama-first"
+            timeout (float): wall-clock limit in seconds, defaults to None (no limit)
+            memory_limit (int): memory limit in bytes (POSIX only), defaults to None (no limit)
+            cwd (str): planner working directory, defaults to None (current directory)
+            verbose (bool): print planner status, defaults to False
+            process (PlannerProcess): process to run the planner in (built from the arguments above if None), defaults to None
+
+        Returns:
+            result (PlannerResult): plan or error message, exit codes and timing
+        """
+
+        start = time.perf_counter()
+        result = PlannerResult(
+            success=False,
+            plan="",
+            exitcode=None,
+            returncode=None,
+            elapsed=0.0,
+            search_alg=search_alg,
+            domain_file=domain_file,
+            problem_file=problem_file,
+        )
+        process = process or PlannerProcess(
+            self.command(domain_file, problem_file, search_alg), timeout, memory_limit, cwd
+        )
+
+        try:
+            result.returncode, plan = process.run()
+            result.timed_out = process.timed_out
+            result.cancelled = process.cancelled
+            result.elapsed = time.perf_counter() - start
+
+            if result.cancelled:
+                result.plan = "Planner run was cancelled."
+            elif result.returncode == SUCCESS:
+                result.exitcode = SUCCESS
+                if verbose:
+                    print("Planning succeeded!")
+                    print(
+                        "All run components successfully terminated (translator: completed, search: found a plan, validate: validated a plan)"
+                    )
 
                 # Extract the plan steps from the output
-                plan_output = self.extract_plan_steps(result.stdout)
-                if plan_output:
-                    return True, plan_output
-                else:
-                    return False, "No plan found in the output."
+                result.success = bool(plan)
+                result.plan = plan or "No plan found in the output."
             else:
                 # Planning failed
-                exitcode, plan_found = self.generate_portfolio_exitcode(exitcodes)
-                return False, self.handle_error(exitcode, plan_found)
+                exitcode, plan_found = self.generate_portfolio_exitcode(
+                    [self.exitcode_of(result.returncode, result.timed_out, memory_limit)],
+                    verbose=verbose,
+                )
+                result.exitcode = exitcode
+                result.plan = self.handle_error(exitcode, plan_found)
         except Exception as e:
-            print("An error occurred while running the planner.")
-            return False, str(e)
+            if verbose:
+                print("An error occurred while running the planner.")
+            result.plan = str(e)
+            result.elapsed = time.perf_counter() - start
+        return result
+
+    def command(
+        self, domain_file: str, problem_file: str, search_alg: str | list[str]
+    ) -> list[str]:
+        """
+        Planner command line for one run: `search_alg` is an alias (i.e. "lama-first") or a list
+        of search options (i.e. ["--search", "astar(lmcut())"]).
+        """
+        if isinstance(search_alg, str):
+            return [self.planner_path, "--alias", search_alg, domain_file, problem_file]
+        return [self.planner_path, domain_file, problem_file, *search_alg]
+
+    def exitcode_of(
+        self, returncode: int, timed_out: bool = False, memory_limit: int | None = None
+    ) -> int:
+        """
+        Maps a planner return code to a FastDownward exit code: runs killed at their timeout
+        count as SEARCH_OUT_OF_TIME, runs killed by a signal as SEARCH_OUT_OF_MEMORY under a
+        memory limit and as DRIVER_CRITICAL_ERROR otherwise.
+        """
+        if timed_out:
+            return SEARCH_OUT_OF_TIME
+        if returncode < 0:
+            return SEARCH_OUT_OF_MEMORY if memory_limit else DRIVER_CRITICAL_ERROR
+        return returncode
 
     def extract_plan_steps(self, output):
         plan_steps = re.findall(r"^\w+.*\(.*\)", output, re.MULTILINE)
@@ -140,9 +348,10 @@ class FastDownward:
         # Exit codes in the range from 30 to 39 represent unrecoverable failures.
         return 30 <= exitcode < 40
 
-    def generate_portfolio_exitcode(self, exitcodes):
+    def generate_portfolio_exitcode(self, exitcodes, verbose: bool = True):
 
-        print("Exit codes: {}".format(exitcodes))
+        if verbose:
+            print("Exit codes: {}".format(exitcodes))
         exitcodes = set(exitcodes)
         unrecoverable_codes = [
             code for code in exitcodes if self.is_unrecoverable(code)
@@ -150,7 +359,8 @@ class FastDownward:
 
         # There are unrecoverable exit codes.
         if unrecoverable_codes:
-            print("Error: Unexpected exit codes: {}".format(unrecoverable_codes))
+            if verbose:
+                print("Error: Unexpected exit codes: {}".format(unrecoverable_codes))
             if len(unrecoverable_codes) == 1:
                 return (unrecoverable_codes[0], False)
             else:
@@ -4,6 +4,9 @@ L2P PDDL Type and Data Structure Definitions
 This module defines core types and data classes used for representing components of PDDL
 domains, problems, and plans. These include structured representations for predicates, actions,
 functions, domain/task metadata, and parameterized object lists.
+
+Compact, immutable counterparts of the predicate, function, action and HTN dictionaries (that
+still read like them) are defined in `l2p/utils/pddl_objects.py`.
 """
 
 from collections import OrderedDict
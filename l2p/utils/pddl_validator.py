@@ -16,6 +16,9 @@ For instance:
             ]
 
 Is supported in: DomainBuilder.extract_pddl_action(**kwargs, syntax_validator)
+
+Builders run the enabled checks through `ValidationPipeline` (validation_pipeline.py), which
+runs every enabled check instead of stopping at the first failing one.
 """
 
 import re
@@ -23,6 +26,9 @@ from collections import OrderedDict
 from .pddl_format import *
 from .pddl_parser import *
 from .pddl_types import Predicate, Function
+from .domain_context import DomainContext
+from .state_index import StateIndex
+from .type_index import TypeIndex
 
 
 ORDINAL_SUFFIXES = {1: "st", 2: "nd", 3: "rd"}
@@ -89,7 +95,7 @@ class SyntaxValidator:
         Args:
             target_type (str): type that is expected for the parameter (from :predicates)
             claimed_type (str): type that is provided in the LLM output PDDL.
-            types (dict[str,str] | list[dict[str,str]]): current types in domain
+            types (dict[str,str] | list[dict[str,str]] | TypeIndex): current types in domain
 
         Returns:
             validation_info (tuple[bool,str]): validation info containing pass flag and error message
@@ -100,42 +106,17 @@ class SyntaxValidator:
             feedback_msg = "[PASS]: claimed type matches target type definition."
             return True, feedback_msg
 
-        types = format_types(types)  # flatten hierarchy
-
-        # extract all types from the keys in the types dictionary
-        all_types = set()
-        for key in types.keys():
-            main_type, *subtype = key.split(" - ")
-            all_types.add(main_type.strip())
-            if subtype:
-                all_types.add(subtype[0].strip())
+        type_index = TypeIndex.of(types)
 
         # check if target type is not found in all types
-        if target_type not in all_types:
-            feedback_msg = f"[ERROR]: target type `{target_type}` is not found in :types definition: {all_types}."
+        if target_type not in type_index:
+            feedback_msg = f"[ERROR]: target type `{target_type}` is not found in :types definition: {set(type_index)}."
             return False, feedback_msg
 
-        # iterate through the types hierarchy to check if claimed_type is a subtype of target_type
-        current_type = claimed_type
-        while current_type in all_types:
-            # find the key that starts with the current type
-
-            parent_type_entry = next(
-                (k for k in types.keys() if k.startswith(f"{current_type} - ")), None
-            )
-
-            if parent_type_entry:
-                # extract the parent type from the key
-                super_type = parent_type_entry.split(" - ")[1].strip()
-
-                if super_type == target_type:
-                    feedback_msg = (
-                        "[PASS]: claimed type matches target type definition."
-                    )
-                    return True, feedback_msg
-                current_type = super_type
-            else:
-                break
+        # check if claimed_type is a subtype of target_type
+        if type_index.is_subtype(claimed_type, target_type):
+            feedback_msg = "[PASS]: claimed type matches target type definition."
+            return True, feedback_msg
 
         feedback_msg = f"[ERROR]: claimed type `{claimed_type}` does not match target `{target_type}` or any of its possible sub-types."
         return False, feedback_msg
@@ -157,10 +138,8 @@ class SyntaxValidator:
             return True, "[PASS]: no types provided."
 
         # flatten types if it is in a hierarchy
-        types = format_types(types)
-
         invalid_types = []
-        for t_name, _ in types.items():
+        for t_name in TypeIndex.of(types).flat:
             if t_name.startswith("?"):
                 invalid_types.append(f" - {t_name}")
 
@@ -194,74 +173,25 @@ class SyntaxValidator:
             validation_info (tuple[bool,str]): validation info containing pass flag and error message
         """
 
-        def visit_type(node, visited, path, all_types):
-            """Traverses the type hierarchy and check for cycles."""
-
-            node_key = next(iter(node))  # get first type
-
-            # if already visited this type, it indicates a cycle
-            if node_key in visited:
-                cycle_path = " -> ".join(path[path.index(node_key) :] + [node_key])
-                violated_type = node_key  # type that caused the cycle
-                return False, cycle_path, violated_type
-
-            # mark the current type as visited in this traversal path
-            visited.add(node_key)
-            path.append(node_key)
-
-            # visit all children of the current node
-            if "children" in node:
-                for child in node["children"]:
-                    result, cycle, violated_type = visit_type(
-                        child, visited, path, all_types
-                    )
-                    if not result:
-                        return result, cycle, violated_type
-
-            # also check if type appears elsewhere in the hierarchy with children
-            for other_type in all_types:
-                other_key = next(iter(other_type))
-                if (
-                    other_key == node_key
-                    and "children" in other_type
-                    and other_type["children"]
-                ):
-                    for child in other_type["children"]:
-                        result, cycle, violated_type = visit_type(
-                            child, visited, path, all_types
-                        )
-                        if not result:
-                            return result, cycle, violated_type
-
-            # remove the type from the visited once its children are processed
-            visited.remove(node_key)
-            path.pop()
-            return True, "", ""
-
         # if no types are provided, return invalid
         if not types:
             return True, "[PASS]: no types provided."
 
-        if isinstance(types, dict):
-            types = [{k: v} for k, v in types.items()]
-
-        # iterate over all the top-level types
-        for type_node in types:
-            visited = set()
-            path = []  # This will keep track of the current path
-            result, cycle, violated_type = visit_type(type_node, visited, path, types)
-            if not result:
-                feedback_msg = (
-                    f"[ERROR]: Circular dependency detected in the type hierarchy: {cycle}"
-                    f"\n\nThis means the type '{violated_type}' indirectly inherits from itself through the chain:"
-                    f"\n - Starts with: '{path[0]}'"
-                    f"\n - Leads back to: '{violated_type}' via: {cycle}"
-                    f"\n\nThis creates an infinite loop in the type system where '{violated_type}' cannot be properly defined because its parent eventually depends on itself"
-                    f"\n\nPossible Solutions:"
-                    f"\n(1) Remove or modify one of the relationships in the cycle"
-                    f"\n(2) Consider flattening your hierarchy if circular references are needed"
-                )
-                return False, feedback_msg
+        cycle = TypeIndex.of(types).find_cycle()
+        if cycle:
+            violated_type = cycle[-1]  # type that caused the cycle
+            cycle_path = " -> ".join(cycle)
+            feedback_msg = (
+                f"[ERROR]: Circular dependency detected in the type hierarchy: {cycle_path}"
+                f"\n\nThis means the type '{violated_type}' indirectly inherits from itself through the chain:"
+                f"\n - Starts with: '{cycle[0]}'"
+                f"\n - Leads back to: '{violated_type}' via: {cycle_path}"
+                f"\n\nThis creates an infinite loop in the type system where '{violated_type}' cannot be properly defined because its parent eventually depends on itself"
+                f"\n\nPossible Solutions:"
+                f"\n(1) Remove or modify one of the relationships in the cycle"
+                f"\n(2) Consider flattening your hierarchy if circular references are needed"
+            )
+            return False, feedback_msg
 
         feedback_msg = "[PASS]: Type hierarchy is valid."
         return True, feedback_msg
@@ -285,16 +215,16 @@ class SyntaxValidator:
         if not constants:
             return True, "[PASS]: no constants provided."
 
-        types = format_types(types)  # flatten type hierarchy
+        type_index = TypeIndex.of(types)
 
-        if types:
+        if type_index:
             for const_name, const_type in constants.items():
-                if const_type not in types.keys():
+                if const_type not in type_index:
                     return (
                         False,
                         f"[ERROR]: constant `{const_name}` contains type `{const_type}` "
                         f"that is not found in list of available types:\n"
-                        f"{pretty_print_dict(types)}\n\n"
+                        f"{pretty_print_dict(type_index.flat)}\n\n"
                         f"Make sure that constants only point to types that exist.",
                     )
 
@@ -322,14 +252,8 @@ class SyntaxValidator:
             return True, "[PASS]: no functions provided."
 
         # retrieve types
-        valid_types = list()
-        if types:
-            types = format_types(types)
-            valid_types = [
-                type_key.split(" - ")[0].strip() for type_key in types.keys()
-            ]
-        else:
-            valid_types = []
+        type_index = TypeIndex.of(types)
+        valid_types = type_index.names
 
         all_invalid_params = []
 
@@ -383,7 +307,7 @@ class SyntaxValidator:
 
                     param_obj_type = split_function[i + 2]
 
-                    if param_obj_type not in valid_types:
+                    if param_obj_type not in type_index:
                         all_invalid_params.append((param_obj_type, f, func_def))
 
                     i += 3  # skip ?var - type
@@ -436,24 +360,16 @@ class SyntaxValidator:
             feedback_msg = "[PASS]: No types declared, all predicate names are unique."
             return True, feedback_msg
 
-        types = format_types(types)
-
-        invalid_predicates = list()
-        for pred in predicates:
+        type_index = TypeIndex.of(types)
 
-            for type_key in types.keys():
-                # extract the actual type name, disregarding hierarchical or descriptive parts
-                type_name = type_key.split(" - ")[0].strip()
-
-                # check if the predicate name is exactly the same as the type name
-                if pred["name"] == type_name:
-                    invalid_predicates.append(pred)
+        # check if the predicate name is exactly the same as a type name
+        invalid_predicates = [pred for pred in predicates if pred["name"] in type_index]
 
         if invalid_predicates:
             feedback_msg = "[ERROR]: The following predicate(s) have the same name(s) as existing object types:"
             for pred_i, pred in enumerate(invalid_predicates):
                 feedback_msg += f"\n{pred_i + 1}. `{pred['name']}` from {pred['clean']}"
-            feedback_msg += f"\nRename these predicates that are unique from types: {list(types.keys())}"
+            feedback_msg += f"\nRename these predicates that are unique from types: {list(type_index.flat)}"
             return False, feedback_msg
 
         feedback_msg = "[PASS]: All predicate names are unique to object type names"
@@ -584,15 +500,9 @@ class SyntaxValidator:
         if not predicates:
             return True, "[PASS: no predicates provided."
 
-        valid_types = list()
         # flatten type hierarchy if exists
-        if types:
-            types = format_types(types)
-            valid_types = [
-                type_key.split(" - ")[0].strip() for type_key in types.keys()
-            ]
-        else:
-            valid_types = []
+        type_index = TypeIndex.of(types)
+        valid_types = type_index.names
 
         all_invalid_params = []
 
@@ -640,7 +550,7 @@ class SyntaxValidator:
 
                     param_obj_type = split_predicate[i + 2]
 
-                    if param_obj_type not in valid_types:
+                    if param_obj_type not in type_index:
                         all_invalid_params.append((param_obj_type, p, pred_def))
 
                     i += 3  # skip ?var - type
@@ -699,7 +609,8 @@ class SyntaxValidator:
             validation_info (tuple[bool,str]): validation info containing pass flag and error message
         """
 
-        pddl = parse_pddl(pddl)  # parse into nested list
+        pddl = parse_sexpr(pddl)  # parse into expression tree
+        type_index = TypeIndex.of(types)
 
         # retrieve dict comprehension for each predicate/function
         pred_index = {pred["name"]: pred for pred in predicates}
@@ -721,11 +632,10 @@ class SyntaxValidator:
             except ValueError:
                 return False
 
-        def split_var_type_pairs(raw_list):
+        def split_var_type_pairs(var_list):
             """Helper function that for parsing typed variable declarations in PDDL-like syntax."""
-            if not raw_list:
-                return []
-            tokens = raw_list[0].split()
+            items = var_list if isinstance(var_list, SExpr) else [var_list]
+            tokens = [t for t in items if isinstance(t, str)]
             result, current_vars = [], []
             for i, token in enumerate(tokens):
                 if token == "-":
@@ -743,32 +653,28 @@ class SyntaxValidator:
             """Recursive function that validates a term which may be a function or value."""
 
             # if nested expression
-            if isinstance(term, list):
+            if isinstance(term, SExpr):
                 # (1) if term is a numeric operator
-                head_parts = term[0].strip().split()
-                head = head_parts[0]
+                head = term.head
 
                 if head in NUMERIC_OPERATORS:
-                    terms_ = term[0].split(" ") + term[1:]
-
-                    if len(terms_) != 3:
+                    if len(term) != 3:
                         return (
                             False,
-                            f"[ERROR]: Numeric operator `{head}` requires two arguments: {format_pddl_expr(terms_)}\n\n"
+                            f"[ERROR]: Numeric operator `{head}` requires two arguments: {format_pddl_expr(term)}\n\n"
                             f"Parsed line: {format_pddl_expr(node)}\n\n"
                             f"Make sure that only fluents are used and not variables.",
                         )
 
-                    for arg in term[1:]:
+                    for arg in term.args:
                         valid, msg = validate_term(node, arg, scoped_params)
                         if not valid:
                             return False, msg
                     return True, "[PASS]"
 
                 # (2) if term is a function or nested expression
-                func_ = term[0].split(" ")
-                func_name = func_[0]
-                func_args = func_[1:]
+                func_name = term.head
+                func_args = term.args
 
                 # checks if function name in pddl not found in :function list
                 if func_name not in func_index:
@@ -815,12 +721,12 @@ class SyntaxValidator:
                     return (
                         False,
                         f"[ERROR]: Function `{target_func['clean']}` expects {len(expected_args)} variable parameter(s), "
-                        f"but found {len(term[1:])} in {part}.\n\nParsed line: ({format_pddl_expr(node)})",
+                        f"but found {len(func_args)} in {part}.\n\nParsed line: ({format_pddl_expr(node)})",
                     )
 
                 # recursively checks if function argument is nested
                 for i, arg in enumerate(func_args):
-                    if isinstance(arg, list):
+                    if isinstance(arg, SExpr):
                         valid, msg = validate_term(node, arg, scoped_params)
                         if not valid:
                             return False, msg
@@ -839,7 +745,7 @@ class SyntaxValidator:
 
                             # validates if variable type aligns with target :type
                             flag, _ = self.validate_type(
-                                expected_type, actual_type, types
+                                expected_type, actual_type, type_index
                             )
                             if not flag:
                                 param_number = i + 1
@@ -872,34 +778,40 @@ class SyntaxValidator:
                     )
                 return True, "[PASS]"
 
-        def traverse(node, scoped_params):
-            """Recursive function that goes through nested list."""
+        def visit(node, scoped_params):
+            """
+            Validates a single node. Returns (False, error message) or (True, children), where
+            children are (node, scope, error prefix) tuples still to be validated.
+            """
 
             # if reached end node with no errors, return true
-            if isinstance(node, str) or not isinstance(node, list) or len(node) == 0:
-                return True, "[PASS]"
+            if not isinstance(node, SExpr) or len(node) == 0:
+                return True, []
 
-            keyword = node[0].split(" ")[0]  # extract keyword from node
+            keyword = node.head  # extract keyword from node
+            if keyword is None:
+                return (
+                    False,
+                    f"[ERROR]: Expression in {part} does not start with a keyword, predicate or function name.\n\n"
+                    f"Parsed line: {format_pddl_expr(node)}",
+                )
 
             # (1) if keyword is a logical connective (and, not, or)
             if keyword in LOGICAL_CONNECTIVES:
 
-                # recursively branch child nodes
-                children = node[1:] if keyword != "not" else [node[1]]
-                for child in children:
-                    valid, msg = traverse(child, scoped_params)
-                    if not valid:
-                        return False, msg
-                return True, "[PASS]"
+                # branch child nodes
+                children = node.args if keyword != "not" else node.args[:1]
+                return True, [(child, scoped_params, "") for child in children]
 
             # (2) if keyword is a quantifier (forall, exists)
             if keyword in QUANTIFIERS:
 
-                # validates correct arguments provided into quantifier
-                if len(node) != 3:
+                # validates correct arguments provided into quantifier (adjacent symbols count as one)
+                n_args = len(node.to_list())
+                if n_args != 3:
                     return (
                         False,
-                        f"[ERROR]: malformed usage of `{keyword}` statement. There should be 3 main arguments, but {len(node)} was given."
+                        f"[ERROR]: malformed usage of `{keyword}` statement. There should be 3 main arguments, but {n_args} was given."
                         f"\nMake sure to adhere to valid PDDL syntax. For example: `({keyword} (<variable_list>) (<logical_expression(s)>))`\n\n"
                         f"Parsed line: {format_pddl_expr(node)}\n\n"
                         f"Possible solutions:\n"
@@ -917,14 +829,14 @@ class SyntaxValidator:
                     var_type = parts[2] if len(parts) >= 3 and parts[1] == "-" else ""
 
                     # validate if type exists in :types
-                    if not var_type or var_type not in types:
+                    if not var_type or var_type not in type_index:
                         return False, (
                             f"[ERROR]: Unknown type declared `{var_type}` for `{var}` in quantifier `{keyword}`\n\n"
                             f"Parsed line: {format_pddl_expr(node)}\n\n"
                             f"Make sure that the PDDL actions do not contain any type declarations. For example: `(drive ?c)` is correct, but `(drive ?c - car)` is invalid"
                         )
                     new_scope[var] = var_type  # update variable scope environment
-                return traverse(body, new_scope)
+                return True, [(body, new_scope, "")]
 
             # (3) if keyword is a conditional effect (when)
             if keyword in CONDITIONAL_EFFECTS:
@@ -936,23 +848,21 @@ class SyntaxValidator:
                         f"Parsed line: {format_pddl_expr(node)}",
                     )
 
-                if len(node) != 3:
+                n_args = len(node.to_list())
+                if n_args != 3:
                     return (
                         False,
-                        f"[ERROR]: malformed usage of `{keyword}` statement. There should be 3 main arguments, but {len(node)} was given."
+                        f"[ERROR]: malformed usage of `{keyword}` statement. There should be 3 main arguments, but {n_args} was given."
                         f"\nMake sure to adhere to valid PDDL syntax. For example: `({keyword} (<condition(s)>) (<effect(s)>))`\n\n"
                         f"Parsed line: {format_pddl_expr(node)}\n\n"
                         f"Possible solutions:\n"
                         f"  (1) `{keyword}` must have two arguments: `(when <condition> <effect>)` where both condition and effect must be wrapped in parentheses.\n"
                         f"  (2) If there are multiple conditions or effects, they must use a logical connective like `and` expression to wrap arguments.",
                     )
-                valid, msg = traverse(node[1], scoped_params)
-                if not valid:
-                    return False, f"Invalid condition in 'when': {msg}"
-                valid, msg = traverse(node[2], scoped_params)
-                if not valid:
-                    return False, f"Invalid effect in 'when': {msg}"
-                return True, "[PASS]"
+                return True, [
+                    (node[1], scoped_params, "Invalid condition in 'when': "),
+                    (node[2], scoped_params, "Invalid effect in 'when': "),
+                ]
 
             # (4) if keyword is a numeric-fluent operator
             if (
@@ -969,9 +879,8 @@ class SyntaxValidator:
 
                 # check if equality is doing object comparison
                 if keyword == "=":
-                    parts = node[0].split(" ")
-                    if len(parts) == 3:
-                        arg_1, arg_2 = parts[1], parts[2]
+                    if len(node) == 3 and all(isinstance(arg, str) for arg in node):
+                        arg_1, arg_2 = node[1], node[2]
 
                         if arg_1.startswith("?") and arg_2.startswith("?"):
                             for arg in (arg_1, arg_2):
@@ -995,9 +904,12 @@ class SyntaxValidator:
                                     f"Make sure that when using object equality, the variables share the same types.",
                                 )
 
-                            return True, "[PASS]"
+                            return True, []
 
-                if len(node) != 3:
+                # arguments are numeric constants or function expressions, not variables
+                if len(node) != 3 or any(
+                    isinstance(arg, str) and not is_value(arg) for arg in node.args
+                ):
                     return (
                         False,
                         f"[ERROR]: `{keyword}` operator requires exactly two arguments.\n\n"
@@ -1006,17 +918,17 @@ class SyntaxValidator:
                         f"where both <arg1> and <arg2> can be numeric constants (e.g., 5, 3.14, -2)\n"
                         f"or numeric function expressions (e.g., (total-cost), (fuel-level ?v)).",
                     )
-                for term in node[1:]:
+                for term in node.args:
                     # traverse terms of operator statement
                     valid, msg = validate_term(node, term, scoped_params)
                     if not valid:
                         return False, msg
 
-                return True, "[PASS]"
+                return True, []
 
             # (5) if keyword is a predicate
             pred_name = keyword
-            pred_args = node[0].split(" ")[1:]
+            pred_args = [arg for arg in node.args if isinstance(arg, str)]
 
             # validate if predicate is found in :predicates
             if pred_name not in pred_index:
@@ -1065,7 +977,7 @@ class SyntaxValidator:
 
             for i, arg in enumerate(pred_args):
                 # recursively checks if predicate argument is nested
-                if isinstance(arg, list):
+                if isinstance(arg, SExpr):
                     valid, msg = validate_term(node, arg, scoped_params)
                     if not valid:
                         return False, msg
@@ -1090,7 +1002,7 @@ class SyntaxValidator:
                                 False,
                                 f"[ERROR]: Types declared in predicate, but types list is empty.",
                             )
-                        flag, _ = self.validate_type(expected_type, actual_type, types)
+                        flag, _ = self.validate_type(expected_type, actual_type, type_index)
                         if not flag:
                             suffix = get_ordinal_suffix(i + 1)
                             return (
@@ -1100,10 +1012,21 @@ class SyntaxValidator:
                                 f"Parsed line: {format_pddl_expr(node)}",
                             )
 
-            return True, "[PASS]"
+            return True, []
+
+        # walk expression tree with an explicit stack (no recursion limit on nesting depth)
+        stack = [(pddl, action_params.copy(), "")]
+        while stack:
+            node, scoped_params, prefix = stack.pop()
+            valid, result = visit(node, scoped_params)
+            if not valid:
+                return False, prefix + result
+            stack.extend(
+                (child, scope, prefix + child_prefix)
+                for child, scope, child_prefix in reversed(result)
+            )
 
-        # resurively invoked function to branch nested list
-        return traverse(pddl, scoped_params=action_params.copy())
+        return True, "[PASS]"
 
     def validate_params(
         self,
@@ -1150,9 +1073,9 @@ class SyntaxValidator:
             )
             return False, feedback_msg
 
-        types = format_types(types)
+        type_index = TypeIndex.of(types)
         # if no types are defined, check if parameters contain types
-        if not types:
+        if not type_index:
             for param_name, param_type in parameters.items():
                 if param_type is not None and param_type != "":
                     feedback_msg = (
@@ -1168,9 +1091,9 @@ class SyntaxValidator:
         else:
             for param_name, param_type in parameters.items():
 
-                if not any(param_type in t for t in types.keys()):
+                if param_type and param_type not in type_index:
                     feedback_msg = (
-                        f"[ERROR]: There is an invalid object type `{param_type}` for the parameter `{param_name}` not found in the types {list(types.keys())} found in the action parameters section. Parameter types should align with the provided types, otherwise just leave parameter untyped.\n\n"
+                        f"[ERROR]: There is an invalid object type `{param_type}` for the parameter `{param_name}` not found in the types {list(type_index.flat)} found in the action parameters section. Parameter types should align with the provided types, otherwise just leave parameter untyped.\n\n"
                         f"Make sure each line defines a parameter using the format: "
                         f"`?<parameter_name> - <type_name>: <description of parameter>`\n\n"
                         f"For example:\n"
@@ -1211,11 +1134,8 @@ class SyntaxValidator:
         else:
             new_predicates = []
 
-        if curr_predicates is None:
-            curr_predicates = new_predicates
-        else:
-            curr_predicates.extend(new_predicates)
-        curr_predicates = parse_predicates(curr_predicates)
+        # merge into a new list, the caller's predicates are left untouched
+        curr_predicates = parse_predicates(list(curr_predicates or []) + new_predicates)
 
         # get action params
         params_info = parse_params(llm_response)
@@ -1257,6 +1177,7 @@ class SyntaxValidator:
         self,
         objects: dict[str, str],
         types: dict[str, str] | list[dict[str, str]] | None = None,
+        domain_context: DomainContext | None = None,
     ) -> tuple[bool, str]:
         """
         Checks if task objects are declared correctly. Performs the following cases:
@@ -1265,60 +1186,38 @@ class SyntaxValidator:
 
         Args:
             objects (dict[str,str]): task objects generated from LLM
-            types (dict[str,str] | list[dict[str,str]]): current types in domain
+            types (dict[str,str] | list[dict[str,str]] | TypeIndex): current types in domain
+            domain_context (DomainContext): precompiled domain, replaces `types` if given, defaults to None
 
         Returns:
             validation_info (tuple[bool,str]): validation info containing pass flag and error message
         """
 
-        # if type hierarchy format
-        if isinstance(types, list):
-            types = format_types(types)
-
-        type_keys = types.keys() if types else []
+        type_index = (
+            domain_context.type_index
+            if domain_context is not None
+            else TypeIndex.of(types)
+        )
+        type_keys = list(type_index.flat)
 
         for obj_name, obj_type in objects.items():
 
-            obj_type_found = False
-
-            for type_key in type_keys:
-                # Try to split into current_type and parent_type if possible
-                if " - " in type_key:
-                    current_type, parent_type = type_key.split(" - ")
-                else:
-                    current_type = type_key
-                    parent_type = None
-
-                # Match object type to current or parent
-                if obj_type == current_type or (
-                    parent_type and obj_type == parent_type
-                ):
-                    obj_type_found = True
-
-                # Check for name conflict with types
-                if obj_name == current_type:
-                    parsed_line = f"{obj_name} - {obj_type}"
-                    return (
-                        False,
-                        f"[ERROR]: Object variable '{obj_name}' matches the type name '{current_type}', change it to be unique from types: {list(type_keys)}\n"
-                        f"Violated object declaration: ({parsed_line if obj_type else obj_name})\n",
-                    )
-
-                if parent_type and obj_name == parent_type:
-                    parsed_line = f"{obj_name} - {obj_type}"
-                    return (
-                        False,
-                        f"[ERROR]: Object variable '{obj_name}' matches the type name '{parent_type}', change it to be unique from types: {list(type_keys)}\n"
-                        f"Violated object declaration: ({parsed_line if obj_type else obj_name})\n",
-                    )
+            # check for name conflict with types
+            if obj_name in type_index:
+                parsed_line = f"{obj_name} - {obj_type}"
+                return (
+                    False,
+                    f"[ERROR]: Object variable '{obj_name}' matches the type name '{obj_name}', change it to be unique from types: {type_keys}\n"
+                    f"Violated object declaration: ({parsed_line if obj_type else obj_name})\n",
+                )
 
             # if object does not contain a type
             if not obj_type:
                 continue
 
-            if not obj_type_found:
+            if obj_type not in type_index:
                 message = (
-                    f"not found in types: {list(type_keys)}"
+                    f"not found in types: {type_keys}"
                     if type_keys
                     else "but there are no types declared."
                 )
@@ -1336,9 +1235,12 @@ class SyntaxValidator:
         self,
         states: list[dict[str, str]],
         objects: dict[str, str],
-        predicates: list[Predicate],
+        predicates: list[Predicate] | None = None,
         functions: list[Function] | None = None,
         state_type: str = "initial",
+        domain_context: DomainContext | None = None,
+        collect_all: bool = False,
+        state_index: StateIndex | None = None,
     ) -> tuple[bool, str]:
         """
         Checks if task states are declared correcly. Performs following checks:
@@ -1352,101 +1254,28 @@ class SyntaxValidator:
             predicates (list[Predicate]): current predicates in domain
             functions (list[Function]): list of current functions in domain
             state_type (str): optional; 'initial' or 'goal' to label messages
+            domain_context (DomainContext): precompiled domain, replaces `predicates`/`functions` if given, defaults to None
+            collect_all (bool): report every invalid state instead of the first one, defaults to False
+            state_index (StateIndex): prebuilt index of `objects` and the domain (i.e. shared by initial and goal states), defaults to None
 
         Returns:
             validation_info (tuple[bool,str]): validation info containing pass flag and error message
         """
 
-        for state in states:
-
-            # new check: function states
-            state_name = state.get("func_name", None)
-            if state_name:
-                state_params = state["params"]
-                state_val = state["value"]
-                state_op = state["op"]
-
-                # (i) check if function name exists in domain functions
-                if not functions:
-                    functions = []
-                function_names = [f["name"] for f in functions]
-                if state_name not in function_names:
-                    function_names_str = (
-                        function_names if functions else "No functions provided"
-                    )
-                    return (
-                        False,
-                        f"[ERROR]: In the {state_type} state, '({state_op} ({state_name} {' '.join(state_params)}) {state_val})' "
-                        f"uses function '{state_name}', which is not defined in the domain: {function_names_str}.\n\n"
-                        f"If there are no functions, do not include this state.",
-                    )
-
-                # (ii) Check if all parameters exist in the task objects
-                missing_params = [p for p in state_params if p not in objects]
-                if missing_params:
-                    return (
-                        False,
-                        f"[ERROR]: In the {state_type} state, '({state_name} {' '.join(state_params)})' "
-                        f"contains parameter(s) {missing_params} not found in task objects {list(objects.keys())}.",
-                    )
-
-                # (iii) Check if object types match expected predicate types
-                target_func = next(f for f in functions if f["name"] == state_name)
-                expected_types = list(target_func["params"].values())
-                actual_types = [objects[param] for param in state_params]
-                actual_name_type_pairs = [
-                    f"'{param}' is type: '{objects[param]}'" for param in state_params
-                ]
-
-                if expected_types != actual_types:
-                    return (
-                        False,
-                        f"[ERROR]: In the {state_type} state, '({state_op} ({state_name} {' '.join(state_params)}) {state_val})' has mismatched types.\n\n"
-                        f"Declared objects: {[f'{obj_name} - {obj_type}' for obj_name, obj_type in objects.items()]}\n\n"
-                        f"Function `{target_pred['clean']}` expects type(s): {expected_types}\n"
-                        f"Parsed line: ({state_op} ({state_name} {' '.join(state_params)}) {state_val}) contains type(s): {actual_types}, where [{', '.join(actual_name_type_pairs)}]\n\n"
-                        f"Revise the state such that their parameter types align with the original function definition types.",
-                    )
-
-            else:
-                state_name = state["pred_name"]
-                state_params = state["params"]
-
-                # (i) Check if predicate name exists in domain predicates
-                predicate_names = [p["name"] for p in predicates]
-                if state_name not in predicate_names:
-                    return (
-                        False,
-                        f"[ERROR]: In the {state_type} state, '({state_name} {' '.join(state_params)})' "
-                        f"uses predicate '{state_name}', which is not defined in the domain ({predicate_names}).",
-                    )
-
-                # (ii) Check if all parameters exist in the task objects
-                missing_params = [p for p in state_params if p not in objects]
-                if missing_params:
-                    return (
-                        False,
-                        f"[ERROR]: In the {state_type} state, '({state_name} {' '.join(state_params)})' "
-                        f"contains parameter(s) {missing_params} not found in task objects {list(objects.keys())}.",
-                    )
-
-                # (iii) Check if object types match expected predicate types
-                target_pred = next(p for p in predicates if p["name"] == state_name)
-                expected_types = list(target_pred["params"].values())
-                actual_types = [objects[param] for param in state_params]
-                actual_name_type_pairs = [
-                    f"'{param}' is type: '{objects[param]}'" for param in state_params
-                ]
+        # hash indexes over objects and predicate/function signatures, reusable across calls
+        if state_index is None:
+            state_index = StateIndex(
+                objects,
+                predicates=predicates,
+                functions=functions,
+                domain_context=domain_context,
+            )
 
-                if expected_types != actual_types:
-                    return (
-                        False,
-                        f"[ERROR]: In the {state_type} state, '({state_name} {' '.join(state_params)})' has mismatched types.\n\n"
-                        f"Declared objects: {[f'{obj_name} - {obj_type}' for obj_name, obj_type in objects.items()]}\n\n"
-                        f"Predicate `{target_pred['clean']}` expects type(s): {expected_types}\n"
-                        f"Parsed line: ({state_name} {' '.join(state_params)}) contains type(s): {actual_types}, where [{', '.join(actual_name_type_pairs)}]\n\n"
-                        f"Revise the state predicates to match the original predicate parameter types. Do not include type annotations in the predicate—e.g., use (drive ?c), not (drive ?c - car).",
-                    )
+        errors = state_index.check(states, state_type=state_type, collect_all=collect_all)
+        if errors:
+            if collect_all:  # objects are listed once, not per violation
+                errors.append(f"Declared objects: {state_index.declared_objects()[1]}")
+            return False, "\n\n".join(errors)
 
         feedback_msg = "[PASS]: All task states are valid."
         return True, feedback_msg
@@ -0,0 +1,108 @@
+"""
+L2P Streaming PDDL Writer
+
+This module defines `write_task`, which streams a PDDL problem to any file-like object (anything
+with `write(str)`). Objects, initial and goal states are consumed lazily — dictionaries, lists,
+generators or `FactTable`s — and written through a fixed-size buffer, so peak memory does not
+grow with the problem size (beyond the inputs themselves). `TaskBuilder.generate_task` is a thin
+wrapper writing into a `StringIO`.
+
+For instance:
+    with open("problem.pddl", "w") as f:
+        write_task(
+            f, "logistics", "p1",
+            objects=((f"pkg{i}", "package") for i in range(100000)),
+            initial=fact_table,
+            goal=goal_states,
+        )
+"""
+
+from typing import IO, Iterable
+from .fact_table import FactTable
+from .pddl_format import iter_objects, iter_states
+
+INDENT = "   "
+
+
+def write_task(
+    file: IO[str],
+    domain_name: str,
+    problem_name: str,
+    objects: dict[str, str] | Iterable[tuple[str, str]],
+    initial: Iterable[dict[str, str]] | FactTable,
+    goal: Iterable[dict[str, str]] | FactTable,
+    group_objects: bool = True,
+    buffer_size: int = 1 << 16,
+) -> int:
+    """
+    Streams a PDDL problem to `file`.
+
+    Args:
+        file (IO[str]): writable text file-like object
+        domain_name (str): domain name
+        problem_name (str): specific task instance name
+        objects (dict[str,str] | Iterable[tuple[str,str]]): PDDL :objects, or (name, type) pairs
+        initial (Iterable[dict[str,str]] | FactTable): PDDL :init states
+        goal (Iterable[dict[str,str]] | FactTable): PDDL :goal states
+        group_objects (bool): declare objects of one type on a shared line (`a b c - block`), defaults to True
+        buffer_size (int): # of characters buffered before each `file.write`, defaults to 65536
+
+    Returns:
+        size (int): # of characters written
+    """
+
+    buffer = _Buffer(file, buffer_size)
+
+    buffer.write(f"(define\n{INDENT}(problem {problem_name})\n{INDENT}(:domain {domain_name})\n\n")
+
+    buffer.write(f"{INDENT}(:objects \n")
+    buffer.lines(iter_objects(objects, group=group_objects), INDENT * 2)
+    buffer.write(f"{INDENT})\n\n")
+
+    buffer.write(f"{INDENT}(:init\n")
+    buffer.lines(iter_states(initial), INDENT * 2)
+    buffer.write(f"{INDENT})\n\n")
+
+    buffer.write(f"{INDENT}(:goal\n{INDENT * 2}(and \n")
+    buffer.lines(iter_states(goal), INDENT * 3)
+    buffer.write(f"{INDENT * 2})\n{INDENT})\n)")
+
+    return buffer.close()
+
+
+class _Buffer:
+    """Collects chunks and hands them to `file.write` once `buffer_size` characters are pending"""
+
+    def __init__(self, file: IO[str], buffer_size: int) -> None:
+        self.file = file
+        self.buffer_size = buffer_size
+        self.chunks = []
+        self.pending = 0
+        self.written = 0
+
+    def write(self, chunk: str):
+        self.chunks.append(chunk)
+        self.pending += len(chunk)
+        if self.pending >= self.buffer_size:
+            self.flush()
+
+    def lines(self, lines: Iterable[str], prefix: str):
+        """Writes each line with `prefix`; an empty section keeps a blank indented line"""
+        empty = True
+        for line in lines:
+            empty = False
+            self.write(f"{prefix}{line}\n")
+        if empty:
+            self.write(f"{prefix}\n")
+
+    def flush(self):
+        if self.chunks:
+            data = "".join(self.chunks)
+            self.file.write(data)
+            self.written += len(data)
+            self.chunks.clear()
+            self.pending = 0
+
+    def close(self) -> int:
+        self.flush()
+        return self.written
@@ -0,0 +1,333 @@
+"""
+L2P Planner Pool
+
+This module defines `PlannerPool`, which runs many FastDownward invocations concurrently (i.e.
+planning thousands of LLM-generated tasks) without letting a pathological task take a worker down:
+    - every run has a wall-clock `timeout` and a `memory_limit`; a run over its timeout is killed
+      with its whole process group and reported as SEARCH_OUT_OF_TIME
+    - every run gets a private working directory, so concurrent runs do not overwrite each
+      other's `sas_plan`/`output.sas`
+    - planner output is spooled to disk, only the plan steps are kept in memory
+    - the queue is bounded: `submit` blocks once `max_workers + max_pending` runs are outstanding
+    - results are `concurrent.futures.Future`s of `PlannerResult`, with return codes mapped through
+      `FastDownward.generate_portfolio_exitcode`/`handle_error`
+    - `race` runs a portfolio of configurations on one task in parallel: the first plan wins and
+      the other runs are killed. Configurations are FastDownward aliases, lists of search options,
+      or "up:<engine>" for a unified-planning engine (run in a subprocess by `up_solve.py`)
+
+For instance:
+    with PlannerPool("downward/fast-downward.py", timeout=60, memory_limit=4 * 2**30) as pool:
+        future = pool.submit(domain_file, problem_file)       # Future[PlannerResult]
+        for result in pool.solve_all((domain_file, p) for p in problem_files):
+            print(result.problem_file, result.success, result.plan)
+        result = pool.race(domain_file, problem_file, ["lama-first", "seq-opt-lmcut", "up:aries"])
+        pool.stats                                            # {"solved": 981, "timed_out": 12, ...}
+"""
+
+import dataclasses
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Iterable, Iterator
+from .pddl_planner import FastDownward, PlannerProcess, PlannerResult
+
+UP_PREFIX = "up:"  # portfolio configuration running a unified-planning engine, i.e. "up:aries"
+_UP_SOLVE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "up_solve.py")
+
+
+class PlannerPool:
+    def __init__(
+        self,
+        planner: FastDownward | str,
+        max_workers: int | None = None,
+        max_pending: int | None = None,
+        timeout: float | None = None,
+        memory_limit: int | None = None,
+        work_dir: str | None = None,
+    ) -> None:
+        """
+        Starts a pool of planner workers. Workers are threads that each wait on one planner
+        process, so the planner runs themselves use up to `max_workers` cores.
+
+        Args:
+            planner (FastDownward | str): planner, or path to the FastDownward driver
+            max_workers (int): max # of concurrent planner runs, defaults to the # of CPUs
+            max_pending (int): max # of runs queued behind the running ones, defaults to `max_workers`
+            timeout (float): default wall-clock limit per run in seconds, defaults to None (no limit)
+            memory_limit (int): default memory limit per run in bytes (POSIX only), defaults to None (no limit)
+            work_dir (str): parent folder of the per-run working directories, defaults to the system temp folder
+        """
+
+        self.planner = FastDownward(planner) if isinstance(planner, str) else planner
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = self.max_workers if max_pending is None else max_pending
+        if self.max_workers < 1 or self.max_pending < 0:
+            raise ValueError("`max_workers` must be at least 1 and `max_pending` at least 0.")
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.work_dir = work_dir
+
+        self.stats = {"submitted": 0, "solved": 0, "failed": 0, "timed_out": 0, "cancelled": 0}
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="l2p-planner"
+        )
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.max_pending)
+        self._processes: dict[Future, PlannerProcess] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(
+        self,
+        domain_file: str,
+        problem_file: str,
+        search_alg: str | list[str] = "lama-first",
+        timeout: float | None = None,
+        memory_limit: int | None = None,
+    ) -> Future:
+        """
+        Queues a planner run, blocking while the queue is full.
+
+        Args:
+            domain_file (str): PDDL domain file path
+            problem_file (str): PDDL problem file path
+            search_alg (str | list[str]): alias, search options or "up:<engine>" (see `command`), defaults to "lama-first"
+            timeout (float): wall-clock limit in seconds, defaults to the pool's
+            memory_limit (int): memory limit in bytes, defaults to the pool's
+
+        Returns:
+            future (Future[PlannerResult]): result of the run
+        """
+
+        if self._closed:
+            raise RuntimeError("Cannot submit to a PlannerPool after shutdown.")
+        timeout = self.timeout if timeout is None else timeout
+        memory_limit = self.memory_limit if memory_limit is None else memory_limit
+
+        process = PlannerProcess(
+            self.command(domain_file, problem_file, search_alg), timeout, memory_limit
+        )
+
+        self._slots.acquire()
+        try:
+            with self._lock:
+                future = self._executor.submit(
+                    self._run, process, domain_file, problem_file, search_alg, memory_limit
+                )
+                self._processes[future] = process
+                self.stats["submitted"] += 1
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(self._done)
+        return future
+
+    def command(
+        self, domain_file: str, problem_file: str, search_alg: str | list[str]
+    ) -> list[str]:
+        """Command line of one run, with absolute paths as runs happen in private working directories"""
+        domain_file, problem_file = os.path.abspath(domain_file), os.path.abspath(problem_file)
+        if isinstance(search_alg, str) and search_alg.startswith(UP_PREFIX):
+            engine = search_alg[len(UP_PREFIX) :]
+            return [sys.executable, _UP_SOLVE, engine, domain_file, problem_file]
+
+        command = self.planner.command(domain_file, problem_file, search_alg)
+        if os.path.exists(command[0]):
+            command[0] = os.path.abspath(command[0])
+        return command
+
+    def _run(
+        self,
+        process: PlannerProcess,
+        domain_file: str,
+        problem_file: str,
+        search_alg: str | list[str],
+        memory_limit: int | None,
+    ) -> PlannerResult:
+        with tempfile.TemporaryDirectory(prefix="l2p-planner-", dir=self.work_dir) as cwd:
+            process.cwd = cwd
+            return self.planner.run(
+                domain_file, problem_file, search_alg, memory_limit=memory_limit, process=process
+            )
+
+    def _done(self, future: Future):
+        with self._lock:
+            self._processes.pop(future, None)
+            if future.cancelled():
+                self.stats["cancelled"] += 1
+            elif future.exception() is None:
+                result = future.result()
+                if result.cancelled:
+                    self.stats["cancelled"] += 1
+                elif result.timed_out:
+                    self.stats["timed_out"] += 1
+                else:
+                    self.stats["solved" if result.success else "failed"] += 1
+            else:
+                self.stats["failed"] += 1
+        self._slots.release()
+
+    def cancel(self, future: Future) -> bool:
+        """
+        Cancels a queued run, or kills a running one (its result then has `cancelled=True`).
+
+        Returns:
+            cancelled (bool): False if the run had already finished
+        """
+        if future.cancel():
+            return True
+        with self._lock:
+            process = self._processes.get(future)
+        if process is None:
+            return False
+        process.kill()
+        return True
+
+    def solve_all(
+        self,
+        jobs: Iterable[tuple[str, str] | tuple[str, str, str]],
+        timeout: float | None = None,
+        memory_limit: int | None = None,
+    ) -> Iterator[PlannerResult]:
+        """
+        Runs many planner jobs, yielding results as soon as each completes (out of order; use
+        `result.problem_file` to match them). Jobs are submitted lazily, so closing the generator
+        early cancels the outstanding runs instead of leaving a backlog.
+
+        Args:
+            jobs (Iterable[tuple]): (domain_file, problem_file) or (domain_file, problem_file, search_alg)
+            timeout (float): wall-clock limit per run in seconds, defaults to the pool's
+            memory_limit (int): memory limit per run in bytes, defaults to the pool's
+
+        Yields:
+            result (PlannerResult): result of one job
+        """
+
+        pending_jobs = iter(jobs)
+        running = set()
+
+        def submit_next() -> bool:
+            job = next(pending_jobs, None)
+            if job is None:
+                return False
+            running.add(self.submit(*job, timeout=timeout, memory_limit=memory_limit))
+            return True
+
+        while len(running) < self.max_workers + self.max_pending and submit_next():
+            pass
+
+        try:
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    running.discard(future)
+                    submit_next()
+                    if not future.cancelled():
+                        yield future.result()
+        finally:
+            for future in running:
+                self.cancel(future)
+
+    def race(
+        self,
+        domain_file: str,
+        problem_file: str,
+        search_algs: Iterable[str | list[str]],
+        timeout: float | None = None,
+        memory_limit: int | None = None,
+    ) -> PlannerResult:
+        """
+        Runs a portfolio of planner configurations on the same task in parallel. The first run to
+        find a plan wins and the others are killed; exit codes of the runs that finished are
+        aggregated with `generate_portfolio_exitcode`. Keep the portfolio within `max_workers`
+        so that every configuration starts right away.
+
+        Args:
+            domain_file (str): PDDL domain file path
+            problem_file (str): PDDL problem file path
+            search_algs (Iterable[str | list[str]]): aliases, search options or "up:<engine>" (see `command`)
+            timeout (float): wall-clock limit per run in seconds, defaults to the pool's
+            memory_limit (int): memory limit per run in bytes, defaults to the pool's
+
+        Returns:
+            result (PlannerResult): the winning run (or the failure of the whole portfolio), with
+                the portfolio exit code and every run in `runs`
+        """
+
+        start = time.perf_counter()
+        search_algs = list(search_algs)
+        if not search_algs:
+            raise ValueError("`search_algs` must contain at least one configuration.")
+        futures = [
+            self.submit(domain_file, problem_file, alg, timeout, memory_limit)
+            for alg in search_algs
+        ]
+
+        winner, pending = None, set(futures)
+        try:
+            while pending and winner is None:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if not future.cancelled() and future.result().success:
+                        winner = winner or future.result()
+        finally:
+            for future in pending:
+                self.cancel(future)
+
+        # killed runs exit right away: wait for them so that the next task gets the cores
+        wait(futures)
+        runs = [
+            future.result()
+            for future in futures
+            if not future.cancelled() and future.exception() is None
+        ]
+
+        try:
+            codes = [r.exitcode for r in runs if r.exitcode is not None]
+            exitcode, plan_found = self.planner.generate_portfolio_exitcode(codes, verbose=False)
+        except AssertionError:  # no exit codes, or codes FastDownward does not define
+            exitcode, plan_found = None, winner is not None
+
+        elapsed = time.perf_counter() - start
+        if winner is not None:
+            return dataclasses.replace(winner, exitcode=exitcode, elapsed=elapsed, runs=runs)
+        return PlannerResult(
+            success=False,
+            plan=(
+                self.planner.handle_error(exitcode, plan_found)
+                if exitcode is not None
+                else "No configuration of the portfolio found a plan."
+            ),
+            exitcode=exitcode,
+            returncode=None,
+            elapsed=elapsed,
+            timed_out=bool(runs) and all(r.timed_out for r in runs),
+            search_alg=search_algs,
+            domain_file=domain_file,
+            problem_file=problem_file,
+            runs=runs,
+        )
+
+    def shutdown(self, wait: bool = True, cancel: bool = False):
+        """
+        Stops accepting runs.
+
+        Args:
+            wait (bool): block until outstanding runs finish, defaults to True
+            cancel (bool): cancel queued runs and kill running ones, defaults to False
+        """
+        self._closed = True
+        if cancel:
+            with self._lock:
+                futures = list(self._processes)
+            for future in futures:
+                self.cancel(future)
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "PlannerPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown(cancel=exc_type is not None)
@@ -0,0 +1,216 @@
+"""
+L2P Prompt Templates
+
+This module compiles prompt templates (`templates/`) into literal and placeholder segments once,
+instead of filling them with chains of `str.replace` that copy the whole template per placeholder:
+    - `PromptTemplate` splits a template on its `{name}` placeholders (identifiers only, so JSON
+      examples such as `{"name": ...}` are left alone) and renders it with a single join
+    - substituted values are never re-scanned, so a `{types}` inside a domain description stays as
+      it is instead of being replaced by accident
+    - `render` checks that every placeholder is supplied (`strict=False` leaves missing ones as
+      `{name}`, as the builders did with `str.replace`)
+    - `TemplateRegistry` preloads and compiles a template tree (`templates/` by default), shared
+      process-wide through `load_template`
+
+For instance:
+    template = load_template("domain_templates/formalize_predicates")
+    template.placeholders                                     # frozenset({"domain_desc", ...})
+    prompt = template.render(domain_desc=domain_desc, types=types_str, ...)
+
+    PromptTemplate.of(prompt_template).render(values, strict=False)   # compiled once per text
+"""
+
+import os
+import re
+import threading
+from functools import lru_cache
+from typing import Any
+
+_PLACEHOLDER = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+# repo `templates/` tree, next to the `l2p` package
+DEFAULT_TEMPLATE_ROOT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "templates",
+)
+
+
+class PromptTemplate:
+    __slots__ = ("text", "name", "placeholders", "_literals", "_names")
+
+    def __init__(self, text: str, name: str | None = None) -> None:
+        """
+        Compiles a template into literal and placeholder segments.
+
+        Args:
+            text (str): template text with `{name}` placeholders
+            name (str): template name (i.e. "domain_templates/formalize_type"), defaults to None
+        """
+
+        segments = _PLACEHOLDER.split(text)
+        self.text = text
+        self.name = name
+        self._literals = segments[0::2]  # always one more literal than placeholders
+        self._names = segments[1::2]
+        self.placeholders = frozenset(self._names)
+
+    @classmethod
+    def of(cls, template: "str | PromptTemplate") -> "PromptTemplate":
+        """Returns `template` if already compiled, otherwise the (cached) compilation of the text"""
+        if isinstance(template, PromptTemplate):
+            return template
+        return _compile(template)
+
+    def missing(self, values: dict[str, Any]) -> set[str]:
+        """Placeholders of the template not supplied by `values`"""
+        return set(self.placeholders.difference(values))
+
+    def render(
+        self, values: dict[str, Any] | None = None, strict: bool = True, **kwargs
+    ) -> str:
+        """
+        Fills the placeholders of the template.
+
+        Args:
+            values (dict[str,Any]): placeholder name -> value (`str()` is applied), defaults to None
+            strict (bool): raise if a placeholder is not supplied, otherwise leave it as `{name}`, defaults to True
+            **kwargs: more placeholder values, override `values`
+
+        Returns:
+            prompt (str): rendered template; values supplied for absent placeholders are ignored
+        """
+
+        if kwargs:
+            values = {**values, **kwargs} if values else kwargs
+        elif values is None:
+            values = {}
+
+        if strict:
+            missing = self.missing(values)
+            if missing:
+                raise ValueError(
+                    f"Template {self.name or ''!r} is missing values for: {', '.join(sorted(missing))}"
+                )
+
+        literals = self._literals
+        parts = [literals[0]]
+        for i, name in enumerate(self._names, 1):
+            parts.append(str(values[name]) if name in values else f"{{{name}}}")
+            parts.append(literals[i])
+        return "".join(parts)
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        return f"PromptTemplate(name={self.name!r}, placeholders={sorted(self.placeholders)})"
+
+
+@lru_cache(maxsize=256)
+def _compile(text: str) -> PromptTemplate:
+    return PromptTemplate(text)
+
+
+class TemplateRegistry:
+    def __init__(self, root: str | None = None, preload: bool = True) -> None:
+        """
+        Registry of compiled templates of a template tree.
+
+        Args:
+            root (str): template tree, defaults to the repo `templates/` folder
+            preload (bool): compile every `.txt` template of the tree now, defaults to True
+        """
+
+        self.root = os.path.abspath(root or DEFAULT_TEMPLATE_ROOT)
+        self._templates: dict[str, PromptTemplate] = {}
+        self._lock = threading.Lock()
+        if preload:
+            self.preload()
+
+    def preload(self) -> int:
+        """Compiles every `.txt` template under `root`, returns the # of templates registered"""
+        if not os.path.isdir(self.root):
+            return 0
+        for folder, _, files in os.walk(self.root):
+            for filename in sorted(files):
+                if filename.endswith(".txt"):
+                    self.get(os.path.join(folder, filename))
+        return len(self._templates)
+
+    def _name(self, path: str) -> str:
+        """Registry name of a template path, i.e. "domain_templates/formalize_type" """
+        path = os.path.normpath(path)
+        if os.path.isabs(path) or (
+            os.path.isfile(path) and not os.path.isfile(os.path.join(self.root, path))
+        ):
+            path = os.path.relpath(os.path.abspath(path), self.root)
+        name, ext = os.path.splitext(path)
+        return (name if ext == ".txt" else path).replace(os.sep, "/")
+
+    def get(self, name: str) -> PromptTemplate:
+        """
+        Returns a compiled template, loading it on first use if it was not preloaded.
+
+        Args:
+            name (str): template name relative to `root` (".txt" optional), or a file path
+
+        Returns:
+            template (PromptTemplate): compiled template
+        """
+
+        key = self._name(name)
+        template = self._templates.get(key)
+        if template is not None:
+            return template
+
+        path = os.path.join(self.root, key)
+        if not os.path.splitext(path)[1]:
+            path += ".txt"
+        with open(path, "r") as file:
+            template = PromptTemplate(file.read().strip(), name=key)  # as `load_file`
+
+        with self._lock:
+            return self._templates.setdefault(key, template)
+
+    def render(self, name: str, values: dict[str, Any] | None = None, **kwargs) -> str:
+        """Renders template `name` (see `PromptTemplate.render`)"""
+        return self.get(name).render(values, **kwargs)
+
+    def names(self) -> list[str]:
+        return sorted(self._templates)
+
+    def __contains__(self, name: str) -> bool:
+        return self._name(name) in self._templates
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+
+_registries: dict[str, TemplateRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_template_registry(root: str | None = None) -> TemplateRegistry:
+    """Process-wide registry of template tree `root` (repo `templates/` by default), preloaded on first use"""
+    root = os.path.abspath(root or DEFAULT_TEMPLATE_ROOT)
+    registry = _registries.get(root)
+    if registry is None:
+        with _registries_lock:
+            registry = _registries.get(root)
+            if registry is None:
+                registry = _registries[root] = TemplateRegistry(root)
+    return registry
+
+
+def load_template(name: str, root: str | None = None) -> PromptTemplate:
+    """
+    Loads a compiled template from the process-wide registry.
+
+    Args:
+        name (str): template name (i.e. "task_templates/formalize_goal"), ".txt" optional, or a file path
+        root (str): template tree, defaults to the repo `templates/` folder
+
+    Returns:
+        template (PromptTemplate): compiled template
+    """
+    return get_template_registry(root).get(name)
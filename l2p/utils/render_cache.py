@@ -0,0 +1,140 @@
+"""
+L2P Render Cache
+
+This module defines `RenderCache`, which memoizes the prompt fragments and PDDL sections rendered
+from domain components (`{types}`, `{predicates}`, `(:types ...)`, ...). A rendered fragment is
+reused until its source changes:
+    - `NamedCollection` sources (builder predicates, functions, actions) are checked by `version`,
+      O(1); their items are treated as immutable, replace them with `add` instead of editing them
+    - other sources are checked by a `version` passed by their owner (`DomainBuilder` versions its
+      types, type hierarchy and constants on assignment)
+    - sources without a version (i.e. a caller's plain lists) are rendered directly: fingerprinting
+      them (i.e. by `repr`) costs as much as rendering them
+
+Fragments are named (see `FRAGMENTS`); empty sources render to their placeholder text (i.e.
+"No types provided."). `DomainBuilder` owns one cache and passes all its `formalize_*` prompts
+and `generate_domain` sections through it; `fragments()` returns the prompt fragments by name,
+which `PromptBuilder.set_fragments` substitutes into its task.
+
+For instance:
+    render_cache = RenderCache()
+    render_cache.render("predicates", domain_builder.predicates)  # rendered once per version
+    render_cache.render("types", types, version=3)                # rendered once per (types, 3)
+    render_cache.fragments(types=types, predicates=predicates)    # {"types": ..., "predicates": ...}
+    render_cache.stats                                            # {"hits": 41, "misses": 3}, versioned sources only
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+from .named_collection import NamedCollection
+from .pddl_format import (
+    format_actions,
+    format_constants,
+    format_expression,
+    format_types_to_string,
+    pretty_print_dict,
+)
+
+
+def _join_raw(items) -> str:
+    return "\n".join([f"{item['raw']}" for item in items])
+
+
+# name -> (render function, text of an empty source)
+FRAGMENTS: dict[str, tuple[Callable[[Any], str], str]] = {
+    # prompt fragments
+    "types": (pretty_print_dict, "No types provided."),
+    "constants": (format_constants, "No constants provided."),
+    "predicates": (_join_raw, "No predicates provided."),
+    "functions": (_join_raw, "No functions provided."),
+    # PDDL domain sections
+    "pddl_types": (format_types_to_string, ""),
+    "pddl_constants": (format_constants, ""),
+    "pddl_predicates": (format_expression, ""),
+    "pddl_functions": (format_expression, ""),
+    "pddl_actions": (format_actions, ""),
+}
+
+
+class RenderCache:
+    def __init__(self, maxsize: int = 128) -> None:
+        """
+        Initializes an empty render cache.
+
+        Args:
+            maxsize (int): max # of rendered fragments kept (least recently used are evicted), defaults to 128
+        """
+
+        self.maxsize = maxsize
+        self.stats = {"hits": 0, "misses": 0}
+        self._entries: OrderedDict[tuple[str, int], tuple[Any, Any, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def render(self, name: str, source: Any, version: Hashable | None = None) -> str:
+        """
+        Renders fragment `name` of `source`, reusing the last rendering if `source` is unchanged.
+
+        Args:
+            name (str): fragment name, a key of `FRAGMENTS`
+            source (Any): domain component to render (i.e. types, predicates)
+            version (Hashable): version of a source that is not a `NamedCollection`, bumped by its
+                owner on every change; defaults to None (rendered directly, not cached)
+
+        Returns:
+            text (str): rendered fragment
+        """
+
+        render, empty = FRAGMENTS[name]
+        if not source:
+            return empty
+        if isinstance(source, NamedCollection):
+            version = source.version
+        elif version is None:
+            return render(source)
+
+        key = (name, id(source))
+        stamp = version
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is source and entry[1] == stamp:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry[2]
+            self.stats["misses"] += 1
+
+        text = render(source)
+
+        with self._lock:
+            self._entries[key] = (source, stamp, text)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return text
+
+    def fragments(self, **sources) -> dict[str, str]:
+        """
+        Renders several named fragments at once.
+
+        Args:
+            **sources: fragment name -> source, i.e. `types=types, predicates=predicates`
+
+        Returns:
+            fragments (dict[str,str]): fragment name -> rendered text
+        """
+        return {name: self.render(name, source) for name, source in sources.items()}
+
+    def clear(self):
+        """Drops every rendered fragment (stats are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # entries are keyed by source `id`, meaningless in a copy: copies start empty
+        with self._lock:
+            return {"maxsize": self.maxsize, "stats": dict(self.stats)}
+
+    def __setstate__(self, state: dict[str, Any]):
+        self.__dict__.update(state)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
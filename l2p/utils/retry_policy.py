@@ -0,0 +1,226 @@
+"""
+L2P Retry Policy
+
+This module defines `RetryPolicy`, the retry loop shared by every `formalize_*` method of
+`DomainBuilder`, `TaskBuilder` and `ModelBuilder`. Failed attempts are classified as:
+    - transport: `model.query` raised (i.e. connection errors, rate limits)
+    - parse: the LLM response could not be parsed (parser raised)
+    - validation: the response was parsed but `validation_info` failed (only retried with
+      `retry_invalid=True`; by default invalid results are returned to the caller)
+
+Transport errors re-send the same prompt after an exponential backoff. Parse and validation
+errors are retried immediately with the error appended to the prompt and, if the model's `query`
+accepts a `temperature` argument, a raised sampling temperature for that query only (re-sending an
+identical prompt at temperature 0 usually reproduces the same failure). A `budget` caps the total # of retries
+across all calls sharing the policy, i.e. one policy per pipeline.
+
+For instance:
+    retry_policy = RetryPolicy(budget=20)
+    domain_builder = DomainBuilder(retry_policy=retry_policy)
+    task_builder = TaskBuilder(retry_policy=retry_policy)
+    ...
+    print(retry_policy.get_stats())
+"""
+
+import inspect, random, threading
+from typing import Any, Callable
+
+ERROR_CLASSES = ["transport", "parse", "validation"]
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        budget: int | None = None,
+        temperature_step: float = 0.2,
+        max_temperature: float = 1.0,
+        inject_errors: bool = True,
+        retry_invalid: bool = False,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+    ) -> None:
+        """
+        Initializes a retry policy.
+
+        Args:
+            budget (int): max # of retries (attempts after the first) across all calls, defaults to None (unlimited)
+            temperature_step (float): temperature increase per parse/validation retry, defaults to 0.2
+            max_temperature (float): upper bound for escalated temperature, defaults to 1.0
+            inject_errors (bool): append the previous error to the prompt on parse/validation retries, defaults to True
+            retry_invalid (bool): retry results whose `validation_info` failed, defaults to False
+            base_delay (float): initial backoff (seconds) after transport errors, defaults to 1.0
+            max_delay (float): max backoff (seconds) after transport errors, defaults to 30.0
+        """
+
+        self.budget = budget
+        self.temperature_step = temperature_step
+        self.max_temperature = max_temperature
+        self.inject_errors = inject_errors
+        self.retry_invalid = retry_invalid
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self.stats = {"attempts": 0, "retries": 0, "exhausted": 0}
+        self.stats.update({error_class: 0 for error_class in ERROR_CLASSES})
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+
+    def run(
+        self,
+        model,
+        prompt: str,
+        handle: Callable[[str], Any],
+        max_retries: int = 3,
+        error_msg: str = "Max retries exceeded.",
+    ) -> Any:
+        """
+        Queries `model` and hands the response to `handle`, retrying failed attempts.
+
+        Args:
+            model (BaseLLM): LLM to query
+            prompt (str): prompt to send
+            handle (Callable): parses/validates LLM output, `handle(llm_output) -> result`. If
+                `result` is a tuple ending with `validation_info (bool, str)`, it is used to
+                detect validation errors
+            max_retries (int): max # of attempts for this call, defaults to 3
+            error_msg (str): message of the `RuntimeError` raised once attempts are exhausted
+
+        Returns:
+            result (Any): output of `handle` of the first successful attempt (or the last invalid one)
+        """
+
+        query_prompt = prompt
+        temperature = None
+        transport_errors = 0
+        result = None
+
+        for attempt in range(max_retries):
+            if attempt and not self._take_retry():
+                break
+
+            llm_output = None
+            try:
+                with self._lock:
+                    self.stats["attempts"] += 1
+                model.reset_tokens()
+                if temperature is None:
+                    llm_output = model.query(prompt=query_prompt)
+                else:
+                    # per query: the model instance is shared by other builders/threads
+                    llm_output = model.query(prompt=query_prompt, temperature=temperature)
+            except Exception as e:
+                error_class, error = "transport", e
+            else:
+                try:
+                    result = handle(llm_output)
+                    validation_info = _validation_info(result)
+                    if self.retry_invalid and validation_info and not validation_info[0]:
+                        error_class, error = "validation", validation_info[1]
+                    else:
+                        return result
+                except Exception as e:
+                    error_class, error = "parse", e
+
+            with self._lock:
+                self.stats[error_class] += 1
+            print(
+                f"[{error_class.upper()}] Error on attempt {attempt + 1}/{max_retries}: {error}\n"
+                f"LLM Output:\n{llm_output}\nRetrying...\n"
+            )
+
+            if attempt + 1 == max_retries:
+                break
+
+            if error_class == "transport":
+                # same prompt after backoff, interrupted by `cancel()`
+                delay = min(self.max_delay, self.base_delay * 2**transport_errors)
+                transport_errors += 1
+                if self._cancelled.wait(delay * random.uniform(0.5, 1.0)):
+                    break
+            else:
+                if self.inject_errors:
+                    query_prompt = _inject_error(prompt, error_class, error, llm_output)
+                temperature = self._escalate(model, temperature)
+
+        if result is not None and _validation_info(result):
+            return result  # invalid result of last attempt, caller handles feedback
+
+        with self._lock:
+            self.stats["exhausted"] += 1
+        raise RuntimeError(error_msg)
+
+    def _take_retry(self) -> bool:
+        """Consumes one retry from the shared budget; False if exhausted or cancelled"""
+        with self._lock:
+            if self._cancelled.is_set():
+                return False
+            if self.budget is not None and self.stats["retries"] >= self.budget:
+                return False
+            self.stats["retries"] += 1
+            return True
+
+    def _escalate(self, model, temperature: float | None) -> float | None:
+        """Next retry temperature, or None if the model's `query` takes no `temperature`"""
+        if not self.temperature_step or not _accepts_temperature(model):
+            return None
+        current = getattr(model, "temperature", None) if temperature is None else temperature
+        return min(self.max_temperature, (current or 0.0) + self.temperature_step)
+
+    def cancel(self):
+        """Stops retries of every call sharing the policy, waking calls waiting on backoff"""
+        self._cancelled.set()
+
+    def reset(self):
+        """Resets stats, budget and cancellation"""
+        with self._lock:
+            for key in self.stats:
+                self.stats[key] = 0
+        self._cancelled.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """Returns # of attempts, retries, exhausted calls and errors per class"""
+        with self._lock:
+            return dict(self.stats)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # locks/events cannot be copied: builders holding a policy stay deepcopy-able/picklable
+        with self._lock:
+            state = self.__dict__.copy()
+            state["stats"] = dict(self.stats)
+        state["_cancelled"] = self._cancelled.is_set()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]):
+        cancelled = state.pop("_cancelled")
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        if cancelled:
+            self._cancelled.set()
+
+
+def _accepts_temperature(model) -> bool:
+    """Whether `model.query` takes a per-query `temperature` argument"""
+    try:
+        return "temperature" in inspect.signature(model.query).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _validation_info(result: Any) -> tuple[bool, str] | None:
+    """Returns trailing `validation_info` of a formalize result, if any"""
+    if isinstance(result, tuple) and result:
+        last = result[-1]
+        if isinstance(last, tuple) and len(last) == 2 and isinstance(last[0], bool):
+            return last
+    return None
+
+
+def _inject_error(prompt: str, error_class: str, error: Any, llm_output: str | None) -> str:
+    """Appends the previous failure to the prompt"""
+    previous = f"\n\nPrevious response:\n{llm_output}" if llm_output else ""
+    return (
+        f"{prompt}\n\n## PREVIOUS ATTEMPT FAILED ({error_class} error)\n{error}{previous}\n\n"
+        "Fix the issue above and answer again in the required format."
+    )
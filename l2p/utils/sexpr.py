@@ -0,0 +1,155 @@
+"""
+L2P S-Expression Parser
+
+This module defines a single-pass, iterative S-expression parser used for PDDL expressions
+(action preconditions/effects, initial/goal states). `parse_sexpr` tokenizes and builds the
+tree in one scan with an explicit stack, so arbitrarily deep nesting does not hit Python's
+recursion limit. Symbols are interned and every node records its source offsets.
+
+For instance:
+    expr = parse_sexpr("(and (on ?a ?b) (not (clear ?b)))")
+    expr.head                   # 'and'
+    expr[1].head, expr[1].args  # 'on', ['?a', '?b']
+    expr[2].start, expr[2].end  # offsets of `(not (clear ?b))` in the source string
+    str(expr)                   # '(and (on ?a ?b) (not (clear ?b)))'
+"""
+
+import re, sys
+
+_TOKEN = re.compile(r"[()]|[^\s()]+")
+
+
+class SExpr:
+    """Parenthesized expression: symbols (interned `str`) and nested `SExpr` in source order"""
+
+    __slots__ = ("items", "start", "end")
+
+    def __init__(self, items: list, start: int = -1, end: int = -1) -> None:
+        self.items = items
+        self.start = start  # offset of `(`
+        self.end = end  # offset after `)`
+
+    @property
+    def head(self) -> str | None:
+        """Leading symbol (keyword, predicate or function name), None if the first item is nested"""
+        if self.items and isinstance(self.items[0], str):
+            return self.items[0]
+        return None
+
+    @property
+    def args(self) -> list:
+        """Items after the head"""
+        return self.items[1:]
+
+    @property
+    def children(self) -> list["SExpr"]:
+        """Nested expressions"""
+        return [item for item in self.items if isinstance(item, SExpr)]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __repr__(self) -> str:
+        return f"SExpr({self})"
+
+    def __str__(self) -> str:
+        parts = []
+        stack = [(self, 0)]
+        while stack:
+            node, i = stack.pop()
+            if i == 0:
+                parts.append("(")
+            if i == len(node.items):
+                parts.append(")")
+                continue
+            if i:
+                parts.append(" ")
+            stack.append((node, i + 1))
+            item = node.items[i]
+            if isinstance(item, SExpr):
+                stack.append((item, 0))
+            else:
+                parts.append(item)
+        return "".join(parts)
+
+    def walk(self):
+        """Yields this expression and every nested expression in pre-order"""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def to_list(self) -> list:
+        """
+        Converts to the nested list format of `parse_pddl`, where adjacent symbols are joined
+        into one string (i.e. `(on ?a ?b)` -> `['on ?a ?b']`).
+        """
+
+        root = []
+        stack = [(self, root)]
+        while stack:
+            node, out = stack.pop()
+            pending = []
+            for item in node.items:
+                if isinstance(item, SExpr):
+                    if pending:
+                        out.append(" ".join(pending))
+                        pending = []
+                    nested = []
+                    out.append(nested)
+                    stack.append((item, nested))
+                else:
+                    pending.append(item)
+            if pending:
+                out.append(" ".join(pending))
+        return root
+
+
+def parse_sexpr(text: str) -> SExpr | str:
+    """
+    Parses a single S-expression in one pass. Closing parentheses without a matching opening
+    one are ignored (as in `parse_pddl`); unclosed parentheses raise.
+
+    Args:
+        text (str): expression, i.e. `(and (on ?a ?b) (clear ?a))`
+
+    Returns:
+        expr (SExpr | str): parsed expression (or the symbol, if `text` is a single symbol)
+    """
+
+    intern = sys.intern
+    top = []
+    stack = []
+    current = top
+
+    for match in _TOKEN.finditer(text):
+        token = match.group()
+        if token == "(":
+            node = SExpr([], match.start())
+            current.append(node)
+            stack.append((node, current))
+            current = node.items
+        elif token == ")":
+            if stack:
+                node, current = stack.pop()
+                node.end = match.end()
+        else:
+            current.append(intern(token))
+
+    if stack:
+        raise ValueError(
+            f"Malformed PDDL expression: `(` at offset {stack[-1][0].start} is never closed."
+        )
+    if len(top) != 1:
+        raise ValueError(
+            f"Malformed PDDL expression: expected one expression, found {len(top)}."
+        )
+
+    return top[0]
@@ -0,0 +1,202 @@
+"""
+L2P State Index
+
+This module defines `StateIndex`, the validation engine behind `SyntaxValidator.validate_task_states`.
+It is built once per task (objects + domain predicates/functions) and interns every type name to an
+integer ID, so that:
+    - each object maps to the ID of its type
+    - each predicate/function maps to the tuple of its parameter type IDs (its signature)
+
+A state is then checked with one dict lookup for its predicate/function and one tuple comparison
+of type IDs, instead of rebuilding name lists and type lists per state. All violations can be
+collected in a single pass (`collect_all=True`); their messages then omit the declared-object
+listing, which `declared_objects()` renders once.
+
+For instance:
+    state_index = StateIndex(objects, predicates=predicates, functions=functions)
+    errors = state_index.check(initial, state_type="initial", collect_all=True)
+    errors += state_index.check(goal, state_type="goal", collect_all=True)
+"""
+
+from .domain_context import DomainContext
+from .pddl_types import Function, Predicate
+
+
+class StateIndex:
+    def __init__(
+        self,
+        objects: dict[str, str],
+        predicates: list[Predicate] | None = None,
+        functions: list[Function] | None = None,
+        domain_context: DomainContext | None = None,
+    ) -> None:
+        """
+        Builds the index.
+
+        Args:
+            objects (dict[str,str]): task objects and their types
+            predicates (list[Predicate]): current predicates in domain
+            functions (list[Function]): list of current functions in domain
+            domain_context (DomainContext): precompiled domain, replaces `predicates`/`functions` if given, defaults to None
+        """
+
+        if domain_context is not None:
+            self.predicate_index = domain_context.predicate_index
+            self.function_index = domain_context.function_index
+        else:
+            self.predicate_index = {p["name"]: p for p in predicates or []}
+            self.function_index = {f["name"]: f for f in functions or []}
+
+        self.objects = objects
+        self.type_ids: dict[str, int] = {}
+        self.object_types = {
+            name: self._type_id(obj_type) for name, obj_type in objects.items()
+        }
+        self.predicate_signatures = {
+            name: self._signature(pred) for name, pred in self.predicate_index.items()
+        }
+        self.function_signatures = {
+            name: self._signature(func) for name, func in self.function_index.items()
+        }
+
+        self._declared = None  # rendered object listings, built on first error
+
+    def _type_id(self, type_name: str | None) -> int:
+        return self.type_ids.setdefault(type_name, len(self.type_ids))
+
+    def _signature(self, definition: Predicate | Function) -> tuple[int, ...]:
+        return tuple(self._type_id(t) for t in definition["params"].values())
+
+    def check(
+        self,
+        states: list[dict[str, str]],
+        state_type: str = "initial",
+        collect_all: bool = False,
+    ) -> list[str]:
+        """
+        Checks task states in one pass:
+            (i) if predicates/functions in states exist in the domain
+            (ii) if all object variables in states are declared in task objects
+            (iii) if types of object variables match predicate/function parameter types
+
+        Args:
+            states (list[dict[str,str]]): a list of dictionaries of the states
+            state_type (str): optional; 'initial' or 'goal' to label messages
+            collect_all (bool): report every violation instead of stopping at the first, defaults to False
+
+        Returns:
+            errors (list[str]): error messages, empty if all states are valid
+        """
+
+        object_type = self.object_types.get
+        predicate_signature = self.predicate_signatures.get
+        function_signature = self.function_signatures.get
+
+        errors = []
+        for state in states:
+            func_name = state.get("func_name")
+            if func_name:
+                expected = function_signature(func_name)
+            else:
+                expected = predicate_signature(state["pred_name"])
+
+            # fast path: one lookup per parameter and one tuple comparison
+            if expected is not None:
+                actual = tuple(map(object_type, state["params"]))
+                if actual == expected:
+                    continue
+
+            errors.append(self._error(state, state_type, listing=not collect_all))
+            if not collect_all:
+                break
+
+        return errors
+
+    def _error(self, state: dict[str, str], state_type: str, listing: bool = True) -> str:
+        """Builds the error message of an invalid state, with the declared objects if `listing`"""
+
+        state_params = state["params"]
+        params_str = " ".join(state_params)
+        if listing:
+            declared_names, declared_pairs = self.declared_objects()
+            in_objects = f"task objects {declared_names}"
+            declared = f"Declared objects: {declared_pairs}\n\n"
+        else:
+            in_objects, declared = "task objects", ""
+        missing_params = [p for p in state_params if p not in self.object_types]
+        actual_types = [self.objects.get(param) for param in state_params]
+        actual_name_type_pairs = [
+            f"'{param}' is type: '{self.objects.get(param)}'" for param in state_params
+        ]
+
+        state_name = state.get("func_name")
+        if state_name:
+            state_val = state["value"]
+            state_op = state["op"]
+
+            # (i) function name exists in domain functions
+            if state_name not in self.function_index:
+                function_names_str = (
+                    list(self.function_index)
+                    if self.function_index
+                    else "No functions provided"
+                )
+                return (
+                    f"[ERROR]: In the {state_type} state, '({state_op} ({state_name} {params_str}) {state_val})' "
+                    f"uses function '{state_name}', which is not defined in the domain: {function_names_str}.\n\n"
+                    f"If there are no functions, do not include this state."
+                )
+
+            # (ii) all parameters exist in the task objects
+            if missing_params:
+                return (
+                    f"[ERROR]: In the {state_type} state, '({state_name} {params_str})' "
+                    f"contains parameter(s) {missing_params} not found in {in_objects}."
+                )
+
+            # (iii) object types match expected function types
+            target_func = self.function_index[state_name]
+            expected_types = list(target_func["params"].values())
+            return (
+                f"[ERROR]: In the {state_type} state, '({state_op} ({state_name} {params_str}) {state_val})' has mismatched types.\n\n"
+                f"{declared}"
+                f"Function `{target_func['clean']}` expects type(s): {expected_types}\n"
+                f"Parsed line: ({state_op} ({state_name} {params_str}) {state_val}) contains type(s): {actual_types}, where [{', '.join(actual_name_type_pairs)}]\n\n"
+                f"Revise the state such that their parameter types align with the original function definition types."
+            )
+
+        state_name = state["pred_name"]
+
+        # (i) predicate name exists in domain predicates
+        if state_name not in self.predicate_index:
+            return (
+                f"[ERROR]: In the {state_type} state, '({state_name} {params_str})' "
+                f"uses predicate '{state_name}', which is not defined in the domain ({list(self.predicate_index)})."
+            )
+
+        # (ii) all parameters exist in the task objects
+        if missing_params:
+            return (
+                f"[ERROR]: In the {state_type} state, '({state_name} {params_str})' "
+                f"contains parameter(s) {missing_params} not found in {in_objects}."
+            )
+
+        # (iii) object types match expected predicate types
+        target_pred = self.predicate_index[state_name]
+        expected_types = list(target_pred["params"].values())
+        return (
+            f"[ERROR]: In the {state_type} state, '({state_name} {params_str})' has mismatched types.\n\n"
+            f"{declared}"
+            f"Predicate `{target_pred['clean']}` expects type(s): {expected_types}\n"
+            f"Parsed line: ({state_name} {params_str}) contains type(s): {actual_types}, where [{', '.join(actual_name_type_pairs)}]\n\n"
+            f"Revise the state predicates to match the original predicate parameter types. Do not include type annotations in the predicate—e.g., use (drive ?c), not (drive ?c - car)."
+        )
+
+    def declared_objects(self) -> tuple[str, str]:
+        """Object names and `name - type` pairs as listed in error messages, rendered once"""
+        if self._declared is None:
+            self._declared = (
+                str(list(self.objects)),
+                str([f"{obj_name} - {obj_type}" for obj_name, obj_type in self.objects.items()]),
+            )
+        return self._declared
@@ -0,0 +1,165 @@
+"""
+L2P Type Index
+
+This module defines `TypeIndex`, a lookup structure built once per type hierarchy. It flattens
+flat type dictionaries, nested hierarchies (`[{"object": "", "children": [...]}]`) and
+`format_types` output (`{"child - parent": ...}`) into:
+    - parent / description tables
+    - ancestor and descendant sets for every type (each including the type itself)
+    - cycles found in the hierarchy
+
+Subtype checks (`is_subtype`) and membership checks are O(1). Validators accept a `TypeIndex`
+wherever they accept `types`, and `DomainBuilder.get_type_index()` caches the index of the builder's
+current types (rebuilt after `set_types`/`set_type_hierarchy`/`delete_type`).
+
+For instance:
+    type_index = TypeIndex(types)
+    type_index.is_subtype("truck", "vehicle")  # True
+    type_index.descendants("vehicle")          # frozenset({"vehicle", "truck", "car"})
+"""
+
+from typing import Iterator
+
+TypeSpec = dict[str, str] | list[dict[str, str]] | None
+
+
+class TypeIndex:
+    def __init__(self, types: TypeSpec = None) -> None:
+        """
+        Builds the index.
+
+        Args:
+            types (dict[str,str] | list[dict[str,str]]): flat types, nested type hierarchy or `format_types` output
+        """
+
+        self.parents: dict[str, str | None] = {}
+        self.descriptions: dict[str, str] = {}
+        self._collect(types)
+
+        self._ancestors: dict[str, frozenset[str]] = {}
+        self.cycles: list[list[str]] = []
+        for name in self.parents:
+            chain = [name]
+            seen = {name}
+            parent = self.parents[name]
+            while parent is not None:
+                if parent in seen:  # guard against cyclic hierarchies
+                    cycle = chain[chain.index(parent) :] + [parent]
+                    if not any(set(cycle) == set(c) for c in self.cycles):
+                        self.cycles.append(cycle)
+                    break
+                chain.append(parent)
+                seen.add(parent)
+                parent = self.parents.get(parent)
+            self._ancestors[name] = frozenset(chain)
+
+        descendants: dict[str, set[str]] = {name: set() for name in self.parents}
+        for name, ancestors in self._ancestors.items():
+            for ancestor in ancestors:
+                descendants[ancestor].add(name)
+        self._descendants = {name: frozenset(d) for name, d in descendants.items()}
+
+        self._flat = None
+
+    @classmethod
+    def of(cls, types: "TypeSpec | TypeIndex") -> "TypeIndex":
+        """Returns `types` if it is already an index, else builds one"""
+        return types if isinstance(types, TypeIndex) else cls(types)
+
+    def _collect(self, types: TypeSpec):
+        """Fills parent and description tables (iterative walk of nested hierarchies)"""
+
+        if not types:
+            return
+
+        nested = isinstance(types, list) or any(
+            k == "children" and isinstance(v, list) for k, v in types.items()
+        )
+        if not nested:
+            for key, desc in types.items():
+                name, parent = _split_key(key)
+                if desc and desc.startswith("; "):  # `format_types` output
+                    desc = desc[2:]
+                self._add(name, parent, desc)
+            return
+
+        stack = [(node, None) for node in reversed(types if isinstance(types, list) else [types])]
+        while stack:
+            node, parent = stack.pop()
+            if not isinstance(node, dict):
+                continue
+            name = next((k for k in node if k != "children"), None)
+            if name is None:
+                continue
+            self._add(name, parent, node[name])
+            stack.extend((child, name) for child in reversed(node.get("children", [])))
+
+    def _add(self, name: str, parent: str | None, desc: str | None):
+        if name not in self.parents or self.parents[name] is None:
+            self.parents[name] = parent if parent != name else None
+        self.descriptions.setdefault(name, desc or "")
+        if parent is not None and parent != name:
+            self.parents.setdefault(parent, None)
+            self.descriptions.setdefault(parent, "")
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.parents
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.parents)
+
+    def __len__(self) -> int:
+        return len(self.parents)
+
+    def __bool__(self) -> bool:
+        return bool(self.parents)
+
+    @property
+    def names(self) -> list[str]:
+        """Names of all declared types"""
+        return list(self.parents)
+
+    @property
+    def closure(self) -> dict[str, frozenset[str]]:
+        """Type -> set of itself and all supertypes"""
+        return self._ancestors
+
+    @property
+    def flat(self) -> dict[str, str]:
+        """Flat `format_types`-style dictionary ({"child - parent": "; desc"})"""
+        if self._flat is None:
+            self._flat = {
+                (f"{name} - {parent}" if parent else name): (
+                    f"; {self.descriptions[name]}" if self.descriptions[name] else ""
+                )
+                for name, parent in self.parents.items()
+            }
+        return self._flat
+
+    def parent(self, name: str) -> str | None:
+        """Direct supertype of `name`, None for top-level or unknown types"""
+        return self.parents.get(name)
+
+    def ancestors(self, name: str) -> frozenset[str]:
+        """`name` and all of its supertypes"""
+        return self._ancestors.get(name, frozenset((name,)))
+
+    def descendants(self, name: str) -> frozenset[str]:
+        """`name` and all of its subtypes"""
+        return self._descendants.get(name, frozenset((name,)))
+
+    def is_subtype(self, child: str, parent: str) -> bool:
+        """Checks if type `child` is `parent` or one of its (transitive) subtypes"""
+        return child == parent or parent in self._ancestors.get(child, ())
+
+    def find_cycle(self) -> list[str] | None:
+        """Returns the first cycle found (i.e. ["a", "b", "a"]), None if the hierarchy is acyclic"""
+        return self.cycles[0] if self.cycles else None
+
+
+def _split_key(key: str) -> tuple[str, str | None]:
+    """Splits `format_types` keys (`child - parent`) into name and parent"""
+    if " - " in key:
+        name, parent = (t.strip() for t in key.split(" - ", 1))
+        return name, parent
+    return key.strip(), None
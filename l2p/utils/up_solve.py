@@ -0,0 +1,57 @@
+"""
+Runs one unified-planning engine on a PDDL task, as a standalone script, so that `PlannerPool`
+can race UP engines against FastDownward configurations and kill the losers like any other
+planner process.
+
+Plan steps are printed one per line as FastDownward does (`action arg1 arg2 (1)`) and the exit
+code follows FastDownward's (see `pddl_planner.py`).
+
+Run: python l2p/utils/up_solve.py <engine> <domain_file> <problem_file>
+"""
+
+import sys
+
+# FastDownward exit codes (`pddl_planner.py`); kept here as this script runs outside the package
+SUCCESS = 0
+SEARCH_UNSOLVED_INCOMPLETE = 12
+DRIVER_CRITICAL_ERROR = 35
+DRIVER_INPUT_ERROR = 36
+
+
+def main(argv: list[str]) -> int:
+    if len(argv) != 3:
+        print(__doc__, file=sys.stderr)
+        return DRIVER_INPUT_ERROR
+    engine, domain_file, problem_file = argv
+
+    try:
+        from unified_planning.io import PDDLReader
+        from unified_planning.shortcuts import OneshotPlanner, get_environment
+    except ImportError as e:
+        print(f"unified-planning is not installed: {e}", file=sys.stderr)
+        return DRIVER_CRITICAL_ERROR
+
+    try:
+        problem = PDDLReader().parse_problem(domain_file, problem_file)
+    except Exception as e:
+        print(f"Could not parse the task: {e}", file=sys.stderr)
+        return DRIVER_INPUT_ERROR
+
+    try:
+        get_environment().credits_stream = None
+        with OneshotPlanner(name=engine, problem_kind=problem.kind) as planner:
+            result = planner.solve(problem)
+    except Exception as e:  # engine not available for the task, or crashed
+        print(f"Engine `{engine}` failed: {e}", file=sys.stderr)
+        return DRIVER_CRITICAL_ERROR
+
+    if result.plan is None:
+        print(f"No plan found: {result.status}")
+        return SEARCH_UNSOLVED_INCOMPLETE
+    for step in result.plan.actions:
+        print(" ".join([step.action.name, *map(str, step.actual_parameters), "(1)"]))
+    return SUCCESS
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,221 @@
+"""
+L2P Symbol Usage Index
+
+This module defines `UsageIndex`, an inverted index of which domain symbols each action uses. It
+is built from the parsed preconditions/effects (`parse_sexpr`) of each action:
+    - predicate/function name -> actions using it
+    - type -> actions using it (parameters and `forall`/`exists` variables)
+    - type -> predicates/functions with a parameter of it
+
+Actions and predicates are added and removed incrementally, so pruning unused predicates or
+types after each generated action is a lookup instead of a substring scan of every action.
+Symbols are matched as whole names, i.e. predicate `at` is not "used" by `(cat ?x)`.
+
+For instance:
+    usage_index = UsageIndex(actions=actions, predicates=predicates)
+    usage_index.add_action(new_action)            # replaces an action of the same name
+    predicates = usage_index.prune_predicates(predicates)
+    usage_index.actions_using("holding")          # frozenset({"pick-up", "put-down"})
+"""
+
+import re
+from collections import defaultdict
+from typing import Iterable
+from .pddl_types import Action, Function, Predicate
+from .sexpr import SExpr, parse_sexpr
+from .type_index import TypeIndex
+
+KEYWORDS = frozenset(
+    [
+        "and", "or", "not", "imply", "forall", "exists", "when",
+        "increase", "decrease", "assign", "scale-up", "scale-down",
+        "=", ">", "<", ">=", "<=", "+", "-", "*", "/",
+    ]
+)
+QUANTIFIERS = frozenset(["forall", "exists"])
+
+_HEAD = re.compile(r"\(\s*([^\s()?;]+)")
+
+
+def action_symbols(action: Action) -> tuple[frozenset[str], frozenset[str]]:
+    """
+    Collects the symbols an action uses.
+
+    Args:
+        action (Action): PDDL action
+
+    Returns:
+        symbols (frozenset[str]): predicate/function names in preconditions and effects
+        types (frozenset[str]): types of parameters and quantified variables
+    """
+
+    symbols, types = set(), set(t for t in action["params"].values() if t)
+
+    for part in (action["preconditions"], action["effects"]):
+        if not part or not part.strip():
+            continue
+        try:
+            expr = parse_sexpr(part)
+        except ValueError:
+            # malformed expression: fall back to the heads of parenthesized terms
+            symbols.update(h for h in _HEAD.findall(part) if h not in KEYWORDS)
+            continue
+        if not isinstance(expr, SExpr):
+            continue
+
+        for node in expr.walk():
+            head = node.head
+            if head is None or head.startswith("?"):
+                continue
+            if head in QUANTIFIERS and len(node) > 1 and isinstance(node[1], SExpr):
+                types.update(_variable_types(node[1]))
+            elif head not in KEYWORDS:
+                symbols.add(head)
+
+    return frozenset(symbols), frozenset(types)
+
+
+def _variable_types(variables: SExpr) -> Iterable[str]:
+    """Types of a typed variable list, i.e. `(?x ?y - block ?a - arm)`"""
+    items = variables.items
+    for i, item in enumerate(items[:-1]):
+        if item == "-" and isinstance(items[i + 1], str):
+            yield items[i + 1]
+
+
+class UsageIndex:
+    def __init__(
+        self,
+        actions: list[Action] | None = None,
+        predicates: list[Predicate | Function] | None = None,
+    ) -> None:
+        """
+        Builds the index.
+
+        Args:
+            actions (list[Action]): actions to index, defaults to None
+            predicates (list[Predicate|Function]): predicates/functions to index by parameter type, defaults to None
+        """
+
+        self.actions: dict[str, tuple[frozenset[str], frozenset[str]]] = {}
+        self.symbol_actions: dict[str, set[str]] = defaultdict(set)
+        self.type_actions: dict[str, set[str]] = defaultdict(set)
+
+        self.predicates: dict[str, frozenset[str]] = {}
+        self.type_predicates: dict[str, set[str]] = defaultdict(set)
+
+        for action in actions or []:
+            self.add_action(action)
+        for predicate in predicates or []:
+            self.add_predicate(predicate)
+
+    """Actions"""
+
+    def add_action(self, action: Action, name: str | None = None):
+        """Indexes an action, replacing any indexed action of the same name"""
+
+        name = name or action["name"]
+        self.remove_action(name)
+
+        symbols, types = action_symbols(action)
+        self.actions[name] = (symbols, types)
+        for symbol in symbols:
+            self.symbol_actions[symbol].add(name)
+        for type_name in types:
+            self.type_actions[type_name].add(name)
+
+    def remove_action(self, name: str):
+        """Removes an action from the index (no-op if not indexed)"""
+
+        entry = self.actions.pop(name, None)
+        if entry is None:
+            return
+        symbols, types = entry
+        for symbol in symbols:
+            _discard(self.symbol_actions, symbol, name)
+        for type_name in types:
+            _discard(self.type_actions, type_name, name)
+
+    def symbols_of(self, name: str) -> frozenset[str]:
+        """Predicate/function names used by an indexed action"""
+        return self.actions.get(name, (frozenset(), frozenset()))[0]
+
+    def actions_using(self, symbol: str) -> frozenset[str]:
+        """Names of actions using a predicate/function"""
+        return frozenset(self.symbol_actions.get(symbol, ()))
+
+    def is_used(self, symbol: str) -> bool:
+        """Checks if any indexed action uses a predicate/function"""
+        return symbol in self.symbol_actions
+
+    """Predicates"""
+
+    def add_predicate(self, predicate: Predicate | Function):
+        """Indexes a predicate/function by its parameter types"""
+
+        name = predicate["name"]
+        self.remove_predicate(name)
+
+        types = frozenset(t for t in predicate["params"].values() if t)
+        self.predicates[name] = types
+        for type_name in types:
+            self.type_predicates[type_name].add(name)
+
+    def remove_predicate(self, name: str):
+        """Removes a predicate/function from the index (no-op if not indexed)"""
+
+        for type_name in self.predicates.pop(name, ()):
+            _discard(self.type_predicates, type_name, name)
+
+    """Pruning"""
+
+    def prune_predicates(self, predicates: list[Predicate]) -> list[Predicate]:
+        """
+        Returns predicates used by at least one indexed action, first occurrence per name.
+
+        Args:
+            predicates (list[Predicate]): predicates to filter
+
+        Returns:
+            list[Predicate]: the pruned list of predicates
+        """
+
+        used, seen = [], set()
+        for pred in predicates:
+            if pred["name"] in self.symbol_actions and pred["name"] not in seen:
+                used.append(pred)
+                seen.add(pred["name"])
+        return used
+
+    def used_types(self) -> set[str]:
+        """Types used by an indexed action or predicate"""
+        return set(self.type_actions) | set(self.type_predicates)
+
+    def prune_types(
+        self, types: dict[str, str] | list[dict[str, str]] | TypeIndex
+    ) -> dict[str, str]:
+        """
+        Returns types used by an indexed action or predicate.
+
+        Args:
+            types (dict[str,str] | list[dict[str,str]] | TypeIndex): flat types or type hierarchy
+
+        Returns:
+            dict[str, str]: used type names and their descriptions
+        """
+
+        used = self.used_types()
+        return {
+            name: desc
+            for name, desc in TypeIndex.of(types).descriptions.items()
+            if name in used
+        }
+
+
+def _discard(index: dict[str, set[str]], key: str, name: str):
+    """Removes `name` from `index[key]`, dropping the key once empty"""
+    names = index.get(key)
+    if names is not None:
+        names.discard(name)
+        if not names:
+            del index[key]
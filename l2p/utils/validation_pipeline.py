@@ -0,0 +1,388 @@
+"""
+L2P Validation Pipeline
+
+This module defines `ValidationPipeline`, which compiles the checks enabled in a
+`SyntaxValidator.error_types` once and runs them all over one set of parsed inputs. Every builder
+function hands the pipeline what it parsed from the LLM output (the *subject*: an action, new
+predicates, objects, states, ...) plus the domain it is validated against (the *context*: types,
+predicates, functions, a `DomainContext`). A check only runs if its subject was given, so one
+validator can be shared by all builder functions.
+
+Indexes needed by several checks (`TypeIndex`, the merged predicate list, `StateIndex`) are built
+once per run and shared. The pipeline does not stop at the first failing check: every enabled check
+runs, and its violations are tagged with the check and the response section they are located in
+(`None` for checks over the whole response), so one repair round can address all of them. Most
+checks wrap a `SyntaxValidator` method and report only the first violation it finds; the exceptions
+are `validate_task_objects` (one per invalid object), `validate_task_states` (every invalid state)
+and the action checks (preconditions and effects are checked separately).
+
+For instance:
+    pipeline = ValidationPipeline.of(syntax_validator)
+    violations = pipeline.run(llm_output=llm_output, action=action, types=types, predicates=predicates)
+    for violation in violations:
+        print(violation.check, violation.section, violation.message)
+
+    validation_info = pipeline.validate(llm_output=llm_output, ...)  # (bool, str) of all violations
+
+Custom checks are registered under the name used in `error_types`:
+    pipeline.register("validate_no_negation", lambda validator, inputs: ...)
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Callable, Iterable, NamedTuple
+from .domain_context import DomainContext
+from .pddl_parser import parse_predicates, remove_comments
+from .pddl_types import Action, Function, Predicate
+from .pddl_validator import SyntaxValidator
+from .state_index import StateIndex
+from .type_index import TypeIndex
+
+
+class Violation(NamedTuple):
+    check: str  # `error_types` entry that failed, i.e. "validate_params"
+    section: str | None  # response section the violation is located in, None if the whole response
+    message: str
+
+
+@dataclass(eq=False)
+class ValidationInput:
+    """Inputs of one pipeline run; indexes shared by several checks are built lazily, once"""
+
+    # subject: parsed LLM output to validate
+    llm_output: str | None = None
+    keyword_text: str | None = None  # text checked for unsupported keywords, defaults to `llm_output`
+    new_types: dict[str, str] | list[dict[str, str]] | None = None
+    constants: dict[str, str] | None = None
+    new_predicates: list[Predicate] | None = None
+    new_functions: list[Function] | None = None
+    params: OrderedDict | None = None
+    action: Action | None = None
+    preconditions: str | None = None
+    effects: str | None = None
+    objects: dict[str, str] | None = None
+    initial: list[dict[str, str]] | None = None
+    goal: list[dict[str, str]] | None = None
+
+    # context: domain the subject is validated against
+    types: dict[str, str] | list[dict[str, str]] | TypeIndex | None = None
+    predicates: list[Predicate] | None = None
+    functions: list[Function] | None = None
+    action_params: OrderedDict | None = None  # parameters in scope of `preconditions`/`effects`
+    task_objects: dict[str, str] | None = None  # objects of `initial`/`goal`, defaults to `objects`
+    domain_context: DomainContext | None = None
+
+    extra: dict = field(default_factory=dict)  # inputs of custom checks
+
+    @cached_property
+    def type_index(self) -> TypeIndex:
+        if self.domain_context is not None:
+            return self.domain_context.type_index
+        return TypeIndex.of(self.types)
+
+    @cached_property
+    def all_predicates(self) -> list[Predicate]:
+        """Domain predicates followed by new predicates (neither list is modified)"""
+        return parse_predicates(list(self.predicates or []) + list(self.new_predicates or []))
+
+    @cached_property
+    def state_index(self) -> StateIndex:
+        return StateIndex(
+            self.objects if self.objects is not None else self.task_objects or {},
+            predicates=self.predicates,
+            functions=self.functions,
+            domain_context=self.domain_context,
+        )
+
+
+# a check yields (section, message) for each violation it reports
+Check = Callable[[SyntaxValidator, ValidationInput], Iterable[tuple[str | None, str]]]
+
+CHECKS: dict[str, Check] = {}
+
+
+def _check(name: str) -> Callable[[Check], Check]:
+    """Registers a built-in check under its `error_types` name"""
+
+    def register(fn: Check) -> Check:
+        CHECKS[name] = fn
+        return fn
+
+    return register
+
+
+def _failed(info: tuple[bool, str], section: str | None) -> list[tuple[str | None, str]]:
+    return [] if info[0] else [(section, info[1])]
+
+
+def _action_pddl(pddl: str) -> str:
+    """Normalizes a precondition/effect body the way `validate_usage_action` does"""
+    pddl = remove_comments(pddl)
+    return pddl.replace("\n", " ").replace("(", " ( ").replace(")", " ) ")
+
+
+"""Response checks"""
+
+
+@_check("validate_header")
+def _header(validator: SyntaxValidator, inputs: ValidationInput):
+    if inputs.llm_output is not None:
+        return _failed(validator.validate_header(inputs.llm_output), None)
+    return []
+
+
+@_check("validate_duplicate_headers")
+def _duplicate_headers(validator: SyntaxValidator, inputs: ValidationInput):
+    if inputs.llm_output is not None:
+        return _failed(validator.validate_duplicate_headers(inputs.llm_output), None)
+    return []
+
+
+@_check("validate_unsupported_keywords")
+def _unsupported_keywords(validator: SyntaxValidator, inputs: ValidationInput):
+    text = inputs.keyword_text if inputs.keyword_text is not None else inputs.llm_output
+    if text is not None:
+        return _failed(validator.validate_unsupported_keywords(text), None)
+    return []
+
+
+"""Domain checks"""
+
+
+@_check("validate_format_types")
+def _format_types(validator: SyntaxValidator, inputs: ValidationInput):
+    if inputs.new_types is not None:
+        return _failed(validator.validate_format_types(inputs.new_types), "TYPES")
+    return []
+
+
+@_check("validate_cyclic_types")
+def _cyclic_types(validator: SyntaxValidator, inputs: ValidationInput):
+    if inputs.new_types is not None:
+        return _failed(validator.validate_cyclic_types(inputs.new_types), "TYPES")
+    return []
+
+
+@_check("validate_constant_types")
+def _constant_types(validator: SyntaxValidator, inputs: ValidationInput):
+    if inputs.constants is not None:
+        info = validator.validate_constant_types(inputs.constants, inputs.type_index)
+        return _failed(info, "CONSTANTS")
+    return []
+
+
+@_check("validate_types_predicates")
+def _types_predicates(validator: SyntaxValidator, inputs: ValidationInput):
+    if inputs.new_predicates is not None:
+        info = validator.validate_types_predicates(inputs.new_predicates, inputs.type_index)
+        return _failed(info, "New Predicates")
+    return []
+
+
+@_check("validate_format_predicates")
+def _format_predicates(validator: SyntaxValidator, inputs: ValidationInput):
+    if inputs.new_predicates is not None:
+        info = validator.validate_format_predicates(inputs.new_predicates, inputs.type_index)
+        return _failed(info, "New Predicates")
+    return []
+
+
+@_check("validate_duplicate_predicates")
+def _duplicate_predicates(validator: SyntaxValidator, inputs: ValidationInput):
+    if inputs.new_predicates is not None:
+        info = validator.validate_duplicate_predicates(
+            list(inputs.predicates or []), inputs.new_predicates
+        )
+        return _failed(info, "New Predicates")
+    return []
+
+
+@_check("validate_format_functions")
+def _format_functions(validator: SyntaxValidator, inputs: ValidationInput):
+    if inputs.new_functions is not None:
+        info = validator.validate_format_functions(inputs.new_functions, inputs.type_index)
+        return _failed(info, "FUNCTIONS")
+    return []
+
+
+@_check("validate_params")
+def _params(validator: SyntaxValidator, inputs: ValidationInput):
+    params = inputs.params
+    if params is None and inputs.action is not None:
+        params = inputs.action["params"]
+    if params is not None:
+        info = validator.validate_params(params, inputs.type_index)
+        return _failed(info, "Action Parameters")
+    return []
+
+
+def _action_parts(
+    validator: SyntaxValidator,
+    inputs: ValidationInput,
+    params: OrderedDict,
+    parts: list[tuple[str, str, str]],
+):
+    """Validates each (section, part, body); both parts are checked even if the first fails"""
+    violations = []
+    for section, part, body in parts:
+        info = validator.validate_pddl_action(
+            pddl=_action_pddl(body),
+            predicates=inputs.all_predicates,
+            action_params=params,
+            functions=inputs.functions,
+            types=inputs.type_index,
+            part=part,
+        )
+        violations.extend(_failed(info, section))
+    return violations
+
+
+@_check("validate_usage_action")
+def _usage_action(validator: SyntaxValidator, inputs: ValidationInput):
+    action = inputs.action
+    if action is None:
+        return []
+    return _action_parts(
+        validator,
+        inputs,
+        action["params"],
+        [
+            ("Action Preconditions", "preconditions", action["preconditions"]),
+            ("Action Effects", "effects", action["effects"]),
+        ],
+    )
+
+
+@_check("validate_pddl_action")
+def _pddl_action(validator: SyntaxValidator, inputs: ValidationInput):
+    parts = [
+        (section, part, body)
+        for section, part, body in [
+            ("Action Preconditions", "preconditions", inputs.preconditions),
+            ("Action Effects", "effects", inputs.effects),
+        ]
+        if body is not None
+    ]
+    if not parts:
+        return []
+    return _action_parts(validator, inputs, inputs.action_params or OrderedDict(), parts)
+
+
+"""Task checks"""
+
+
+@_check("validate_task_objects")
+def _task_objects(validator: SyntaxValidator, inputs: ValidationInput):
+    if inputs.objects is None:
+        return []
+    # one object at a time against the shared type index, to report every invalid object
+    violations = []
+    for obj_name, obj_type in inputs.objects.items():
+        info = validator.validate_task_objects({obj_name: obj_type}, inputs.type_index)
+        violations.extend(_failed(info, "OBJECTS"))
+    return violations
+
+
+@_check("validate_task_states")
+def _task_states(validator: SyntaxValidator, inputs: ValidationInput):
+    violations = []
+    for section, states, state_type in [
+        ("INITIAL", inputs.initial, "initial"),
+        ("GOAL", inputs.goal, "goal"),
+    ]:
+        if states is None:
+            continue
+        info = validator.validate_task_states(
+            states=states,
+            objects=inputs.state_index.objects,
+            state_type=state_type,
+            collect_all=True,
+            state_index=inputs.state_index,
+        )
+        violations.extend(_failed(info, section))
+    return violations
+
+
+class ValidationPipeline:
+    def __init__(self, syntax_validator: SyntaxValidator) -> None:
+        """
+        Compiles the checks enabled in `syntax_validator.error_types`, in order. Names without a
+        built-in check are skipped until registered with `register`.
+
+        Args:
+            syntax_validator (SyntaxValidator): syntax checker holding enabled `error_types`
+        """
+
+        self.validator = syntax_validator
+        self.error_types = tuple(syntax_validator.error_types)
+        self.custom: dict[str, Check] = {}
+        self._compile()
+
+    @classmethod
+    def of(cls, syntax_validator: SyntaxValidator) -> "ValidationPipeline":
+        """Returns the pipeline of `syntax_validator`, recompiled if its `error_types` changed"""
+
+        pipeline = getattr(syntax_validator, "_pipeline", None)
+        if pipeline is None:
+            pipeline = cls(syntax_validator)
+            syntax_validator._pipeline = pipeline
+        elif pipeline.error_types != tuple(syntax_validator.error_types):
+            pipeline.error_types = tuple(syntax_validator.error_types)
+            pipeline._compile()
+        return pipeline
+
+    def _compile(self):
+        checks = {**CHECKS, **self.custom}
+        self.checks = [(name, checks[name]) for name in self.error_types if name in checks]
+
+    def register(self, name: str, fn: Check):
+        """
+        Registers a custom check, run wherever `name` is listed in `error_types`.
+
+        Args:
+            name (str): `error_types` entry of the check
+            fn (Callable): `fn(syntax_validator, inputs) -> Iterable[(section, message)]`
+        """
+        self.custom[name] = fn
+        self._compile()
+
+    def run(self, **inputs) -> list[Violation]:
+        """
+        Runs every compiled check over one set of inputs.
+
+        Args:
+            **inputs: fields of `ValidationInput` (subject and context); unknown keys are kept
+                in `inputs.extra` for custom checks
+
+        Returns:
+            violations (list[Violation]): violations reported by each check, in `error_types` order
+        """
+
+        known = ValidationInput.__dataclass_fields__
+        extra = {k: inputs.pop(k) for k in list(inputs) if k not in known}
+        validation_input = ValidationInput(**inputs, extra=extra)
+
+        violations = []
+        for name, fn in self.checks:
+            violations.extend(
+                Violation(name, section, message)
+                for section, message in fn(self.validator, validation_input)
+            )
+        return violations
+
+    def validate(self, **inputs) -> tuple[bool, str]:
+        """
+        Runs every compiled check and merges the violations into builder validation info.
+
+        Returns:
+            validation_info (tuple[bool,str]): validation info containing pass flag and every error message
+        """
+        return merge_violations(self.run(**inputs))
+
+
+def merge_violations(violations: list[Violation]) -> tuple[bool, str]:
+    """Merges violations into a (pass flag, message) pair"""
+    if not violations:
+        return True, "All validations passed."
+    return False, "\n\n".join(v.message for v in violations)
@@ -16,10 +16,11 @@ Changes made:
     > structure output from LLM to enable L2P type extractions
     > using L2P `formalize_pddl_action` function in ABA algorithm
     > syntax validator + error message changes
+    > section-level repair (L2P `RepairBuilder`) before re-generating a failed action
+    > incremental ABA refinement (L2P `RefinementBuilder`): outer iterations only re-query actions whose relevant predicates changed
 """
 
 import os
-from copy import deepcopy
 from l2p import *
 
 DOMAINS = ["household", "logistics", "tyreworld"]
@@ -84,7 +85,7 @@ def construct_action(
 
     Returns:
         - action (Action): action data type containing parameters, preconditions, and effects
-        - predicates (list[Predicate]): list of updated predicates
+        - new_predicates (list[Predicate]): list of predicates created for this action
         - llm_response (str): original LLM output
     """
 
@@ -110,6 +111,11 @@ def construct_action(
     else:
         validator = None
 
+    # keep the predicates in the builder, so retries reuse their rendered prompt fragment
+    domain_builder.predicates = predicates
+    predicates = domain_builder.predicates
+
+    action, new_predicates, llm_response = None, [], ""
     no_syntax_error = False
     i_iter = 0
 
@@ -129,12 +135,29 @@ def construct_action(
                     types=types,
                     extract_new_preds=True,
                     syntax_validator=validator,
+                    auto_fix=True,
                 )
             )
 
             # retrieve validation check and error message
             no_error, error_msg = validation_info
 
+            # repair only the failing section(s) before re-generating the full action
+            if not no_error and validator:
+                action, new_predicates, llm_response, validation_info = (
+                    repair_builder.repair_action(
+                        model=model,
+                        prompt_template=repair_prompt,
+                        llm_output=llm_response,
+                        action_name=action_name,
+                        syntax_validator=validator,
+                        types=types,
+                        predicates=predicates,
+                        extract_new_preds=True,
+                    )
+                )
+                no_error, error_msg = validation_info
+
         except Exception as e:
             no_error = False
             error_msg = str(e)
@@ -158,9 +181,7 @@ def construct_action(
     if not no_syntax_error:
         print(f"[WARNING] syntax error remaining in the action model: {action_name}")
 
-    predicates.extend(new_predicates)  # extend the predicate list
-
-    return action, predicates, llm_response
+    return action, new_predicates, llm_response
 
 
 def run_llm_dm(
@@ -195,10 +216,10 @@ def run_llm_dm(
 
     reqs = [":" + r for r in hierarchy_reqs["requirements"]]
     types = format_types(get_types(hierarchy_reqs))
+    domain_builder.set_types(types)  # versioned by the builder: rendered once for every action
 
     actions = list(action_model.keys())
-    action_list = list()
-    predicates = list()
+    refinement_builder = RefinementBuilder(types=types)
 
     # initialize result folder
     result_log_dir = f"paper_reconstructions/llm+dm/results/{domain}"
@@ -209,68 +230,63 @@ def run_llm_dm(
         it is generating new predicates if needed and is added to a dynamic list. At the end of the iterations, it is ran again once more to
         create the action models agains, but with using the new predicate list. This algorithm can iterative as many times as needed until no
         new predicates are added to the list. This is an action model refinement algorithm, that refines itself by a growing predicate list.
-    """
-
-    # outer loop that resets all action creation to be conditioned on updated predicate list
-    for i_iter in range(max_iter):
-        readable_results = ""  # for logging purposes
-        prev_predicate_list = deepcopy(predicates)  # copy previous predicate list
-        action_list = []
 
-        # inner loop that generates a single action along with its predicates
-        for _, action in enumerate(actions):
-
-            # retrieve prompt for specific action
-            action_prompt, _ = get_action_prompt(prompt_template, action_model[action])
-            readable_results += (
-                "\n" * 2 + "#" * 20 + "\n" + f"Action: {action}\n" + "#" * 20 + "\n"
-            )
-
-            # retrieve prompt for current predicate list
-            predicate_prompt = get_predicate_prompt(predicates)
-            readable_results += "-" * 20
-            readable_results += f"\n{predicate_prompt}\n" + "-" * 20
-
-            # assemble template
-            action_predicate_prompt = f"{action_prompt}\n\n{predicate_prompt}"
-            action_predicate_prompt += "\n\nParameters:"
-
-            # create single action + corresponding predicates
-            action, predicates, llm_response = construct_action(
-                model,
-                action_predicate_prompt,
-                action,
-                predicates,
-                types,
-                max_attempts,
-                True,
-            )
-
-            # add action to current list + remove any redundant predicates
-            action_list.append(action)
-            predicates = prune_predicates(predicates, action_list)
+        `RefinementBuilder` runs the outer loop incrementally: after the first iteration, only actions for which a relevant predicate
+        was added (or a used predicate removed) are generated again, and the loop stops once no action is stale.
+    """
 
-            readable_results += "\n" + "-" * 10 + "-" * 10 + "\n"
-            readable_results += llm_response + "\n"
+    readable_results = ""  # for logging purposes
+
+    def generate(action, predicates):
+        # inner step that generates a single action along with its predicates
+        nonlocal readable_results
+
+        # retrieve prompt for specific action
+        action_prompt, _ = get_action_prompt(prompt_template, action_model[action])
+        readable_results += (
+            "\n" * 2 + "#" * 20 + "\n" + f"Action: {action}\n" + "#" * 20 + "\n"
+        )
+
+        # retrieve prompt for current predicate list
+        predicate_prompt = get_predicate_prompt(predicates)
+        readable_results += "-" * 20
+        readable_results += f"\n{predicate_prompt}\n" + "-" * 20
+
+        # assemble template
+        action_predicate_prompt = f"{action_prompt}\n\n{predicate_prompt}"
+        action_predicate_prompt += "\n\nParameters:"
+
+        # create single action + corresponding predicates
+        action, new_predicates, llm_response = construct_action(
+            model,
+            action_predicate_prompt,
+            action,
+            predicates,
+            types,
+            max_attempts,
+            True,
+        )
 
-        # record log results into separate file of current iteration
         readable_results += "\n" + "-" * 10 + "-" * 10 + "\n"
-        readable_results += "Extracted predicates:\n"
-        for i, p in enumerate(predicates):
-            readable_results += f'\n{i + 1}. {p["raw"]}'
+        readable_results += llm_response + "\n"
 
-        with open(os.path.join(result_log_dir, f"{engine}_0_{i_iter}.txt"), "w") as f:
-            f.write(readable_results)
+        return action, new_predicates
 
-        gen_done = False
-        if len(prev_predicate_list) == len(predicates):
-            print(
-                f"[INFO] iter {i_iter} | no new predicate has been defined, will terminate the process"
-            )
-            gen_done = True
+    actions_by_name, predicates = refinement_builder.refine(
+        action_names=actions, generate=generate, max_iter=max_iter
+    )
+    # actions whose generation failed on every attempt are left out of the domain
+    action_list = [actions_by_name[action] for action in actions if action in actions_by_name]
+
+    # record log results into separate file
+    readable_results += "\n" + "-" * 10 + "-" * 10 + "\n"
+    readable_results += "Extracted predicates:\n"
+    for i, p in enumerate(predicates):
+        readable_results += f'\n{i + 1}. {p["raw"]}'
+    readable_results += f"\n\nRefinement stats: {refinement_builder.get_stats()}\n"
 
-        if gen_done:
-            break
+    with open(os.path.join(result_log_dir, f"{engine}_0.txt"), "w") as f:
+        f.write(readable_results)
 
     # generate PDDL format
     pddl_domain = domain_builder.generate_domain(
@@ -297,6 +313,8 @@ if __name__ == "__main__":
     api_key = os.environ.get("OPENAI_API_KEY")
     gpt_model = OPENAI(model=engine, api_key=api_key)
     domain_builder = DomainBuilder()
+    repair_builder = RepairBuilder()
+    repair_prompt = load_file("templates/repair_templates/repair_section.txt")
 
     # run LLM+DM method on all domains
     run_llm_dm(model=gpt_model, domain="logistics")
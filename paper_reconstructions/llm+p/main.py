@@ -110,6 +110,67 @@ def llm_ic_pddl_planner(args, problem_name):
         file.write(output)
 
 
+def llm_ic_pddl_planner_batch(args):
+    # same as `llm_ic_pddl_planner`, but formalizes all `args.tasks` concurrently
+
+    task_builder = TaskBuilder()
+    domain = Domain(name=args.domain)
+    planner = FastDownward(planner_path=args.planner)
+
+    api_key = os.environ.get("OPENAI_API_KEY")
+    model = OPENAI(model=args.model, api_key=api_key)
+
+    context = domain.get_context()
+    domain_pddl = domain.get_domain_pddl()
+    domain_pddl_file = domain.get_domain_pddl_file()
+
+    result_folder = f"paper_reconstructions/llm+p/domains/{domain.name}/results/pddl"
+    plan_results_folder = (
+        f"paper_reconstructions/llm+p/domains/{domain.name}/results/plan"
+    )
+
+    # A. generate problem pddl files (task NL is filled into the prompt per problem)
+    prompt = create_llm_ic_pddl_prompt("{problem_desc}", domain_pddl, context)
+    tasks = args.tasks or range(len(domain.tasks))
+    problem_descs = {task: domain.get_task(task) for task in tasks}
+
+    results = task_builder.formalize_tasks(
+        model=model,
+        problem_descs=problem_descs,
+        prompt_template=prompt,
+        max_workers=args.max_workers,
+    )
+
+    def generate_problems():
+        for task, objects, initial, goal, _, validation_info in results:
+            # failed formalizations come back empty: skip them instead of planning on them
+            if not validation_info[0] or not objects:
+                print(f"Skipping task {task}: {validation_info[1]}")
+                continue
+            task_name = domain.get_task_name(task)
+            yield task_name, task_builder.generate_task(
+                domain_name=domain.name,
+                problem_name=f"{domain.name}_{os.path.splitext(task_name)[0]}",
+                objects=objects,
+                initial=initial,
+                goal=goal,
+            )
+
+    pddl_file_paths = task_builder.write_tasks(generate_problems(), result_folder)
+
+    # B. run planner on every problem concurrently, each run bounded in time and memory
+    os.makedirs(plan_results_folder, exist_ok=True)
+    jobs = [(domain_pddl_file, pddl_file_path) for pddl_file_path in pddl_file_paths]
+    with PlannerPool(
+        planner, timeout=args.planner_timeout, memory_limit=args.planner_memory * 2**20
+    ) as planner_pool:
+        for result in planner_pool.solve_all(jobs):
+            plan_name = os.path.basename(result.problem_file).replace("pddl", "txt")
+            plan_file_path = os.path.join(plan_results_folder, plan_name)
+            with open(plan_file_path, "w") as file:
+                file.write(result.plan)
+
+
 if __name__ == "__main__":
 
     # load in arguments to run program
@@ -119,8 +180,17 @@ if __name__ == "__main__":
     )  # experiment originally ran on o3-mini
     parser.add_argument("--domain", type=str, choices=DOMAINS, default="termes")
     parser.add_argument("--task", type=int, default=3)  # task to run
+    parser.add_argument(
+        "--tasks", type=int, nargs="*", default=None
+    )  # run several tasks concurrently (no values = all tasks of the domain)
+    parser.add_argument("--max_workers", type=int, default=8)
     parser.add_argument("--planner", type=str, default="downward/fast-downward.py")
+    parser.add_argument("--planner_timeout", type=float, default=300)  # seconds per run
+    parser.add_argument("--planner_memory", type=int, default=4096)  # MiB per run
     args = parser.parse_args()
 
     # run LLM+P method
-    llm_ic_pddl_planner(args=args, problem_name="termes_problem")
+    if args.tasks is not None:
+        llm_ic_pddl_planner_batch(args=args)
+    else:
+        llm_ic_pddl_planner(args=args, problem_name="termes_problem")
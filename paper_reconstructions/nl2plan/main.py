@@ -15,6 +15,13 @@ Step 1-4 is concerned with PDDL domain; step 5 involves PDDL problem.
 Each step contains a feedback mechanism (either LLM or human). In this case, we chose to do full
 automation and let LLM run a feedback checklist on its outputs. There are also validators found
 in step 4 (action construction) and step 5 (task extraction) for PDDL syntax.
+
+The output of each step is checkpointed (see l2p/utils/checkpoint.py), so a crashed run re-launched
+with `--resume` (and the same `--run_id`) resumes at the first incomplete step. Without `--resume`,
+the checkpoints of the run are discarded. A run is only resumed with the model it was started with.
+
+With `--speculative`, steps 2 and 3 start on the previous step's output while its LLM feedback
+is pending (see `Speculator` in l2p/pipeline_builder.py).
 """
 
 import argparse
@@ -47,6 +54,14 @@ REQUIREMENTS = [
 
 UNSUPPORTED_KEYWORDS = ["object", "pddl", "lisp"]
 
+STAGES = [
+    "type_extraction",
+    "hierarchy_construction",
+    "action_extraction",
+    "action_construction",
+    "task_extraction",
+]
+
 separator = "-" * 20
 
 
@@ -93,103 +108,178 @@ def run_nl2plan(args, domain: str, problem: str):
     # write log file (in case of run-time failure)
     log_file = f"{main_directory}/log.txt"
 
+    # checkpoint store; with `--resume`, completed stages are restored instead of re-queried
+    checkpoint = Checkpoint(
+        root="paper_reconstructions/nl2plan/results/checkpoints",
+        run_id=args.run_id or f"{domain}-{problem}",
+    )
+    config = {"model": args.model, "domain": domain, "problem": problem}
+    if args.resume and checkpoint.has("config"):
+        if checkpoint.load("config") != config:
+            raise ValueError(
+                f"Run `{checkpoint.run_id}` was started with {checkpoint.load('config')}, "
+                f"cannot resume it with {config}. Drop `--resume` or use another `--run_id`."
+            )
+    else:
+        checkpoint.clear()
+        checkpoint.save("config", config)
+    resume_stage = checkpoint.first_incomplete(STAGES)
+    if resume_stage != STAGES[0]:
+        print(f"Resuming run `{checkpoint.run_id}` at stage: {resume_stage or 'planning'}")
+
     try:
         # initialize OpenAI engine
         api_key = os.environ.get("OPENAI_API_KEY")
         model = OPENAI(model=args.model, api_key=api_key)
 
-        # A. Type Extraction
-        type_extraction = TypeExtraction()
-        type_extraction.prompt_template = set_prompt(
-            type_extraction.prompt_template,
-            role_path="paper_reconstructions/nl2plan/prompts/type_extraction/role.txt",
-            examples_path="paper_reconstructions/nl2plan/prompts/type_extraction/examples",
-            task_path="paper_reconstructions/nl2plan/prompts/type_extraction/task.txt",
-        )
+        # B/C steps as functions, so they can also run speculatively (see below)
+        def run_hierarchy_construction(types, speculator=None):
+            hierarchy_construction = HierarchyConstruction()
+            hierarchy_construction.prompt_template = set_prompt(
+                hierarchy_construction.prompt_template,
+                role_path="paper_reconstructions/nl2plan/prompts/hierarchy_construction/role.txt",
+                examples_path="paper_reconstructions/nl2plan/prompts/hierarchy_construction/examples",
+                task_path="paper_reconstructions/nl2plan/prompts/hierarchy_construction/task.txt",
+            )
+
+            return hierarchy_construction.hierarchy_construction(
+                model=model,
+                domain_desc=load_file(
+                    f"paper_reconstructions/nl2plan/domains/{domain}/desc.txt"
+                ),
+                type_hierarchy_prompt=hierarchy_construction.prompt_template,
+                types=types,
+                feedback_prompt=load_file(
+                    "paper_reconstructions/nl2plan/prompts/hierarchy_construction/feedback.txt"
+                ),
+                speculator=speculator,
+            )
+
+        def run_action_extraction(type_hierarchy):
+            action_extraction = ActionExtraction()
+            action_extraction.prompt_template = set_prompt(
+                action_extraction.prompt_template,
+                role_path="paper_reconstructions/nl2plan/prompts/action_extraction/role.txt",
+                examples_path="paper_reconstructions/nl2plan/prompts/action_extraction/examples",
+                task_path="paper_reconstructions/nl2plan/prompts/action_extraction/task.txt",
+            )
+
+            return action_extraction.action_extraction(
+                model=model,
+                domain_desc=load_file(
+                    f"paper_reconstructions/nl2plan/domains/{domain}/desc.txt"
+                ),
+                action_extraction_prompt=action_extraction.prompt_template,
+                type_hierarchy=type_hierarchy,
+                feedback_prompt=load_file(
+                    "paper_reconstructions/nl2plan/prompts/action_extraction/feedback.txt"
+                ),
+            )
+
+        # with `--speculative`, the next step starts on a step's output while its LLM feedback
+        # is still pending; the speculative result is discarded if feedback requests changes
+        speculator = Speculator() if args.speculative else None
 
-        types, llm_output = type_extraction.type_extraction(
-            model=model,
-            domain_desc=load_file(
-                f"paper_reconstructions/nl2plan/domains/{domain}/desc.txt"
-            ),
-            type_extraction_prompt=type_extraction.prompt_template,
-            feedback_prompt=load_file(
-                "paper_reconstructions/nl2plan/prompts/type_extraction/feedback.txt"
-            ),
-        )
+        # A. Type Extraction
+        if checkpoint.has("type_extraction"):
+            types = checkpoint.load("type_extraction")["types"]
+        else:
+            type_extraction = TypeExtraction()
+            type_extraction.prompt_template = set_prompt(
+                type_extraction.prompt_template,
+                role_path="paper_reconstructions/nl2plan/prompts/type_extraction/role.txt",
+                examples_path="paper_reconstructions/nl2plan/prompts/type_extraction/examples",
+                task_path="paper_reconstructions/nl2plan/prompts/type_extraction/task.txt",
+            )
+
+            if speculator and not checkpoint.has("hierarchy_construction"):
+                speculator.prepare(run_hierarchy_construction)
+
+            types, llm_output = type_extraction.type_extraction(
+                model=model,
+                domain_desc=load_file(
+                    f"paper_reconstructions/nl2plan/domains/{domain}/desc.txt"
+                ),
+                type_extraction_prompt=type_extraction.prompt_template,
+                feedback_prompt=load_file(
+                    "paper_reconstructions/nl2plan/prompts/type_extraction/feedback.txt"
+                ),
+                speculator=speculator,
+            )
+            checkpoint.save("type_extraction", {"types": types}, llm_output)
 
         log += f"STEP ONE: TYPE EXTRACTION\n\n{types}\n\n"
 
         # B. Hierarchy Construction
-        hierarchy_construction = HierarchyConstruction()
-        hierarchy_construction.prompt_template = set_prompt(
-            hierarchy_construction.prompt_template,
-            role_path="paper_reconstructions/nl2plan/prompts/hierarchy_construction/role.txt",
-            examples_path="paper_reconstructions/nl2plan/prompts/hierarchy_construction/examples",
-            task_path="paper_reconstructions/nl2plan/prompts/hierarchy_construction/task.txt",
-        )
-
-        type_hierarchy, llm_output = hierarchy_construction.hierarchy_construction(
-            model=model,
-            domain_desc=load_file(
-                f"paper_reconstructions/nl2plan/domains/{domain}/desc.txt"
-            ),
-            type_hierarchy_prompt=hierarchy_construction.prompt_template,
-            types=types,
-            feedback_prompt=load_file(
-                "paper_reconstructions/nl2plan/prompts/hierarchy_construction/feedback.txt"
-            ),
-        )
+        if checkpoint.has("hierarchy_construction"):
+            type_hierarchy = checkpoint.load("hierarchy_construction")["type_hierarchy"]
+        else:
+            speculated, result = speculator.result(types) if speculator else (False, None)
+            if not speculated:
+                if speculator and not checkpoint.has("action_extraction"):
+                    speculator.prepare(run_action_extraction)
+                result = run_hierarchy_construction(types, speculator=speculator)
+
+            type_hierarchy, llm_output = result
+            checkpoint.save(
+                "hierarchy_construction", {"type_hierarchy": type_hierarchy}, llm_output
+            )
 
         log += f"{separator}\nSTEP TWO: HIERARCHY CONSTRUCTION\n\n{type_hierarchy}\n\n"
 
         # C. Action Extraction
-        action_extraction = ActionExtraction()
-        action_extraction.prompt_template = set_prompt(
-            action_extraction.prompt_template,
-            role_path="paper_reconstructions/nl2plan/prompts/action_extraction/role.txt",
-            examples_path="paper_reconstructions/nl2plan/prompts/action_extraction/examples",
-            task_path="paper_reconstructions/nl2plan/prompts/action_extraction/task.txt",
-        )
-
-        nl_actions, llm_output = action_extraction.action_extraction(
-            model=model,
-            domain_desc=load_file(
-                f"paper_reconstructions/nl2plan/domains/{domain}/desc.txt"
-            ),
-            action_extraction_prompt=action_extraction.prompt_template,
-            type_hierarchy=type_hierarchy,
-            feedback_prompt=load_file(
-                "paper_reconstructions/nl2plan/prompts/action_extraction/feedback.txt"
-            ),
-        )
+        if checkpoint.has("action_extraction"):
+            nl_actions = checkpoint.load("action_extraction")["nl_actions"]
+        else:
+            speculated, result = (
+                speculator.result(type_hierarchy) if speculator else (False, None)
+            )
+            if not speculated:
+                result = run_action_extraction(type_hierarchy)
+
+            nl_actions, llm_output = result
+            checkpoint.save("action_extraction", {"nl_actions": nl_actions}, llm_output)
+
+        if speculator:
+            print(f"Speculative execution: {speculator.get_stats()}")
+            speculator.shutdown()
 
         log += f"{separator}\nSTEP THREE: ACTION EXTRACTION\n\n{nl_actions}\n\n"
 
         # D. Action Construction
-        action_construction = ActionConstruction()
-        action_construction.prompt_template = set_prompt(
-            action_construction.prompt_template,
-            role_path="paper_reconstructions/nl2plan/prompts/action_construction/role.txt",
-            examples_path="paper_reconstructions/nl2plan/prompts/action_construction/examples",
-            task_path="paper_reconstructions/nl2plan/prompts/action_construction/task.txt",
-        )
-
-        (
-            actions,
-            predicates,
-        ) = action_construction.action_construction(
-            model=model,
-            domain_desc=load_file(
-                f"paper_reconstructions/nl2plan/domains/{domain}/desc.txt"
-            ),
-            act_constr_prompt=action_construction.prompt_template,
-            nl_actions=nl_actions,
-            type_hierarchy=type_hierarchy,
-            feedback_prompt=load_file(
-                "paper_reconstructions/nl2plan/prompts/action_construction/feedback.txt"
-            ),
-        )
+        if checkpoint.has("action_construction"):
+            state = checkpoint.load("action_construction")
+            actions, predicates = state["actions"], state["predicates"]
+        else:
+            action_construction = ActionConstruction()
+            action_construction.prompt_template = set_prompt(
+                action_construction.prompt_template,
+                role_path="paper_reconstructions/nl2plan/prompts/action_construction/role.txt",
+                examples_path="paper_reconstructions/nl2plan/prompts/action_construction/examples",
+                task_path="paper_reconstructions/nl2plan/prompts/action_construction/task.txt",
+            )
+
+            (
+                actions,
+                predicates,
+                llm_output,
+            ) = action_construction.action_construction(
+                model=model,
+                domain_desc=load_file(
+                    f"paper_reconstructions/nl2plan/domains/{domain}/desc.txt"
+                ),
+                act_constr_prompt=action_construction.prompt_template,
+                nl_actions=nl_actions,
+                type_hierarchy=type_hierarchy,
+                feedback_prompt=load_file(
+                    "paper_reconstructions/nl2plan/prompts/action_construction/feedback.txt"
+                ),
+            )
+            checkpoint.save(
+                "action_construction",
+                {"actions": actions, "predicates": predicates},
+                llm_output,
+            )
 
         log += f"{separator}\n"
         log += "STEP FOUR: ACTION CONSTRUCTION\n\n"
@@ -199,26 +289,35 @@ def run_nl2plan(args, domain: str, problem: str):
         log += "\n".join([str(predicate) for predicate in predicates]) + "\n\n"
 
         # E. Task Extraction
-        task_extraction = TaskExtraction()
-        task_extraction.prompt_template = set_prompt(
-            task_extraction.prompt_template,
-            role_path="paper_reconstructions/nl2plan/prompts/task_extraction/role.txt",
-            examples_path="paper_reconstructions/nl2plan/prompts/task_extraction/examples",
-            task_path="paper_reconstructions/nl2plan/prompts/task_extraction/task.txt",
-        )
-
-        objects, initial, goal = task_extraction.task_extraction(
-            model=model,
-            problem_desc=load_file(
-                f"paper_reconstructions/nl2plan/domains/{domain}/{problem}.txt"
-            ),
-            task_extraction_prompt=task_extraction.prompt_template,
-            types=type_hierarchy,
-            predicates=predicates,
-            feedback_prompt=load_file(
-                "paper_reconstructions/nl2plan/prompts/task_extraction/feedback.txt"
-            ),
-        )
+        if checkpoint.has("task_extraction"):
+            state = checkpoint.load("task_extraction")
+            objects, initial, goal = state["objects"], state["initial"], state["goal"]
+        else:
+            task_extraction = TaskExtraction()
+            task_extraction.prompt_template = set_prompt(
+                task_extraction.prompt_template,
+                role_path="paper_reconstructions/nl2plan/prompts/task_extraction/role.txt",
+                examples_path="paper_reconstructions/nl2plan/prompts/task_extraction/examples",
+                task_path="paper_reconstructions/nl2plan/prompts/task_extraction/task.txt",
+            )
+
+            objects, initial, goal, llm_output = task_extraction.task_extraction(
+                model=model,
+                problem_desc=load_file(
+                    f"paper_reconstructions/nl2plan/domains/{domain}/{problem}.txt"
+                ),
+                task_extraction_prompt=task_extraction.prompt_template,
+                types=type_hierarchy,
+                predicates=predicates,
+                feedback_prompt=load_file(
+                    "paper_reconstructions/nl2plan/prompts/task_extraction/feedback.txt"
+                ),
+            )
+            checkpoint.save(
+                "task_extraction",
+                {"objects": objects, "initial": initial, "goal": goal},
+                llm_output,
+            )
 
         log += f"{separator}\nSTEP FIVE: TASK EXTRACTION\n\n"
         log += f"OBJECTS:\n{objects}\n"
@@ -291,6 +390,9 @@ if __name__ == "__main__":
     parser.add_argument("--domain", type=str, choices=DOMAINS, default="blocksworld")
     parser.add_argument("--requirements", type=list[str], default=REQUIREMENTS)
     parser.add_argument("--planner", type=str, default="downward/fast-downward.py")
+    parser.add_argument("--run_id", type=str, default=None)
+    parser.add_argument("--resume", action="store_true")
+    parser.add_argument("--speculative", action="store_true")
     args = parser.parse_args()
 
     # run NL2Plan
@@ -20,6 +20,8 @@ class ActionConstruction:
         self.prompt_template = PromptBuilder()
         self.domain_builder = DomainBuilder()
         self.feedback_builder = FeedbackBuilder()
+        self.repair_builder = RepairBuilder()
+        self.repair_prompt = load_file("templates/repair_templates/repair_section.txt")
         self.syntax_validator = SyntaxValidator()
         self.syntax_validator.unsupported_keywords = []
         self.syntax_validator.error_types = [
@@ -46,7 +48,7 @@ class ActionConstruction:
         feedback_prompt: str = None,
         max_feedback_retries: int = 1,
         max_syntax_retries: int = 3,
-    ) -> tuple[Action, list[Predicate]]:
+    ) -> tuple[Action, list[Predicate], str]:
         """
         Construct a single action from a given action description using LLM language model.
         NL2Plan defaults to 8 attempts to construct the action; in this case, we did 2 to reduce
@@ -66,24 +68,28 @@ class ActionConstruction:
         Returns:
             action (Action): The constructed action.
             new_predicates (list[Predicate]): A list of new predicates
+            llm_output (str): The raw LLM output of the action
         """
 
         # fill in action construction prompt placeholders
-        action_prompt = act_constr_prompt.generate_prompt()
-        action_prompt = action_prompt.replace("{action_desc}", action_desc)
-        action_prompt = action_prompt.replace("{action_name}", action_name)
-
         if len(predicates) == 0:
             predicate_str = "No predicate has been defined yet"
         else:
-            predicate_str = ""
             predicate_str = "\n".join([f"- {pred['clean']}" for pred in predicates])
-        action_prompt = action_prompt.replace("{predicates}", predicate_str)
+
+        # other placeholders are left for the domain builder to fill
+        action_prompt = PromptTemplate.of(act_constr_prompt.generate_prompt()).render(
+            action_desc=action_desc,
+            action_name=action_name,
+            predicates=predicate_str,
+            strict=False,
+        )
 
         # replace specific feedback template
         if feedback_prompt is not None:
-            feedback_prompt = feedback_prompt.replace("{action_desc}", action_desc)
-            feedback_prompt = feedback_prompt.replace("{action_name}", action_name)
+            feedback_prompt = PromptTemplate.of(feedback_prompt).render(
+                action_desc=action_desc, action_name=action_name, strict=False
+            )
         elif feedback:
             raise ValueError("Feedback template is required when feedback is enabled.")
 
@@ -110,11 +116,32 @@ class ActionConstruction:
                         predicates=predicates,
                         extract_new_preds=True,
                         syntax_validator=self.syntax_validator,
+                        auto_fix=True,
                     )
                 )
 
                 valid = validation_info[0]
                 if not valid:
+                    # first try to repair only the failing section(s)
+                    try:
+                        action, new_predicates, llm_output, validation_info = (
+                            self.repair_builder.repair_action(
+                                model=model,
+                                prompt_template=self.repair_prompt,
+                                llm_output=llm_output,
+                                action_name=action_name,
+                                syntax_validator=self.syntax_validator,
+                                types=type_hierarchy,
+                                predicates=predicates,
+                                extract_new_preds=True,
+                            )
+                        )
+                        valid = validation_info[0]
+                    except Exception as e:
+                        print(f"Section repair failed: {e}")
+
+                if not valid:
+                    # fall back to re-generating the full action
                     llm_input_prompt = self.generate_validation_prompt(
                         action_name=action_name,
                         action_desc=action_desc,
@@ -150,7 +177,7 @@ class ActionConstruction:
             else:
                 break
 
-        return action, new_predicates
+        return action, new_predicates, llm_output
 
     def action_construction(
         self,
@@ -163,7 +190,7 @@ class ActionConstruction:
         max_syntax_retries: int = 3,
         max_feedback_retries: int = 1,
         max_iters: int = 1,
-    ) -> tuple[list[Action], list[Predicate]]:
+    ) -> tuple[list[Action], list[Predicate], str]:
         """
         This function loops through all the natural language actions found in the
         previous step. The number of loops determines how many overall cycles that all actions
@@ -182,19 +209,27 @@ class ActionConstruction:
         Returns:
             - actions (list[Action]): list of actions
             - predicates (list[Predicates]): list of predicates
+            - llm_output (str): raw LLM outputs of the last iteration's actions
         """
 
         action_list = [f"{name}: {desc}" for name, desc in nl_actions.items()]
 
+        # keep types and predicates in the builder, so their prompt fragments are rendered once
+        # per change instead of on every generation, repair and feedback round
+        self.domain_builder.set_type_hierarchy(type_hierarchy)
+        self.domain_builder.predicates = []
+        predicates = self.domain_builder.predicates
+
         # run through main loop over each action
-        predicates = []
         for iter in range(max_iters):
             actions = []
+            llm_outputs = []
+            usage_index = UsageIndex()  # predicates used by this iteration's actions
             print(f"Starting iteration {iter + 1} of action construction")
             curr_preds = len(predicates)
 
             for action_name, action_desc in nl_actions.items():
-                action, new_predicates = self.construct_action(
+                action, new_predicates, llm_output = self.construct_action(
                     model=model,
                     domain_desc=domain_desc,
                     act_constr_prompt=act_constr_prompt,
@@ -208,8 +243,13 @@ class ActionConstruction:
                     max_syntax_retries=max_syntax_retries,
                 )
                 actions.append(action)
-                predicates.extend(new_predicates)
-                predicates = prune_predicates(predicates, actions)
+                llm_outputs.append(llm_output)
+                usage_index.add_action(action)
+                for pred in new_predicates:
+                    if pred["name"] not in predicates.keys():
+                        self.domain_builder.set_predicate(pred)
+                for name in [n for n in predicates.keys() if not usage_index.is_used(n)]:
+                    self.domain_builder.delete_predicate(name)
 
             if len(predicates) == curr_preds:
                 print("No new predicates created. Stopping action construction.")
@@ -217,7 +257,7 @@ class ActionConstruction:
         else:
             print("Reached maximum iterations. Stopping action construction.")
 
-        return actions, predicates
+        return actions, list(predicates), "\n\n".join(llm_outputs)
 
     def generate_validation_prompt(
         self,
@@ -228,7 +268,7 @@ class ActionConstruction:
         original_llm_output: str,
         validation_info: tuple[bool, str],
     ) -> str:
-        prompt = load_file(
+        prompt = load_template(
             "paper_reconstructions/nl2plan/prompts/action_construction/error.txt"
         )
 
@@ -239,17 +279,15 @@ class ActionConstruction:
             else "No predicates provided."
         )
 
-        prompt = (
-            prompt.replace("{error_msg}", validation_info[1])
-            .replace("{llm_response}", original_llm_output)
-            .replace("{action_name}", action_name)
-            .replace("{action_desc}", action_desc)
-            .replace("{types}", types_str)
-            .replace("{predicates}", preds_str)
+        return prompt.render(
+            error_msg=validation_info[1],
+            llm_response=original_llm_output,
+            action_name=action_name,
+            action_desc=action_desc,
+            types=types_str,
+            predicates=preds_str,
         )
 
-        return prompt
-
     def generate_feedback_revision_prompt(
         self,
         fb_msg: str,
@@ -259,7 +297,7 @@ class ActionConstruction:
         predicates: list[Predicate],
         types: list[dict[str, str]],
     ) -> str:
-        prompt = load_file(
+        prompt = load_template(
             "paper_reconstructions/nl2plan/prompts/action_construction/feedback_revision.txt"
         )
 
@@ -279,16 +317,14 @@ class ActionConstruction:
             else "No predicates provided."
         )
 
-        prompt = (
-            prompt.replace("{fb_msg}", fb_msg)
-            .replace("{domain_desc}", domain_desc)
-            .replace("{action_name}", act_name_str)
-            .replace("{action_desc}", action_desc)
-            .replace("{action_params}", params_str)
-            .replace("{action_preconditions}", prec_str)
-            .replace("{action_effects}", eff_str)
-            .replace("{predicates}", preds_str)
-            .replace("{types}", types_str)
+        return prompt.render(
+            fb_msg=fb_msg,
+            domain_desc=domain_desc,
+            action_name=act_name_str,
+            action_desc=action_desc,
+            action_params=params_str,
+            action_preconditions=prec_str,
+            action_effects=eff_str,
+            predicates=preds_str,
+            types=types_str,
         )
-
-        return prompt
@@ -71,11 +71,7 @@ class ActionExtraction:
     def generate_feedback_revision_prompt(
         self, fb_msg: str, nl_actions: dict[str, str]
     ) -> str:
-        prompt = load_file(
+        prompt = load_template(
             "paper_reconstructions/nl2plan/prompts/action_extraction/feedback_revision.txt"
         )
-        prompt = prompt.replace("{fb_msg}", fb_msg).replace(
-            "{nl_actions}", pretty_print_dict(nl_actions)
-        )
-
-        return prompt
+        return prompt.render(fb_msg=fb_msg, nl_actions=pretty_print_dict(nl_actions))
@@ -27,6 +27,7 @@ class HierarchyConstruction:
         feedback_prompt: str,
         max_feedback_retries: int = 1,
         max_syntax_retries: int = 3,
+        speculator: Speculator | None = None,
     ) -> tuple[list[dict[str, str]], str]:
         """
         Main function of the hierarchy construction step.
@@ -37,6 +38,7 @@ class HierarchyConstruction:
             - type_hierarchy_prompt (PromptBuilder): base prompt to organize types.
             - types (dict[str,str]): type dictionary
             - feedback_prompt (str): feedback template for LLM to correct output.
+            - speculator (Speculator): runs the prepared next step on the output while feedback is pending.
         Returns:
             - type_hierarchy (list[dict[str,str]]): organized hierarchy type dictionary
         """
@@ -75,7 +77,7 @@ class HierarchyConstruction:
 
             if i < max_feedback_retries:
                 # feedback mechanism: after valid generation
-                no_feedback, fb_msg = self.feedback_builder.type_feedback(
+                feedback = lambda: self.feedback_builder.type_feedback(
                     model=model,
                     domain_desc=domain_desc,
                     llm_output=llm_output,
@@ -83,6 +85,9 @@ class HierarchyConstruction:
                     feedback_type="llm",
                     types=type_hierarchy,
                 )
+                no_feedback, fb_msg = (
+                    speculator.check(type_hierarchy, feedback) if speculator else feedback()
+                )
                 if not no_feedback:
                     llm_input_prompt = self.generate_feedback_revision_prompt(
                         fb_msg=fb_msg, types=type_hierarchy
@@ -99,23 +104,17 @@ class HierarchyConstruction:
         original_llm_output: str,
         validation_info: tuple[bool, str],
     ) -> str:
-        prompt = load_file("paper_reconstructions/nl2plan/prompts/validation.txt")
-        prompt = (
-            prompt.replace("{error_msg}", validation_info[1])
-            .replace("{llm_response}", original_llm_output)
-            .replace("{domain_desc}", domain_desc)
+        prompt = load_template("paper_reconstructions/nl2plan/prompts/validation.txt")
+        return prompt.render(
+            error_msg=validation_info[1],
+            llm_response=original_llm_output,
+            domain_desc=domain_desc,
         )
 
-        return prompt
-
     def generate_feedback_revision_prompt(
         self, fb_msg: str, types: dict[str, str]
     ) -> str:
-        prompt = load_file(
+        prompt = load_template(
             "paper_reconstructions/nl2plan/prompts/hierarchy_construction/feedback_revision.txt"
         )
-        prompt = prompt.replace("{fb_msg}", fb_msg).replace(
-            "{types}", pretty_print_dict(types)
-        )
-
-        return prompt
+        return prompt.render(fb_msg=fb_msg, types=pretty_print_dict(types))
@@ -14,6 +14,8 @@ class TaskExtraction:
         self.prompt_template = PromptBuilder()
         self.task_builder = TaskBuilder()
         self.feedback_builder = FeedbackBuilder()
+        self.repair_builder = RepairBuilder()
+        self.repair_prompt = load_file("templates/repair_templates/repair_section.txt")
         self.syntax_validator = SyntaxValidator()
         self.syntax_validator.headers = ["OBJECTS", "INITIAL", "GOAL"]
         self.syntax_validator.error_types = [
@@ -35,7 +37,7 @@ class TaskExtraction:
         feedback_prompt: str,
         max_feedback_retries: int = 1,
         max_syntax_retries: int = 3,
-    ) -> tuple[dict[str, str], list[dict[str, str]], list[dict[str, str]]]:
+    ) -> tuple[dict[str, str], list[dict[str, str]], list[dict[str, str]], str]:
         """
         Main function to run task extraction. Specifically, extracts objects,
         initial state, and goal state as components to get PDDL problem.
@@ -55,6 +57,7 @@ class TaskExtraction:
             - initial (list[dict[str,str]]): initial state of problem
             - goal (list[dict[str,str]]): desired state of problem
                 ex: state_1 = {'name': 'on_top', 'params': ['blue_block', 'red_block'], 'neg': False}
+            - llm_output (str): raw LLM output of the last valid task
         """
 
         i = 0
@@ -65,6 +68,7 @@ class TaskExtraction:
         last_valid_obj = None
         last_valid_init = None
         last_valid_goal = None
+        last_valid_output = None
 
         while not no_feedback and i <= max_feedback_retries:
             # inner loop: repeat until syntax validator passes
@@ -79,15 +83,34 @@ class TaskExtraction:
                         types=types,
                         predicates=predicates,
                         syntax_validator=self.syntax_validator,
+                        auto_fix=True,
                     )
                 )
 
                 valid = validation_info[0]
+                if not valid:
+                    # first try to repair only the failing section(s)
+                    try:
+                        objects, initial, goal, llm_output, validation_info = (
+                            self.repair_builder.repair_task(
+                                model=model,
+                                prompt_template=self.repair_prompt,
+                                llm_output=llm_output,
+                                syntax_validator=self.syntax_validator,
+                                types=types,
+                                predicates=predicates,
+                            )
+                        )
+                        valid = validation_info[0]
+                    except Exception as e:
+                        print(f"Section repair failed: {e}")
+
                 if valid:
                     # store last valid results
                     last_valid_obj = objects
                     last_valid_init = initial
                     last_valid_goal = goal
+                    last_valid_output = llm_output
                 else:
                     llm_input_prompt = self.generate_validation_prompt(
                         problem_desc=problem_desc,
@@ -126,7 +149,7 @@ class TaskExtraction:
             else:
                 break
 
-        return last_valid_obj, last_valid_init, last_valid_goal
+        return last_valid_obj, last_valid_init, last_valid_goal, last_valid_output
 
     def generate_validation_prompt(
         self,
@@ -144,19 +167,17 @@ class TaskExtraction:
             else "No predicates provided."
         )
 
-        prompt = load_file(
+        prompt = load_template(
             "paper_reconstructions/nl2plan/prompts/task_extraction/error.txt"
         )
-        prompt = (
-            prompt.replace("{error_msg}", validation_info[1])
-            .replace("{llm_response}", original_llm_output)
-            .replace("{problem_desc}", problem_desc)
-            .replace("{types}", types_str)
-            .replace("{predicates}", preds_str)
+        return prompt.render(
+            error_msg=validation_info[1],
+            llm_response=original_llm_output,
+            problem_desc=problem_desc,
+            types=types_str,
+            predicates=preds_str,
         )
 
-        return prompt
-
     def generate_feedback_revision_prompt(
         self,
         fb_msg: str,
@@ -175,17 +196,15 @@ class TaskExtraction:
             else "No predicates provided."
         )
 
-        prompt = load_file(
+        prompt = load_template(
             "paper_reconstructions/nl2plan/prompts/task_extraction/feedback_revision.txt"
         )
-        prompt = (
-            prompt.replace("{fb_msg}", fb_msg)
-            .replace("{problem_desc}", problem_desc)
-            .replace("{types}", types_str)
-            .replace("{predicates}", preds_str)
-            .replace("{objects}", format_objects(objects))
-            .replace("{initial_states}", format_initial(initial))
-            .replace("{goal_states}", format_goal(goal))
+        return prompt.render(
+            fb_msg=fb_msg,
+            problem_desc=problem_desc,
+            types=types_str,
+            predicates=preds_str,
+            objects=format_objects(objects),
+            initial_states=format_initial(initial),
+            goal_states=format_goal(goal),
         )
-
-        return prompt
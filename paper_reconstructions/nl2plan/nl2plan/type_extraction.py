@@ -23,6 +23,7 @@ class TypeExtraction:
         feedback_prompt: str,
         max_feedback_retries: int = 1,
         max_syntax_retries: int = 3,
+        speculator: Speculator | None = None,
     ) -> tuple[dict[str, str], str]:
         """
         Main function of the type extraction step.
@@ -32,6 +33,7 @@ class TypeExtraction:
             - domain_desc (str): specific domain description to work off.
             - type_extraction_prompt (PromptBuilder): base prompt to extract types.
             - feedback_prompt (str): feedback template for LLM to correct output.
+            - speculator (Speculator): runs the prepared next step on the output while feedback is pending.
         Returns:
             - types (dict[str,str]): type dictionary
         """
@@ -73,7 +75,7 @@ class TypeExtraction:
 
             if i < max_feedback_retries:
                 # feedback mechanism: after valid generation
-                no_feedback, fb_msg = self.feedback_builder.type_feedback(
+                feedback = lambda: self.feedback_builder.type_feedback(
                     model=model,
                     domain_desc=domain_desc,
                     llm_output=llm_output,
@@ -81,6 +83,9 @@ class TypeExtraction:
                     feedback_type="llm",
                     types=types,
                 )
+                no_feedback, fb_msg = (
+                    speculator.check(types, feedback) if speculator else feedback()
+                )
                 if not no_feedback:
                     llm_input_prompt = self.generate_feedback_revision_prompt(
                         fb_msg=fb_msg, types=types
@@ -97,21 +102,17 @@ class TypeExtraction:
         original_llm_output: str,
         validation_info: tuple[bool, str],
     ) -> str:
-        prompt = load_file("paper_reconstructions/nl2plan/prompts/validation.txt")
-        prompt = (
-            prompt.replace("{error_msg}", validation_info[1])
-            .replace("{llm_response}", original_llm_output)
-            .replace("{domain_desc}", domain_desc)
+        prompt = load_template("paper_reconstructions/nl2plan/prompts/validation.txt")
+        return prompt.render(
+            error_msg=validation_info[1],
+            llm_response=original_llm_output,
+            domain_desc=domain_desc,
         )
-        return prompt
 
     def generate_feedback_revision_prompt(
         self, fb_msg: str, types: dict[str, str]
     ) -> str:
-        prompt = load_file(
+        prompt = load_template(
             "paper_reconstructions/nl2plan/prompts/type_extraction/feedback_revision.txt"
         )
-        prompt = prompt.replace("{fb_msg}", fb_msg).replace(
-            "{types}", pretty_print_dict(types)
-        )
-        return prompt
+        return prompt.render(fb_msg=fb_msg, types=pretty_print_dict(types))
@@ -8,6 +8,7 @@ Mental representations are structured symbolically with rules for logical reason
 In this paper, they are tasking the LLM to translate natural language initial and goal states to PDDL via few shot prompting.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from l2p import *
 
 
@@ -88,11 +89,11 @@ def run_problem_01(init_examples, goal_examples):
         objects=objects_01,
     )
 
-    # run FastDownward planner
-    _, result = planner.run_fast_downward(
+    # run FastDownward planner (in a private working directory of the pool)
+    result = planner_pool.submit(
         domain_file="paper_reconstructions/p+s/results/domain.pddl",
         problem_file=problem_file,
-    )
+    ).result().plan
 
     # write result of plan
     with open(problem_path + "/plan.txt", "w") as f:
@@ -125,10 +126,10 @@ def run_problem_02(init_examples, goal_examples):
         objects=objects_02,
     )
 
-    _, result = planner.run_fast_downward(
+    result = planner_pool.submit(
         domain_file="paper_reconstructions/p+s/results/domain.pddl",
         problem_file=problem_file,
-    )
+    ).result().plan
 
     with open(problem_path + "/plan.txt", "w") as f:
         f.write(result)
@@ -161,10 +162,10 @@ def run_problem_03(init_examples, goal_examples):
         objects=objects_03,
     )
 
-    _, result = planner.run_fast_downward(
+    result = planner_pool.submit(
         domain_file="paper_reconstructions/p+s/results/domain.pddl",
         problem_file=problem_file,
-    )
+    ).result().plan
 
     with open(problem_path + "/plan.txt", "w") as f:
         f.write(result)
@@ -203,7 +204,14 @@ if __name__ == "__main__":
     ROLE_GOAL = ROLE + load_file("templates/task_templates/formalize_goal.txt")
     DOMAIN_DIR = "paper_reconstructions/p+s/domain.pddl"
 
-    # run problem sets
-    run_problem_01(init_examples, goal_examples)
-    run_problem_02(init_examples, goal_examples)
-    run_problem_03(init_examples, goal_examples)
+    # run problem sets (independent of each other, so run concurrently); planner runs go
+    # through a pool so that each gets its own working directory for `output.sas`/`sas_plan`
+    problems = [run_problem_01, run_problem_02, run_problem_03]
+    with PlannerPool(planner, max_workers=len(problems)) as planner_pool:
+        with ThreadPoolExecutor(max_workers=len(problems)) as executor:
+            futures = [
+                executor.submit(run_problem, init_examples, goal_examples)
+                for run_problem in problems
+            ]
+            for future in futures:
+                future.result()
@@ -0,0 +1,107 @@
+"""
+Benchmark for frozen PDDL objects (`l2p/utils/pddl_objects.py`) on a large synthetic domain:
+memory held by predicates/actions as dictionaries vs frozen objects, and the cost of taking a
+snapshot of the domain (`deepcopy` of the dictionaries vs `freeze_all` / `deepcopy` of frozen objects).
+
+Run: python playground/bench_pddl_objects.py [--predicates 20000] [--actions 5000] [--repeat 5]
+"""
+
+import argparse, sys, os, time, tracemalloc
+from collections import OrderedDict
+from copy import deepcopy
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from l2p.utils.domain_context import DomainContext
+from l2p.utils.pddl_objects import FrozenAction, FrozenPredicate, freeze_all
+
+TYPES = ["block", "arm", "table", "location", "truck", "package"]
+
+
+def synthetic_domain(num_predicates: int, num_actions: int):
+    """Predicates of arity 1-3 and actions using them, with parser-like dictionaries"""
+    predicates = []
+    for i in range(num_predicates):
+        params = OrderedDict(
+            (f"?x{j}", TYPES[(i + j) % len(TYPES)]) for j in range(1 + i % 3)
+        )
+        clean = f"(pred-{i} {' '.join(f'{p} - {t}' for p, t in params.items())})"
+        predicates.append(
+            {"name": f"pred-{i}", "desc": f"description of pred-{i}", "raw": f"{clean}: description of pred-{i}", "params": params, "clean": clean}
+        )
+
+    actions = []
+    for i in range(num_actions):
+        used = [predicates[(i * 7 + k) % num_predicates] for k in range(3)]
+        params = OrderedDict((f"?x{j}", TYPES[(i + j) % len(TYPES)]) for j in range(3))
+        actions.append(
+            {
+                "name": f"action-{i}",
+                "desc": f"description of action-{i}",
+                "raw": f"### Action action-{i}",
+                "params": params,
+                "preconditions": "(and " + " ".join(p["clean"] for p in used[:2]) + ")",
+                "effects": "(and " + used[2]["clean"] + ")",
+            }
+        )
+    return predicates, actions
+
+
+def measure(label: str, build):
+    tracemalloc.start()
+    data = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<45} {size / 2**20:>10.2f} MiB")
+    return data
+
+
+def bench(label: str, func, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<45} {best * 1000:>10.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--predicates", type=int, default=20000)
+    parser.add_argument("--actions", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"predicates: {args.predicates}, actions: {args.actions}\n")
+    predicates, actions = measure(
+        "dictionaries", lambda: synthetic_domain(args.predicates, args.actions)
+    )
+    # frozen from fresh dictionaries that are dropped, so no strings are shared with `predicates`
+    frozen_predicates, frozen_actions = measure(
+        "frozen objects",
+        lambda: (
+            freeze_all(synthetic_domain(args.predicates, 0)[0], FrozenPredicate),
+            freeze_all(synthetic_domain(1, args.actions)[1], FrozenAction),
+        ),
+    )
+    print()
+
+    bench("deepcopy (dictionaries)", lambda: deepcopy((predicates, actions)), args.repeat)
+    bench("freeze_all (dictionaries)", lambda: (freeze_all(predicates), freeze_all(actions, FrozenAction)), args.repeat)
+    bench(
+        "freeze_all (frozen, shared)",
+        lambda: (freeze_all(list(frozen_predicates)), freeze_all(list(frozen_actions), FrozenAction)),
+        args.repeat,
+    )
+    bench("deepcopy (frozen, shared)", lambda: deepcopy((list(frozen_predicates), list(frozen_actions))), args.repeat)
+    print()
+
+    bench("DomainContext.from_domain (dictionaries)", lambda: DomainContext.from_domain(predicates=predicates), args.repeat)
+    bench(
+        "DomainContext.from_domain (frozen)",
+        lambda: DomainContext.from_domain(predicates=frozen_predicates),
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
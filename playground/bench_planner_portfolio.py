@@ -0,0 +1,79 @@
+"""
+Benchmark for portfolio racing (`PlannerPool.race`, `l2p/utils/planner_pool.py`) against running a
+single configuration, on simulated planners: each (configuration, task) pair takes a seeded,
+heavy-tailed time to plan, so every configuration is slow on some tasks (as on a mix of easy and
+pathological generated domains). No FastDownward build is needed.
+
+Run: python playground/bench_planner_portfolio.py [--tasks 30] [--timeout 5] [--scale 0.4]
+"""
+
+import argparse, sys, os, random, statistics, stat, tempfile, time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from l2p.utils.planner_pool import PlannerPool
+
+CONFIGS = ["lama-first", "seq-sat-fd-autotune-1", "seq-opt-lmcut"]
+
+# `fast-downward.py --alias <alg> <domain> <problem>`: sleeps for the time the problem file lists
+FAKE_PLANNER = f"""#!{sys.executable}
+import json, sys, time
+alg, domain, problem = sys.argv[2:5]
+time.sleep(json.load(open(problem))[alg])
+print("pick-up a (1)")
+"""
+
+
+def bench(label: str, pool: PlannerPool, jobs, run) -> list[float]:
+    times = []
+    start = time.perf_counter()
+    for job in jobs:
+        result = run(pool, *job)
+        times.append(result.elapsed if result.success else float("inf"))
+    total = time.perf_counter() - start
+    solved = [t for t in times if t != float("inf")]
+    p90 = sorted(times)[int(0.9 * (len(times) - 1))]
+    print(
+        f"{label:<30} solved {len(solved):>3}/{len(times)}   median {statistics.median(times):>6.2f} s"
+        f"   p90 {p90:>6.2f} s   total {total:>6.1f} s"
+    )
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=30)
+    parser.add_argument("--timeout", type=float, default=5)
+    parser.add_argument("--scale", type=float, default=0.4)  # median planning time (s)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as folder:
+        planner_path = os.path.join(folder, "fast-downward.py")
+        with open(planner_path, "w") as f:
+            f.write(FAKE_PLANNER)
+        os.chmod(planner_path, os.stat(planner_path).st_mode | stat.S_IEXEC)
+        domain_file = os.path.join(folder, "domain.pddl")
+        open(domain_file, "w").close()
+
+        jobs = []
+        for i in range(args.tasks):
+            # log-normal planning times: most runs are fast, a few take far longer
+            times = {c: args.scale * rng.lognormvariate(0, 1.5) for c in CONFIGS}
+            problem_file = os.path.join(folder, f"p{i}.pddl")
+            with open(problem_file, "w") as f:
+                f.write(str(times).replace("'", '"'))
+            jobs.append((domain_file, problem_file))
+
+        print(f"tasks: {args.tasks}, timeout: {args.timeout} s, configurations: {CONFIGS}\n")
+        with PlannerPool(planner_path, max_workers=len(CONFIGS), timeout=args.timeout) as pool:
+            bench(
+                f"single ({CONFIGS[0]})",
+                pool,
+                jobs,
+                lambda pool, d, p: pool.submit(d, p, CONFIGS[0]).result(),
+            )
+            bench("portfolio race", pool, jobs, lambda pool, d, p: pool.race(d, p, CONFIGS))
+
+
+if __name__ == "__main__":
+    main()
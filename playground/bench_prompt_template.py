@@ -0,0 +1,98 @@
+"""
+Benchmark for prompt template filling (`l2p/utils/prompt_template.py`) on the shipped
+`templates/` tree, against the previous chained `str.replace` calls.
+
+Every template is filled with the placeholders a builder passes for it (the union of the
+`formalize_*` placeholders) and values of realistic size (`--scale` repeats them).
+
+Run: python playground/bench_prompt_template.py [--scale 20] [--repeat 2000]
+"""
+
+import argparse, sys, os, time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from l2p.utils.pddl_parser import load_file
+from l2p.utils.prompt_template import DEFAULT_TEMPLATE_ROOT, PromptTemplate, TemplateRegistry
+
+# placeholders supplied by the builders, with one line of sample text each
+PLACEHOLDERS = {
+    "domain_desc": "Blocks are stacked on a table by a robot arm that holds one block at a time.",
+    "problem_desc": "There are three blocks: b1 is on b2, b2 and b3 are on the table.",
+    "task_desc": "Build a tower b1 on b2 on b3 using a single arm.",
+    "types": "- block: a stackable block\n- arm: a robot arm",
+    "constants": "table - surface",
+    "predicates": "(on ?b1 - block ?b2 - block): b1 is on b2",
+    "functions": "(total-cost): cost of the plan",
+    "nl_actions": "pick-up: the arm picks up a clear block",
+    "action_list": "- pick-up\n- put-down\n- stack\n- unstack",
+    "action_name": "stack",
+    "action_desc": "The arm stacks the held block on a clear block",
+    "objects": "b1 - block\nb2 - block\nb3 - block",
+    "initial_state": "(on b1 b2)\n(ontable b2)\n(ontable b3)",
+    "goal_state": "(on b1 b2)\n(on b2 b3)",
+    "section": "TYPES",
+    "section_content": "- block: a stackable block",
+    "error_msg": "[ERROR]: type 'surface' is not defined",
+    "context": "## TYPES\n- block\n- arm",
+    "llm_output": "### New Predicates\n- (holding ?b - block): the arm holds b",
+}
+
+
+def legacy_fill(template: str, values: dict[str, str]) -> str:
+    """Previous implementation: one `str.replace` (one full copy) per placeholder"""
+    for name, value in values.items():
+        template = template.replace("{" + name + "}", value)
+    return template
+
+
+def bench(label: str, func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<45} {best * 1000:>10.2f} ms")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    values = {name: "\n".join([text] * args.scale) for name, text in PLACEHOLDERS.items()}
+    paths = [
+        os.path.join(folder, f)
+        for folder, _, files in os.walk(DEFAULT_TEMPLATE_ROOT)
+        for f in sorted(files)
+        if f.endswith(".txt")
+    ]
+    texts = [load_file(path) for path in paths]
+    print(f"templates: {len(texts)}, {sum(map(len, texts))} chars, values: {sum(map(len, values.values()))} chars\n")
+
+    start = time.perf_counter()
+    registry = TemplateRegistry(DEFAULT_TEMPLATE_ROOT)
+    print(f"{'TemplateRegistry (preload + compile)':<45} {(time.perf_counter() - start) * 1000:>10.2f} ms\n")
+    templates = [registry.get(path) for path in paths]
+
+    for text, template in zip(texts, templates):
+        assert legacy_fill(text, values) == template.render(values, strict=False), template.name
+
+    legacy = bench("chained str.replace", lambda: [legacy_fill(t, values) for t in texts], args.repeat)
+    compiled = bench(
+        "PromptTemplate.render (preloaded)",
+        lambda: [t.render(values, strict=False) for t in templates],
+        args.repeat,
+    )
+    bench(
+        "PromptTemplate.of(text).render",
+        lambda: [PromptTemplate.of(t).render(values, strict=False) for t in texts],
+        args.repeat,
+    )
+    print(f"\nspeedup (preloaded): {legacy / compiled:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
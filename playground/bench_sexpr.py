@@ -0,0 +1,115 @@
+"""
+Benchmark for the S-expression parser (`l2p/utils/sexpr.py`) against the previous
+`parse_pddl`/`concatenate_strings` implementation, plus `validate_pddl_action` on large
+synthetic preconditions/effects and deeply nested expressions.
+
+Run: python playground/bench_sexpr.py [--conjuncts 5000] [--depth 20000] [--repeat 5]
+"""
+
+import argparse, re, sys, os, time
+from collections import OrderedDict
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from l2p.utils.pddl_parser import concatenate_strings
+from l2p.utils.pddl_validator import SyntaxValidator
+from l2p.utils.sexpr import parse_sexpr
+
+
+def legacy_parse_pddl(pddl_str: str) -> list:
+    """Previous regex tokenizer + recursive `concatenate_strings`"""
+    tokens = re.sub(r"([()])", r" \1 ", pddl_str).split()
+    stack, current = [], []
+    for token in tokens:
+        if token == "(":
+            stack.append(current)
+            current = []
+        elif token == ")":
+            if stack:
+                parent = stack.pop()
+                parent.append(current)
+                current = parent
+        else:
+            current.append(token)
+    return concatenate_strings(current[0])
+
+
+def synthetic_action(conjuncts: int) -> tuple[str, str, list, OrderedDict]:
+    """Wide preconditions/effects over `conjuncts` atoms, with quantifiers and conditional effects"""
+    params = OrderedDict((f"?o{i}", "obj") for i in range(8))
+    predicates = [
+        {
+            "name": f"p{i}",
+            "desc": "",
+            "raw": f"(p{i} ?a - obj ?b - obj)",
+            "params": OrderedDict([("?a", "obj"), ("?b", "obj")]),
+            "clean": f"(p{i} ?a - obj ?b - obj)",
+        }
+        for i in range(50)
+    ]
+
+    pre, eff = [], []
+    for i in range(conjuncts):
+        atom = f"(p{i % 50} ?o{i % 8} ?o{(i + 1) % 8})"
+        if i % 10 == 0:
+            pre.append(f"(forall (?x - obj) (or (not (p{i % 50} ?x ?o0)) {atom}))")
+            eff.append(f"(when (and {atom} (not (p0 ?o1 ?o2))) (not {atom}))")
+        else:
+            pre.append(atom if i % 3 else f"(not {atom})")
+            eff.append(atom if i % 2 else f"(not {atom})")
+
+    return f"(and {' '.join(pre)})", f"(and {' '.join(eff)})", predicates, params
+
+
+def bench(label: str, func, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<45} {best * 1000:>10.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--conjuncts", type=int, default=5000)
+    parser.add_argument("--depth", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    pre, eff, predicates, params = synthetic_action(args.conjuncts)
+    types = {"obj": "object"}
+    validator = SyntaxValidator()
+    print(f"preconditions: {len(pre)} chars, effects: {len(eff)} chars\n")
+
+    bench("legacy parse_pddl (preconditions)", lambda: legacy_parse_pddl(pre), args.repeat)
+    bench("parse_sexpr (preconditions)", lambda: parse_sexpr(pre), args.repeat)
+    bench("parse_sexpr + to_list (preconditions)", lambda: parse_sexpr(pre).to_list(), args.repeat)
+    bench(
+        "validate_pddl_action (preconditions)",
+        lambda: validator.validate_pddl_action(pre, predicates, params, [], types),
+        args.repeat,
+    )
+    bench(
+        "validate_pddl_action (effects)",
+        lambda: validator.validate_pddl_action(eff, predicates, params, [], types, part="effects"),
+        args.repeat,
+    )
+
+    # deep nesting: (not (not ... (p0 ?o0 ?o1)))
+    deep = "(not " * args.depth + "(p0 ?o0 ?o1)" + ")" * args.depth
+    print(f"\nnesting depth: {args.depth} (recursion limit: {sys.getrecursionlimit()})")
+    try:
+        legacy_parse_pddl(deep)
+        print(f"{'legacy parse_pddl':<45} {'ok':>10}")
+    except RecursionError:
+        print(f"{'legacy parse_pddl':<45} {'RecursionError':>10}")
+    bench("parse_sexpr (deep)", lambda: parse_sexpr(deep), args.repeat)
+    bench(
+        "validate_pddl_action (deep)",
+        lambda: validator.validate_pddl_action(deep, predicates, params, [], types),
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
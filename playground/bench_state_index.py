@@ -0,0 +1,109 @@
+"""
+Benchmark for task-state validation (`SyntaxValidator.validate_task_states`, backed by
+`l2p/utils/state_index.py`) on a synthetic logistics-style problem, against the previous
+per-state implementation.
+
+Run: python playground/bench_state_index.py [--facts 100000] [--objects 2000] [--repeat 5]
+"""
+
+import argparse, sys, os, time
+from collections import OrderedDict
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from l2p.utils.pddl_validator import SyntaxValidator
+from l2p.utils.state_index import StateIndex
+
+
+def legacy_validate_task_states(states, objects, predicates, state_type="initial"):
+    """Previous implementation: name lists and linear predicate lookups per state"""
+    for state in states:
+        predicate_names = [p["name"] for p in predicates]
+        state_name = state["pred_name"]
+        state_params = state["params"]
+        if state_name not in predicate_names:
+            return False, f"predicate {state_name} not defined"
+        missing_params = [p for p in state_params if p not in objects]
+        if missing_params:
+            return False, f"{missing_params} not found in task objects {list(objects.keys())}"
+        target_pred = next(p for p in predicates if p["name"] == state_name)
+        expected_types = list(target_pred["params"].values())
+        actual_types = [objects[param] for param in state_params]
+        if expected_types != actual_types:
+            return False, f"Declared objects: {[f'{n} - {t}' for n, t in objects.items()]}"
+    return True, "[PASS]: All task states are valid."
+
+
+def synthetic_problem(facts: int, num_objects: int):
+    """Packages, trucks and locations with `at`/`in`/`connected` facts"""
+    kinds = ["package", "truck", "location"]
+    objects = {f"{kinds[i % 3]}{i}": kinds[i % 3] for i in range(num_objects)}
+    by_type = {k: [o for o, t in objects.items() if t == k] for k in kinds}
+    signatures = {
+        "at": ["package", "location"],
+        "in": ["package", "truck"],
+        "truck-at": ["truck", "location"],
+        "connected": ["location", "location"],
+    }
+    predicates = [
+        {
+            "name": name,
+            "params": OrderedDict((f"?x{i}", t) for i, t in enumerate(types)),
+            "clean": f"({name} {' '.join(f'?x{i} - {t}' for i, t in enumerate(types))})",
+        }
+        for name, types in signatures.items()
+    ]
+
+    states = []
+    names = list(signatures)
+    for i in range(facts):
+        name = names[i % len(names)]
+        params = [by_type[t][(i * 7 + j) % len(by_type[t])] for j, t in enumerate(signatures[name])]
+        states.append({"pred_name": name, "params": params, "neg": False})
+    return states, objects, predicates
+
+
+def bench(label: str, func, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<45} {best * 1000:>10.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--facts", type=int, default=100000)
+    parser.add_argument("--objects", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    states, objects, predicates = synthetic_problem(args.facts, args.objects)
+    validator = SyntaxValidator()
+    state_index = StateIndex(objects, predicates=predicates)
+    print(f"facts: {len(states)}, objects: {len(objects)}\n")
+
+    bench(
+        "legacy validate_task_states",
+        lambda: legacy_validate_task_states(states, objects, predicates),
+        args.repeat,
+    )
+    bench(
+        "validate_task_states",
+        lambda: validator.validate_task_states(states, objects, predicates),
+        args.repeat,
+    )
+    bench("StateIndex (build)", lambda: StateIndex(objects, predicates=predicates), args.repeat)
+    bench("StateIndex.check (prebuilt)", lambda: state_index.check(states), args.repeat)
+
+    # every 10th fact uses a mistyped object
+    invalid = [
+        dict(s, params=s["params"][::-1]) if i % 10 == 0 else s for i, s in enumerate(states)
+    ]
+    errors = state_index.check(invalid, collect_all=True)
+    print(f"\n{len(errors)} violations collected")
+    bench("StateIndex.check (collect_all)", lambda: state_index.check(invalid, collect_all=True), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -70,20 +70,20 @@ results_summary = {
 
 for task in dataset.data_dict.values():
     task_directory = RESULTS_PATH + task['name'] + "/"
-    
-    # Create task directory if it doesn't exist
-    if not os.path.exists(task_directory):
-        os.makedirs(task_directory)
-    else: # Skip if the directory already exists
-        print(f"Directory {task_directory} already exists. Skipping task {task['name']}.")
+    log_path = task_directory + task['name'] + ".log.txt"
+
+    # Skip only tasks that ran to completion (log is written last); a task whose run crashed
+    # is run again from scratch, overwriting the files it left behind
+    if os.path.exists(log_path):
+        print(f"Task {task['name']} already completed. Skipping.")
         continue
+    os.makedirs(task_directory, exist_ok=True)
     
     print(f"Running task: {task['name']}")
     domain_path = task_directory + task['name'] + ".domain.hddl"
     problem_path = task_directory + task['name'] + ".problem.hddl"
     plan_path = task_directory + task['name'] + ".plan.txt"
     response_path = task_directory + task['name'] + ".llm_response.txt"
-    log_path = task_directory + task['name'] + ".log.txt"
 
     # Extract domain and problem using the agent
     error_trace, execution_flag = agent.run(task['desc'], domain_path, problem_path, plan_path, response_path)
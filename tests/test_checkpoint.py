@@ -0,0 +1,85 @@
+import os, tempfile, unittest
+from collections import OrderedDict
+from l2p.domain_builder import DomainBuilder
+from l2p.task_builder import TaskBuilder
+from l2p.utils.checkpoint import Checkpoint
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.checkpoint = Checkpoint(root=self.tmp_dir.name, run_id="blocksworld-task1")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_save_and_load(self):
+        self.assertIsNone(self.checkpoint.load("type_extraction"))
+
+        self.checkpoint.save("type_extraction", {"types": {"block": "a block"}}, "llm")
+        self.assertTrue(self.checkpoint.has("type_extraction"))
+        self.assertEqual(
+            self.checkpoint.load("type_extraction"), {"types": {"block": "a block"}}
+        )
+        self.assertEqual(self.checkpoint.load_llm_output("type_extraction"), "llm")
+
+        # no temporary files left behind by atomic writes
+        files = os.listdir(self.checkpoint.run_dir)
+        self.assertEqual(sorted(files), ["manifest.json", "type_extraction.json"])
+
+    def test_first_incomplete(self):
+        stages = ["types", "predicates", "actions"]
+        self.assertEqual(self.checkpoint.first_incomplete(stages), "types")
+
+        self.checkpoint.save("types", {})
+        self.checkpoint.save("predicates", {})
+        self.assertEqual(self.checkpoint.first_incomplete(stages), "actions")
+
+        # re-opening the same run sees the same progress
+        resumed = Checkpoint(root=self.tmp_dir.name, run_id="blocksworld-task1")
+        self.assertEqual(resumed.completed_stages(), ["types", "predicates"])
+
+        self.checkpoint.save("actions", {})
+        self.assertIsNone(self.checkpoint.first_incomplete(stages))
+
+        self.checkpoint.clear()
+        self.assertEqual(self.checkpoint.completed_stages(), [])
+
+    def test_builders_roundtrip(self):
+        predicate = {
+            "name": "on",
+            "desc": "block ?a is on block ?b",
+            "raw": "(on ?a - block ?b - block): block ?a is on block ?b",
+            "params": OrderedDict([("?a", "block"), ("?b", "block")]),
+            "clean": "(on ?a - block ?b - block)",
+        }
+        domain_builder = DomainBuilder(
+            types={"block": "a block"}, predicates=[predicate]
+        )
+        task_builder = TaskBuilder(
+            objects={"b1": "block"},
+            initial=[{"pred_name": "clear", "params": ["b1"], "neg": False}],
+        )
+        self.checkpoint.save_builders(
+            "task_extraction", domain_builder, task_builder, llm_output="raw"
+        )
+
+        new_domain_builder, new_task_builder = DomainBuilder(), TaskBuilder()
+        self.assertTrue(
+            self.checkpoint.restore_builders(
+                "task_extraction", new_domain_builder, new_task_builder
+            )
+        )
+        self.assertEqual(new_domain_builder.get_types(), {"block": "a block"})
+        self.assertEqual(new_domain_builder.get_predicates(), [predicate])
+        self.assertIsInstance(
+            new_domain_builder.get_predicates()[0]["params"], OrderedDict
+        )
+        self.assertEqual(new_task_builder.get_objects(), {"b1": "block"})
+        self.assertEqual(new_task_builder.get_initial(), task_builder.get_initial())
+
+        self.assertFalse(self.checkpoint.restore_builders("missing", DomainBuilder()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -315,6 +315,8 @@ class TestDomainBuilder(unittest.TestCase):
             )
         )
 
+        exp_action["raw"] = self.mock_llm.output
+
         self.assertEqual(exp_action, action)
         self.assertEqual(exp_predicates, new_predicates)
         self.assertEqual(validation_info[0], True)
@@ -0,0 +1,101 @@
+import unittest, textwrap
+from collections import OrderedDict
+from l2p.task_builder import TaskBuilder
+from l2p.utils.domain_context import DomainContext
+from l2p.utils.pddl_validator import SyntaxValidator
+from .mock_llm import MockLLM
+
+
+class TestDomainContext(unittest.TestCase):
+    def setUp(self):
+        self.task_builder = TaskBuilder()
+        self.syntax_validator = SyntaxValidator()
+        self.mock_llm = MockLLM()
+
+        self.types = [
+            {
+                "object": "root type",
+                "children": [
+                    {
+                        "vehicle": "a vehicle",
+                        "children": [{"car": "a car", "children": []}],
+                    },
+                    {"location": "a location", "children": []},
+                ],
+            }
+        ]
+        self.predicates = [
+            {
+                "name": "at",
+                "desc": "true if vehicle is at location",
+                "raw": "(at ?v - vehicle ?l - location): true if vehicle is at location",
+                "params": OrderedDict([("?v", "vehicle"), ("?l", "location")]),
+                "clean": "(at ?v - vehicle ?l - location)",
+            }
+        ]
+
+    def test_from_domain(self):
+        ctx = DomainContext.from_domain(types=self.types, predicates=self.predicates)
+
+        self.assertIn("(at ?v - vehicle ?l - location)", ctx.predicates_str)
+        self.assertEqual(ctx.constants_str, "No constants provided.")
+        self.assertEqual(ctx.functions_str, "No functions provided.")
+        self.assertIs(ctx.predicate_index["at"], ctx.predicates[0])
+
+        self.assertTrue(ctx.is_subtype("car", "object"))
+        self.assertTrue(ctx.is_subtype("car", "car"))
+        self.assertFalse(ctx.is_subtype("location", "vehicle"))
+        self.assertEqual(
+            sorted(ctx.type_names()), ["car", "location", "object", "vehicle"]
+        )
+
+        # context is isolated from later changes to the domain
+        self.predicates[0]["name"] = "located"
+        self.assertEqual(ctx.predicates[0]["name"], "at")
+        with self.assertRaises(AttributeError):
+            ctx.types_str = ""
+
+    def test_formalize_task_with_context(self):
+        self.syntax_validator.headers = ["OBJECTS", "INITIAL", "GOAL"]
+        self.syntax_validator.error_types = [
+            "validate_header",
+            "validate_task_objects",
+            "validate_task_states",
+        ]
+        self.mock_llm.output = textwrap.dedent(
+            """
+            ### OBJECTS
+            ```
+            v1 - vehicle
+            l1 - location
+            l2 - location
+            ```
+
+            ### INITIAL
+            ```
+            (at v1 l1)
+            ```
+
+            ### GOAL
+            ```
+            (at v1 l3)
+            ```
+            """
+        )
+        ctx = DomainContext.from_domain(types=self.types, predicates=self.predicates)
+
+        objects, initial, goal, _, validation_info = self.task_builder.formalize_task(
+            model=self.mock_llm,
+            problem_desc="",
+            prompt_template="{types}\n{predicates}",
+            domain_context=ctx,
+            syntax_validator=self.syntax_validator,
+        )
+
+        self.assertEqual(len(objects), 3)
+        self.assertFalse(validation_info[0])
+        self.assertIn("l3", validation_info[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
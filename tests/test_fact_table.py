@@ -0,0 +1,104 @@
+import os, tempfile, unittest
+from l2p.task_builder import TaskBuilder
+from l2p.utils.checkpoint import Checkpoint
+from l2p.utils.fact_table import FactTable, SymbolTable
+from l2p.utils.pddl_format import format_goal, format_initial
+
+
+class TestFactTable(unittest.TestCase):
+    def setUp(self):
+        self.initial = [
+            {"pred_name": "on", "params": ["a", "b"], "neg": False},
+            {"pred_name": "clear", "params": ["a"], "neg": False},
+            {"pred_name": "holding", "params": ["b"], "neg": True},
+            {"func_name": "weight", "params": ["a"], "value": "3", "op": "="},
+            {"pred_name": "on", "params": ["a", "b"], "neg": False},
+            {"pred_name": "handempty", "params": [], "neg": False},
+        ]
+        self.goal = [
+            {"pred_name": "on", "params": ["b", "a"], "neg": False},
+            {"pred_name": "clear", "params": ["a"], "neg": False},
+        ]
+
+    def test_round_trip(self):
+        table = FactTable(self.initial)
+
+        self.assertEqual(len(table), 6)
+        self.assertEqual(table.to_states(), self.initial)
+        self.assertEqual(table[2], self.initial[2])
+        self.assertEqual(table[-1], self.initial[-1])
+        self.assertEqual(table, self.initial)
+        with self.assertRaises(IndexError):
+            table[6]
+
+        self.assertEqual(format_initial(table), format_initial(self.initial))
+        self.assertEqual(format_goal(FactTable(self.goal)), format_goal(self.goal))
+
+    def test_membership_and_dedupe(self):
+        table = FactTable(self.initial)
+
+        self.assertIn({"pred_name": "clear", "params": ["a"], "neg": False}, table)
+        self.assertNotIn({"pred_name": "clear", "params": ["a"], "neg": True}, table)
+        self.assertNotIn({"pred_name": "clear", "params": ["z"], "neg": False}, table)
+        self.assertIn(
+            {"func_name": "weight", "params": ["a"], "value": "3", "op": "="}, table
+        )
+
+        deduped = table.dedupe()
+        self.assertEqual(len(deduped), 5)
+        self.assertEqual(deduped.to_states(), self.initial[:4] + self.initial[5:])
+
+        removed = table.remove(self.initial[0])
+        self.assertEqual(len(removed), 4)
+        self.assertNotIn(self.initial[0], removed)
+
+    def test_set_operations(self):
+        symbols = SymbolTable()
+        initial = FactTable(self.initial, symbols=symbols)
+        goal = FactTable(self.goal, symbols=symbols)
+
+        self.assertEqual((goal - initial).to_states(), self.goal[:1])
+        self.assertEqual((goal & initial).to_states(), self.goal[1:])
+        self.assertEqual(len(initial | goal), 6)
+        self.assertFalse(goal.issubset(initial))
+        self.assertTrue((goal & initial).issubset(initial))
+
+        # tables with different symbol tables and plain state lists
+        other = FactTable(self.goal)
+        self.assertEqual((initial & other).to_states(), self.goal[1:])
+        self.assertEqual((initial & self.goal).to_states(), self.goal[1:])
+
+        added, removed = initial.diff(self.initial[1:3] + self.goal[:1])
+        self.assertEqual(added.to_states(), self.goal[:1])
+        self.assertEqual(
+            removed.to_states(), [self.initial[0], self.initial[3], self.initial[5]]
+        )
+
+    def test_task_builder(self):
+        task_builder = TaskBuilder()
+        task_builder.set_initial(FactTable(self.initial))
+        task_builder.set_goal(FactTable(self.goal))
+        self.assertIsInstance(task_builder.get_initial(), FactTable)
+
+        task_builder.delete_initial_state(self.initial[1])
+        self.assertEqual(len(task_builder.get_initial()), 5)
+
+        problem = task_builder.generate_task(
+            "blocksworld", "p1", {"a": "block", "b": "block"},
+            task_builder.get_initial(), task_builder.get_goal(),
+        )
+        self.assertIn("(not (holding b))", problem)
+        self.assertIn("(= (weight a) 3)", problem)
+        self.assertNotIn("(clear a)\n", problem.split(":goal")[0])
+
+        with tempfile.TemporaryDirectory() as root:
+            checkpoint = Checkpoint(root=root, run_id="run")
+            checkpoint.save_builders("task", task_builder=task_builder)
+            restored = TaskBuilder()
+            checkpoint.restore_builders("task", task_builder=restored)
+            self.assertEqual(restored.get_goal(), self.goal)
+            self.assertTrue(os.path.exists(os.path.join(root, "run", "task.json")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import unittest
+from collections import OrderedDict
+from .mock_llm import MockLLM
+from l2p.feedback_builder import FeedbackBuilder
+
+
+def predicate(name: str, **params) -> dict:
+    params = OrderedDict((f"?{k}", v) for k, v in params.items())
+    clean = f"({name} {' '.join(f'{k} - {v}' for k, v in params.items())})"
+    return {"name": name, "desc": "", "raw": clean, "params": params, "clean": clean}
+
+
+class TestFeedbackBuilder(unittest.TestCase):
+    def setUp(self):
+        self.llm = MockLLM()
+        self.llm.output = "### JUDGMENT\n```\nno feedback\n```"
+        self.types = {"block": "a block", "table": "a table"}
+        self.predicates = [predicate("clear", b="block"), predicate("on", a="block", b="block")]
+        self.action = {
+            "name": "stack",
+            "raw": "",
+            "params": OrderedDict([("?a", "block"), ("?b", "block")]),
+            "preconditions": "(and (clear ?a) (clear ?b))",
+            "effects": "(and (on ?a ?b) (not (clear ?b)))",
+        }
+
+    def test_precheck_disabled(self):
+        builder = FeedbackBuilder()
+        no_fb, _ = builder.type_feedback(
+            model=self.llm, domain_desc="", feedback_template="", types=self.types
+        )
+        self.assertTrue(no_fb)
+        self.assertEqual(builder.get_stats()["queries"], 1)
+
+    def test_precheck_types(self):
+        builder = FeedbackBuilder(precheck=True)
+        issues = builder.precheck_types(self.types, self.predicates, [self.action])
+        self.assertEqual(len(issues), 1)
+        self.assertIn("table", issues[0])
+
+        no_fb, fb_msg = builder.type_feedback(
+            model=self.llm,
+            domain_desc="",
+            feedback_template="",
+            types=self.types,
+            predicates=self.predicates,
+            actions=[self.action],
+        )
+        self.assertFalse(no_fb)
+        self.assertIn("table", fb_msg)
+        self.assertEqual(builder.get_stats()["queries"], 0)
+        self.assertEqual(builder.get_stats()["shortcut"], 1)
+
+    def test_precheck_action(self):
+        builder = FeedbackBuilder(precheck=True)
+        self.assertEqual(
+            builder.precheck_action(self.action, self.types, self.predicates, []), []
+        )
+
+        # clean output is accepted without querying the LLM
+        no_fb, _ = builder.pddl_action_feedback(
+            model=self.llm,
+            domain_desc="",
+            feedback_template="",
+            action=self.action,
+            types=self.types,
+            predicates=self.predicates,
+        )
+        self.assertTrue(no_fb)
+
+        # undefined predicate and empty effects are reported
+        action = dict(self.action, preconditions="(and (holding ?a))", effects="(and)")
+        issues = builder.precheck_action(action, self.types, self.predicates, [])
+        self.assertEqual(len(issues), 2)
+
+        stats = builder.get_stats()
+        self.assertEqual((stats["queries"], stats["skipped"]), (0, 1))
+        self.assertEqual(stats["skip_rate"], 1.0)
+
+    def test_precheck_task(self):
+        builder = FeedbackBuilder(precheck=True, skip_clean=False)
+        objects = {"b1": "block", "b2": "block", "b3": "block"}
+        initial = [{"pred_name": "clear", "params": ["b1"], "neg": False}]
+        goal = [{"pred_name": "on", "params": ["b1", "b2"], "neg": False}]
+
+        issues = builder.precheck_task(
+            objects, initial, goal, self.types, self.predicates, []
+        )
+        self.assertEqual(len(issues), 1)
+        self.assertIn("b3", issues[0])
+
+        # with skip_clean disabled, outputs passing all checks are still sent to the LLM
+        objects.pop("b3")
+        no_fb, _ = builder.task_feedback(
+            model=self.llm,
+            problem_desc="",
+            feedback_template="",
+            objects=objects,
+            initial=initial,
+            goal=goal,
+            types=self.types,
+            predicates=self.predicates,
+        )
+        self.assertTrue(no_fb)
+        self.assertEqual(builder.get_stats()["queries"], 1)
+
+    def test_precheck_error(self):
+        # a check that cannot process its input does not pass: the LLM is queried instead
+        builder = FeedbackBuilder(precheck=True)
+
+        def crash(*args):
+            raise ValueError("cannot parse types")
+
+        builder.syntax_validator.validate_format_types = crash
+        with self.assertRaises(ValueError):
+            builder.precheck_types(self.types)
+
+        self.llm.output = "### JUDGMENT\n```\nrename `table`\n```"
+        no_fb, fb_msg = builder.type_feedback(
+            model=self.llm, domain_desc="", feedback_template="", types=self.types
+        )
+        self.assertFalse(no_fb)
+        self.assertIn("rename", fb_msg)
+        self.assertEqual(builder.get_stats()["queries"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
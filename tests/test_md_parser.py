@@ -0,0 +1,65 @@
+import unittest
+from l2p.utils.md_parser import (
+    SectionIndex,
+    extract_bracket_block,
+    extract_section_by_name,
+    get_section,
+    split_sections,
+)
+from l2p.utils.pddl_parser import parse_heading
+
+
+class TestSectionIndex(unittest.TestCase):
+    def setUp(self):
+        self.response = (
+            "[ROLE]\nYou are a planner.\n[TASK]\nBuild the domain.\n\n"
+            "# TASKS\n## OUTPUT\n```\ndeliver\n```\n"
+            "# deliver\n## method_1\n```\n(:method m1)\n```\n## method_2\n```\n(:method m2)\n```\n"
+            "# ACTIONS\n## drive\nmove a truck\n## fly\nmove a plane\n"
+            "### INITIAL\n```\n(at t1 l1)\n```\n### GOAL\n```\n(at t1 l2)\n```"
+        )
+
+    def test_sections(self):
+        self.assertEqual(
+            extract_section_by_name(self.response, "TASKS"), "## OUTPUT\n```\ndeliver\n```"
+        )
+        self.assertEqual(
+            extract_section_by_name(
+                extract_section_by_name(self.response, "TASKS"), "OUTPUT", level=2
+            ),
+            "```\ndeliver\n```",
+        )
+        self.assertEqual(extract_section_by_name(self.response, "missing"), "")
+        self.assertEqual(
+            split_sections(extract_section_by_name(self.response, "ACTIONS"), level=2),
+            ["drive\nmove a truck", "fly\nmove a plane\n### INITIAL\n```\n(at t1 l1)\n```\n### GOAL\n```\n(at t1 l2)\n```"],
+        )
+
+    def test_headings_and_blocks(self):
+        self.assertEqual(parse_heading(self.response, "INITIAL"), "```\n(at t1 l1)\n```")
+        self.assertEqual(get_section(self.response, "GOAL"), "```\n(at t1 l2)\n```")
+        with self.assertRaises(ValueError):
+            parse_heading(self.response, "OBJECTS")
+
+        self.assertEqual(extract_bracket_block(self.response, "role"), "You are a planner.")
+        self.assertTrue(extract_bracket_block(self.response, "TASK").startswith("Build the domain."))
+        self.assertEqual(extract_bracket_block(self.response, "TEMPLATE"), "")
+
+        self.assertIs(SectionIndex.of(self.response), SectionIndex.of(self.response))
+
+    def test_legacy_quirks(self):
+        # the line right below a heading never closes its section
+        self.assertEqual(extract_section_by_name("# A\n# A\n# B", "A"), "# A")
+        # a heading followed by no line break is not a section
+        self.assertEqual(extract_section_by_name("text\n# A", "A"), "")
+        # `parse_heading` stops at the next occurrence of the heading
+        self.assertEqual(parse_heading("### A\nx A y\n### B", "A"), "x")
+        # ... even inside a longer heading, as `split(heading)` did
+        for text in ("## A\nx\n### A\ny\n### AA\nz", "## A\nx\n### B\ny", "## A x ## A"):
+            self.assertEqual(
+                parse_heading(text, "## A"), text.split("## A")[1].split("\n### ")[0].strip()
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
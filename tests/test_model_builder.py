@@ -0,0 +1,145 @@
+import unittest, textwrap
+from unittest.mock import patch
+from l2p.model_builder import ModelBuilder
+from l2p.utils.pddl_parser import load_file
+from .mock_llm import MockLLM
+
+SKELETON = textwrap.dedent(
+    """
+    # TYPES
+    The only type needed is a block.
+
+    ## OUTPUT
+    {"block": "a block", "children": []}
+
+    # PREDICATES
+    ## OUTPUT
+    - (clear ?b - block): 'nothing is on top of the block'
+    - (holding ?b - block): 'the block is held'
+    """
+)
+
+ACTIONS = textwrap.dedent(
+    """
+    # ACTIONS
+    ## pickup
+    ### Action Parameters
+    - ?b - block: 'the block to pick up'
+
+    ### Action Preconditions
+    ```
+    (and
+        (clear ?b)
+    )
+    ```
+
+    ### Action Effects
+    ```
+    (and
+        (holding ?b)
+    )
+    ```
+    """
+)
+
+PROBLEM = textwrap.dedent(
+    """
+    # OBJECTS
+    ## OUTPUT
+    b1 - block
+
+    # INITIAL
+    ## OUTPUT
+    ```
+    (clear b1): b1 is clear
+    ```
+
+    # GOAL
+    ## OUTPUT
+    ```
+    (and
+       (holding b1) ; b1 is held
+    )
+    ```
+    """
+)
+
+
+class SectionLLM(MockLLM):
+    """Answers each split-mode prompt with the requested sections only"""
+
+    def __init__(self, broken_actions: int = 0):
+        super().__init__()
+        self.broken_actions = broken_actions
+        self.prompts = []
+
+    def query(self, prompt: str):
+        self.prompts.append(prompt)
+        requested = prompt.split("Only define the following sections: ")[1].split(".")[0]
+        if requested.startswith("TYPES"):
+            return SKELETON
+        if requested == "ACTIONS":
+            if self.broken_actions:
+                self.broken_actions -= 1
+                return "# ACTIONS\n## pickup\nno sections"
+            return ACTIONS
+        return PROBLEM
+
+
+class TestModelBuilder(unittest.TestCase):
+    def setUp(self):
+        self.model_builder = ModelBuilder("blocks", "blocks-1")
+        self.prompt = load_file("templates/model_templates/extract_pddl_model.txt")
+
+    def check_model(self):
+        self.assertEqual(self.model_builder.types_hierarchy, [{"block": "a block", "children": []}])
+        self.assertEqual([p["name"] for p in self.model_builder.predicates], ["clear", "holding"])
+        self.assertEqual(self.model_builder.actions[0]["name"], "pickup")
+        self.assertEqual(self.model_builder.objects, {"b1": "block"})
+        self.assertEqual(self.model_builder.initial[0]["params"], ["b1"])
+        self.assertEqual(self.model_builder.goal[0]["pred_name"], "holding")
+
+    def test_extract_domain_and_problem(self):
+        mock_llm = MockLLM()
+        mock_llm.output = SKELETON + ACTIONS + PROBLEM
+
+        self.model_builder.extract_domain_and_problem(
+            model=mock_llm, task_desc="Pick up b1.", prompt_template=self.prompt
+        )
+        self.check_model()
+
+    def test_extract_domain_and_problem_split(self):
+        mock_llm = SectionLLM()
+
+        llm_response = self.model_builder.extract_domain_and_problem(
+            model=mock_llm, task_desc="Pick up b1.", prompt_template=self.prompt, split=True
+        )
+        self.check_model()
+        self.assertEqual(len(mock_llm.prompts), 3)
+        self.assertIn("# ACTIONS", llm_response)
+
+        # fan-out prompts only contain their own section formats plus the skeleton
+        actions_prompt = next(p for p in mock_llm.prompts if "sections: ACTIONS." in p)
+        self.assertIn("Pick up b1.", actions_prompt)
+        self.assertIn("[CONTEXT]", actions_prompt)
+        self.assertIn("(clear ?b - block)", actions_prompt)
+        self.assertNotIn("# OBJECTS", actions_prompt)
+
+    @patch("l2p.model_builder.time.sleep")
+    def test_split_retries_failing_section_only(self, _):
+        mock_llm = SectionLLM(broken_actions=1)
+
+        self.model_builder.extract_domain_and_problem(
+            model=mock_llm,
+            task_desc="Pick up b1.",
+            prompt_template=self.prompt,
+            split=True,
+            max_retries=2,
+        )
+        self.check_model()
+        # skeleton and problem are queried once, actions twice
+        self.assertEqual(len(mock_llm.prompts), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+from collections import OrderedDict
+from l2p.domain_builder import DomainBuilder
+from l2p.task_builder import TaskBuilder
+from l2p.utils.fact_table import FactTable
+from l2p.utils.named_collection import NamedCollection, state_key
+
+
+def action(name: str, preconditions: str, effects: str) -> dict:
+    return {
+        "name": name,
+        "params": OrderedDict([("?b", "block")]),
+        "preconditions": preconditions,
+        "effects": effects,
+    }
+
+
+class TestNamedCollection(unittest.TestCase):
+    def setUp(self):
+        self.items = [{"name": "clear", "v": 1}, {"name": "on", "v": 1}, {"name": "holding", "v": 1}]
+
+    def test_collection(self):
+        collection = NamedCollection(self.items)
+        self.assertEqual(collection, self.items)
+        self.assertEqual(collection[1], self.items[1])
+        self.assertEqual(collection[-2:], self.items[-2:])  # slices are lists
+        self.assertIn(self.items[0], collection)
+        self.assertNotIn({"name": "clear", "v": 2}, collection)
+        self.assertEqual(collection + [{"name": "x"}], self.items + [{"name": "x"}])
+
+        # replacing keeps the position, popping is by key
+        previous = collection.add({"name": "on", "v": 2})
+        self.assertEqual(previous, self.items[1])
+        self.assertEqual([i["v"] for i in collection], [1, 2, 1])
+        self.assertEqual(collection.pop("clear")["name"], "clear")
+        self.assertIsNone(collection.pop("clear", None))
+        self.assertEqual(list(collection.keys()), ["on", "holding"])
+
+        with self.assertRaises(ValueError):
+            collection.remove({"name": "missing"})
+
+    def test_versions(self):
+        collection = NamedCollection(self.items, journal_size=4)
+        version = collection.version
+        snapshot = collection.snapshot()
+        self.assertIs(collection.snapshot(), snapshot)
+        self.assertEqual(collection.changed_keys(version), set())
+
+        collection.add({"name": "at"})
+        collection.pop("on")
+        self.assertEqual(collection.changed_keys(version), {"at", "on"})
+        self.assertIsNot(collection.snapshot(), snapshot)
+
+        # the journal no longer reaches back: callers must rebuild
+        for i in range(4):
+            collection.add({"name": f"p{i}"})
+        self.assertIsNone(collection.changed_keys(version))
+
+        states = NamedCollection(
+            [{"pred_name": "on", "params": ["a", "b"], "neg": False}] * 2, key=state_key
+        )
+        self.assertEqual(len(states), 1)
+        self.assertIs(NamedCollection.of(states, key=state_key), states)
+
+    def test_domain_builder(self):
+        domain_builder = DomainBuilder(
+            predicates=[{"name": "clear", "params": OrderedDict([("?b", "block")])}],
+            pddl_actions=[action("pick-up", "(clear ?b)", "(holding ?b)")],
+        )
+        predicates = domain_builder.get_predicates()
+        self.assertIsInstance(predicates, list)
+        self.assertEqual(domain_builder.predicates[:1] + predicates, predicates * 2)
+
+        index = domain_builder.get_usage_index()
+        domain_builder.set_pddl_action(action("pick-up", "(clear ?b)", "(on ?b)"))
+        domain_builder.set_pddl_action(action("stack", "(holding ?b)", "(clear ?b)"))
+        self.assertIs(domain_builder.get_usage_index(), index)  # updated, not rebuilt
+        self.assertEqual(len(domain_builder.get_pddl_actions()), 2)
+        self.assertEqual(index.actions_using("holding"), {"stack"})
+
+        domain_builder.delete_pddl_action("stack")
+        domain_builder.delete_predicate("clear")
+        self.assertFalse(domain_builder.get_usage_index().is_used("holding"))
+        self.assertEqual(domain_builder.get_predicates(), [])
+
+    def test_task_builder(self):
+        state = {"pred_name": "on", "params": ["a", "b"], "neg": False}
+        objects = {"a": "block", "b": "block"}
+        task_builder = TaskBuilder(objects=objects, initial=[state, dict(state, neg=True)])
+
+        task_builder.delete_initial_state(dict(state))
+        task_builder.delete_objects("a")
+        self.assertEqual(task_builder.get_initial(), [dict(state, neg=True)])
+        self.assertEqual(task_builder.get_objects(), {"b": "block"})
+        self.assertEqual(objects, {"a": "block", "b": "block"})  # caller's dict is untouched
+
+        task_builder.set_goal(FactTable([state]))
+        self.assertIsInstance(task_builder.get_goal(), FactTable)
+
+
+if __name__ == "__main__":
+    unittest.main()
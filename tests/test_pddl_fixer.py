@@ -0,0 +1,85 @@
+import unittest, textwrap
+from collections import OrderedDict
+from l2p.utils.pddl_fixer import *
+from l2p.utils.pddl_parser import parse_action
+
+
+class TestPDDLFixer(unittest.TestCase):
+    def test_fix_expression(self):
+        expr, changes = fix_expression("(AND (clear ?b) (NOT (on ?a ?b))))")
+        self.assertEqual(expr, "(and (clear ?b) (not (on ?a ?b)))")
+        self.assertEqual(len(changes), 2)
+
+        expr, changes = fix_expression("(and (clear `?b`) ; comment (\n    (on ?a ?b)")
+        self.assertEqual(expr, "(and (clear ?b) ; comment (\n    (on ?a ?b))")
+        self.assertEqual(len(changes), 2)
+
+        # valid expressions are untouched
+        expr, changes = fix_expression("(and (clear ?b))")
+        self.assertEqual(expr, "(and (clear ?b))")
+        self.assertEqual(changes, [])
+
+    def test_fix_action_output(self):
+        llm_output = textwrap.dedent(
+            """
+            ### Action Parameters
+            ```
+            - b - block: The block being picked up
+            - ?a - arm: The arm picking up the block
+            ```
+
+            ### Action Preconditions
+            ```
+            (AND (clear b) (empty ?a))
+            ```
+
+            ### Action Effects
+            ```
+            (and (holding ?a b) (not (clear b)
+            ```
+            """
+        )
+
+        fixed, changes = fix_action_output(llm_output)
+        action = parse_action(fixed, "pickup")
+
+        self.assertEqual(action["params"], OrderedDict([("?b", "block"), ("?a", "arm")]))
+        self.assertEqual(action["preconditions"], "(and (clear ?b) (empty ?a))")
+        self.assertEqual(action["effects"], "(and (holding ?a ?b) (not (clear ?b)))")
+        self.assertEqual(len(changes), 3)
+
+        # only `- name - type` lines declare parameters, other lines are left alone
+        llm_output = "### Action Parameters\n```\n- ?b - block\nNote: b is clear\n```\n\n### Action Effects\n```\n(not (Note ?b))\n```"
+        self.assertEqual(fix_action_output(llm_output), (llm_output, []))
+
+    def test_fix_task_output(self):
+        llm_output = textwrap.dedent(
+            """
+            ### OBJECTS
+            ```
+            c1 - car
+            ```
+
+            ### INITIAL
+            ```
+            (at c1 - car l1 - location) ; car c1 - car
+            ```
+
+            ### GOAL
+            ```
+            (at c1 l2)
+            ```
+            """
+        )
+        fixed, changes = fix_task_output(llm_output)
+        self.assertIn("(at c1 l1) ; car c1 - car", fixed)
+        self.assertEqual(changes, ["[INITIAL] Removed type annotation(s) from states."])
+
+    def test_fix_objects(self):
+        objects, changes = fix_objects({"?b1": "block", "`b2`": "block"})
+        self.assertEqual(objects, {"b1": "block", "b2": "block"})
+        self.assertEqual(len(changes), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
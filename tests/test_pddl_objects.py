@@ -0,0 +1,95 @@
+import copy
+import json
+import os
+import pickle
+import tempfile
+import unittest
+from collections import OrderedDict
+from l2p.utils.checkpoint import _atomic_write_json
+from l2p.utils.domain_context import DomainContext
+from l2p.utils.pddl_format import format_expression
+from l2p.utils.pddl_objects import (
+    FrozenAction,
+    FrozenHDDLMethod,
+    FrozenHPDLTask,
+    FrozenPredicate,
+    Params,
+    freeze_all,
+    thaw_all,
+)
+
+
+def predicate(name: str, *types: str) -> dict:
+    params = OrderedDict((f"?x{i}", t) for i, t in enumerate(types))
+    clean = f"({name} {' '.join(f'{p} - {t}' for p, t in params.items())})"
+    return {"name": name, "desc": f"{name} desc", "raw": f"{clean}: {name} desc", "params": params, "clean": clean}
+
+
+class TestPddlObjects(unittest.TestCase):
+    def test_dict_interface(self):
+        source = predicate("on", "block", "block")
+        frozen = FrozenPredicate.of(source)
+
+        self.assertEqual(frozen, source)
+        self.assertEqual(source, frozen)
+        self.assertEqual(frozen["clean"], source["clean"])
+        self.assertEqual(list(frozen["params"].items()), list(source["params"].items()))
+        self.assertEqual(frozen.get("missing", 1), 1)
+        self.assertEqual(frozen.to_dict(), source)
+        self.assertIsInstance(frozen.to_dict()["params"], OrderedDict)
+        self.assertEqual(format_expression([frozen]), format_expression([source]))
+
+        # order matters between parameter lists, as between OrderedDicts
+        self.assertNotEqual(Params([("?b", "x"), ("?a", "x")]), OrderedDict([("?a", "x"), ("?b", "x")]))
+
+        # keys outside the schema and absent keys are kept as in the source dictionary
+        action = FrozenAction({"name": "stack", "params": {}, "effects": "(on ?a ?b)", "order": 2})
+        self.assertEqual(sorted(action), ["effects", "name", "order", "params"])
+        self.assertNotIn("preconditions", action)
+
+        task = FrozenHPDLTask(name="deliver", params={}, methods=[{"name": "m", "task": "deliver"}])
+        self.assertEqual(task.to_dict()["methods"], [{"name": "m", "task": "deliver"}])
+
+        # list/dictionary values are hashed by value
+        method = FrozenHDDLMethod(name="m", params={}, ordered_subtasks=["(a)"], notes={"k": [1]})
+        same = FrozenHDDLMethod(name="m", params={}, ordered_subtasks=["(a)"], notes={"k": [1]})
+        self.assertEqual(hash(method), hash(same))
+        self.assertEqual(len({method, same, action}), 2)
+
+    def test_immutable_sharing(self):
+        frozen = FrozenPredicate(predicate("clear", "block"))
+        with self.assertRaises(AttributeError):
+            frozen.name = "other"
+        with self.assertRaises(TypeError):
+            frozen["name"] = "other"
+
+        self.assertIs(FrozenPredicate(predicate("holding", "block"))["params"], frozen["params"])
+        self.assertIs(copy.deepcopy(frozen), frozen)
+        self.assertEqual(pickle.loads(pickle.dumps(frozen)), frozen)
+
+        # replace shares the unchanged fields and keeps an explicit signature
+        renamed = frozen.replace(desc="no block on top")
+        self.assertIs(renamed.params, frozen.params)
+        self.assertEqual(renamed["clean"], frozen["clean"])
+
+        snapshot = freeze_all([frozen, predicate("on", "block", "block")])
+        self.assertIs(snapshot[0], frozen)
+        self.assertIs(freeze_all(snapshot), snapshot)
+        self.assertEqual(thaw_all(snapshot)[1], predicate("on", "block", "block"))
+
+    def test_domain_context(self):
+        predicates = [predicate("on", "block", "block")]
+        ctx = DomainContext.from_domain(types={"block": "a block"}, predicates=predicates)
+        self.assertIsInstance(ctx.predicates[0], FrozenPredicate)
+        predicates[0]["params"]["?x0"] = "table"  # later edits do not leak into the context
+        self.assertEqual(ctx.predicate_index["on"]["params"]["?x0"], "block")
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "snapshot.json")
+            _atomic_write_json(path, {"predicates": ctx.predicates})
+            with open(path) as f:
+                self.assertEqual(json.load(f)["predicates"][0]["clean"], "(on ?x0 - block ?x1 - block)")
+
+
+if __name__ == "__main__":
+    unittest.main()
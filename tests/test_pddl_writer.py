@@ -0,0 +1,77 @@
+import io, unittest
+from l2p.task_builder import TaskBuilder
+from l2p.utils.fact_table import FactTable
+from l2p.utils.pddl_format import iter_objects
+from l2p.utils.pddl_writer import write_task
+
+
+class RecordingFile:
+    """File-like object recording every write"""
+
+    def __init__(self):
+        self.writes = []
+
+    def write(self, data: str):
+        self.writes.append(data)
+
+
+class TestPddlWriter(unittest.TestCase):
+    def setUp(self):
+        self.objects = {"b1": "block", "a1": "arm", "b2": "block", "t": ""}
+        self.initial = [
+            {"pred_name": "on", "params": ["b1", "b2"], "neg": False},
+            {"pred_name": "empty", "params": ["a1"], "neg": True},
+        ]
+        self.goal = [{"pred_name": "on", "params": ["b2", "b1"], "neg": False}]
+
+    def test_matches_generate_task(self):
+        buffer = io.StringIO()
+        size = write_task(
+            buffer, "blocksworld", "p1", self.objects, self.initial, self.goal,
+            group_objects=False,
+        )
+
+        expected = TaskBuilder().generate_task(
+            "blocksworld", "p1", self.objects, self.initial, self.goal
+        )
+        self.assertEqual(buffer.getvalue(), expected)
+        self.assertEqual(size, len(expected))
+
+    def test_group_objects(self):
+        self.assertEqual(
+            list(iter_objects(self.objects, group=True)), ["b1 b2 - block", "a1 - arm", "t"]
+        )
+
+        # generators are grouped by consecutive runs, split at `names_per_line`
+        pairs = [("b1", "block"), ("b2", "block"), ("b3", "block"), ("a1", "arm"), ("b4", "block")]
+        self.assertEqual(
+            list(iter_objects(iter(pairs), group=True, names_per_line=2)),
+            ["b1 b2 - block", "b3 - block", "a1 - arm", "b4 - block"],
+        )
+
+        buffer = io.StringIO()
+        write_task(buffer, "blocksworld", "p1", self.objects, self.initial, self.goal)
+        self.assertIn("      b1 b2 - block\n      a1 - arm\n      t\n", buffer.getvalue())
+
+    def test_streaming(self):
+        n = 5000
+        objects = ((f"pkg{i}", "package") for i in range(n))
+        initial = FactTable(
+            {"pred_name": "at", "params": [f"pkg{i}", "depot"], "neg": False} for i in range(n)
+        )
+        goal = ({"pred_name": "delivered", "params": [f"pkg{i}"], "neg": False} for i in range(n))
+
+        file = RecordingFile()
+        size = write_task(file, "logistics", "p1", objects, initial, goal, buffer_size=4096)
+        problem = "".join(file.writes)
+
+        self.assertGreater(len(file.writes), 10)
+        self.assertTrue(all(len(w) < 4096 + 100 for w in file.writes))
+        self.assertEqual(size, len(problem))
+        self.assertEqual(problem.count("(at pkg"), n)
+        self.assertEqual(problem.count(" - package"), n // 16 + 1)
+        self.assertTrue(problem.endswith("(delivered pkg4999)\n      )\n   )\n)"))
+
+
+if __name__ == "__main__":
+    unittest.main()
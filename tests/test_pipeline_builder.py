@@ -0,0 +1,145 @@
+import threading, time, unittest
+from l2p.pipeline_builder import PipelineBuilder, Speculator
+
+
+class TestPipelineBuilder(unittest.TestCase):
+    def setUp(self):
+        self.pipeline = PipelineBuilder(max_workers=4, llm_concurrency=2)
+
+    def test_run_dependencies(self):
+        self.pipeline.add_node("types", lambda desc: ["block"], inputs=["desc"])
+        self.pipeline.add_node(
+            "predicates", lambda types: [f"(on ?x - {types[0]})"], inputs=["types"]
+        )
+        self.pipeline.add_node(
+            "objects", lambda types: {"b1": types[0]}, inputs=["types"]
+        )
+        self.pipeline.add_node(
+            "task",
+            lambda predicates, objects: (len(predicates), len(objects)),
+            inputs=["predicates", "objects"],
+            outputs=["num_predicates", "num_objects"],
+        )
+
+        values = self.pipeline.run({"desc": "blocksworld"})
+
+        self.assertEqual(values["types"], ["block"])
+        self.assertEqual(values["predicates"], ["(on ?x - block)"])
+        self.assertEqual(values["num_predicates"], 1)
+        self.assertEqual(values["num_objects"], 1)
+        self.assertEqual(
+            set(self.pipeline.get_timings()), {"types", "predicates", "objects", "task"}
+        )
+
+    def test_independent_nodes_run_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def wait_for_sibling():
+            barrier.wait()  # deadlocks (and times out) if nodes run serially
+            return True
+
+        self.pipeline.add_node("initial", wait_for_sibling)
+        self.pipeline.add_node("goal", wait_for_sibling)
+
+        values = self.pipeline.run()
+        self.assertTrue(values["initial"] and values["goal"])
+
+    def test_llm_concurrency_budget(self):
+        pipeline = PipelineBuilder(max_workers=4, llm_concurrency=1)
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def llm_call():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+
+        for name in ["a", "b", "c"]:
+            pipeline.add_node(name, llm_call)
+        pipeline.run()
+
+        self.assertEqual(peak[0], 1)
+
+    def test_cache(self):
+        calls = []
+        self.pipeline.add_node(
+            "types", lambda desc: calls.append(desc) or ["block"], inputs=["desc"]
+        )
+
+        self.pipeline.run({"desc": "blocksworld"})
+        self.pipeline.run({"desc": "blocksworld"})
+        self.assertEqual(calls, ["blocksworld"])
+        self.assertTrue(self.pipeline.get_results()["types"].cached)
+
+        self.pipeline.run({"desc": "logistics"})
+        self.assertEqual(calls, ["blocksworld", "logistics"])
+
+    def test_invalid_graph(self):
+        self.pipeline.add_node("a", lambda b: b, inputs=["b"])
+        self.pipeline.add_node("b", lambda a: a, inputs=["a"])
+        with self.assertRaises(ValueError):
+            self.pipeline.run()
+
+        pipeline = PipelineBuilder()
+        pipeline.add_node("a", lambda missing: missing, inputs=["missing"])
+        with self.assertRaises(ValueError):
+            pipeline.run()
+
+    def test_node_failure(self):
+        def fail():
+            raise ValueError("bad output")
+
+        self.pipeline.add_node("a", fail)
+        with self.assertRaises(RuntimeError):
+            self.pipeline.run()
+
+
+
+class TestSpeculator(unittest.TestCase):
+    def setUp(self):
+        self.speculator = Speculator()
+        self.started = threading.Event()
+
+    def tearDown(self):
+        self.speculator.shutdown()
+
+    def next_stage(self, types):
+        self.started.set()
+        return [f"{t}s" for t in types]
+
+    def test_speculation_committed(self):
+        self.speculator.prepare(self.next_stage)
+
+        def feedback():
+            # next stage runs while feedback is pending
+            self.assertTrue(self.started.wait(timeout=5))
+            return True, "no feedback"
+
+        no_feedback, _ = self.speculator.check(["block"], feedback)
+        self.assertTrue(no_feedback)
+        self.assertEqual(self.speculator.result(["block"]), (True, ["blocks"]))
+        self.assertEqual(self.speculator.get_stats()["committed"], 1)
+
+    def test_speculation_discarded(self):
+        self.speculator.prepare(self.next_stage)
+
+        # feedback requests changes, so the revised output is checked again
+        self.speculator.check(["blok"], lambda: (False, "typo"))
+        self.speculator.check(["block"], lambda: (True, "no feedback"))
+        self.assertEqual(self.speculator.result(["block"]), (True, ["blocks"]))
+
+        # final output differs from the reviewed one (i.e. failed re-validation)
+        self.speculator.prepare(self.next_stage)
+        self.speculator.check(["arm"], lambda: (True, "no feedback"))
+        self.assertEqual(self.speculator.result(["gripper"]), (False, None))
+
+        stats = self.speculator.get_stats()
+        self.assertEqual(stats["started"], 3)
+        self.assertEqual(stats["committed"], 1)
+        self.assertEqual(stats["discarded"] + stats["cancelled"], 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,218 @@
+import importlib.util
+import os
+import stat
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+from l2p.utils.pddl_planner import (
+    DRIVER_CRITICAL_ERROR,
+    DRIVER_INPUT_ERROR,
+    SEARCH_OUT_OF_MEMORY,
+    SEARCH_OUT_OF_TIME,
+    SEARCH_UNSOLVABLE,
+    SEARCH_UNSOLVED_INCOMPLETE,
+    SUCCESS,
+    FastDownward,
+)
+from l2p.utils.planner_pool import PlannerPool
+
+# stands in for `fast-downward.py --alias <alg> <domain> <problem>`: the problem file holds the
+# behaviour to simulate
+FAKE_PLANNER = f"""#!{sys.executable}
+import subprocess, sys, time
+alg, domain, problem = sys.argv[2:5]
+behaviour = open(problem).read().strip()
+if behaviour == "race":  # portfolio: the behaviour depends on the configuration
+    behaviour = {{"fast": "solve", "slow": "hang", "fail": "11"}}[alg]
+open("sas_plan", "w").write(problem)  # every run writes to its working directory
+if behaviour == "solve":
+    print("translating...\\npick-up a (1)\\nstack a b (1)\\nPlan length: 2 step(s).")
+elif behaviour == "hang":
+    subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])  # a child process too
+    time.sleep(60)
+elif behaviour == "memory":
+    try:
+        data = bytearray(1024 * 2**20)
+    except MemoryError:
+        sys.exit(22)
+else:
+    sys.exit(int(behaviour))
+"""
+
+# stands in for the `unified_planning` modules `up_solve.py` imports: the problem file holds the
+# behaviour to simulate
+FAKE_UP = {
+    "__init__.py": "",
+    "io.py": """
+class Problem:
+    def __init__(self, kind):
+        self.kind = kind
+
+class PDDLReader:
+    def parse_problem(self, domain_file, problem_file):
+        behaviour = open(problem_file).read().strip()
+        if behaviour == "parse":
+            raise SyntaxError("unexpected token")
+        return Problem(behaviour)
+""",
+    "shortcuts.py": """
+from types import SimpleNamespace as Obj
+
+environment = Obj(credits_stream="stdout")
+
+def get_environment():
+    return environment
+
+class OneshotPlanner:
+    def __init__(self, name, problem_kind):
+        if problem_kind == "no-engine":
+            raise RuntimeError(f"no engine {name} for this problem kind")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def solve(self, problem):
+        if problem.kind == "crash":
+            raise RuntimeError("engine crashed")
+        if problem.kind == "unsolvable":
+            return Obj(plan=None, status="UNSOLVABLE_INCOMPLETELY")
+        steps = [("pick-up", ["a"]), ("stack", ["a", "b"])]
+        actions = [Obj(action=Obj(name=n), actual_parameters=p) for n, p in steps]
+        return Obj(plan=Obj(actions=actions), status="SOLVED_SATISFICING")
+""",
+}
+
+
+class TestPlannerPool(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.planner_path = self.write("fast-downward.py", FAKE_PLANNER)
+        os.chmod(self.planner_path, os.stat(self.planner_path).st_mode | stat.S_IEXEC)
+        self.domain_file = self.write("domain.pddl", "(define (domain d))")
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def write(self, name: str, text: str) -> str:
+        path = os.path.join(self.folder.name, name)
+        with open(path, "w") as f:
+            f.write(text)
+        return path
+
+    def test_run(self):
+        planner = FastDownward(self.planner_path)
+        run = lambda problem, **kwargs: planner.run(
+            self.domain_file, self.write(f"{problem}.pddl", problem), cwd=self.folder.name, **kwargs
+        )
+
+        output = "translating...\npick-up a (1)\nstack a b (1)\nPlan length: 2 step(s)."
+        self.assertEqual(
+            run("solve").plan,
+            planner.extract_plan_steps(output),  # same steps as from the captured output
+        )
+
+        result = run(str(SEARCH_UNSOLVABLE))
+        self.assertEqual(result.exitcode, SEARCH_UNSOLVABLE)
+        self.assertEqual(result.plan, "Search phase determined the problem is unsolvable.")
+
+        start = time.perf_counter()
+        result = run("hang", timeout=0.5)
+        self.assertLess(time.perf_counter() - start, 10)
+        self.assertTrue(result.timed_out)
+        self.assertEqual(result.exitcode, SEARCH_OUT_OF_TIME)
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "address-space limits")
+    def test_memory_limit(self):
+        planner = FastDownward(self.planner_path)
+        problem_file = self.write("memory.pddl", "memory")
+        result = planner.run(
+            self.domain_file, problem_file, memory_limit=256 * 2**20, cwd=self.folder.name
+        )
+        self.assertEqual(result.exitcode, SEARCH_OUT_OF_MEMORY)
+
+    def test_pool(self):
+        behaviours = ["solve", "hang", str(SEARCH_UNSOLVABLE)] * 3
+        jobs = [
+            (self.domain_file, self.write(f"p{i}.pddl", b))
+            for i, b in enumerate(behaviours)
+        ]
+
+        with PlannerPool(self.planner_path, max_workers=4, max_pending=1, timeout=1) as pool:
+            results = {r.problem_file: r for r in pool.solve_all(jobs)}
+            self.assertEqual(len(results), len(jobs))
+            for (_, problem_file), behaviour in zip(jobs, behaviours):
+                self.assertEqual(results[problem_file].success, behaviour == "solve")
+            self.assertEqual(
+                pool.stats,
+                {"submitted": 9, "solved": 3, "failed": 3, "timed_out": 3, "cancelled": 0},
+            )
+
+            # runs are killed, not left hanging
+            future = pool.submit(self.domain_file, jobs[1][1], timeout=60)
+            time.sleep(0.3)
+            self.assertTrue(pool.cancel(future))
+            self.assertTrue(future.result(timeout=10).cancelled)
+
+        self.assertFalse(os.path.exists(os.path.join(os.getcwd(), "sas_plan")))  # private working directories
+        with self.assertRaises(RuntimeError):
+            pool.submit(self.domain_file, jobs[0][1])
+
+    def test_race(self):
+        problem_file = self.write("race.pddl", "race")
+        with PlannerPool(self.planner_path, max_workers=3, timeout=30) as pool:
+            start = time.perf_counter()
+            result = pool.race(self.domain_file, problem_file, ["slow", "fail", "fast"])
+            self.assertLess(time.perf_counter() - start, 10)  # `slow` was killed
+            self.assertTrue(result.success)
+            self.assertEqual(result.search_alg, "fast")
+            self.assertEqual(result.exitcode, SUCCESS)
+            self.assertTrue(next(r for r in result.runs if r.search_alg == "slow").cancelled)
+
+            # no plan: exit codes are aggregated as a FastDownward portfolio
+            result = pool.race(self.domain_file, problem_file, ["slow", "fail"], timeout=0.5)
+            self.assertFalse(result.success)
+            self.assertEqual(result.exitcode, SEARCH_UNSOLVABLE)
+            self.assertEqual(sorted(r.exitcode for r in result.runs), [SEARCH_UNSOLVABLE, SEARCH_OUT_OF_TIME])
+
+    @unittest.skipIf(importlib.util.find_spec("unified_planning"), "unified-planning is installed")
+    def test_race_up_engine(self):
+        problem_file = self.write("race.pddl", "race")
+        with PlannerPool(self.planner_path, max_workers=2) as pool:
+            self.assertIn("aries", pool.command(self.domain_file, problem_file, "up:aries"))
+            result = pool.race(self.domain_file, problem_file, ["up:aries"])
+            self.assertEqual(result.exitcode, DRIVER_CRITICAL_ERROR)  # engine not available
+
+    def test_up_engine(self):
+        stub = os.path.join(self.folder.name, "stub", "unified_planning")
+        os.makedirs(stub)
+        for name, text in FAKE_UP.items():
+            self.write(os.path.join("stub", "unified_planning", name), text)
+
+        planner = FastDownward(self.planner_path)
+        cases = [
+            ("solve", SUCCESS),
+            ("unsolvable", SEARCH_UNSOLVED_INCOMPLETE),
+            ("no-engine", DRIVER_CRITICAL_ERROR),
+            ("crash", DRIVER_CRITICAL_ERROR),
+            ("parse", DRIVER_INPUT_ERROR),
+        ]
+        with mock.patch.dict(os.environ, {"PYTHONPATH": os.path.dirname(stub)}):
+            with PlannerPool(planner, max_workers=2) as pool:
+                for behaviour, exitcode in cases:
+                    problem_file = self.write(f"{behaviour}.pddl", behaviour)
+                    result = pool.submit(self.domain_file, problem_file, "up:stub").result()
+                    self.assertEqual(result.exitcode, exitcode, behaviour)
+                    self.assertEqual(result.success, behaviour == "solve")
+
+                # plan steps are printed as FastDownward's
+                result = pool.race(self.domain_file, self.write("up.pddl", "solve"), ["up:stub"])
+                self.assertEqual(result.plan, planner.extract_plan_steps("pick-up a (1)\nstack a b (1)"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import unittest
+from l2p.domain_builder import DomainBuilder
+from l2p.utils.pddl_parser import load_file
+from l2p.utils.prompt_template import (
+    PromptTemplate,
+    TemplateRegistry,
+    get_template_registry,
+    load_template,
+)
+from .mock_llm import MockLLM
+
+
+class TestPromptTemplate(unittest.TestCase):
+    def test_render(self):
+        template = PromptTemplate('Domain: {domain_desc}\n{"name": "{types}"} {types}', name="t")
+        self.assertEqual(template.placeholders, {"domain_desc", "types"})
+
+        # JSON braces are literal, substituted values are not expanded again
+        prompt = template.render(domain_desc="uses {types}", types="block")
+        self.assertEqual(prompt, 'Domain: uses {types}\n{"name": "block"} block')
+
+        with self.assertRaises(ValueError) as error:
+            template.render(domain_desc="blocksworld")
+        self.assertIn("types", str(error.exception))
+
+        self.assertEqual(
+            template.render({"types": "arm"}, strict=False, extra="ignored"),
+            'Domain: {domain_desc}\n{"name": "arm"} arm',
+        )
+        self.assertIs(PromptTemplate.of(template), template)
+        self.assertIs(PromptTemplate.of("{x}"), PromptTemplate.of("{x}"))
+
+    def test_registry(self):
+        registry = get_template_registry()
+        self.assertIs(get_template_registry(), registry)
+        self.assertIn("domain_templates/formalize_type", registry)
+        self.assertEqual(len(registry), len(TemplateRegistry(registry.root)))
+
+        # names, relative paths and absolute paths resolve to the same template
+        path = os.path.join(registry.root, "task_templates", "formalize_goal.txt")
+        template = load_template("task_templates/formalize_goal")
+        self.assertIs(load_template(path), template)
+        self.assertEqual(template.text, load_file(path))
+
+        # same prompt as the chained replace it replaces
+        text = load_file(os.path.join(registry.root, "repair_templates", "repair_section.txt"))
+        values = {"section": "TYPES", "section_content": "- block", "error_msg": "x", "context": ""}
+        expected = text
+        for name, value in values.items():
+            expected = expected.replace("{" + name + "}", value)
+        self.assertEqual(load_template("repair_templates/repair_section").render(values), expected)
+
+    def test_builder(self):
+        prompts = []
+        llm = MockLLM()
+        llm.output = "## OUTPUT\n{\n}"
+        llm.query = lambda prompt: prompts.append(prompt) or llm.output
+
+        DomainBuilder().formalize_types(
+            model=llm,
+            domain_desc="A {types} placeholder in the description",
+            prompt_template="{domain_desc}\n{types}\n{unknown}",
+            types={"block": "a block"},
+        )
+        self.assertTrue(prompts[0].startswith("A {types} placeholder"))
+        self.assertTrue(prompts[0].endswith("{unknown}"))
+
+
+if __name__ == "__main__":
+    unittest.main()
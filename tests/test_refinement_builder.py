@@ -0,0 +1,92 @@
+import unittest
+from collections import OrderedDict
+from l2p.refinement_builder import RefinementBuilder
+
+
+def predicate(name: str, **params) -> dict:
+    params = OrderedDict((f"?{k}", v) for k, v in params.items())
+    clean = f"({name} {' '.join(f'{k} - {v}' for k, v in params.items())})"
+    return {"name": name, "desc": "", "raw": clean, "params": params, "clean": clean}
+
+
+def action(name: str, params: dict, body: str) -> dict:
+    return {
+        "name": name,
+        "raw": "",
+        "params": OrderedDict(params),
+        "preconditions": body,
+        "effects": "(and)",
+    }
+
+
+class TestRefinementBuilder(unittest.TestCase):
+    def setUp(self):
+        self.types = [
+            {
+                "object": "",
+                "children": [
+                    {"truck": "", "children": []},
+                    {"location": "", "children": []},
+                    {"package": "", "children": []},
+                ],
+            }
+        ]
+        self.refinement_builder = RefinementBuilder(types=self.types)
+        self.calls = []
+
+    def generate(self, action_name, predicates):
+        """drive creates `at`; load uses `at` and creates `in` on the first query"""
+        self.calls.append(action_name)
+        known = {p["name"] for p in predicates}
+        if action_name == "drive":
+            return (
+                action("drive", {"?t": "truck", "?l": "location"}, "(and (at ?t ?l))"),
+                [predicate("at", t="truck", l="location")],
+            )
+        if action_name == "load":
+            new = [] if "in" in known else [predicate("in", p="package", t="truck")]
+            return (
+                action("load", {"?p": "package", "?t": "truck"}, "(and (in ?p ?t))"),
+                new,
+            )
+        return action("wait", {"?p": "package"}, "(and (in ?p ?p))"), []
+
+    def test_refine_reaches_fixed_point(self):
+        actions, predicates = self.refinement_builder.refine(
+            ["drive", "load", "wait"], self.generate, max_iter=5
+        )
+
+        self.assertEqual(set(actions), {"drive", "load", "wait"})
+        self.assertEqual([p["name"] for p in predicates], ["at", "in"])
+
+        # iteration 1 queries everything; `in` (created by `load`) is relevant to `drive` (truck)
+        # but not to anything else, so iteration 2 only re-queries `drive`; iteration 3 is a no-op
+        self.assertEqual(self.calls, ["drive", "load", "wait", "drive"])
+        stats = self.refinement_builder.get_stats()
+        self.assertEqual(stats["queries"], 4)
+        self.assertEqual(stats["iterations"], 2)
+
+    def test_stale_when_used_predicate_removed(self):
+        actions, predicates = self.refinement_builder.refine(
+            ["drive"], self.generate, max_iter=1
+        )
+        self.assertFalse(self.refinement_builder.is_stale("drive", actions, predicates))
+        self.assertTrue(self.refinement_builder.is_stale("drive", actions, []))
+        self.assertTrue(self.refinement_builder.is_stale("load", actions, predicates))
+
+    def test_failed_generation(self):
+        generate = lambda action_name, predicates: (
+            (None, []) if action_name == "load" else self.generate(action_name, predicates)
+        )
+        actions, predicates = self.refinement_builder.refine(
+            ["drive", "load"], generate, max_iter=2
+        )
+
+        # `load` is neither stored nor indexed, and is retried on the next iteration
+        self.assertEqual(set(actions), {"drive"})
+        self.assertEqual(self.refinement_builder.get_stats()["failed"], 2)
+        self.assertTrue(self.refinement_builder.is_stale("load", actions, predicates))
+
+
+if __name__ == "__main__":
+    unittest.main()
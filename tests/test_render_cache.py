@@ -0,0 +1,106 @@
+import copy, unittest
+from collections import OrderedDict
+from l2p.domain_builder import DomainBuilder
+from l2p.prompt_builder import PromptBuilder
+from l2p.utils.pddl_format import format_expression, pretty_print_dict
+from l2p.utils.render_cache import RenderCache
+
+
+def predicate(name: str) -> dict:
+    return {
+        "name": name,
+        "desc": "",
+        "raw": f"({name} ?b - block): {name} block",
+        "params": OrderedDict([("?b", "block")]),
+        "clean": f"({name} ?b - block)",
+    }
+
+
+class TestRenderCache(unittest.TestCase):
+    def setUp(self):
+        self.types = {"block": "a block", "arm": "a robot arm"}
+        self.domain_builder = DomainBuilder(
+            types=self.types, predicates=[predicate("clear"), predicate("on")]
+        )
+
+    def test_render(self):
+        cache = RenderCache()
+        self.assertEqual(cache.render("types", self.types), pretty_print_dict(self.types))
+        self.assertEqual(cache.render("constants", {}), "No constants provided.")
+
+        # plain sources have no version: rendered directly, never cached
+        predicates = [predicate("clear"), predicate("on")]
+        self.assertEqual(cache.render("pddl_predicates", predicates), format_expression(predicates))
+        predicates.append(predicate("holding"))
+        self.types["table"] = "a table"
+        self.assertIn("holding", cache.render("pddl_predicates", predicates))
+        self.assertIn("table", cache.render("types", self.types))
+        self.assertEqual(cache.stats, {"hits": 0, "misses": 0})
+        self.assertEqual(len(cache._entries), 0)
+
+        # collections are checked by version
+        predicates = self.domain_builder.predicates
+        text = cache.render("pddl_predicates", predicates)
+        self.assertEqual(text, format_expression(list(predicates)))
+        self.assertIs(cache.render("pddl_predicates", predicates), text)
+        self.domain_builder.set_predicate(predicate("holding"))
+        self.assertIn("holding", cache.render("pddl_predicates", predicates))
+
+        # other sources are checked by the version their owner passes
+        text = cache.render("types", self.types, version=1)
+        self.assertIs(cache.render("types", self.types, version=1), text)
+        self.assertNotIn("arm", cache.render("types", {"block": "a block"}, version=1))
+
+        # copies keep stats, not entries keyed by the original sources' ids
+        copied = copy.deepcopy(cache)
+        self.assertEqual(copied.stats, cache.stats)
+        self.assertEqual(len(copied._entries), 0)
+
+    def test_builder_versions(self):
+        render = self.domain_builder._render
+        text = render("types", self.domain_builder.types)
+        self.assertIs(render("types", self.domain_builder.types), text)
+
+        # in-place edits are picked up once the types are reassigned
+        self.types["table"] = "a table"
+        self.domain_builder.set_types(self.types)
+        self.assertIn("table", render("types", self.domain_builder.types))
+        self.domain_builder.delete_type("table")
+        self.assertNotIn("table", render("types", self.domain_builder.types))
+
+        # a caller's own dict has no version
+        hits = self.domain_builder.render_cache.stats["hits"]
+        render("types", dict(self.types))
+        render("types", dict(self.types))
+        self.assertEqual(self.domain_builder.render_cache.stats["hits"], hits)
+
+    def test_builder_fragments(self):
+        fragments = self.domain_builder.get_prompt_fragments()
+        self.assertEqual(fragments["constants"], "No constants provided.")
+        self.assertEqual(fragments["predicates"].count("\n"), 1)
+
+        hits = self.domain_builder.render_cache.stats["hits"]
+        domain = self.domain_builder.generate_domain(
+            "blocksworld",
+            types=self.domain_builder.types,
+            predicates=self.domain_builder.predicates,
+        )
+        self.assertEqual(
+            self.domain_builder.generate_domain(
+                "blocksworld",
+                types=self.domain_builder.types,
+                predicates=self.domain_builder.predicates,
+            ),
+            domain,
+        )
+        self.assertEqual(self.domain_builder.render_cache.stats["hits"], hits + 2)  # types, predicates
+
+        prompt_builder = PromptBuilder(task="Types:\n{types}\nPredicates:\n{predicates}")
+        prompt_builder.set_fragments(fragments)
+        prompt = prompt_builder.generate_prompt()
+        self.assertIn(fragments["predicates"], prompt)
+        self.assertNotIn("{types}", prompt)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+import unittest, textwrap
+from l2p.repair_builder import RepairBuilder
+from l2p.utils.md_parser import get_section, splice_section
+from l2p.utils.pddl_validator import SyntaxValidator
+from l2p.utils.pddl_parser import load_file
+from .mock_llm import MockLLM
+
+
+class TestRepairBuilder(unittest.TestCase):
+    def setUp(self):
+        self.repair_builder = RepairBuilder()
+        self.syntax_validator = SyntaxValidator()
+        self.mock_llm = MockLLM()
+        self.prompt = load_file("templates/repair_templates/repair_section.txt")
+        self.types = {"block": "a block", "arm": "a robotic arm"}
+
+    def test_splice_section(self):
+        text = textwrap.dedent(
+            """
+            ### Action Preconditions
+            ```
+            (old)
+            ```
+
+            ## DISTRACTION TEXT
+
+            ### Action Effects
+            ```
+            (effect)
+            ```
+            """
+        )
+        spliced = splice_section(text, "Action Preconditions", "(new)")
+        self.assertEqual(get_section(spliced, "Action Preconditions"), "```\n(new)\n```")
+        self.assertIn("## DISTRACTION TEXT", spliced)
+        self.assertEqual(get_section(spliced, "Action Effects"), "```\n(effect)\n```")
+
+    def test_repair_action(self):
+        self.syntax_validator.unsupported_keywords = []
+        self.syntax_validator.error_types = [
+            "validate_header",
+            "validate_params",
+            "validate_format_predicates",
+            "validate_usage_action",
+        ]
+        self.syntax_validator.headers = [
+            "Action Parameters",
+            "Action Preconditions",
+            "Action Effects",
+            "New Predicates",
+        ]
+
+        llm_output = textwrap.dedent(
+            """
+            ### Action Parameters
+            ```
+            - ?b - block: The block being picked up
+            - ?a - arm: The arm picking up the block
+            ```
+
+            ### Action Preconditions
+            ```
+            (and
+                (clear ?b)
+                (empty ?a) ; undefined predicate
+            )
+            ```
+
+            ### Action Effects
+            ```
+            (and
+                (holding ?a ?b)
+                (not (clear ?b))
+            )
+            ```
+
+            ### New Predicates
+            ```
+            - (holding ?a - arm ?b - block): true if arm is holding a block
+            - (clear ?b - block): true if a block does not have anything on top of it
+            ```
+            """
+        )
+
+        # LLM only returns the repaired section
+        self.mock_llm.output = textwrap.dedent(
+            """
+            ### Action Preconditions
+            ```
+            (and
+                (clear ?b)
+            )
+            ```
+            """
+        )
+
+        action, new_preds, repaired_output, validation_info = (
+            self.repair_builder.repair_action(
+                model=self.mock_llm,
+                prompt_template=self.prompt,
+                llm_output=llm_output,
+                action_name="pickup",
+                syntax_validator=self.syntax_validator,
+                types=self.types,
+                extract_new_preds=True,
+            )
+        )
+
+        self.assertTrue(validation_info[0], validation_info[1])
+        self.assertNotIn("empty", action["preconditions"])
+        self.assertEqual(action["effects"], "(and\n    (holding ?a ?b)\n    (not (clear ?b))\n)")
+        self.assertEqual(len(new_preds), 2)
+        self.assertIn("(holding ?a ?b)", repaired_output)
+        self.assertEqual(self.repair_builder.get_stats()["repairs"], 1)
+
+    def test_repair_task(self):
+        self.syntax_validator.headers = ["OBJECTS", "INITIAL", "GOAL"]
+        self.syntax_validator.error_types = [
+            "validate_header",
+            "validate_task_objects",
+            "validate_task_states",
+        ]
+        predicates = [
+            {
+                "name": "clear",
+                "desc": "true if a block does not have anything on top of it",
+                "raw": "(clear ?b - block): true if a block does not have anything on top of it",
+                "params": {"?b": "block"},
+                "clean": "(clear ?b - block)",
+            }
+        ]
+
+        llm_output = textwrap.dedent(
+            """
+            ### OBJECTS
+            ```
+            b1 - block
+            b2 - block
+            ```
+
+            ### INITIAL
+            ```
+            (clear b1)
+            ```
+
+            ### GOAL
+            ```
+            (clear b3)
+            ```
+            """
+        )
+        self.mock_llm.output = "### GOAL\n```\n(clear b2)\n```"
+
+        objects, initial, goal, _, validation_info = self.repair_builder.repair_task(
+            model=self.mock_llm,
+            prompt_template=self.prompt,
+            llm_output=llm_output,
+            syntax_validator=self.syntax_validator,
+            types={"block": "a block"},
+            predicates=predicates,
+        )
+
+        self.assertTrue(validation_info[0], validation_info[1])
+        self.assertEqual(objects, {"b1": "block", "b2": "block"})
+        self.assertEqual(initial[0]["params"], ["b1"])
+        self.assertEqual(goal[0]["params"], ["b2"])
+        self.assertEqual(self.repair_builder.get_stats()["repairs"], 1)
+
+    def test_header_error_not_repaired(self):
+        self.syntax_validator.headers = ["OBJECTS", "INITIAL", "GOAL"]
+        self.syntax_validator.error_types = ["validate_duplicate_headers"]
+        llm_output = "### OBJECTS\n```\nb1 - block\n```\n### OBJECTS\n```\nb1 - block\n```\n### INITIAL\n```\n(clear b1)\n```\n### GOAL\n```\n(clear b1)\n```"
+
+        *_, validation_info = self.repair_builder.repair_task(
+            model=self.mock_llm,
+            prompt_template=self.prompt,
+            llm_output=llm_output,
+            syntax_validator=self.syntax_validator,
+        )
+        self.assertFalse(validation_info[0])
+        self.assertEqual(self.repair_builder.get_stats()["repairs"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import copy, pickle, unittest
+from l2p.domain_builder import DomainBuilder
+from l2p.task_builder import TaskBuilder
+from l2p.utils.retry_policy import RetryPolicy
+
+
+class ScriptedLLM:
+    """Returns (or raises) scripted responses in order and records prompts/temperatures"""
+
+    def __init__(self, outputs: list):
+        self.outputs = list(outputs)
+        self.prompts = []
+        self.temperatures = []
+        self.temperature = 0.0
+
+    def query(self, prompt: str, temperature: float | None = None) -> str:
+        self.prompts.append(prompt)
+        self.temperatures.append(self.temperature if temperature is None else temperature)
+        output = self.outputs.pop(0)
+        if isinstance(output, Exception):
+            raise output
+        return output
+
+    def reset_tokens(self):
+        pass
+
+
+def parse(llm_output: str):
+    if llm_output == "bad":
+        raise ValueError("could not parse")
+    return llm_output, (llm_output == "ok", "invalid output")
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_parse_error(self):
+        policy = RetryPolicy()
+        model = ScriptedLLM(["bad", "ok"])
+
+        self.assertEqual(policy.run(model, "prompt", parse), ("ok", (True, "invalid output")))
+        self.assertEqual(model.prompts[0], "prompt")
+        self.assertIn("could not parse", model.prompts[1])
+        self.assertEqual(model.temperatures, [0.0, 0.2])
+        self.assertEqual(model.temperature, 0.0)  # shared model left untouched
+
+        stats = policy.get_stats()
+        self.assertEqual((stats["attempts"], stats["retries"], stats["parse"]), (2, 1, 1))
+
+    def test_no_temperature_argument(self):
+        class FixedLLM(ScriptedLLM):
+            def query(self, prompt: str) -> str:
+                return super().query(prompt)
+
+        model = FixedLLM(["bad", "ok"])
+        RetryPolicy().run(model, "prompt", parse)
+        self.assertEqual(model.temperatures, [0.0, 0.0])
+
+    def test_transport_error(self):
+        policy = RetryPolicy(base_delay=0.0)
+        model = ScriptedLLM([ConnectionError("timeout"), "ok"])
+
+        policy.run(model, "prompt", parse)
+        self.assertEqual(model.prompts, ["prompt", "prompt"])  # same prompt, same temperature
+        self.assertEqual(model.temperatures, [0.0, 0.0])
+        self.assertEqual(policy.get_stats()["transport"], 1)
+
+    def test_validation_error(self):
+        # invalid results are returned to the caller by default
+        model = ScriptedLLM(["invalid", "ok"])
+        result = RetryPolicy().run(model, "prompt", parse)
+        self.assertFalse(result[1][0])
+
+        policy = RetryPolicy(retry_invalid=True)
+        model = ScriptedLLM(["invalid", "ok"])
+        self.assertTrue(policy.run(model, "prompt", parse)[1][0])
+        self.assertIn("invalid output", model.prompts[1])
+        self.assertEqual(policy.get_stats()["validation"], 1)
+
+        # last invalid result is returned once attempts are exhausted
+        model = ScriptedLLM(["invalid", "invalid"])
+        self.assertFalse(policy.run(model, "prompt", parse, max_retries=2)[1][0])
+
+    def test_budget(self):
+        policy = RetryPolicy(budget=1)
+        model = ScriptedLLM(["bad", "bad", "bad", "bad"])
+
+        with self.assertRaises(RuntimeError):
+            policy.run(model, "prompt", parse, error_msg="failed")
+        with self.assertRaises(RuntimeError):
+            policy.run(model, "prompt", parse)
+
+        # budget shared across calls: 1 retry in total
+        self.assertEqual(len(model.prompts), 3)
+        self.assertEqual(policy.get_stats()["exhausted"], 2)
+
+    def test_copy(self):
+        policy = RetryPolicy(budget=1)
+        with self.assertRaises(RuntimeError):
+            policy.run(ScriptedLLM(["bad", "bad"]), "prompt", parse)
+        policy.cancel()
+
+        for copied in (copy.deepcopy(policy), pickle.loads(pickle.dumps(policy))):
+            self.assertEqual(copied.get_stats(), policy.get_stats())
+            self.assertTrue(copied._cancelled.is_set())
+            self.assertIsNot(copied._lock, policy._lock)
+
+        # builders hold a policy, and must stay copyable
+        domain_builder = copy.deepcopy(DomainBuilder(types={"block": "a block"}))
+        self.assertEqual(domain_builder.types, {"block": "a block"})
+        task_builder = pickle.loads(pickle.dumps(TaskBuilder(objects={"b1": "block"})))
+        self.assertEqual(task_builder.objects, {"b1": "block"})
+        self.assertEqual(task_builder.retry_policy.get_stats()["attempts"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
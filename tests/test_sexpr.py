@@ -0,0 +1,69 @@
+import unittest
+from collections import OrderedDict
+from l2p.utils.sexpr import SExpr, parse_sexpr
+from l2p.utils.pddl_parser import parse_pddl, parse_goal
+from l2p.utils.pddl_validator import SyntaxValidator
+
+
+class TestSExpr(unittest.TestCase):
+    def test_parse_sexpr(self):
+        text = "(and (on ?a ?b) (not (clear ?b)))"
+        expr = parse_sexpr(text)
+
+        self.assertEqual(expr.head, "and")
+        self.assertEqual(expr[1].head, "on")
+        self.assertEqual(expr[1].args, ["?a", "?b"])
+        self.assertEqual(text[expr[2].start : expr[2].end], "(not (clear ?b))")
+        self.assertEqual(str(expr), text)
+        self.assertEqual([node.head for node in expr.walk()], ["and", "on", "not", "clear"])
+
+        # symbols are interned
+        self.assertIs(parse_sexpr("(on-table ?x)")[0], parse_sexpr("(on-table ?y)")[0])
+
+        # unmatched `)` ignored, unclosed `(` raises
+        self.assertEqual(str(parse_sexpr("(clear ?b))")), "(clear ?b)")
+        with self.assertRaises(ValueError):
+            parse_sexpr("(and (clear ?b)")
+        with self.assertRaises(ValueError):
+            parse_sexpr("")
+
+    def test_legacy_format(self):
+        self.assertEqual(
+            parse_pddl("(and (on ?a ?b) (> (fuel ?t) 5))"),
+            ["and", ["on ?a ?b"], [">", ["fuel ?t"], "5"]],
+        )
+
+    def test_deep_nesting(self):
+        depth = 5000
+        text = "(not " * depth + "(clear ?b)" + ")" * depth
+        expr = parse_sexpr(text)
+        self.assertEqual(str(expr), text)
+
+        predicates = [
+            {
+                "name": "clear",
+                "desc": "",
+                "raw": "(clear ?b - block)",
+                "params": OrderedDict([("?b", "block")]),
+                "clean": "(clear ?b - block)",
+            }
+        ]
+        flag, _ = SyntaxValidator().validate_pddl_action(
+            text, predicates, OrderedDict([("?b", "block")]), types={"block": ""}
+        )
+        self.assertTrue(flag)
+
+    def test_parse_goal_conjunction(self):
+        goal = parse_goal("### GOAL\n```\n(and (on a b) (not (clear a)) (> (fuel t) 5))\n```")
+        self.assertEqual(
+            goal,
+            [
+                {"pred_name": "on", "params": ["a", "b"], "neg": False},
+                {"pred_name": "clear", "params": ["a"], "neg": True},
+                {"func_name": "fuel", "params": ["t"], "value": "5", "op": ">"},
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
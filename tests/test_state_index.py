@@ -0,0 +1,109 @@
+import unittest
+from collections import OrderedDict
+from l2p.utils.pddl_types import Function, Predicate
+from l2p.utils.pddl_validator import SyntaxValidator
+from l2p.utils.state_index import StateIndex
+
+
+class TestStateIndex(unittest.TestCase):
+    def setUp(self):
+        self.syntax_validator = SyntaxValidator()
+        self.objects = {"b1": "block", "b2": "block", "a1": "arm"}
+        self.predicates = [
+            Predicate(
+                {
+                    "name": "on",
+                    "desc": "",
+                    "raw": "(on ?b1 - block ?b2 - block)",
+                    "params": OrderedDict([("?b1", "block"), ("?b2", "block")]),
+                    "clean": "(on ?b1 - block ?b2 - block)",
+                }
+            ),
+            Predicate(
+                {
+                    "name": "holding",
+                    "desc": "",
+                    "raw": "(holding ?a - arm ?b - block)",
+                    "params": OrderedDict([("?a", "arm"), ("?b", "block")]),
+                    "clean": "(holding ?a - arm ?b - block)",
+                }
+            ),
+        ]
+        self.functions = [
+            Function(
+                {
+                    "name": "weight",
+                    "desc": "",
+                    "raw": "(weight ?b - block)",
+                    "params": OrderedDict([("?b", "block")]),
+                    "clean": "(weight ?b - block)",
+                }
+            )
+        ]
+
+    def test_valid_states(self):
+        states = [
+            {"pred_name": "on", "params": ["b1", "b2"], "neg": False},
+            {"pred_name": "holding", "params": ["a1", "b1"], "neg": False},
+            {"func_name": "weight", "params": ["b1"], "value": "3", "op": "="},
+        ]
+        state_index = StateIndex(self.objects, self.predicates, self.functions)
+
+        self.assertEqual(state_index.check(states, collect_all=True), [])
+
+    def test_collect_all(self):
+        states = [
+            {"pred_name": "throw", "params": ["b1"], "neg": False},
+            {"pred_name": "on", "params": ["b1", "b3"], "neg": False},
+            {"pred_name": "on", "params": ["b1", "b2"], "neg": False},
+            {"pred_name": "holding", "params": ["b1", "a1"], "neg": False},
+            {"pred_name": "on", "params": ["b1"], "neg": False},
+            {"func_name": "weight", "params": ["a1"], "value": "3", "op": "="},
+        ]
+        state_index = StateIndex(self.objects, self.predicates, self.functions)
+
+        errors = state_index.check(states, state_type="goal", collect_all=True)
+        self.assertEqual(len(errors), 5)
+        self.assertIn("uses predicate 'throw'", errors[0])
+        self.assertIn("parameter(s) ['b3'] not found", errors[1])
+        self.assertIn("'(holding b1 a1)' has mismatched types", errors[2])
+        self.assertIn("'(on b1)' has mismatched types", errors[3])
+        self.assertIn("Function `(weight ?b - block)` expects type(s): ['block']", errors[4])
+        self.assertTrue(all("In the goal state" in error for error in errors))
+
+        # first violation only
+        self.assertEqual(state_index.check(states, state_type="goal"), errors[:1])
+
+    def test_validate_task_states(self):
+        states = [
+            {"pred_name": "on", "params": ["b1", "a1"], "neg": False},
+            {"pred_name": "on", "params": ["b2", "a1"], "neg": False},
+        ]
+
+        flag, msg = self.syntax_validator.validate_task_states(
+            states=states, objects=self.objects, predicates=self.predicates
+        )
+        self.assertFalse(flag)
+        self.assertEqual(msg.count("[ERROR]"), 1)
+
+        flag, msg = self.syntax_validator.validate_task_states(
+            states=states,
+            objects=self.objects,
+            predicates=self.predicates,
+            collect_all=True,
+        )
+        self.assertFalse(flag)
+        self.assertEqual(msg.count("[ERROR]"), 2)
+
+        # prebuilt index, no domain arguments needed
+        state_index = StateIndex(self.objects, self.predicates)
+        flag, _ = self.syntax_validator.validate_task_states(
+            states=[{"pred_name": "on", "params": ["b1", "b2"], "neg": False}],
+            objects=self.objects,
+            state_index=state_index,
+        )
+        self.assertTrue(flag)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
-import unittest, textwrap
+import os, tempfile, unittest, textwrap
+from collections import OrderedDict
 from l2p.task_builder import TaskBuilder
 from l2p.utils import *
 from l2p.utils.pddl_validator import SyntaxValidator
@@ -136,6 +137,65 @@ class TestTaskBuilder(unittest.TestCase):
         self.assertEqual(validation_info[0], True)
         self.assertEqual(exp_initial, initial)
 
+    def test_formalize_initial_state_auto_fix(self):
+
+        self.syntax_validator.headers = ["INITIAL"]
+        self.syntax_validator.error_types = ["validate_header", "validate_task_states"]
+        self.mock_llm.output = textwrap.dedent(
+            """
+            ### INITIAL
+            ```
+            (predicate_1 object1 - type_1 object2 - type_2) ; type annotations
+            (predicate_3 `object1`))
+            ```
+            """
+        )
+
+        objects = {"object1": "type_1", "object2": "type_2"}
+        predicates = [
+            Predicate(
+                {
+                    "name": "predicate_1",
+                    "desc": "",
+                    "raw": "(predicate_1 ?t1 ?t2): description",
+                    "params": OrderedDict([("?t1", "type_1"), ("?t2", "type_2")]),
+                    "clean": "(predicate_1 ?t1 ?t2",
+                }
+            ),
+            Predicate(
+                {
+                    "name": "predicate_3",
+                    "desc": "",
+                    "raw": "(predicate_3 ?t1): description",
+                    "params": OrderedDict([("?t1", "type_1")]),
+                    "clean": "(predicate_3 ?t1",
+                }
+            ),
+        ]
+
+        initial, _, validation_info = self.task_builder.formalize_initial_state(
+            model=self.mock_llm,
+            problem_desc="",
+            prompt_template="",
+            predicates=predicates,
+            objects=objects,
+            syntax_validator=self.syntax_validator,
+            auto_fix=True,
+        )
+
+        exp_initial = [
+            {
+                "pred_name": "predicate_1",
+                "params": ["object1", "object2"],
+                "neg": False,
+            },
+            {"pred_name": "predicate_3", "params": ["object1"], "neg": False},
+        ]
+
+        self.assertEqual(validation_info[0], True)
+        self.assertEqual(exp_initial, initial)
+        self.assertEqual(len(self.task_builder.fix_log), 3)
+
     def test_formalize_task(self):
         self.syntax_validator.headers = ["INITIAL"]
         self.syntax_validator.error_types = [
@@ -292,6 +352,55 @@ class TestTaskBuilder(unittest.TestCase):
 
         self.assertEqual(self.normalize(result), self.normalize(expected_output))
 
+    def test_formalize_tasks(self):
+
+        class EchoLLM(MockLLM):
+            def query(self, prompt: str):
+                return prompt
+
+        self.syntax_validator.headers = ["OBJECTS", "INITIAL", "GOAL"]
+        self.syntax_validator.error_types = ["validate_header", "validate_task_states"]
+        predicates = [
+            Predicate(
+                {
+                    "name": "clear",
+                    "desc": "",
+                    "raw": "(clear ?b - block): description",
+                    "params": OrderedDict([("?b", "block")]),
+                    "clean": "(clear ?b - block)",
+                }
+            )
+        ]
+        task = "### OBJECTS\n```\nb1 - block\n```\n### INITIAL\n```\n({init} b1)\n```\n### GOAL\n```\n(clear b1)\n```"
+        problem_descs = {f"p{i}": task.format(init="clear") for i in range(10)}
+        problem_descs["bad"] = task.format(init="on")
+
+        results = {
+            key: (objects, validation_info)
+            for key, objects, _, _, _, validation_info in self.task_builder.formalize_tasks(
+                model=EchoLLM(),
+                problem_descs=problem_descs,
+                prompt_template="{problem_desc}",
+                predicates=predicates,
+                syntax_validator=self.syntax_validator,
+                max_workers=3,
+            )
+        }
+
+        self.assertEqual(set(results), set(problem_descs))
+        self.assertEqual(results["p0"][0], {"b1": "block"})
+        self.assertTrue(results["p0"][1][0])
+        self.assertFalse(results["bad"][1][0])
+
+    def test_write_tasks(self):
+        tasks = ((f"p{i}.pddl", f"(define (problem p{i}))") for i in range(5))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_dir = os.path.join(tmp_dir, "problems")
+            file_paths = self.task_builder.write_tasks(tasks, output_dir)
+
+            self.assertEqual(len(file_paths), 5)
+            self.assertEqual(load_file(file_paths[3]), "(define (problem p3))")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+from l2p.domain_builder import DomainBuilder
+from l2p.utils.pddl_format import format_types
+from l2p.utils.pddl_parser import prune_types
+from l2p.utils.type_index import TypeIndex
+
+
+class TestTypeIndex(unittest.TestCase):
+    def setUp(self):
+        self.hierarchy = [
+            {
+                "object": "root type",
+                "children": [
+                    {
+                        "vehicle": "moves packages",
+                        "children": [
+                            {"truck": "drives within a city", "children": []},
+                            {"airplane": "flies between cities", "children": []},
+                        ],
+                    },
+                    {"location": "a place", "children": [{"airport": "", "children": []}]},
+                ],
+            }
+        ]
+
+    def test_subtype(self):
+        type_index = TypeIndex(self.hierarchy)
+
+        self.assertTrue(type_index.is_subtype("truck", "vehicle"))
+        self.assertTrue(type_index.is_subtype("truck", "object"))
+        self.assertTrue(type_index.is_subtype("truck", "truck"))
+        self.assertFalse(type_index.is_subtype("vehicle", "truck"))
+        self.assertFalse(type_index.is_subtype("airport", "vehicle"))
+        self.assertFalse(type_index.is_subtype("boat", "vehicle"))
+
+    def test_ancestors_descendants(self):
+        type_index = TypeIndex(self.hierarchy)
+
+        self.assertEqual(type_index.parent("airport"), "location")
+        self.assertIsNone(type_index.parent("object"))
+        self.assertEqual(
+            type_index.ancestors("airplane"), {"airplane", "vehicle", "object"}
+        )
+        self.assertEqual(
+            type_index.descendants("vehicle"), {"vehicle", "truck", "airplane"}
+        )
+        self.assertEqual(type_index.descendants("boat"), {"boat"})
+
+    def test_flat_input(self):
+        flat = format_types(self.hierarchy)
+        from_flat = TypeIndex(flat)
+        from_hierarchy = TypeIndex(self.hierarchy)
+
+        self.assertEqual(from_flat.closure, from_hierarchy.closure)
+        self.assertEqual(from_flat.flat, flat)
+        self.assertEqual(from_flat.descriptions["truck"], "drives within a city")
+
+        plain = TypeIndex({"block": "a block", "table": "a table"})
+        self.assertEqual(plain.names, ["block", "table"])
+        self.assertIn("block", plain)
+        self.assertFalse(TypeIndex(None))
+
+    def test_cycles(self):
+        type_index = TypeIndex({"a - b": "", "b - c": "", "c - a": "", "d - a": ""})
+
+        cycle = type_index.find_cycle()
+        self.assertEqual(cycle[0], cycle[-1])
+        self.assertEqual(set(cycle), {"a", "b", "c"})
+        self.assertEqual(len(type_index.cycles), 1)
+        self.assertTrue(type_index.is_subtype("d", "c"))
+        self.assertIsNone(TypeIndex(self.hierarchy).find_cycle())
+
+    def test_prune_types(self):
+        predicates = [{"name": "at", "params": {"?v": "vehicle", "?l": "location"}}]
+        actions = [
+            {
+                "name": "fly",
+                "params": {"?a": "airplane"},
+                "preconditions": "(at ?a ?l)",
+                "effects": "(not (at ?a ?l))",
+            }
+        ]
+
+        used = prune_types(self.hierarchy, predicates, actions)
+        self.assertEqual(list(used), ["vehicle", "airplane", "location"])
+        self.assertEqual(used["location"], "a place")
+
+    def test_domain_builder_cache(self):
+        domain_builder = DomainBuilder(types={"block": "a block"})
+
+        type_index = domain_builder.get_type_index()
+        self.assertIs(domain_builder.get_type_index(), type_index)
+
+        domain_builder.set_type_hierarchy(self.hierarchy)
+        self.assertIsNot(domain_builder.get_type_index(), type_index)
+        self.assertTrue(domain_builder.get_type_index().is_subtype("truck", "object"))
+
+
+if __name__ == "__main__":
+    unittest.main()
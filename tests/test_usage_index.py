@@ -0,0 +1,97 @@
+import unittest
+from collections import OrderedDict
+from l2p.domain_builder import DomainBuilder
+from l2p.utils.pddl_parser import prune_predicates, prune_types
+from l2p.utils.usage_index import UsageIndex, action_symbols
+
+
+def predicate(name: str, **params) -> dict:
+    params = OrderedDict((f"?{k}", v) for k, v in params.items())
+    return {"name": name, "desc": "", "raw": "", "params": params, "clean": ""}
+
+
+class TestUsageIndex(unittest.TestCase):
+    def setUp(self):
+        self.pick_up = {
+            "name": "pick-up",
+            "params": OrderedDict([("?b", "block"), ("?a", "arm")]),
+            "preconditions": "(and (clear ?b) (handempty ?a) (forall (?x - pyramid) (not (on ?x ?b))))",
+            "effects": "(and (holding ?a ?b) (not (handempty ?a)) (increase (total-cost) 1))",
+        }
+        self.stack = {
+            "name": "stack",
+            "params": OrderedDict([("?b", "block"), ("?c", "block")]),
+            "preconditions": "(and (holding-block ?b) (clear ?c))",
+            "effects": "(on ?b ?c)",
+        }
+        self.predicates = [
+            predicate("clear", b="block"),
+            predicate("handempty", a="arm"),
+            predicate("holding", a="arm", b="block"),
+            predicate("on", x="block", y="block"),
+            predicate("cat", x="animal"),
+            predicate("at", x="animal"),
+        ]
+
+    def test_action_symbols(self):
+        symbols, types = action_symbols(self.pick_up)
+        self.assertEqual(symbols, {"clear", "handempty", "on", "holding", "total-cost"})
+        self.assertEqual(types, {"block", "arm", "pyramid"})
+
+        # malformed expressions fall back to term heads
+        malformed = dict(self.stack, preconditions="(and (clear ?b) (on ?b ?c)")
+        self.assertEqual(action_symbols(malformed)[0], {"clear", "on"})
+
+    def test_incremental(self):
+        index = UsageIndex(actions=[self.pick_up], predicates=self.predicates)
+        self.assertEqual(index.actions_using("clear"), {"pick-up"})
+        self.assertFalse(index.is_used("holding-block"))
+
+        index.add_action(self.stack)
+        self.assertEqual(index.actions_using("clear"), {"pick-up", "stack"})
+
+        index.remove_action("pick-up")
+        self.assertEqual(index.actions_using("clear"), {"stack"})
+        self.assertFalse(index.is_used("handempty"))
+        self.assertEqual(index.symbols_of("stack"), {"holding-block", "clear", "on"})
+
+        # re-adding an action replaces its previous version
+        index.add_action(dict(self.stack, effects="(clear ?b)"))
+        self.assertFalse(index.is_used("on"))
+
+    def test_prune(self):
+        pruned = prune_predicates(self.predicates, [self.stack])
+        self.assertEqual([p["name"] for p in pruned], ["clear", "on"])
+
+        # whole-name matching: `at` is not used by `(cat ?x)`
+        chase = {
+            "name": "chase",
+            "params": OrderedDict([("?x", "animal")]),
+            "preconditions": "(cat ?x)",
+            "effects": "(not (cat ?x))",
+        }
+        self.assertEqual([p["name"] for p in prune_predicates(self.predicates, [chase])], ["cat"])
+
+        types = {"block": "", "arm": "", "pyramid": "", "animal": "", "table": ""}
+        self.assertEqual(
+            list(prune_types(types, self.predicates[:3], [self.pick_up])),
+            ["block", "arm", "pyramid"],
+        )
+
+    def test_domain_builder(self):
+        domain_builder = DomainBuilder(predicates=list(self.predicates), pddl_actions=[])
+        index = domain_builder.get_usage_index()
+
+        domain_builder.set_pddl_action(self.pick_up)
+        self.assertIs(domain_builder.get_usage_index(), index)
+        self.assertTrue(index.is_used("holding"))
+
+        domain_builder.delete_pddl_action("pick-up")
+        self.assertFalse(domain_builder.get_usage_index().is_used("holding"))
+
+        domain_builder.pddl_actions = [self.stack]  # reassigned directly
+        self.assertTrue(domain_builder.get_usage_index().is_used("holding-block"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import unittest, textwrap
+from collections import OrderedDict
+from l2p import *
+from .mock_llm import MockLLM
+
+
+class TestValidationPipeline(unittest.TestCase):
+    def setUp(self):
+        self.syntax_validator = SyntaxValidator(unsupported_keywords=[])
+        self.types = {"block": "a block", "arm": "a robot arm"}
+        self.predicates = parse_new_predicates(
+            textwrap.dedent(
+                """
+                ### New Predicates
+                ```
+                - (clear ?b - block): block has nothing on top
+                - (holding ?a - arm ?b - block): arm holds block
+                ```
+                """
+            )
+        )
+
+    def test_action_violations(self):
+        self.syntax_validator.error_types = [
+            "validate_params",
+            "validate_usage_action",
+            "validate_task_objects",
+        ]
+        action = {
+            "name": "pick-up",
+            "params": OrderedDict([("?b", "block"), ("?a", "robot")]),
+            "preconditions": "(and (clear ?b) (empty ?a))",
+            "effects": "(holding ?b ?a)",
+        }
+        predicates = list(self.predicates)
+
+        violations = ValidationPipeline.of(self.syntax_validator).run(
+            action=action, types=self.types, predicates=predicates
+        )
+
+        # every failing section is reported, not only the first one
+        self.assertEqual(
+            [(v.check, v.section) for v in violations],
+            [
+                ("validate_params", "Action Parameters"),
+                ("validate_usage_action", "Action Preconditions"),
+                ("validate_usage_action", "Action Effects"),
+            ],
+        )
+        self.assertIn("empty", violations[1].message)
+        self.assertEqual(predicates, self.predicates)  # domain predicates are not extended
+
+    def test_task_violations(self):
+        self.syntax_validator.error_types = [
+            "validate_header",
+            "validate_task_objects",
+            "validate_task_states",
+        ]
+        objects = {"b1": "block", "b2": "table", "a1": "robot"}
+        initial = [
+            {"pred_name": "clear", "params": ["b1"], "neg": False},
+            {"pred_name": "clear", "params": ["b3"], "neg": False},
+        ]
+        goal = [{"pred_name": "on", "params": ["b1", "b2"], "neg": False}]
+
+        info = ValidationPipeline.of(self.syntax_validator).validate(
+            objects=objects,
+            initial=initial,
+            goal=goal,
+            types=self.types,
+            predicates=self.predicates,
+        )
+
+        self.assertFalse(info[0])
+        for fragment in ["'table'", "'robot'", "b3", "on"]:
+            self.assertIn(fragment, info[1])
+
+        # no subject for the task checks: nothing runs
+        self.assertEqual(
+            ValidationPipeline.of(self.syntax_validator).validate(types=self.types),
+            (True, "All validations passed."),
+        )
+
+    def test_compile(self):
+        self.syntax_validator.error_types = ["validate_format_types", "validate_missing"]
+        pipeline = ValidationPipeline.of(self.syntax_validator)
+        self.assertEqual([name for name, _ in pipeline.checks], ["validate_format_types"])
+        self.assertIs(ValidationPipeline.of(self.syntax_validator), pipeline)
+
+        pipeline.register(
+            "validate_missing", lambda validator, inputs: [("TYPES", "[ERROR]: custom")]
+        )
+        self.assertEqual(len(pipeline.run(new_types={"?block": ""})), 2)
+
+        # changed error types recompile the same pipeline
+        self.syntax_validator.error_types = ["validate_cyclic_types"]
+        self.assertIs(ValidationPipeline.of(self.syntax_validator), pipeline)
+        self.assertEqual(pipeline.run(new_types={"?block": ""}), [])
+
+    def test_builder(self):
+        self.syntax_validator.error_types = ["validate_params", "validate_usage_action"]
+        mock_llm = MockLLM()
+        mock_llm.output = textwrap.dedent(
+            """
+            ### Action Parameters
+            ```
+            - ?b - block: the block
+            - ?a - robot: the arm
+            ```
+
+            ### Action Preconditions
+            ```
+            (empty ?a)
+            ```
+
+            ### Action Effects
+            ```
+            (holding ?a ?b)
+            ```
+            """
+        )
+
+        _, _, _, validation_info = DomainBuilder().formalize_pddl_action(
+            model=mock_llm,
+            domain_desc="",
+            prompt_template="",
+            action_name="pick-up",
+            types=self.types,
+            predicates=self.predicates,
+            syntax_validator=self.syntax_validator,
+            max_retries=1,
+        )
+
+        self.assertFalse(validation_info[0])
+        self.assertIn("robot", validation_info[1])
+        self.assertIn("empty", validation_info[1])
+
+
+if __name__ == "__main__":
+    unittest.main()